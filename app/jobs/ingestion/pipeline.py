@@ -0,0 +1,316 @@
+"""Batch-pipelined execution for multi-stage ingestion jobs."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable
+
+from app.jobs.ingestion.common import JobResult, _build_result, _emit_stage_progress, _now_str
+
+BatchRunner = Callable[[list[str], Callable[[dict[str, Any]], None] | None], JobResult]
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """One stage of a symbol-batch pipeline.
+
+    `run_batch(symbols, progress_callback)` returns the stage's JobResult for one
+    batch. A batch whose result is `failed` is not handed to later stages.
+    """
+
+    name: str
+    job_name: str
+    run_batch: BatchRunner
+    max_workers: int = 1
+
+
+@dataclass
+class _StageProgress:
+    started: bool = False
+    started_at: str | None = None
+    first_start: float | None = None
+    last_done: float | None = None
+    completed_batches: int = 0
+    done_symbols: int = 0
+    rows_written: int = 0
+    inflight_symbols: dict[int, int] = field(default_factory=dict)
+    inflight_rows: dict[int, int] = field(default_factory=dict)
+
+
+def split_symbol_batches(symbols: list[str], batch_size: int) -> list[list[str]]:
+    size = max(int(batch_size or 1), 1)
+    return [symbols[i : i + size] for i in range(0, len(symbols), size)]
+
+
+def _run_batch_safely(stage: PipelineStage, symbols: list[str], progress: Callable[[dict[str, Any]], None]) -> JobResult:
+    started_at = _now_str()
+    t0 = perf_counter()
+    try:
+        return stage.run_batch(symbols, progress)
+    except Exception as exc:
+        return _build_result(
+            job_name=stage.job_name,
+            status="failed",
+            started_at=started_at,
+            finished_at=_now_str(),
+            duration_sec=perf_counter() - t0,
+            rows_written=0,
+            symbols_requested=len(symbols),
+            symbols_processed=0,
+            failed_symbols=list(symbols),
+            message=f"{stage.name} batch failed: {exc}",
+        )
+
+
+def run_staged_batches(
+    batches: list[list[str]],
+    stages: list[PipelineStage],
+    *,
+    queue_size: int = 2,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> tuple[list[list[JobResult | None]], list[dict[str, Any]]]:
+    """
+    Stream symbol batches through `stages` over bounded queues.
+
+    Each stage runs `max_workers` threads, so stage 2 works on batch 1 while
+    stage 1 fetches batch 2. A full downstream queue blocks the upstream stage
+    (back-pressure). Progress events are re-emitted from the calling thread:
+    `stage_start` on a stage's first batch, `batch_progress` with stage-wide
+    symbol counts, and `stage_complete` once every batch has left the stage.
+
+    Returns `(results, timings)`: `results[stage_index][batch_index]` is the
+    batch JobResult (`None` = skipped because an earlier stage failed it) and
+    `timings[stage_index]` holds the stage's `started_at` / active `duration_sec`.
+    """
+    total_symbols = sum(len(batch) for batch in batches)
+    total_batches = len(batches)
+    total_stages = len(stages)
+    results: list[list[JobResult | None]] = [[None] * total_batches for _ in stages]
+    events: queue.SimpleQueue = queue.SimpleQueue()
+    inboxes = [queue.Queue(maxsize=max(int(queue_size), 1)) for _ in stages]
+    workers = [max(int(stage.max_workers or 1), 1) for stage in stages]
+    alive = list(workers)
+    alive_lock = threading.Lock()
+
+    def _stage_worker(stage_index: int) -> None:
+        stage = stages[stage_index]
+        inbox = inboxes[stage_index]
+        outbox = inboxes[stage_index + 1] if stage_index + 1 < total_stages else None
+        while True:
+            item = inbox.get()
+            if item is _STOP:
+                break
+            batch_index, symbols, upstream_ok = item
+            result: JobResult | None = None
+            if upstream_ok:
+                events.put(("start", stage_index, batch_index, None))
+                result = _run_batch_safely(
+                    stage,
+                    symbols,
+                    lambda event, b=batch_index: events.put(("progress", stage_index, b, event)),
+                )
+            events.put(("done", stage_index, batch_index, result))
+            if outbox is not None:
+                outbox.put((batch_index, symbols, result is not None and result.get("status") != "failed"))
+        with alive_lock:
+            alive[stage_index] -= 1
+            last = alive[stage_index] == 0
+        if last:
+            if outbox is not None:
+                for _ in range(workers[stage_index + 1]):
+                    outbox.put(_STOP)
+            events.put(("closed", stage_index, None, None))
+
+    def _feed() -> None:
+        for batch_index, symbols in enumerate(batches):
+            inboxes[0].put((batch_index, symbols, True))
+        for _ in range(workers[0]):
+            inboxes[0].put(_STOP)
+
+    threads = [threading.Thread(target=_feed, name="pipeline-feed", daemon=True)]
+    for stage_index, stage in enumerate(stages):
+        threads.extend(
+            threading.Thread(target=_stage_worker, args=(stage_index,), name=f"pipeline-{stage.name}-{n}", daemon=True)
+            for n in range(workers[stage_index])
+        )
+    for thread in threads:
+        thread.start()
+
+    state = [_StageProgress() for _ in stages]
+
+    def _emit_batch_progress(stage_index: int, extra: dict[str, Any] | None = None) -> None:
+        if progress_callback is None:
+            return
+        progress = state[stage_index]
+        processed = progress.done_symbols + sum(progress.inflight_symbols.values())
+        event = {
+            **(extra or {}),
+            "event": (extra or {}).get("event", "batch_progress"),
+            "stage": stages[stage_index].name,
+            "stage_index": stage_index + 1,
+            "total_stages": total_stages,
+            "processed_symbols": min(processed, total_symbols),
+            "total_symbols": total_symbols,
+            "batch_index": progress.completed_batches,
+            "total_batches": total_batches,
+            "rows_written": progress.rows_written + sum(progress.inflight_rows.values()),
+        }
+        progress_callback(event)
+
+    closed = 0
+    while closed < total_stages:
+        kind, stage_index, batch_index, payload = events.get()
+        progress = state[stage_index]
+        if kind == "start":
+            if not progress.started:
+                progress.started = True
+                progress.started_at = _now_str()
+                progress.first_start = perf_counter()
+                _emit_stage_progress(
+                    progress_callback,
+                    event="stage_start",
+                    stage=stages[stage_index].name,
+                    stage_index=stage_index + 1,
+                    total_stages=total_stages,
+                )
+        elif kind == "progress":
+            if not isinstance(payload, dict):
+                continue
+            if "processed_symbols" in payload:
+                progress.inflight_symbols[batch_index] = int(payload.get("processed_symbols") or 0)
+            if "rows_written" in payload:
+                progress.inflight_rows[batch_index] = int(payload.get("rows_written") or 0)
+            _emit_batch_progress(stage_index, payload)
+        elif kind == "done":
+            progress.inflight_symbols.pop(batch_index, None)
+            progress.inflight_rows.pop(batch_index, None)
+            progress.completed_batches += 1
+            progress.done_symbols += len(batches[batch_index])
+            results[stage_index][batch_index] = payload
+            if payload is not None:
+                progress.last_done = perf_counter()
+                progress.rows_written += int(payload.get("rows_written") or 0)
+                _emit_batch_progress(stage_index)
+        elif kind == "closed":
+            closed += 1
+            if progress.started:
+                _emit_stage_progress(
+                    progress_callback,
+                    event="stage_complete",
+                    stage=stages[stage_index].name,
+                    stage_index=stage_index + 1,
+                    total_stages=total_stages,
+                )
+
+    for thread in threads:
+        thread.join()
+    timings = [
+        {
+            "started_at": progress.started_at,
+            "duration_sec": (
+                progress.last_done - progress.first_start
+                if progress.first_start is not None and progress.last_done is not None
+                else 0.0
+            ),
+        }
+        for progress in state
+    ]
+    return results, timings
+
+
+def _merge_detail_values(values: list[Any], key: str) -> Any:
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    first = present[0]
+    if isinstance(first, list):
+        return [item for value in present if isinstance(value, list) for item in value]
+    if isinstance(first, bool):
+        return first
+    if isinstance(first, (int, float)):
+        return sum(value for value in present if isinstance(value, (int, float)) and not isinstance(value, bool))
+    if isinstance(first, dict):
+        merged: dict[str, Any] = {}
+        for value in present:
+            for inner_key, inner_value in (value or {}).items():
+                if isinstance(inner_value, (int, float)) and not isinstance(inner_value, bool):
+                    merged[inner_key] = round(merged.get(inner_key, 0) + inner_value, 6)
+                else:
+                    merged.setdefault(inner_key, inner_value)
+        return merged
+    if isinstance(first, str) and key.endswith("_payload"):
+        return ",".join(value for value in present if value)
+    return first
+
+
+def merge_batch_results(
+    job_name: str,
+    batch_results: list[JobResult | None],
+    batches: list[list[str]],
+    *,
+    started_at: str,
+    duration_sec: float,
+) -> JobResult | None:
+    """Fold per-batch JobResults of one stage into the stage's JobResult."""
+    ran = [(batch_index, result) for batch_index, result in enumerate(batch_results) if result is not None]
+    if not ran:
+        return None
+    skipped_symbols = [
+        symbol for batch_index, result in enumerate(batch_results) if result is None for symbol in batches[batch_index]
+    ]
+    statuses = [result.get("status") for _, result in ran]
+    failed_batches = [(batch_index, result) for batch_index, result in ran if result.get("status") == "failed"]
+    if len(failed_batches) == len(ran):
+        status = "failed"
+    elif failed_batches or skipped_symbols or "partial_success" in statuses:
+        status = "partial_success"
+    else:
+        status = "success"
+
+    message = f"{len(ran) - len(failed_batches)}/{len(ran)} batches completed."
+    if failed_batches:
+        message += f" First failed batch: {failed_batches[0][1].get('message') or ''}".rstrip()
+    if skipped_symbols:
+        message += f" Skipped after upstream failure: {len(skipped_symbols)} symbols."
+
+    detail_keys: list[str] = []
+    for _, result in ran:
+        for key in (result.get("details") or {}):
+            if key not in detail_keys:
+                detail_keys.append(key)
+    details = {
+        key: _merge_detail_values([(result.get("details") or {}).get(key) for _, result in ran], key)
+        for key in detail_keys
+    }
+    details["batch_count"] = len(batches)
+    details["skipped_symbols"] = skipped_symbols
+    details["batches"] = [
+        {
+            "batch_index": batch_index + 1,
+            "status": result.get("status"),
+            "symbols_requested": result.get("symbols_requested"),
+            "rows_written": result.get("rows_written"),
+            "duration_sec": result.get("duration_sec"),
+            "message": result.get("message"),
+        }
+        for batch_index, result in ran
+    ]
+
+    return _build_result(
+        job_name=job_name,
+        status=status,
+        started_at=started_at,
+        finished_at=_now_str(),
+        duration_sec=duration_sec,
+        rows_written=sum(int(result.get("rows_written") or 0) for _, result in ran),
+        symbols_requested=sum(int(result.get("symbols_requested") or 0) for _, result in ran),
+        symbols_processed=sum(int(result.get("symbols_processed") or 0) for _, result in ran),
+        failed_symbols=[symbol for _, result in ran for symbol in (result.get("failed_symbols") or [])],
+        message=message,
+        details=details,
+    )
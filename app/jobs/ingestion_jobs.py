@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import partial
 from time import perf_counter
 from app.jobs.ingestion.common import (
     JobResult,
@@ -15,6 +16,12 @@ from app.jobs.ingestion.common import (
     parse_symbols,
     split_valid_invalid_symbols,
 )
+from app.jobs.ingestion.pipeline import (
+    PipelineStage,
+    merge_batch_results,
+    run_staged_batches,
+    split_symbol_batches,
+)
 from app.jobs.inflation_policy_refresh import run_inflation_policy_raw_refresh
 from typing import Any, Callable, Iterable, Mapping
 
@@ -88,6 +95,8 @@ from finance.data.sec_delisting import collect_and_store_sec_form25_delistings
 from finance.data.symbol_directory import collect_and_store_symbol_directory_snapshots
 from finance.economic_cycle_pipeline import materialize_economic_cycle_snapshot
 
+CORE_MARKET_DATA_PIPELINE_BATCH_SIZE = 100
+
 
 def run_refresh_nyse_listing_universe(
     *,
@@ -985,7 +994,23 @@ def run_pipeline_core_market_data(
     interval: str = "1d",
     freq: str = "annual",
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    batch_size: int = CORE_MARKET_DATA_PIPELINE_BATCH_SIZE,
+    ohlcv_workers: int = 1,
+    fundamentals_workers: int = 2,
+    factors_workers: int = 2,
+    queue_size: int = 2,
 ) -> JobResult:
+    """
+    OHLCV -> fundamentals -> factors, pipelined per symbol batch.
+
+    Batches flow between stages over bounded queues, so fundamentals for batch 1
+    run while OHLCV fetches batch 2 and factors run once both inputs of a batch
+    have landed. Both Yahoo stages take a slot of the shared Yahoo provider gate
+    only around each request, so one stage's DB writes overlap the other's
+    fetches while total Yahoo concurrency stays bounded and an OHLCV rate-limit
+    cooldown also pauses fundamentals. A batch failed by one stage is not passed
+    to the next one.
+    """
     job_name = "pipeline_core_market_data"
     started_at = _now_str()
     t0 = perf_counter()
@@ -1007,78 +1032,65 @@ def run_pipeline_core_market_data(
             details={"steps": []},
         )
 
-    steps: list[JobResult] = []
-
-    if progress_callback is not None:
-        progress_callback(
-            {
-                "event": "stage_start",
-                "stage": "ohlcv",
-                "stage_index": 1,
-                "total_stages": 3,
-            }
-        )
-
-    ohlcv_result = run_collect_ohlcv(
-        parsed,
-        start=start,
-        end=end,
-        period=period,
-        interval=interval,
+    stages = [
+        PipelineStage(
+            name="ohlcv",
+            job_name="collect_ohlcv",
+            run_batch=lambda batch, batch_progress: run_collect_ohlcv(
+                batch,
+                start=start,
+                end=end,
+                period=period,
+                interval=interval,
+                progress_callback=batch_progress,
+            ),
+            max_workers=ohlcv_workers,
+        ),
+        PipelineStage(
+            name="fundamentals",
+            job_name="collect_fundamentals",
+            run_batch=lambda batch, _: run_collect_fundamentals(batch, freq=freq),
+            max_workers=fundamentals_workers,
+        ),
+        PipelineStage(
+            name="factors",
+            job_name="calculate_factors",
+            run_batch=lambda batch, _: run_calculate_factors(batch, freq=freq, start=start, end=end),
+            max_workers=factors_workers,
+        ),
+    ]
+    batches = split_symbol_batches(parsed, batch_size)
+    batch_results, stage_timings = run_staged_batches(
+        batches,
+        stages,
+        queue_size=queue_size,
         progress_callback=progress_callback,
     )
-    steps.append(ohlcv_result)
 
-    if progress_callback is not None:
-        progress_callback(
-            {
-                "event": "stage_complete",
-                "stage": "ohlcv",
-                "stage_index": 1,
-                "total_stages": 3,
-            }
-        )
-
-    if ohlcv_result["status"] == "failed":
-        finished_at = _now_str()
-        return _build_result(
-            job_name=job_name,
-            status="failed",
-            started_at=started_at,
-            finished_at=finished_at,
-            duration_sec=perf_counter() - t0,
-            rows_written=ohlcv_result.get("rows_written") or 0,
-            symbols_requested=len(parsed),
-            symbols_processed=0,
-            failed_symbols=invalid_symbols + (ohlcv_result.get("failed_symbols") or []),
-            message="Pipeline stopped because OHLCV collection failed.",
-            details={"steps": steps},
-        )
-
-    if progress_callback is not None:
-        progress_callback(
-            {
-                "event": "stage_start",
-                "stage": "fundamentals",
-                "stage_index": 2,
-                "total_stages": 3,
-            }
-        )
-
-    fundamentals_result = run_collect_fundamentals(parsed, freq=freq)
-    steps.append(fundamentals_result)
-
-    if progress_callback is not None:
-        progress_callback(
-            {
-                "event": "stage_complete",
-                "stage": "fundamentals",
-                "stage_index": 2,
-                "total_stages": 3,
-            }
-        )
+    steps: list[JobResult] = []
+    for stage, results, timing in zip(stages, batch_results, stage_timings):
+        merged = merge_batch_results(
+            stage.job_name,
+            results,
+            batches,
+            started_at=timing["started_at"] or started_at,
+            duration_sec=timing["duration_sec"],
+        )
+        if merged is not None:
+            steps.append(merged)
+
+    pipeline_details = {
+        "batch_size": max(int(batch_size or 1), 1),
+        "batch_count": len(batches),
+        "queue_size": queue_size,
+        "stage_workers": {stage.name: stage.max_workers for stage in stages},
+        "stage_timings": {stage.name: timing for stage, timing in zip(stages, stage_timings)},
+    }
+    total_rows = sum((step.get("rows_written") or 0) for step in steps)
 
-    if fundamentals_result["status"] == "failed":
+    stopped_stage = next((step for step in steps if step["status"] == "failed"), None)
+    if stopped_stage is not None and stopped_stage["job_name"] in {"collect_ohlcv", "collect_fundamentals"}:
+        is_ohlcv = stopped_stage["job_name"] == "collect_ohlcv"
         finished_at = _now_str()
         return _build_result(
             job_name=job_name,
@@ -1086,52 +1098,20 @@ def run_pipeline_core_market_data(
             started_at=started_at,
             finished_at=finished_at,
             duration_sec=perf_counter() - t0,
-            rows_written=(ohlcv_result.get("rows_written") or 0) + (fundamentals_result.get("rows_written") or 0),
+            rows_written=total_rows,
             symbols_requested=len(parsed),
-            symbols_processed=len(parsed),
-            failed_symbols=invalid_symbols + (fundamentals_result.get("failed_symbols") or []),
-            message="Pipeline stopped because fundamentals ingestion failed.",
-            details={"steps": steps},
-        )
-
-    if progress_callback is not None:
-        progress_callback(
-            {
-                "event": "stage_start",
-                "stage": "factors",
-                "stage_index": 3,
-                "total_stages": 3,
-            }
-        )
-
-    factors_result = run_calculate_factors(
-        parsed,
-        freq=freq,
-        start=start,
-        end=end,
-    )
-    steps.append(factors_result)
-
-    if progress_callback is not None:
-        progress_callback(
-            {
-                "event": "stage_complete",
-                "stage": "factors",
-                "stage_index": 3,
-                "total_stages": 3,
-            }
+            symbols_processed=0 if is_ohlcv else len(parsed),
+            failed_symbols=invalid_symbols + (stopped_stage.get("failed_symbols") or []),
+            message=(
+                "Pipeline stopped because OHLCV collection failed."
+                if is_ohlcv
+                else "Pipeline stopped because fundamentals ingestion failed."
+            ),
+            details={"steps": steps, "pipeline": pipeline_details},
         )
 
-    statuses = [step["status"] for step in steps]
-    if any(status == "failed" for status in statuses):
-        status = "failed"
-    elif any(status == "partial_success" for status in statuses):
-        status = "partial_success"
-    else:
-        status = "success"
-
+    status = _pipeline_status(steps)
     finished_at = _now_str()
-    total_rows = sum((step.get("rows_written") or 0) for step in steps)
 
     return _build_result(
         job_name=job_name,
@@ -1151,6 +1131,7 @@ def run_pipeline_core_market_data(
             "freq": freq,
             "start": start,
             "end": end,
+            "pipeline": pipeline_details,
         },
     )
 
@@ -1463,6 +1444,52 @@ def attach_futures_macro_materialization(
     return output
 
 
+def run_warm_futures_macro_pattern_outlook_cache(
+    *,
+    warm_fn: Callable[[], dict[str, Any]] | None = None,
+    max_workers: int = 1,
+) -> JobResult:
+    """
+    Finish the Futures Macro pattern outlook into the shared disk cache.
+
+    `max_workers` bounds the nested-validation process pool; pass more than 1
+    only when no other thread in this process is doing DB or network work.
+    """
+    job_name = "warm_futures_macro_pattern_outlook_cache"
+    started_at = _now_str()
+    t0 = perf_counter()
+    if warm_fn is None:
+        from app.services.futures_macro_pattern_validation import (
+            warm_overview_futures_macro_pattern_outlook_cache,
+        )
+
+        warm_fn = partial(warm_overview_futures_macro_pattern_outlook_cache, max_workers=max_workers)
+    try:
+        summary = dict(warm_fn())
+    except Exception as exc:
+        return _build_result(
+            job_name=job_name,
+            status="failed",
+            started_at=started_at,
+            finished_at=_now_str(),
+            duration_sec=perf_counter() - t0,
+            rows_written=0,
+            message=f"Futures Macro pattern outlook warm-up failed: {exc}",
+        )
+    cache_status = str(summary.get("status") or "")
+    status = "success" if cache_status in {"hit", "stored", "disabled"} else "partial_success"
+    return _build_result(
+        job_name=job_name,
+        status=status,
+        started_at=started_at,
+        finished_at=_now_str(),
+        duration_sec=perf_counter() - t0,
+        rows_written=1 if cache_status == "stored" else 0,
+        message=f"Futures Macro pattern outlook cache: {cache_status or 'unknown'}.",
+        details=summary,
+    )
+
+
 def run_collect_fomc_calendar(
     *,
     years: Iterable[int] | None = None,
@@ -2380,6 +2407,7 @@ def run_collect_asset_profiles(
     kinds: tuple[str, ...] = ("stock", "etf"),
     symbols: Iterable[str] | None = None,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    summary_materializer: Callable[..., dict[str, Any]] | None = None,
 ) -> JobResult:
     job_name = "collect_asset_profiles"
     started_at = _now_str()
@@ -2403,6 +2431,8 @@ def run_collect_asset_profiles(
             symbols=selected_symbols,
         )
         _emit_stage_progress(progress_callback, event="stage_complete", stage="asset_profiles")
+        # 13F summaries freeze profile sectors; refresh the ones whose sectors moved.
+        summary_materialization = _materialize_13f_summaries(summary_materializer)
         finished_at = _now_str()
         failure_count = len(failed_rows)
         status = "partial_success" if failure_count > 0 else "success"
@@ -2425,6 +2455,7 @@ def run_collect_asset_profiles(
                 "kinds": list(kinds),
                 "symbols": selected_symbols,
                 "failure_count": failure_count,
+                "summary_materialization": summary_materialization,
             },
         )
     except Exception as exc:
@@ -2706,6 +2737,21 @@ def run_collect_sec_form25_delistings(
         )
 
 
+def _materialize_13f_summaries(
+    materializer: Callable[..., dict[str, Any]] | None = None,
+    **scope: Any,
+) -> dict[str, Any]:
+    """Refresh 13F read-side summaries; a failure leaves readers on the live holdings path."""
+    if materializer is None:
+        from app.services.institutional_portfolios import materialize_institutional_13f_summaries
+
+        materializer = materialize_institutional_13f_summaries
+    try:
+        return {"status": "ok", **materializer(**scope)}
+    except Exception as exc:
+        return {"status": "failed", "error": str(exc)}
+
+
 def run_collect_sec_13f_dataset(
     *,
     dataset_url: str | None = None,
@@ -2753,9 +2799,14 @@ def run_collect_sec_13f_dataset(
             user_agent=user_agent,
             request_timeout=float(request_timeout),
             request_sleep=float(request_sleep),
+            streaming=True,
         )
         _emit_stage_progress(progress_callback, event="stage_complete", stage="sec_13f_dataset")
         rows_written = int(summary.get("rows_written") or 0)
+        if rows_written > 0:
+            summary["summary_materialization"] = _materialize_13f_summaries(
+                source_dataset=summary.get("source_dataset"),
+            )
         holdings_written = int(summary.get("holdings_written") or 0)
         if rows_written <= 0:
             status = "failed"
@@ -2815,6 +2866,7 @@ def run_refresh_institutional_13f_hybrid(
     bulk_collector: Callable[..., dict[str, Any]] = collect_and_store_sec_13f_dataset,
     watchlist_collector: Callable[..., dict[str, Any]] = collect_and_store_sec_13f_watchlist,
     refresh_status_loader: Callable[[], dict[str, Any] | None] | None = None,
+    summary_materializer: Callable[..., dict[str, Any]] | None = None,
 ) -> JobResult:
     """Refresh one due 13F quarter via official bulk data or curated EDGAR fallback."""
 
@@ -2879,6 +2931,11 @@ def run_refresh_institutional_13f_hybrid(
                 rows_written = int(summary.get("rows_written") or 0)
                 status = "success" if rows_written > 0 else "no_update"
                 processed = int(summary.get("managers_written") or summary.get("holdings_written") or 0)
+                if rows_written > 0:
+                    summary["summary_materialization"] = _materialize_13f_summaries(
+                        summary_materializer,
+                        source_dataset=str(summary.get("source_dataset") or candidate.get("dataset_label")),
+                    )
         else:
             summary = watchlist_collector(
                 ciks=requested_ciks,
@@ -2900,6 +2957,11 @@ def run_refresh_institutional_13f_hybrid(
                 status = "success"
             else:
                 status = "no_update"
+            if updated:
+                summary["summary_materialization"] = _materialize_13f_summaries(
+                    summary_materializer,
+                    ciks=requested_ciks,
+                )
         _emit_stage_progress(
             progress_callback,
             event="stage_complete",
@@ -2981,6 +3043,10 @@ def run_collect_sec_13f_identifier_mappings(
         ambiguous = int(summary.get("ambiguous") or 0)
         mapped = int(summary.get("mapped") or 0)
         status = "failed" if errors and not mapped else ("partial_success" if errors or ambiguous else "success")
+        if int(summary.get("rows_written") or 0) > 0:
+            # A resolved CUSIP changes every manager holding it, not only the
+            # watchlist, so refresh whichever stored summaries now drift.
+            summary["summary_materialization"] = _materialize_13f_summaries()
         return _build_result(
             job_name=job_name,
             status=status,
@@ -0,0 +1,412 @@
+"""Structured per-job and per-stage timing telemetry for ingestion runs.
+
+Every run-history record is also flattened into a SQLite table next to the
+JSONL history: one `job_run` row (duration, throughput, execution profile
+settings, cooldowns) and one `job_stage` row per measured stage. The JSONL
+file stays the audit log; the tables exist so ETA fits and throughput
+distributions can query recent runs of one job without reparsing it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from app.workspace_paths import RUN_HISTORY_DIR
+
+TELEMETRY_DB = RUN_HISTORY_DIR / "JOB_TELEMETRY.sqlite"
+TELEMETRY_SCHEMA_VERSION = 1
+ETA_MIN_FIT_RUNS = 3
+ETA_FIT_LIMIT = 200
+ACCEPTED_TELEMETRY_STATUSES = ("success", "partial_success")
+_SLEEP_STAGES = ("retry_sleep_sec", "cooldown_sleep_sec", "inter_batch_sleep_sec")
+_RUN_COLUMNS = (
+    "run_id",
+    "job_name",
+    "status",
+    "started_at",
+    "finished_at",
+    "duration_sec",
+    "rows_written",
+    "symbols_requested",
+    "symbols_processed",
+    "rows_per_sec",
+    "symbols_per_sec",
+    "execution_profile",
+    "execution_mode",
+    "chunk_size",
+    "max_workers",
+    "batch_count",
+    "cooldown_count",
+    "cooldown_sec",
+    "sleep_sec",
+)
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS job_run (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id TEXT NOT NULL UNIQUE,
+        job_name TEXT NOT NULL,
+        status TEXT,
+        started_at TEXT,
+        finished_at TEXT,
+        duration_sec REAL,
+        rows_written INTEGER,
+        symbols_requested INTEGER,
+        symbols_processed INTEGER,
+        rows_per_sec REAL,
+        symbols_per_sec REAL,
+        execution_profile TEXT,
+        execution_mode TEXT,
+        chunk_size INTEGER,
+        max_workers INTEGER,
+        batch_count INTEGER,
+        cooldown_count INTEGER,
+        cooldown_sec REAL,
+        sleep_sec REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS job_run_by_name ON job_run (job_name, seq)",
+    """
+    CREATE TABLE IF NOT EXISTS job_stage (
+        run_id TEXT NOT NULL,
+        stage TEXT NOT NULL,
+        seconds REAL NOT NULL,
+        PRIMARY KEY (run_id, stage)
+    )
+    """,
+    f"PRAGMA user_version = {TELEMETRY_SCHEMA_VERSION}",
+)
+
+
+def _float_or_none(value: Any) -> float | None:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _int_or_none(value: Any) -> int | None:
+    number = _float_or_none(value)
+    return int(number) if number is not None else None
+
+
+def _per_second(amount: int | None, duration_sec: float | None) -> float | None:
+    if amount is None or not duration_sec or duration_sec <= 0:
+        return None
+    return round(amount / duration_sec, 6)
+
+
+def _breakdown_stages(breakdown: dict[str, Any], *, prefix: str = "") -> dict[str, float]:
+    stages: dict[str, float] = {}
+    for key, value in breakdown.items():
+        if not str(key).endswith("_sec") or str(key).startswith("avg_"):
+            continue
+        seconds = _float_or_none(value)
+        if seconds is not None:
+            stages[f"{prefix}{key}"] = seconds
+    return stages
+
+
+def build_telemetry_rows(result: dict[str, Any]) -> tuple[dict[str, Any], dict[str, float]]:
+    """Flatten one job result into a `job_run` row and its stage timings.
+
+    Stages come from the writer's `timing_breakdown` (fetch, delete, upsert,
+    sleeps, ...) and, for pipelines, from each step's duration and breakdown
+    under `<step job_name>` / `<step job_name>.<stage>`.
+    """
+
+    details = dict(result.get("details") or {})
+    metadata = dict(result.get("run_metadata") or {})
+    steps = [dict(step) for step in details.get("steps") or [] if isinstance(step, dict)]
+    breakdown = dict(details.get("timing_breakdown") or {})
+    stages = _breakdown_stages(breakdown)
+    settings = dict(details.get("write_settings") or {})
+    profile = details.get("execution_profile")
+    cooldown_events = list(details.get("cooldown_events") or [])
+    for step in steps:
+        step_name = str(step.get("job_name") or "step")
+        step_details = dict(step.get("details") or {})
+        step_duration = _float_or_none(step.get("duration_sec"))
+        if step_duration is not None:
+            stages[step_name] = step_duration
+        step_breakdown = dict(step_details.get("timing_breakdown") or {})
+        stages.update(_breakdown_stages(step_breakdown, prefix=f"{step_name}."))
+        if not breakdown and step_breakdown:
+            breakdown = step_breakdown
+        if not settings and step_details.get("write_settings"):
+            settings = dict(step_details["write_settings"])
+            profile = profile or step_details.get("execution_profile")
+        cooldown_events.extend(step_details.get("cooldown_events") or [])
+
+    duration_sec = _float_or_none(result.get("duration_sec"))
+    rows_written = _int_or_none(result.get("rows_written"))
+    symbols_requested = _int_or_none(result.get("symbols_requested"))
+    symbols_processed = _int_or_none(result.get("symbols_processed"))
+    identity = "|".join(
+        str(result.get(field) or "")
+        for field in ("job_name", "started_at", "finished_at", "duration_sec", "rows_written")
+    )
+    run = {
+        "run_id": hashlib.sha1(identity.encode("utf-8")).hexdigest(),
+        "job_name": str(result.get("job_name") or ""),
+        "status": str(result.get("status") or ""),
+        "started_at": result.get("started_at"),
+        "finished_at": result.get("finished_at"),
+        "duration_sec": duration_sec,
+        "rows_written": rows_written,
+        "symbols_requested": symbols_requested,
+        "symbols_processed": symbols_processed,
+        "rows_per_sec": _per_second(rows_written, duration_sec),
+        "symbols_per_sec": _per_second(symbols_processed, duration_sec),
+        "execution_profile": profile or (metadata.get("input_params") or {}).get("execution_profile"),
+        "execution_mode": metadata.get("execution_mode"),
+        "chunk_size": _int_or_none(settings.get("chunk_size")),
+        "max_workers": _int_or_none(settings.get("max_workers")),
+        "batch_count": _int_or_none(breakdown.get("batch_count")),
+        "cooldown_count": len(cooldown_events),
+        "cooldown_sec": _float_or_none(breakdown.get("cooldown_sleep_sec")),
+        "sleep_sec": round(sum(_float_or_none(breakdown.get(key)) or 0.0 for key in _SLEEP_STAGES), 3),
+    }
+    return run, stages
+
+
+class JobTelemetryStore:
+    """SQLite tables of job runs and stage timings (`JOB_TELEMETRY.sqlite`)."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = Path(path or TELEMETRY_DB)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=5.0)) as conn:
+            conn.row_factory = sqlite3.Row
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            yield conn
+
+    def record(self, result: dict[str, Any]) -> str | None:
+        run, stages = build_telemetry_rows(result)
+        if not run["job_name"]:
+            return None
+        placeholders = ", ".join("?" for _ in _RUN_COLUMNS)
+        with self._connect() as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO job_run ({', '.join(_RUN_COLUMNS)}) VALUES ({placeholders})",
+                [run[column] for column in _RUN_COLUMNS],
+            )
+            conn.execute("DELETE FROM job_stage WHERE run_id = ?", (run["run_id"],))
+            conn.executemany(
+                "INSERT INTO job_stage (run_id, stage, seconds) VALUES (?, ?, ?)",
+                [(run["run_id"], stage, seconds) for stage, seconds in stages.items()],
+            )
+        return str(run["run_id"])
+
+    def load_runs(
+        self,
+        job_name: str,
+        *,
+        limit: int = ETA_FIT_LIMIT,
+        statuses: Sequence[str] | None = ACCEPTED_TELEMETRY_STATUSES,
+    ) -> list[dict[str, Any]]:
+        """Newest-first runs of one job, each with its `stages` mapping."""
+        if not self.path.exists():
+            return []
+        where, params = "WHERE job_name = ?", [job_name]
+        if statuses:
+            where += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(statuses)
+        with self._connect() as conn:
+            runs = [
+                dict(row)
+                for row in conn.execute(
+                    f"SELECT {', '.join(_RUN_COLUMNS)} FROM job_run {where} ORDER BY seq DESC LIMIT ?",
+                    [*params, max(int(limit), 0)],
+                )
+            ]
+            stages: dict[str, dict[str, float]] = {run["run_id"]: {} for run in runs}
+            if runs:
+                ids = list(stages)
+                for row in conn.execute(
+                    f"SELECT run_id, stage, seconds FROM job_stage WHERE run_id IN ({', '.join('?' for _ in ids)})",
+                    ids,
+                ):
+                    stages[row["run_id"]][row["stage"]] = float(row["seconds"])
+        for run in runs:
+            run["stages"] = stages[run["run_id"]]
+        return runs
+
+
+def record_job_telemetry(result: dict[str, Any], *, store: JobTelemetryStore | None = None) -> str | None:
+    """Best-effort telemetry write; history appends must not fail because of it.
+
+    Payloads come from every job's details, so malformed shapes (TypeError,
+    ValueError from flattening) are swallowed along with storage errors.
+    """
+    try:
+        return (store or JobTelemetryStore()).record(result)
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class EtaModel:
+    """
+    Least-squares duration model fitted on one job's recent runs.
+
+    Active time is `intercept + per_symbol_sec * symbols / max_workers +
+    per_batch_sec * ceil(symbols / chunk_size)`; rate-limit cooldowns are
+    added as the historical cooldown seconds per symbol. `low_ratio` and
+    `high_ratio` are the 10th/90th percentiles of actual/fitted duration.
+    """
+
+    intercept_sec: float
+    per_symbol_sec: float
+    per_batch_sec: float
+    cooldown_sec_per_symbol: float
+    low_ratio: float
+    high_ratio: float
+    sample_count: int
+    default_chunk_size: int
+    default_max_workers: int
+
+    def predict(
+        self,
+        symbol_count: int,
+        *,
+        chunk_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> float:
+        symbols = max(int(symbol_count), 0)
+        workers = max(int(max_workers or self.default_max_workers), 1)
+        batches = math.ceil(symbols / max(int(chunk_size or self.default_chunk_size), 1))
+        active = self.intercept_sec + self.per_symbol_sec * symbols / workers + self.per_batch_sec * batches
+        return max(active, 0.0) + self.cooldown_sec_per_symbol * symbols
+
+
+def _eta_features(symbols: float, chunk_size: float, max_workers: float) -> list[float]:
+    return [1.0, symbols / max(max_workers, 1.0), float(math.ceil(symbols / max(chunk_size, 1.0)))]
+
+
+def _nonnegative_lstsq(features: np.ndarray, target: np.ndarray) -> np.ndarray:
+    # A negative term would drag extrapolated ETAs below zero; drop it and refit.
+    active = list(range(features.shape[1]))
+    coefficients = np.zeros(features.shape[1])
+    while active:
+        solution, *_ = np.linalg.lstsq(features[:, active], target, rcond=None)
+        if (solution >= 0).all():
+            coefficients[active] = solution
+            break
+        active.pop(int(np.argmin(solution)))
+    return coefficients
+
+
+def fit_eta_model(runs: Sequence[dict[str, Any]]) -> EtaModel | None:
+    usable = [
+        run
+        for run in runs
+        if (run.get("symbols_requested") or 0) > 0 and (run.get("duration_sec") or 0) > 0
+    ]
+    if len(usable) < ETA_MIN_FIT_RUNS:
+        return None
+    symbols = np.array([float(run["symbols_requested"]) for run in usable])
+    chunk_sizes = np.array([float(run.get("chunk_size") or run["symbols_requested"]) for run in usable])
+    workers = np.array([float(run.get("max_workers") or 1) for run in usable])
+    cooldown = np.array([float(run.get("cooldown_sec") or 0.0) for run in usable])
+    duration = np.array([float(run["duration_sec"]) for run in usable])
+    features = np.array([_eta_features(*row) for row in zip(symbols, chunk_sizes, workers)])
+    intercept, per_symbol, per_batch = _nonnegative_lstsq(features, np.maximum(duration - cooldown, 0.0))
+    model = EtaModel(
+        intercept_sec=float(intercept),
+        per_symbol_sec=float(per_symbol),
+        per_batch_sec=float(per_batch),
+        cooldown_sec_per_symbol=float(cooldown.sum() / symbols.sum()),
+        low_ratio=1.0,
+        high_ratio=1.0,
+        sample_count=len(usable),
+        default_chunk_size=int(np.median(chunk_sizes)),
+        default_max_workers=int(np.median(workers)),
+    )
+    fitted = np.array(
+        [
+            model.predict(int(count), chunk_size=int(chunk), max_workers=int(worker))
+            for count, chunk, worker in zip(symbols, chunk_sizes, workers)
+        ]
+    )
+    ratios = duration[fitted > 0] / fitted[fitted > 0]
+    if ratios.size == 0:
+        return None
+    return replace(
+        model,
+        low_ratio=float(min(np.quantile(ratios, 0.1), 1.0)),
+        high_ratio=float(max(np.quantile(ratios, 0.9), 1.0)),
+    )
+
+
+def _quantiles(values: Sequence[float]) -> dict[str, float] | None:
+    clean = np.array([value for value in values if value is not None and value > 0], dtype=float)
+    if clean.size == 0:
+        return None
+    p10, p50, p90 = np.quantile(clean, [0.1, 0.5, 0.9])
+    return {"p10": round(float(p10), 3), "p50": round(float(p50), 3), "p90": round(float(p90), 3)}
+
+
+def summarize_throughput(runs: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Historical rows/sec and symbols/sec percentiles plus median stage shares."""
+    shares: dict[str, list[float]] = {}
+    for run in runs:
+        duration = run.get("duration_sec") or 0
+        if duration <= 0:
+            continue
+        for stage, seconds in dict(run.get("stages") or {}).items():
+            if "." not in stage:
+                shares.setdefault(stage, []).append(seconds / duration)
+    return {
+        "sample_count": len(runs),
+        "rows_per_sec": _quantiles([run.get("rows_per_sec") for run in runs]),
+        "symbols_per_sec": _quantiles([run.get("symbols_per_sec") for run in runs]),
+        "stage_share": {stage: round(float(np.median(values)), 4) for stage, values in sorted(shares.items())},
+    }
+
+
+def load_job_telemetry(
+    job_name: str,
+    *,
+    limit: int = ETA_FIT_LIMIT,
+    store: JobTelemetryStore | None = None,
+) -> list[dict[str, Any]]:
+    """Best-effort read of recent accepted runs; an unreadable store reads as empty."""
+    try:
+        return (store or JobTelemetryStore()).load_runs(job_name, limit=limit)
+    except (sqlite3.Error, OSError):
+        return []
+
+
+def load_throughput_distribution(
+    job_name: str,
+    *,
+    limit: int = ETA_FIT_LIMIT,
+    store: JobTelemetryStore | None = None,
+) -> dict[str, Any]:
+    return summarize_throughput(load_job_telemetry(job_name, limit=limit, store=store))
+
+
+def throughput_position(value: float | None, distribution: dict[str, float] | None) -> str | None:
+    """Place a live rate against historical percentiles: slow / typical / fast."""
+    if value is None or not distribution:
+        return None
+    if value < distribution["p10"]:
+        return "slow"
+    if value > distribution["p90"]:
+        return "fast"
+    return "typical"
@@ -3,11 +3,13 @@ from __future__ import annotations
 import argparse
 import json
 import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Callable, Iterable, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 from zoneinfo import ZoneInfo
 
 from app.jobs.ingestion_jobs import (
@@ -23,6 +25,7 @@ from app.jobs.ingestion_jobs import (
     run_collect_sp500_universe,
     run_collect_symbol_directory_snapshots,
     run_collect_overview_earnings_calendar,
+    run_warm_futures_macro_pattern_outlook_cache,
 )
 from app.jobs.economic_cycle_refresh import run_economic_cycle_intramonth_refresh
 from app.jobs.economic_cycle_asset_refresh import (
@@ -36,6 +39,21 @@ US_MARKET_TZ = ZoneInfo("America/New_York")
 LOCK_FILE = RUN_ARTIFACT_DIR / "locks" / "overview_automation.lock"
 LOCK_STALE_AFTER_MINUTES = 90
 ACCEPTED_CADENCE_STATUSES = {"success", "partial_success"}
+DEFAULT_AUTOMATION_MAX_WORKERS = 4
+# Jobs sharing a resource class run at most this many at a time. Provider hosts
+# ("provider:<host>") keep one request stream each. Every job that pulls Yahoo
+# prices also bulk-writes price or intraday snapshot rows, so the Yahoo class
+# doubles as the DB write-heavy class and those writers never overlap.
+RESOURCE_CPU = "cpu"
+RESOURCE_PROVIDER = "provider"
+RESOURCE_YAHOO = "provider:yahoo"
+RESOURCE_CLASS_LIMITS: dict[str, int] = {RESOURCE_CPU: 1}
+DEFAULT_RESOURCE_CLASS_LIMIT = 1
+# Classes that run alone: they start only after in-flight jobs drain and block
+# new starts until they finish. CPU jobs fork process pools, which must not
+# happen while sibling threads hold DB, pool, or HTTP locks.
+EXCLUSIVE_RESOURCE_CLASSES = frozenset({RESOURCE_CPU})
+CPU_JOB_MAX_PROCESSES = 4
 
 
 @dataclass(frozen=True)
@@ -49,6 +67,10 @@ class ScheduledJobSpec:
     runner: Callable[[datetime], JobResult]
     description: str
     weekdays_only: bool = False
+    # Ordering only: a due dependency finishes (in any status) before this job
+    # starts. Dependencies that are not due in the same run are ignored.
+    depends_on: tuple[str, ...] = ()
+    resource_class: str = RESOURCE_PROVIDER
 
 
 def _now_str(value: datetime | None = None) -> str:
@@ -113,6 +135,12 @@ def _run_economic_cycle_asset_pathways(_: datetime) -> JobResult:
     return run_economic_cycle_asset_pathway_refresh()
 
 
+def _run_futures_macro_pattern_outlook(_: datetime) -> JobResult:
+    return run_warm_futures_macro_pattern_outlook_cache(
+        max_workers=min(os.cpu_count() or 1, CPU_JOB_MAX_PROCESSES)
+    )
+
+
 def _run_inflation_policy_raw(value: datetime) -> JobResult:
     return run_collect_inflation_policy_raw_context(as_of_at=value.isoformat())
 
@@ -181,6 +209,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_sp500_universe,
         description="Refresh current S&P 500 membership for Overview market intelligence.",
+        resource_class="provider:wikipedia",
     ),
     ScheduledJobSpec(
         job_id="nasdaq_symbol_directory",
@@ -191,6 +220,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_nasdaq_symbol_directory,
         description="Refresh Nasdaq-listed current Symbol Directory snapshot for Overview coverage.",
+        resource_class="provider:nasdaqtrader",
     ),
     ScheduledJobSpec(
         job_id="economic_cycle_intramonth",
@@ -205,6 +235,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
             "economic-cycle nowcast without changing prior month-end rows."
         ),
         weekdays_only=True,
+        resource_class="provider:fred",
     ),
     ScheduledJobSpec(
         job_id="economic_cycle_asset_pathways",
@@ -219,6 +250,23 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
             "by Economic Cycle asset pathways."
         ),
         weekdays_only=True,
+        resource_class=RESOURCE_YAHOO,
+    ),
+    ScheduledJobSpec(
+        job_id="futures_macro_pattern_outlook",
+        job_name="warm_futures_macro_pattern_outlook_cache",
+        label="Futures Macro Pattern Outlook",
+        cadence_minutes=24 * 60,
+        profiles=("safe", "standard", "broad"),
+        market_hours_only=False,
+        runner=_run_futures_macro_pattern_outlook,
+        description=(
+            "Finish the nested-validation pattern outlook for the current "
+            "final daily futures inputs into the shared disk cache."
+        ),
+        weekdays_only=True,
+        depends_on=("economic_cycle_asset_pathways",),
+        resource_class=RESOURCE_CPU,
     ),
     ScheduledJobSpec(
         job_id="inflation_policy_raw",
@@ -233,6 +281,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
             "term-premium inputs without materializing a forecast."
         ),
         weekdays_only=True,
+        resource_class="provider:fred",
     ),
     ScheduledJobSpec(
         job_id="sp500_intraday",
@@ -243,6 +292,8 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=True,
         runner=_run_intraday_snapshot("SP500", 500, fallback_to_yfinance=True),
         description="Collect S&P 500 quote-fast daily movers snapshot during US market hours.",
+        depends_on=("sp500_universe",),
+        resource_class=RESOURCE_YAHOO,
     ),
     ScheduledJobSpec(
         job_id="market_sentiment",
@@ -253,6 +304,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_market_sentiment,
         description="Capture daily CNN and AAII source views for Overview Sentiment.",
+        resource_class="provider:cnn_aaii",
     ),
     ScheduledJobSpec(
         job_id="top1000_intraday",
@@ -263,6 +315,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=True,
         runner=_run_intraday_snapshot("TOP1000", 1000, fallback_to_yfinance=False),
         description="Collect Top1000 quote-fast daily movers snapshot during US market hours.",
+        resource_class=RESOURCE_YAHOO,
     ),
     ScheduledJobSpec(
         job_id="top2000_intraday",
@@ -273,6 +326,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=True,
         runner=_run_intraday_snapshot("TOP2000", 2000, fallback_to_yfinance=False),
         description="Collect Top2000 quote-fast daily movers snapshot during US market hours.",
+        resource_class=RESOURCE_YAHOO,
     ),
     ScheduledJobSpec(
         job_id="nasdaq_intraday",
@@ -283,6 +337,8 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=True,
         runner=_run_intraday_snapshot("NASDAQ", 5000, fallback_to_yfinance=False),
         description="Collect Nasdaq-listed quote-fast daily movers snapshot during US market hours.",
+        depends_on=("nasdaq_symbol_directory",),
+        resource_class=RESOURCE_YAHOO,
     ),
     ScheduledJobSpec(
         job_id="sp500_valuation",
@@ -293,6 +349,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_sp500_valuation,
         description="Discover the newest SEP vintage and refresh Shiller plus SPX/SPY valuation inputs.",
+        resource_class=RESOURCE_YAHOO,
     ),
     ScheduledJobSpec(
         job_id="nasdaq100_valuation",
@@ -303,6 +360,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_nasdaq100_valuation,
         description="Refresh official QQQ holdings, QQQ EOD, and the 95%-gated monthly proxy.",
+        resource_class=RESOURCE_YAHOO,
     ),
     ScheduledJobSpec(
         job_id="fomc_calendar",
@@ -313,6 +371,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_fomc_calendar,
         description="Refresh FOMC event rows from the official Federal Reserve calendar.",
+        resource_class="provider:federalreserve",
     ),
     ScheduledJobSpec(
         job_id="macro_calendar",
@@ -323,6 +382,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         market_hours_only=False,
         runner=_run_macro_calendar,
         description="Refresh official BLS / BEA macro release calendar rows.",
+        resource_class="provider:bls_bea",
     ),
     ScheduledJobSpec(
         job_id="market_structure_calendar",
@@ -335,6 +395,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         description=(
             "Refresh current and next-year US market holidays and early closes."
         ),
+        resource_class="provider:nasdaqtrader",
     ),
     ScheduledJobSpec(
         job_id="earnings_calendar",
@@ -347,6 +408,7 @@ OVERVIEW_AUTOMATION_JOB_SPECS: tuple[ScheduledJobSpec, ...] = (
         description=(
             "Refresh daily priority earnings plus the next S&P 500 coverage shard."
         ),
+        resource_class="provider:nasdaq",
     ),
 )
 
@@ -439,6 +501,8 @@ def build_overview_automation_plan(
                 "should_run": should_run,
                 "reason": reason,
                 "description": spec.description,
+                "depends_on": list(spec.depends_on),
+                "resource_class": spec.resource_class,
             }
         )
     return rows
@@ -556,6 +620,126 @@ def _overall_status(results: Sequence[JobResult], *, skipped: bool = False) -> s
     return "failed"
 
 
+def _failed_runner_result(spec: ScheduledJobSpec, *, started_at: str, exc: Exception) -> JobResult:
+    return {
+        "job_name": spec.job_name,
+        "status": "failed",
+        "started_at": started_at,
+        "finished_at": _now_str(),
+        "duration_sec": 0,
+        "rows_written": 0,
+        "symbols_requested": None,
+        "symbols_processed": None,
+        "failed_symbols": [],
+        "message": f"Overview automation job failed: {exc}",
+        "details": {"automation_job_id": spec.job_id},
+    }
+
+
+def _run_spec(spec: ScheduledJobSpec, now_value: datetime, started_at: str) -> JobResult:
+    try:
+        return spec.runner(now_value)
+    except Exception as exc:
+        return _failed_runner_result(spec, started_at=started_at, exc=exc)
+
+
+def _dependency_order(specs: Sequence[ScheduledJobSpec]) -> list[ScheduledJobSpec]:
+    """Stable topological order: plan order, except dependencies come first."""
+
+    due_ids = {spec.job_id for spec in specs}
+    placed: set[str] = set()
+    ordered: list[ScheduledJobSpec] = []
+    remaining = list(specs)
+    while remaining:
+        ready = next(
+            (
+                spec
+                for spec in remaining
+                if all(dep in placed or dep not in due_ids or dep == spec.job_id for dep in spec.depends_on)
+            ),
+            None,
+        )
+        if ready is None:
+            cycle = ", ".join(spec.job_id for spec in remaining)
+            raise ValueError(f"Overview automation job dependencies form a cycle: {cycle}")
+        remaining.remove(ready)
+        placed.add(ready.job_id)
+        ordered.append(ready)
+    return ordered
+
+
+def _execute_due_specs(
+    specs: Sequence[ScheduledJobSpec],
+    *,
+    now_value: datetime,
+    started_at: str,
+    max_workers: int,
+    resource_limits: Mapping[str, int],
+    on_result: Callable[[ScheduledJobSpec, JobResult], None],
+) -> None:
+    """
+    Run dependency-ordered specs on a thread pool within per-class limits.
+
+    A spec starts once its due dependencies have finished, a worker is free,
+    and its resource class is below its limit. A spec in an exclusive class
+    waits for in-flight jobs to drain, holds back specs after it while it
+    waits, and runs alone. Results are handed to `on_result` in the order of
+    `specs`, regardless of completion order.
+    """
+    due_ids = {spec.job_id for spec in specs}
+    pending = list(range(len(specs)))
+    finished: set[str] = set()
+    running: Counter[str] = Counter()
+    results: list[JobResult | None] = [None] * len(specs)
+    next_to_report = 0
+    workers = max(1, min(int(max_workers), len(specs)))
+
+    def limit(resource_class: str) -> int:
+        return max(1, int(resource_limits.get(resource_class, DEFAULT_RESOURCE_CLASS_LIMIT)))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="overview-automation") as pool:
+        in_flight: dict[Future[JobResult], int] = {}
+
+        def ready(spec: ScheduledJobSpec) -> bool:
+            return not any(dep in due_ids and dep not in finished and dep != spec.job_id for dep in spec.depends_on)
+
+        while pending or in_flight:
+            exclusive_waiting = min(
+                (
+                    index
+                    for index in pending
+                    if specs[index].resource_class in EXCLUSIVE_RESOURCE_CLASSES and ready(specs[index])
+                ),
+                default=len(specs),
+            )
+            exclusive_running = any(specs[index].resource_class in EXCLUSIVE_RESOURCE_CLASSES for index in in_flight.values())
+            for index in list(pending):
+                if len(in_flight) >= workers or exclusive_running:
+                    break
+                spec = specs[index]
+                if not ready(spec) or running[spec.resource_class] >= limit(spec.resource_class):
+                    continue
+                if spec.resource_class in EXCLUSIVE_RESOURCE_CLASSES:
+                    if in_flight:
+                        continue
+                    exclusive_running = True
+                elif index > exclusive_waiting:
+                    continue
+                pending.remove(index)
+                running[spec.resource_class] += 1
+                in_flight[pool.submit(_run_spec, spec, now_value, started_at)] = index
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                spec = specs[index]
+                running[spec.resource_class] -= 1
+                finished.add(spec.job_id)
+                results[index] = future.result()
+            while next_to_report < len(specs) and results[next_to_report] is not None:
+                on_result(specs[next_to_report], results[next_to_report])
+                next_to_report += 1
+
+
 def run_overview_automation(
     *,
     profile: str = "standard",
@@ -570,7 +754,17 @@ def run_overview_automation(
     history_appender: Callable[[dict[str, Any]], None] = append_run_history,
     specs: Sequence[ScheduledJobSpec] = OVERVIEW_AUTOMATION_JOB_SPECS,
     execution_mode: str = "scheduled",
+    max_workers: int = DEFAULT_AUTOMATION_MAX_WORKERS,
+    resource_limits: Mapping[str, int] | None = None,
 ) -> dict[str, Any]:
+    """
+    Run every due spec under one lock, overlapping independent jobs.
+
+    Jobs whose dependencies are done run concurrently on up to `max_workers`
+    threads, bounded per resource class by `resource_limits` (defaults to
+    `RESOURCE_CLASS_LIMITS`). History rows and `results` keep dependency
+    order, with plan order between independent jobs.
+    """
     started_at = _now_str(now)
     t0 = perf_counter()
     now_value = now or datetime.now()
@@ -609,38 +803,32 @@ def run_overview_automation(
             "results": [],
         }
 
+    plan_by_id = {str(row["job_id"]): row for row in due_rows}
+    due_specs = _dependency_order(
+        [spec_by_id[job_id] for job_id in plan_by_id if job_id in spec_by_id]
+    )
     results: list[JobResult] = []
+
+    def record(spec: ScheduledJobSpec, result: JobResult) -> None:
+        annotated = _with_automation_metadata(
+            result,
+            profile=normalized_profile,
+            spec=spec,
+            plan_row=plan_by_id[spec.job_id],
+            execution_mode=normalized_execution_mode,
+        )
+        history_appender(annotated)
+        results.append(annotated)
+
     with OverviewAutomationLock(lock_path, now=now_value):
-        for row in due_rows:
-            spec = spec_by_id.get(str(row["job_id"]))
-            if spec is None:
-                continue
-            try:
-                result = spec.runner(now_value)
-            except Exception as exc:
-                finished_at = _now_str()
-                result = {
-                    "job_name": spec.job_name,
-                    "status": "failed",
-                    "started_at": started_at,
-                    "finished_at": finished_at,
-                    "duration_sec": 0,
-                    "rows_written": 0,
-                    "symbols_requested": None,
-                    "symbols_processed": None,
-                    "failed_symbols": [],
-                    "message": f"Overview automation job failed: {exc}",
-                    "details": {"automation_job_id": spec.job_id},
-                }
-            annotated = _with_automation_metadata(
-                result,
-                profile=normalized_profile,
-                spec=spec,
-                plan_row=row,
-                execution_mode=normalized_execution_mode,
-            )
-            history_appender(annotated)
-            results.append(annotated)
+        _execute_due_specs(
+            due_specs,
+            now_value=now_value,
+            started_at=started_at,
+            max_workers=max_workers,
+            resource_limits=RESOURCE_CLASS_LIMITS if resource_limits is None else resource_limits,
+            on_result=record,
+        )
 
     status = _overall_status(results)
     return {
@@ -690,6 +878,12 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Allow intraday snapshot jobs outside US market hours while keeping cadence checks.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_AUTOMATION_MAX_WORKERS,
+        help="Maximum jobs run at once; per-resource-class limits still apply.",
+    )
     parser.add_argument("--json", action="store_true", help="Print machine-readable JSON summary.")
     args = parser.parse_args(argv)
 
@@ -700,6 +894,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             dry_run=args.dry_run,
             force=args.force,
             allow_outside_market_hours=args.allow_outside_market_hours,
+            max_workers=args.max_workers,
         )
     except RuntimeError as exc:
         error_summary = {
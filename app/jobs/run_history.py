@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import json
+import math
 from datetime import date, datetime
 from typing import Any
 
+from app.jobs.job_telemetry import (
+    TELEMETRY_DB,
+    JobTelemetryStore,
+    fit_eta_model,
+    load_job_telemetry,
+    record_job_telemetry,
+)
 from app.workspace_paths import RUN_HISTORY_DIR
 
 HISTORY_FILE = RUN_HISTORY_DIR / "WEB_APP_RUN_HISTORY.jsonl"
@@ -104,11 +112,17 @@ def _json_safe(value: Any) -> str:
     return str(value)
 
 
+def _telemetry_store() -> JobTelemetryStore:
+    # Resolved per call so the telemetry tables follow a relocated HISTORY_FILE.
+    return JobTelemetryStore(HISTORY_FILE.parent / TELEMETRY_DB.name)
+
+
 def append_run_history(result: dict[str, Any]) -> None:
     record = _normalize_history_record(result)
     HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
     with HISTORY_FILE.open("a", encoding="utf-8") as f:
         f.write(json.dumps(record, ensure_ascii=False, default=_json_safe) + "\n")
+    record_job_telemetry(record, store=_telemetry_store())
 
 
 def load_run_history(limit: int = 50) -> list[dict[str, Any]]:
@@ -128,7 +142,39 @@ def load_run_history(limit: int = 50) -> list[dict[str, Any]]:
     return rows[-limit:][::-1]
 
 
-def estimate_duration_from_history(job_name: str, symbol_count: int) -> dict[str, Any]:
+def _format_estimate(low: int, high: int) -> str:
+    return f"예상 소요 시간: {low // 60}m {low % 60}s - {high // 60}m {high % 60}s"
+
+
+def estimate_duration_from_history(
+    job_name: str,
+    symbol_count: int,
+    *,
+    chunk_size: int | None = None,
+    max_workers: int | None = None,
+    telemetry_store: JobTelemetryStore | None = None,
+) -> dict[str, Any]:
+    """Estimate a run's duration, preferring the ETA model fitted on job telemetry.
+
+    The telemetry model accounts for chunk size, worker count, and historical
+    rate-limit cooldowns; without enough telemetry runs it falls back to the
+    average seconds per symbol in the JSONL history.
+    """
+    if symbol_count > 0:
+        model = fit_eta_model(load_job_telemetry(job_name, store=telemetry_store or _telemetry_store()))
+        if model is not None:
+            estimate_sec = model.predict(symbol_count, chunk_size=chunk_size, max_workers=max_workers)
+            low = max(1, int(estimate_sec * model.low_ratio))
+            high = max(low, int(math.ceil(estimate_sec * model.high_ratio)))
+            return {
+                "available": True,
+                "method": "telemetry_model",
+                "sample_count": model.sample_count,
+                "seconds_low": low,
+                "seconds_high": high,
+                "message": _format_estimate(low, high),
+            }
+
     history = load_run_history(limit=200)
     relevant = [
         item for item in history
@@ -161,7 +207,9 @@ def estimate_duration_from_history(job_name: str, symbol_count: int) -> dict[str
 
     return {
         "available": True,
+        "method": "history_average",
+        "sample_count": len(per_symbol),
         "seconds_low": low,
         "seconds_high": high,
-        "message": f"예상 소요 시간: {low // 60}m {low % 60}s - {high // 60}m {high % 60}s",
+        "message": _format_estimate(low, high),
     }
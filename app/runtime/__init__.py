@@ -16,7 +16,12 @@ from .backtest import (
     run_value_snapshot_strict_annual_backtest_from_db,
     run_value_snapshot_strict_quarterly_prototype_backtest_from_db,
 )
-from .backtest.stores.run_history import BACKTEST_HISTORY_FILE, append_backtest_run_history, load_backtest_run_history
+from .backtest.stores.run_history import (
+    BACKTEST_HISTORY_FILE,
+    append_backtest_run_history,
+    count_backtest_run_history,
+    load_backtest_run_history,
+)
 from .backtest.stores.candidate_registry import (
     CANDIDATE_REVIEW_NOTES_FILE,
     CURRENT_CANDIDATE_REGISTRY_FILE,
@@ -224,6 +229,7 @@ __all__ = [
     "build_selected_portfolio_current_weight_inputs",
     "build_selected_portfolio_drift_alert_preview",
     "build_selected_portfolio_drift_check",
+    "count_backtest_run_history",
     "delete_selected_dashboard_portfolio",
     "delete_saved_portfolio",
     "inspect_strict_annual_price_freshness",
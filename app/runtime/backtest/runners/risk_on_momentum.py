@@ -398,15 +398,16 @@ def run_risk_on_momentum_5d_backtest_from_db(
         )
 
     random_rows: list[dict[str, Any]] = []
-    for iteration in range(analysis_controls.random_iterations):
-        random_result = simulation_executor.run(
-            clone_config(
-                config,
-                ranking_mode="random",
-                random_seed=int(random_seed) + iteration + 1,
-                collect_scanner_rows=False,
-            )
+    random_results = simulation_executor.run_many(
+        clone_config(
+            config,
+            ranking_mode="random",
+            random_seed=int(random_seed) + iteration + 1,
+            collect_scanner_rows=False,
         )
+        for iteration in range(analysis_controls.random_iterations)
+    )
+    for iteration, random_result in enumerate(random_results):
         random_rows.append(
             {
                 "iteration": iteration + 1,
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+"""Append-only JSONL files with a SQLite sidecar offset index.
+
+The JSONL file stays the source of truth; the sidecar only records where each
+complete line starts plus a few filter columns, so tail reads, filtered pages
+and latest-per-id lookups seek straight to the rows they return instead of
+parsing the whole file. The index catches up incrementally from its byte
+watermark and is rebuilt if the file was truncated or rewritten.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+INDEX_FORMAT_VERSION = 1
+INDEX_SUFFIX = ".idx.sqlite"
+_SIGNATURE_BYTES = 256
+_INDEX_COLUMNS = ("recorded_at", "strategy_key", "run_kind", "record_key")
+
+
+def _text_or_none(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+class IndexedJsonlStore:
+    """One JSONL file plus its `<name>.idx.sqlite` sidecar.
+
+    `key_field` names the per-record id used by `load_latest_by_key`
+    (e.g. `registry_id`); run history leaves it unset.
+    """
+
+    def __init__(self, path: Path, *, key_field: str | None = None) -> None:
+        self.path = Path(path)
+        self.key_field = key_field
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+
+    # ------------------------------------------------------------------
+    # write path
+    # ------------------------------------------------------------------
+    def append(self, row: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    # ------------------------------------------------------------------
+    # read path
+    # ------------------------------------------------------------------
+    def load_tail(
+        self,
+        limit: int | None = 30,
+        *,
+        offset: int = 0,
+        strategy_key: str | None = None,
+        run_kind: str | None = None,
+        recorded_from: str | None = None,
+        recorded_to: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Newest-first page of rows matching the indexed filters."""
+        if not self.path.exists():
+            return []
+        where, params = self._filters(strategy_key, run_kind, recorded_from, recorded_to)
+        sql = f"SELECT offset, length FROM records{where} ORDER BY seq DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [max(int(limit), 0), max(int(offset), 0)]
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(max(int(offset), 0))
+        try:
+            with self._index() as conn:
+                spans = conn.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            rows = [row for row in self._scan_rows() if self._matches(row, strategy_key, run_kind, recorded_from, recorded_to)]
+            rows.reverse()
+            stop = None if limit is None else offset + max(int(limit), 0)
+            return rows[offset:stop]
+        return self._read_spans(spans)
+
+    def count(
+        self,
+        *,
+        strategy_key: str | None = None,
+        run_kind: str | None = None,
+        recorded_from: str | None = None,
+        recorded_to: str | None = None,
+    ) -> int:
+        if not self.path.exists():
+            return 0
+        where, params = self._filters(strategy_key, run_kind, recorded_from, recorded_to)
+        try:
+            with self._index() as conn:
+                return int(conn.execute(f"SELECT COUNT(*) FROM records{where}", params).fetchone()[0])
+        except sqlite3.Error:
+            return sum(
+                1 for row in self._scan_rows() if self._matches(row, strategy_key, run_kind, recorded_from, recorded_to)
+            )
+
+    def load_all(self) -> list[dict[str, Any]]:
+        """Every row in file order (same result as a full JSONL scan)."""
+        if not self.path.exists():
+            return []
+        return list(self._scan_rows())
+
+    def load_latest_by_key(self) -> list[dict[str, Any]]:
+        """Latest row per `key_field` by `recorded_at`; later lines win ties."""
+        if self.key_field is None:
+            raise ValueError("load_latest_by_key requires key_field")
+        if not self.path.exists():
+            return []
+        try:
+            with self._index() as conn:
+                entries = conn.execute(
+                    "SELECT record_key, recorded_at, offset, length FROM records "
+                    "WHERE record_key IS NOT NULL ORDER BY seq"
+                ).fetchall()
+        except sqlite3.Error:
+            latest_rows: dict[str, dict[str, Any]] = {}
+            for row in self._scan_rows():
+                key = _text_or_none(row.get(self.key_field))
+                if key is None:
+                    continue
+                previous = latest_rows.get(key)
+                if previous is None or str(row.get("recorded_at") or "") >= str(previous.get("recorded_at") or ""):
+                    latest_rows[key] = row
+            return list(latest_rows.values())
+
+        latest: dict[str, tuple[str, int, int]] = {}
+        for key, recorded_at, start, length in entries:
+            previous = latest.get(key)
+            if previous is None or (recorded_at or "") >= previous[0]:
+                latest[key] = (recorded_at or "", start, length)
+        return self._read_spans([(start, length) for _, start, length in latest.values()])
+
+    # ------------------------------------------------------------------
+    # index maintenance
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.index_path, timeout=30.0, isolation_level=None)) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "seq INTEGER PRIMARY KEY, offset INTEGER NOT NULL, length INTEGER NOT NULL, "
+                "recorded_at TEXT, strategy_key TEXT, run_kind TEXT, record_key TEXT)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT)")
+            for column in _INDEX_COLUMNS:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS records_{column} ON records ({column}, seq)")
+            self._catch_up(conn)
+            yield conn
+
+    def _catch_up(self, conn: sqlite3.Connection) -> None:
+        size = self.path.stat().st_size
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            meta = dict(conn.execute("SELECT k, v FROM meta").fetchall())
+            indexed = int(meta.get("indexed_bytes") or 0)
+            with self.path.open("rb") as handle:
+                if (
+                    meta.get("format_version") != str(INDEX_FORMAT_VERSION)
+                    or meta.get("key_field") != (self.key_field or "")
+                    or indexed > size
+                    or meta.get("head_signature", "") != self._signature(handle, 0, min(indexed, _SIGNATURE_BYTES))
+                    or meta.get("tail_signature", "")
+                    != self._signature(handle, max(indexed - _SIGNATURE_BYTES, 0), indexed)
+                ):
+                    conn.execute("DELETE FROM records")
+                    indexed = 0
+                if indexed < size:
+                    handle.seek(indexed)
+                    pending = handle.read(size - indexed)
+                    complete = pending.rfind(b"\n") + 1
+                    conn.executemany(
+                        "INSERT INTO records (offset, length, recorded_at, strategy_key, run_kind, record_key) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        self._index_entries(pending[:complete], indexed),
+                    )
+                    indexed += complete
+                head = self._signature(handle, 0, min(indexed, _SIGNATURE_BYTES))
+                tail = self._signature(handle, max(indexed - _SIGNATURE_BYTES, 0), indexed)
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (k, v) VALUES (?, ?)",
+                [
+                    ("format_version", str(INDEX_FORMAT_VERSION)),
+                    ("key_field", self.key_field or ""),
+                    ("indexed_bytes", str(indexed)),
+                    ("head_signature", head),
+                    ("tail_signature", tail),
+                ],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _index_entries(self, chunk: bytes, base: int) -> Iterator[tuple]:
+        position = 0
+        for raw in chunk.splitlines(keepends=True):
+            start = base + position
+            position += len(raw)
+            row = self._parse(raw)
+            if row is None:
+                continue
+            yield (
+                start,
+                len(raw),
+                _text_or_none(row.get("recorded_at")),
+                _text_or_none(row.get("strategy_key")),
+                _text_or_none(row.get("run_kind")),
+                _text_or_none(row.get(self.key_field)) if self.key_field else None,
+            )
+
+    @staticmethod
+    def _signature(handle, start: int, stop: int) -> str:
+        if stop <= start:
+            return ""
+        handle.seek(start)
+        return hashlib.sha1(handle.read(stop - start)).hexdigest()
+
+    @staticmethod
+    def _filters(
+        strategy_key: str | None,
+        run_kind: str | None,
+        recorded_from: str | None,
+        recorded_to: str | None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if strategy_key is not None:
+            clauses.append("strategy_key = ?")
+            params.append(strategy_key)
+        if run_kind is not None:
+            clauses.append("run_kind = ?")
+            params.append(run_kind)
+        if recorded_from is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(recorded_from)
+        if recorded_to is not None:
+            clauses.append("recorded_at <= ?")
+            params.append(recorded_to)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _matches(
+        row: dict[str, Any],
+        strategy_key: str | None,
+        run_kind: str | None,
+        recorded_from: str | None,
+        recorded_to: str | None,
+    ) -> bool:
+        recorded_at = _text_or_none(row.get("recorded_at"))
+        if strategy_key is not None and _text_or_none(row.get("strategy_key")) != strategy_key:
+            return False
+        if run_kind is not None and _text_or_none(row.get("run_kind")) != run_kind:
+            return False
+        if recorded_from is not None and (recorded_at is None or recorded_at < recorded_from):
+            return False
+        if recorded_to is not None and (recorded_at is None or recorded_at > recorded_to):
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # raw file access
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _parse(raw: bytes) -> dict[str, Any] | None:
+        line = raw.decode("utf-8", errors="ignore").strip()
+        if not line:
+            return None
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return row if isinstance(row, dict) else None
+
+    def _read_spans(self, spans: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        with self.path.open("rb") as handle:
+            for start, length in spans:
+                handle.seek(start)
+                row = self._parse(handle.read(length))
+                if row is not None:
+                    rows.append(row)
+        return rows
+
+    def _scan_rows(self) -> Iterator[dict[str, Any]]:
+        with self.path.open("rb") as handle:
+            for raw in handle:
+                row = self._parse(raw)
+                if row is not None:
+                    yield row
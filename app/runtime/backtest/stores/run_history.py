@@ -7,6 +7,7 @@ import re
 from datetime import datetime
 from typing import Any
 
+from app.runtime.backtest.stores.jsonl_index import IndexedJsonlStore
 from app.workspace_paths import BACKTEST_ARTIFACT_DIR, RUN_HISTORY_DIR
 
 BACKTEST_HISTORY_FILE = RUN_HISTORY_DIR / "BACKTEST_RUN_HISTORY.jsonl"
@@ -14,6 +15,10 @@ BACKTEST_HISTORY_SCHEMA_VERSION = 2
 _SAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
 
 
+def _history_store() -> IndexedJsonlStore:
+    return IndexedJsonlStore(BACKTEST_HISTORY_FILE)
+
+
 def _safe_token(value: str | None, *, fallback: str) -> str:
     token = _SAFE_CHARS.sub("_", (value or "").strip())
     token = token.strip("._")
@@ -290,23 +295,39 @@ def append_backtest_run_history(
         "context": merged_context,
     }
 
-    BACKTEST_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with BACKTEST_HISTORY_FILE.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    _history_store().append(record)
 
 
-def load_backtest_run_history(limit: int = 30) -> list[dict[str, Any]]:
-    if not BACKTEST_HISTORY_FILE.exists():
-        return []
+def load_backtest_run_history(
+    limit: int | None = 30,
+    *,
+    offset: int = 0,
+    strategy_key: str | None = None,
+    run_kind: str | None = None,
+    recorded_from: str | None = None,
+    recorded_to: str | None = None,
+) -> list[dict[str, Any]]:
+    """Newest-first page of run history, read through the sidecar offset index."""
+    return _history_store().load_tail(
+        limit,
+        offset=offset,
+        strategy_key=strategy_key,
+        run_kind=run_kind,
+        recorded_from=recorded_from,
+        recorded_to=recorded_to,
+    )
 
-    rows: list[dict[str, Any]] = []
-    for line in BACKTEST_HISTORY_FILE.read_text(encoding="utf-8", errors="ignore").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            rows.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
 
-    return rows[-limit:][::-1]
+def count_backtest_run_history(
+    *,
+    strategy_key: str | None = None,
+    run_kind: str | None = None,
+    recorded_from: str | None = None,
+    recorded_to: str | None = None,
+) -> int:
+    return _history_store().count(
+        strategy_key=strategy_key,
+        run_kind=run_kind,
+        recorded_from=recorded_from,
+        recorded_to=recorded_to,
+    )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from app.services.futures_macro_context import (
@@ -179,22 +181,230 @@ def _empty_ranked(reason: str | None = None) -> pd.DataFrame:
     return frame
 
 
-def _scaled_distance(
-    train: pd.DataFrame,
-    current: pd.Series,
-    columns: tuple[str, ...],
+class _EpisodeDistanceBlock:
+    """Row-aligned predictor values whose train scales are memoized per cutoff.
+
+    Values are held column-major, the same layout pandas keeps a float block
+    in, so row means reduce in the order ``DataFrame.mean(axis=1)`` uses and
+    distances match the frame arithmetic bit for bit.
+    """
+
+    def __init__(
+        self,
+        train_values: np.ndarray,
+        current_values: np.ndarray | None = None,
+        *,
+        object_arithmetic: bool = False,
+    ) -> None:
+        self._train = np.ascontiguousarray(train_values, dtype=float)
+        self._current = (
+            self._train
+            if current_values is None
+            else np.ascontiguousarray(current_values, dtype=float)
+        )
+        self._object_arithmetic = bool(object_arithmetic)
+        self._scales: dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, columns: Sequence[str]) -> _EpisodeDistanceBlock:
+        numeric = frame.loc[:, list(columns)].apply(pd.to_numeric, errors="coerce")
+        return cls(numeric.to_numpy(dtype=float, na_value=np.nan).T)
+
+    def scale(self, end: int) -> np.ndarray:
+        """Interquartile range of rows ``[0, end)`` with flat columns scaled by one."""
+
+        cached = self._scales.get(end)
+        if cached is not None:
+            return cached
+        train = self._train[:, :end]
+        missing = np.isnan(train)
+        if not missing.any():
+            lower, upper = np.quantile(train, [0.25, 0.75], axis=1)
+        else:
+            lower = np.full(train.shape[0], np.nan)
+            upper = np.full(train.shape[0], np.nan)
+            for column, (values, mask) in enumerate(zip(train, missing)):
+                present = values[~mask]
+                if present.size:
+                    lower[column], upper[column] = np.quantile(present, [0.25, 0.75])
+        scale = upper - lower
+        scale = np.where(np.abs(scale) > 1e-9, scale, 1.0)
+        self._scales[end] = scale
+        return scale
+
+    def distance(self, current_position: int, end: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return RMS scaled distance and present-column count for rows ``[0, end)``."""
+
+        current = self._current[:, current_position][:, None]
+        scale = self.scale(end)[:, None]
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+            scaled = (self._train[:, :end] - current) / scale
+            if self._object_arithmetic:
+                squared = (scaled.astype(object) ** 2).astype(float).T
+            else:
+                squared = (scaled**2).T
+            missing = np.isnan(squared)
+            present = squared.shape[1] - missing.sum(axis=1)
+            if self._object_arithmetic:
+                filled = np.where(missing, 0.0, squared)
+                total = filled[:, 0].copy() if filled.shape[1] else np.zeros(len(filled))
+                for column in range(1, filled.shape[1]):
+                    total += filled[:, column]
+            else:
+                filled = squared
+                if missing.any():
+                    filled = squared.copy()
+                    np.putmask(filled, missing, 0.0)
+                total = filled.sum(axis=1)
+            mean = total / present.astype(float)
+            mean[present == 0] = np.nan
+            if self._object_arithmetic:
+                return (mean.astype(object) ** 0.5).astype(float), present
+            return mean**0.5, present
+
+    def ranked_positions(self, distance: np.ndarray) -> np.ndarray:
+        """Order non-NaN rows by distance exactly as ``Series.sort_values`` would."""
+
+        usable = np.flatnonzero(~np.isnan(distance))
+        values = distance[usable]
+        if self._object_arithmetic:
+            # An object Series sorts with numpy's generic quicksort, whose ties differ.
+            values = values.astype(object)
+        return usable[values.argsort(kind="quicksort")]
+
+
+def _spaced_episode_positions(
+    positions: Sequence[int],
     *,
-    minimum_present: int,
-) -> pd.Series:
-    numeric = train.loc[:, list(columns)].apply(pd.to_numeric, errors="coerce")
-    current_values = pd.to_numeric(current.reindex(columns), errors="coerce")
-    scale = numeric.quantile(0.75) - numeric.quantile(0.25)
-    scale = scale.where(scale.abs() > 1e-9, 1.0)
-    squared = numeric.sub(current_values).divide(scale).pow(2)
-    present = squared.notna().sum(axis=1)
-    return squared.mean(axis=1, skipna=True).pow(0.5).where(
-        present >= minimum_present
-    )
+    minimum_spacing: int,
+    limit: int,
+) -> list[int]:
+    """Greedily keep ranked row positions at least ``minimum_spacing`` apart."""
+
+    spacing = max(1, int(minimum_spacing))
+    blocked = bytearray(max((int(value) for value in positions), default=-1) + spacing + 1)
+    accepted: list[int] = []
+    for position in positions:
+        if blocked[position]:
+            continue
+        accepted.append(position)
+        if len(accepted) >= limit:
+            break
+        start = max(0, position - spacing + 1)
+        blocked[start : position + spacing] = b"\x01" * (position + spacing - start)
+    return accepted
+
+
+class AnalogEpisodeIndex:
+    """Predictor and context blocks of one origin frame, built once per walk-forward run."""
+
+    def __init__(self, momentum_frame: pd.DataFrame, context_frame: pd.DataFrame) -> None:
+        ordered = momentum_frame.sort_index()
+        self.dates = ordered.index
+        self._positions = {pd.Timestamp(value): index for index, value in enumerate(ordered.index)}
+        context = context_frame.reindex(ordered.index)
+        self._blocks = {
+            "momentum": _EpisodeDistanceBlock.from_frame(ordered, MOMENTUM_PREDICTOR_COLUMNS)
+        }
+        self._context_ready: dict[str, np.ndarray] = {}
+        for name, columns in (
+            ("macro", MACRO_CONTEXT_COLUMNS),
+            ("event", EVENT_CONTEXT_COLUMNS),
+        ):
+            if not set(columns).issubset(context.columns):
+                continue
+            self._blocks[name] = _EpisodeDistanceBlock.from_frame(context, columns)
+            self._context_ready[name] = context.loc[:, list(columns)].notna().all(axis=1).to_numpy()
+        self._origin: tuple[int, int] | None = None
+        self._distances: dict[str, np.ndarray] = {}
+        self._rankings: dict[tuple[str, int], pd.DataFrame] = {}
+
+    def position(self, current_date: pd.Timestamp) -> int | None:
+        return self._positions.get(pd.Timestamp(current_date))
+
+    def has_context(self, name: str, current_position: int) -> bool:
+        ready = self._context_ready.get(name)
+        return ready is not None and bool(ready[current_position])
+
+    def _block_distance(
+        self,
+        name: str,
+        current_position: int,
+        end: int,
+        *,
+        minimum_present: int,
+    ) -> np.ndarray:
+        # Every candidate and temperature evaluated at one origin shares these vectors.
+        if self._origin != (current_position, end):
+            self._origin = (current_position, end)
+            self._distances = {}
+            self._rankings = {}
+        cached = self._distances.get(name)
+        if cached is None:
+            distance, present = self._blocks[name].distance(current_position, end)
+            cached = np.where(present >= minimum_present, distance, np.nan)
+            self._distances[name] = cached
+        return cached
+
+    def rank(
+        self,
+        *,
+        current_position: int,
+        horizon: int,
+        candidate: OutlookCandidate,
+        max_episodes: int,
+    ) -> pd.DataFrame:
+        """Return de-overlapped episodes ordered by combined distance, before weighting."""
+
+        end = max(0, current_position - max(1, int(horizon)))
+        minimum_momentum = max(4, math.ceil(len(MOMENTUM_PREDICTOR_COLUMNS) * 0.75))
+        momentum_distance = self._block_distance(
+            "momentum",
+            current_position,
+            end,
+            minimum_present=minimum_momentum,
+        )
+        key = (candidate.key, int(max_episodes))
+        cached = self._rankings.get(key)
+        if cached is not None:
+            return cached
+        macro_distance = np.zeros(end)
+        event_distance = np.zeros(end)
+        if candidate.lambda_macro > 0:
+            macro_distance = self._block_distance(
+                "macro",
+                current_position,
+                end,
+                minimum_present=len(MACRO_CONTEXT_COLUMNS),
+            )
+        if candidate.lambda_event > 0:
+            event_distance = self._block_distance(
+                "event",
+                current_position,
+                end,
+                minimum_present=len(EVENT_CONTEXT_COLUMNS),
+            )
+        combined = (
+            momentum_distance
+            + float(candidate.lambda_macro) * macro_distance
+            + float(candidate.lambda_event) * event_distance
+        )
+        accepted = _spaced_episode_positions(
+            self._blocks["momentum"].ranked_positions(combined).tolist(),
+            minimum_spacing=max(1, int(horizon)),
+            limit=max(1, int(max_episodes)),
+        )
+        ranked = pd.DataFrame(
+            {
+                "momentum_distance": momentum_distance[accepted],
+                "macro_distance": macro_distance[accepted],
+                "event_distance": event_distance[accepted],
+                "combined_distance": combined[accepted],
+            },
+            index=self.dates[accepted],
+        )
+        self._rankings[key] = ranked
+        return ranked
 
 
 def rank_weighted_analog_episodes(
@@ -206,83 +416,37 @@ def rank_weighted_analog_episodes(
     candidate: OutlookCandidate,
     temperature: float,
     max_episodes: int = 120,
+    episode_index: AnalogEpisodeIndex | None = None,
 ) -> pd.DataFrame:
-    """Rank past-only, de-overlapped episodes with train-scaled distance blocks."""
+    """Rank past-only, de-overlapped episodes with train-scaled distance blocks.
+
+    Pass an ``episode_index`` built from the same frames to reuse predictor
+    matrices, train scales and per-origin distances across calls.
+    """
 
     if temperature <= 0:
         raise ValueError("temperature must be positive")
-    ordered = momentum_frame.sort_index()
-    current_key = pd.Timestamp(current_date)
-    if current_key not in ordered.index:
+    index = episode_index or AnalogEpisodeIndex(momentum_frame, context_frame)
+    current_position = index.position(current_date)
+    if current_position is None:
         return _empty_ranked("current_state_missing")
-    current_position = int(ordered.index.get_loc(current_key))
-    candidate_end = current_position - max(1, int(horizon))
-    train = ordered.iloc[: max(0, candidate_end)].copy()
-    if train.empty:
+    if current_position - max(1, int(horizon)) <= 0:
         return _empty_ranked("eligible_history_missing")
-    minimum_momentum = max(4, math.ceil(len(MOMENTUM_PREDICTOR_COLUMNS) * 0.75))
-    momentum_distance = _scaled_distance(
-        train,
-        ordered.loc[current_key],
-        MOMENTUM_PREDICTOR_COLUMNS,
-        minimum_present=minimum_momentum,
+    for name, weight in (
+        ("macro", candidate.lambda_macro),
+        ("event", candidate.lambda_event),
+    ):
+        if weight > 0 and not index.has_context(name, current_position):
+            return _empty_ranked(f"{name}_context_missing")
+    ranked = index.rank(
+        current_position=current_position,
+        horizon=horizon,
+        candidate=candidate,
+        max_episodes=max_episodes,
     )
-    context = context_frame.reindex(ordered.index)
-    macro_distance = pd.Series(0.0, index=train.index, dtype=float)
-    event_distance = pd.Series(0.0, index=train.index, dtype=float)
-    if candidate.lambda_macro > 0:
-        if not set(MACRO_CONTEXT_COLUMNS).issubset(context.columns):
-            return _empty_ranked("macro_context_missing")
-        current_macro = context.loc[current_key, list(MACRO_CONTEXT_COLUMNS)]
-        if current_macro.isna().any():
-            return _empty_ranked("macro_context_missing")
-        macro_distance = _scaled_distance(
-            context.loc[train.index],
-            context.loc[current_key],
-            MACRO_CONTEXT_COLUMNS,
-            minimum_present=len(MACRO_CONTEXT_COLUMNS),
-        )
-    if candidate.lambda_event > 0:
-        if not set(EVENT_CONTEXT_COLUMNS).issubset(context.columns):
-            return _empty_ranked("event_context_missing")
-        current_event = context.loc[current_key, list(EVENT_CONTEXT_COLUMNS)]
-        if current_event.isna().any():
-            return _empty_ranked("event_context_missing")
-        event_distance = _scaled_distance(
-            context.loc[train.index],
-            context.loc[current_key],
-            EVENT_CONTEXT_COLUMNS,
-            minimum_present=len(EVENT_CONTEXT_COLUMNS),
-        )
-    combined = (
-        momentum_distance
-        + float(candidate.lambda_macro) * macro_distance
-        + float(candidate.lambda_event) * event_distance
-    )
-    ranked = pd.DataFrame(
-        {
-            "momentum_distance": momentum_distance,
-            "macro_distance": macro_distance,
-            "event_distance": event_distance,
-            "combined_distance": combined,
-        }
-    ).dropna(subset=["combined_distance"])
     if ranked.empty:
         return _empty_ranked("eligible_context_history_missing")
-    ranked = ranked.sort_values("combined_distance")
-    positions = {pd.Timestamp(value): index for index, value in enumerate(ordered.index)}
-    accepted_dates: list[pd.Timestamp] = []
-    accepted_positions: list[int] = []
-    for value in ranked.index:
-        date_value = pd.Timestamp(value)
-        position = positions[date_value]
-        if any(abs(position - prior) < max(1, int(horizon)) for prior in accepted_positions):
-            continue
-        accepted_dates.append(date_value)
-        accepted_positions.append(position)
-        if len(accepted_dates) >= max(1, int(max_episodes)):
-            break
-    selected = ranked.loc[accepted_dates].copy()
+    selected = ranked.copy()
     selected["weight"] = selected["combined_distance"].map(
         lambda value: math.exp(-float(value) / float(temperature))
     )
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import Any
+
+from app.workspace_paths import PROJECT_ROOT
+
+
+PATTERN_OUTLOOK_CACHE_FORMAT_VERSION = 1
+PATTERN_OUTLOOK_CACHE_DIR_ENV = "FUTURES_MACRO_PATTERN_OUTLOOK_CACHE_DIR"
+PATTERN_OUTLOOK_CACHE_ENABLED_ENV = "FUTURES_MACRO_PATTERN_OUTLOOK_CACHE"
+PATTERN_OUTLOOK_CACHE_MAX_MB_ENV = "FUTURES_MACRO_PATTERN_OUTLOOK_CACHE_MAX_MB"
+DEFAULT_PATTERN_OUTLOOK_CACHE_DIR = (
+    PROJECT_ROOT / ".aiworkspace" / "cache" / "futures_macro" / "pattern_outlook"
+)
+DEFAULT_PATTERN_OUTLOOK_CACHE_MAX_MB = 64
+
+
+def pattern_outlook_cache_enabled() -> bool:
+    raw = str(os.getenv(PATTERN_OUTLOOK_CACHE_ENABLED_ENV, "1")).strip().lower()
+    return raw not in {"0", "false", "off", "no"}
+
+
+def pattern_outlook_cache_max_bytes() -> int:
+    raw = str(
+        os.getenv(PATTERN_OUTLOOK_CACHE_MAX_MB_ENV, DEFAULT_PATTERN_OUTLOOK_CACHE_MAX_MB)
+    ).strip()
+    try:
+        megabytes = float(raw)
+    except ValueError:
+        megabytes = float(DEFAULT_PATTERN_OUTLOOK_CACHE_MAX_MB)
+    return max(int(megabytes * 1024 * 1024), 0)
+
+
+class PatternOutlookCache:
+    """
+    On-disk store of finished pattern outlook snapshots, one JSON file per key.
+
+    Keys are content hashes of the prepared point-in-time inputs plus the
+    feature, algorithm, and outlook schema versions, so any process that
+    prepares the same inputs can reuse a snapshot another process finished.
+    Files are published by writing a temporary file and `os.replace`-ing it,
+    so readers never see a partial snapshot. The directory is bounded by
+    total file size; reads refresh a file's mtime and the least recently
+    used files are evicted first.
+    """
+
+    def __init__(self, root: str | Path | None = None, *, max_bytes: int | None = None):
+        self.root = Path(
+            root or os.getenv(PATTERN_OUTLOOK_CACHE_DIR_ENV) or DEFAULT_PATTERN_OUTLOOK_CACHE_DIR
+        )
+        self.max_bytes = (
+            pattern_outlook_cache_max_bytes() if max_bytes is None else max(int(max_bytes), 0)
+        )
+
+    def path(self, key: str) -> Path:
+        return self.root / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', str(key))}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        path = self.path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != PATTERN_OUTLOOK_CACHE_FORMAT_VERSION
+            or payload.get("key") != key
+            or not isinstance(payload.get("snapshot"), dict)
+        ):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload["snapshot"]
+
+    def store(self, key: str, snapshot: dict[str, Any]) -> bool:
+        """Publish one snapshot; return False when it cannot be cached."""
+
+        try:
+            encoded = json.dumps(
+                {
+                    "format_version": PATTERN_OUTLOOK_CACHE_FORMAT_VERSION,
+                    "key": key,
+                    "snapshot": snapshot,
+                },
+                ensure_ascii=False,
+                sort_keys=True,
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+        if len(encoded) > self.max_bytes:
+            return False
+        self.root.mkdir(parents=True, exist_ok=True)
+        target = self.path(key)
+        tmp = self.root / f"{target.stem}.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp.write_bytes(encoded)
+            os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._evict(keep=target)
+        return True
+
+    def _evict(self, *, keep: Path) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for pattern in ("*.json", "*.tmp"):
+            for path in self.root.glob(pattern):
+                path.unlink(missing_ok=True)
+
+
+def default_pattern_outlook_cache() -> PatternOutlookCache | None:
+    return PatternOutlookCache() if pattern_outlook_cache_enabled() else None
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
 import json
 import math
+import os
 from time import monotonic
 from typing import Any
 
@@ -23,9 +25,16 @@ from app.services.futures_macro_pattern import (
     build_pattern_feature_frame,
     build_pattern_state_frame,
 )
+from app.services.futures_macro_pattern_outlook_cache import (
+    PatternOutlookCache,
+    default_pattern_outlook_cache,
+)
 from app.services.futures_macro_outlook_model import (
     CANDIDATES,
     TEMPERATURE_GRID,
+    AnalogEpisodeIndex,
+    _EpisodeDistanceBlock,
+    _spaced_episode_positions,
     build_momentum_predictor_frame,
     rank_weighted_analog_episodes,
     select_candidate_from_inner_evaluations,
@@ -51,6 +60,7 @@ from finance.data.futures_market import (
 )
 from finance.loaders.economic_cycle import load_cycle_history
 from finance.loaders.market_events import load_official_macro_event_history
+from finance.process_pool import process_pool_context
 
 
 OUTLOOK_HORIZONS: tuple[int, ...] = (5, 20)
@@ -440,29 +450,71 @@ def build_forward_outcome_frame(
     return pd.DataFrame(rows).sort_values(["as_of_date", "horizon"]).reset_index(drop=True)
 
 
-def _select_spaced_episode_anchors(
-    ranked: pd.DataFrame,
-    *,
-    feature_index: pd.Index,
-    minimum_spacing: int,
-    limit: int,
-) -> pd.DataFrame:
-    positions = {pd.Timestamp(value): position for position, value in enumerate(feature_index)}
-    accepted_rows: list[pd.Series] = []
-    accepted_positions: list[int] = []
-    for _, row in ranked.iterrows():
-        position = positions.get(pd.Timestamp(row["as_of_date"]))
-        if position is None:
-            continue
-        if any(abs(position - prior) < minimum_spacing for prior in accepted_positions):
-            continue
-        accepted_rows.append(row)
-        accepted_positions.append(position)
-        if len(accepted_rows) >= limit:
-            break
-    if not accepted_rows:
-        return ranked.iloc[0:0].copy()
-    return pd.DataFrame(accepted_rows).reset_index(drop=True)
+class PatternEpisodeIndex:
+    """Similarity feature matrix of one feature frame for repeated episode queries.
+
+    Train scales are memoized per cutoff and rankings per query, so walk-forward
+    evaluation builds the matrix once instead of re-deriving it for every origin.
+    """
+
+    def __init__(self, feature_frame: pd.DataFrame) -> None:
+        ordered = feature_frame.sort_index()
+        self.dates = ordered.index
+        self._positions = {pd.Timestamp(value): index for index, value in enumerate(ordered.index)}
+        self.columns = [
+            column
+            for column in PATTERN_FEATURE_COLUMNS
+            if column in ordered.columns and column.endswith(SIMILARITY_SUFFIXES)
+        ]
+        current = (
+            ordered.loc[:, self.columns]
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype=float, na_value=np.nan)
+            .T
+        )
+        train = np.where(np.isinf(current), np.nan, current)
+        # A mixed-dtype row makes pandas evaluate the distance on Python floats.
+        object_arithmetic = bool(len(ordered)) and (
+            ordered.loc[ordered.index[0], self.columns].dtype == object
+        )
+        self._block = _EpisodeDistanceBlock(
+            train,
+            current,
+            object_arithmetic=object_arithmetic,
+        )
+        self._matches: dict[tuple[int, int, int], pd.DataFrame] = {}
+
+    def select(
+        self,
+        *,
+        current_date: pd.Timestamp,
+        horizon: int,
+        max_episodes: int = 120,
+    ) -> pd.DataFrame:
+        current_position = self._positions.get(pd.Timestamp(current_date))
+        if current_position is None:
+            return pd.DataFrame(columns=["as_of_date", "similarity_distance"])
+        eligible_end = max(0, current_position - int(horizon))
+        if eligible_end == 0:
+            return pd.DataFrame(columns=["as_of_date", "similarity_distance"])
+        limit = max(1, int(max_episodes))
+        key = (current_position, int(horizon), limit)
+        cached = self._matches.get(key)
+        if cached is None:
+            distance, _ = self._block.distance(current_position, eligible_end)
+            accepted = _spaced_episode_positions(
+                self._block.ranked_positions(distance).tolist(),
+                minimum_spacing=max(1, int(horizon)),
+                limit=limit,
+            )
+            cached = pd.DataFrame(
+                {
+                    "as_of_date": self.dates[accepted],
+                    "similarity_distance": distance[accepted],
+                }
+            )
+            self._matches[key] = cached
+        return cached.copy()
 
 
 def select_similar_episodes(
@@ -471,34 +523,15 @@ def select_similar_episodes(
     current_date: pd.Timestamp,
     horizon: int,
     max_episodes: int = 120,
+    episode_index: PatternEpisodeIndex | None = None,
 ) -> pd.DataFrame:
     """Rank past-only features and suppress adjacent trading-row duplicates."""
 
-    ordered = feature_frame.sort_index()
-    if current_date not in ordered.index:
-        return pd.DataFrame(columns=["as_of_date", "similarity_distance"])
-    current_position = int(ordered.index.get_loc(current_date))
-    eligible_end = current_position - int(horizon)
-    candidates = ordered.iloc[: max(0, eligible_end)].copy()
-    if candidates.empty:
-        return pd.DataFrame(columns=["as_of_date", "similarity_distance"])
-    columns = [
-        column
-        for column in PATTERN_FEATURE_COLUMNS
-        if column in ordered.columns and column.endswith(SIMILARITY_SUFFIXES)
-    ]
-    train = candidates[columns].replace([float("inf"), float("-inf")], pd.NA)
-    scale = train.quantile(0.75) - train.quantile(0.25)
-    scale = scale.where(scale.abs() > 1e-9, 1.0)
-    current = ordered.loc[current_date, columns]
-    distance = train.sub(current).divide(scale).pow(2).mean(axis=1, skipna=True).pow(0.5)
-    ranked = distance.dropna().sort_values().rename("similarity_distance").reset_index()
-    ranked = ranked.rename(columns={ranked.columns[0]: "as_of_date"})
-    return _select_spaced_episode_anchors(
-        ranked,
-        feature_index=ordered.index,
-        minimum_spacing=max(1, int(horizon)),
-        limit=max(1, int(max_episodes)),
+    index = episode_index or PatternEpisodeIndex(feature_frame)
+    return index.select(
+        current_date=current_date,
+        horizon=horizon,
+        max_episodes=max_episodes,
     )
 
 
@@ -838,6 +871,7 @@ def _forecast_for_configuration(
     context_frame: pd.DataFrame,
     states: pd.DataFrame,
     outcomes: pd.DataFrame,
+    episode_index: AnalogEpisodeIndex | None = None,
 ) -> dict[str, Any] | None:
     key, temperature = configuration
     current_date = pd.Timestamp(origin_date)
@@ -876,6 +910,7 @@ def _forecast_for_configuration(
             horizon=horizon,
             candidate=candidate,
             temperature=temperature,
+            episode_index=episode_index,
         )
         if analogs.empty:
             return None
@@ -936,6 +971,7 @@ def _select_configuration_at_cutoff(
     states: pd.DataFrame,
     outcomes: pd.DataFrame,
     forecast_cache: dict[tuple[pd.Timestamp, str, float], dict[str, Any] | None],
+    episode_index: AnalogEpisodeIndex | None = None,
 ) -> dict[str, str | float | int] | None:
     actual_by_date = {
         pd.Timestamp(row["as_of_date"]): str(row["outcome_regime"])
@@ -965,6 +1001,7 @@ def _select_configuration_at_cutoff(
                     context_frame=context_frame,
                     states=states,
                     outcomes=outcomes,
+                    episode_index=episode_index,
                 )
             forecast = forecast_cache[cache_key]
             if forecast is None:
@@ -993,14 +1030,96 @@ def _closest_weighted_episodes(rows: pd.DataFrame) -> list[dict[str, Any]]:
     ]
 
 
-def _build_nested_horizon_outlook(
-    *,
-    horizon: int,
-    feature_frame: pd.DataFrame,
+ForecastKey = tuple[pd.Timestamp, str, float]
+_NESTED_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_nested_worker(
+    momentum: pd.DataFrame,
     context_frame: pd.DataFrame,
+    states: pd.DataFrame,
     outcomes: pd.DataFrame,
-    current_date: pd.Timestamp,
-) -> dict[str, Any]:
+) -> None:
+    _NESTED_WORKER_STATE.update(
+        momentum=momentum,
+        context_frame=context_frame,
+        states=states,
+        outcomes=outcomes,
+        episode_index=AnalogEpisodeIndex(momentum, context_frame),
+    )
+
+
+def _run_forecast_shard(
+    horizon: int,
+    configuration: tuple[str, float],
+    origins: list[pd.Timestamp],
+) -> list[tuple[ForecastKey, dict[str, Any] | None]]:
+    state = _NESTED_WORKER_STATE
+    results: list[tuple[ForecastKey, dict[str, Any] | None]] = []
+    for origin in origins:
+        forecast = _forecast_for_configuration(
+            configuration=configuration,
+            origin_date=origin,
+            horizon=horizon,
+            momentum_frame=state["momentum"],
+            context_frame=state["context_frame"],
+            states=state["states"],
+            outcomes=state["outcomes"],
+            episode_index=state["episode_index"],
+        )
+        # Cached forecasts are only read for probabilities, centers and regions;
+        # dropping the analog rows keeps the result pickle small.
+        if forecast is not None:
+            forecast = {key: value for key, value in forecast.items() if key != "rows"}
+        results.append(((origin, configuration[0], configuration[1]), forecast))
+    return results
+
+
+def _prefill_forecast_cache(
+    executor: Executor,
+    forecast_cache: dict[ForecastKey, dict[str, Any] | None],
+    *,
+    horizon: int,
+    keys: Sequence[ForecastKey],
+    workers: int,
+) -> None:
+    """Evaluate missing (origin, configuration) forecasts in worker processes.
+
+    Work is sharded by configuration and contiguous origin chunks. Every
+    forecast is a pure function of its key, so merging by key reproduces the
+    sequential cache exactly regardless of completion order.
+    """
+
+    pending: dict[tuple[str, float], list[pd.Timestamp]] = {}
+    for key in dict.fromkeys(keys):
+        if key not in forecast_cache:
+            pending.setdefault((key[1], key[2]), []).append(key[0])
+    if not pending:
+        return
+    total = sum(len(origins) for origins in pending.values())
+    chunk = max(1, -(-total // (max(1, int(workers)) * 4)))
+    futures = [
+        executor.submit(_run_forecast_shard, int(horizon), configuration, origins[start : start + chunk])
+        for configuration, origins in pending.items()
+        for start in range(0, len(origins), chunk)
+    ]
+    for future in futures:
+        forecast_cache.update(future.result())
+
+
+def _fold_test_rows(
+    horizon_rows: pd.DataFrame,
+    fold: WalkForwardFold,
+    *,
+    horizon: int,
+) -> pd.DataFrame:
+    return horizon_rows[
+        (horizon_rows["as_of_date"] >= fold.test_start)
+        & (horizon_rows["as_of_date"] <= fold.test_end)
+    ].iloc[:: max(1, int(horizon))]
+
+
+def _nested_predictor_frames(feature_frame: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     states = build_pattern_state_frame(feature_frame)
     momentum = build_momentum_predictor_frame(
         feature_frame,
@@ -1010,6 +1129,24 @@ def _build_nested_horizon_outlook(
             else 1
         ),
     )
+    return states, momentum
+
+
+def _build_nested_horizon_outlook(
+    *,
+    horizon: int,
+    feature_frame: pd.DataFrame,
+    context_frame: pd.DataFrame,
+    outcomes: pd.DataFrame,
+    current_date: pd.Timestamp,
+    states: pd.DataFrame | None = None,
+    momentum: pd.DataFrame | None = None,
+    executor: Executor | None = None,
+    workers: int = 1,
+) -> dict[str, Any]:
+    if states is None or momentum is None:
+        states, momentum = _nested_predictor_frames(feature_frame)
+    episode_index = AnalogEpisodeIndex(momentum, context_frame)
     cache: dict[tuple[pd.Timestamp, str, float], dict[str, Any] | None] = {}
     actual_all: list[str] = []
     forecast_all: list[dict[str, float]] = []
@@ -1026,8 +1163,31 @@ def _build_nested_horizon_outlook(
     evaluated_folds = 0
     selection_counts: dict[str, int] = {}
     horizon_rows = outcomes[outcomes["horizon"] == int(horizon)].copy()
-    for fold in build_walk_forward_folds(feature_frame, horizon=horizon):
-        selected_config = _select_configuration_at_cutoff(
+    folds = build_walk_forward_folds(feature_frame, horizon=horizon)
+    if executor is not None:
+        inner_origins = dict.fromkeys(
+            origin
+            for cutoff in (*(fold.train_end for fold in folds), current_date)
+            for origin in _eligible_inner_origins(
+                outcomes,
+                states=states,
+                horizon=horizon,
+                cutoff=cutoff,
+            )
+        )
+        _prefill_forecast_cache(
+            executor,
+            cache,
+            horizon=horizon,
+            keys=[
+                (origin, *configuration)
+                for configuration in _candidate_configurations()
+                for origin in inner_origins
+            ],
+            workers=workers,
+        )
+    selections = [
+        _select_configuration_at_cutoff(
             cutoff=fold.train_end,
             horizon=horizon,
             momentum_frame=momentum,
@@ -1035,7 +1195,29 @@ def _build_nested_horizon_outlook(
             states=states,
             outcomes=outcomes,
             forecast_cache=cache,
+            episode_index=episode_index,
+        )
+        for fold in folds
+    ]
+    if executor is not None:
+        _prefill_forecast_cache(
+            executor,
+            cache,
+            horizon=horizon,
+            keys=[
+                (pd.Timestamp(origin), name, temperature)
+                for fold, selected in zip(folds, selections)
+                if selected is not None
+                for origin in _fold_test_rows(horizon_rows, fold, horizon=horizon)["as_of_date"]
+                for name, temperature in (
+                    (str(selected["candidate"]), float(selected["temperature"])),
+                    ("B0_UNCONDITIONAL", 0.0),
+                    ("B1_PERSISTENCE", 0.0),
+                )
+            ],
+            workers=workers,
         )
+    for fold, selected_config in zip(folds, selections):
         if selected_config is None:
             continue
         configuration = (
@@ -1043,10 +1225,7 @@ def _build_nested_horizon_outlook(
             float(selected_config["temperature"]),
         )
         selection_counts[configuration[0]] = selection_counts.get(configuration[0], 0) + 1
-        test = horizon_rows[
-            (horizon_rows["as_of_date"] >= fold.test_start)
-            & (horizon_rows["as_of_date"] <= fold.test_end)
-        ].iloc[:: max(1, int(horizon))]
+        test = _fold_test_rows(horizon_rows, fold, horizon=horizon)
         fold_model_losses: list[float] = []
         fold_baseline_losses: list[float] = []
         for _, actual_row in test.iterrows():
@@ -1068,6 +1247,7 @@ def _build_nested_horizon_outlook(
                         context_frame=context_frame,
                         states=states,
                         outcomes=outcomes,
+                        episode_index=episode_index,
                     )
                 forecasts[name] = cache[key]
             model = forecasts.get(configuration[0])
@@ -1335,7 +1515,9 @@ def _walk_forward_metrics(
     feature_frame: pd.DataFrame,
     outcomes: pd.DataFrame,
     horizon: int,
+    episode_index: PatternEpisodeIndex | None = None,
 ) -> dict[str, float | None]:
+    episode_index = episode_index or PatternEpisodeIndex(feature_frame)
     actual_all: list[str] = []
     forecast_all: list[dict[str, float]] = []
     baseline_all: list[dict[str, float]] = []
@@ -1358,6 +1540,7 @@ def _walk_forward_metrics(
                 feature_frame,
                 current_date=test_date,
                 horizon=horizon,
+                episode_index=episode_index,
             )
             matched = matches.merge(
                 train[["as_of_date", "outcome_regime"]],
@@ -1405,9 +1588,12 @@ def _walk_forward_path_metrics(
     feature_frame: pd.DataFrame,
     coordinates: pd.DataFrame,
     horizon: int,
+    episode_index: PatternEpisodeIndex | None = None,
 ) -> dict[str, float | int | None]:
     """Evaluate terminal analog coordinates using chronological train-only rows."""
 
+    episode_index = episode_index or PatternEpisodeIndex(feature_frame)
+
     terminal = coordinates[
         (coordinates["horizon"] == horizon)
         & (coordinates["step"] == horizon)
@@ -1433,6 +1619,7 @@ def _walk_forward_path_metrics(
                 feature_frame,
                 current_date=test_date,
                 horizon=horizon,
+                episode_index=episode_index,
             )
             analogs = matches.merge(
                 train[["as_of_date", "delta_x", "delta_y"]],
@@ -1606,10 +1793,12 @@ def _build_horizon_outlook(
     current_date: pd.Timestamp,
     current_location: dict[str, Any],
 ) -> dict[str, Any]:
+    episode_index = PatternEpisodeIndex(feature_frame)
     matches = select_similar_episodes(
         feature_frame,
         current_date=current_date,
         horizon=horizon,
+        episode_index=episode_index,
     )
     horizon_outcomes = outcomes[outcomes["horizon"] == horizon].copy()
     selected = matches.merge(horizon_outcomes, on="as_of_date", how="inner")
@@ -1666,6 +1855,7 @@ def _build_horizon_outlook(
         feature_frame=feature_frame,
         outcomes=outcomes,
         horizon=horizon,
+        episode_index=episode_index,
     )
     probability_status = publication_status_for_metrics(
         episode_count=episode_count,
@@ -1678,6 +1868,7 @@ def _build_horizon_outlook(
         feature_frame=feature_frame,
         coordinates=coordinates,
         horizon=horizon,
+        episode_index=episode_index,
     )
     path_status = path_publication_status(
         episode_count=episode_count,
@@ -1747,8 +1938,15 @@ def build_pattern_outlook_snapshot(
     *,
     selected_symbols: Sequence[str],
     context_frame: pd.DataFrame | None = None,
+    max_workers: int | None = 1,
 ) -> dict[str, Any]:
-    """Build nested same-state 5D/20D distributions and independent gates."""
+    """Build nested same-state 5D/20D distributions and independent gates.
+
+    With ``max_workers`` > 1 (``None`` = one per CPU) the inner and outer fold
+    forecasts of every horizon are evaluated in a process pool that receives
+    the prepared predictor, context, state and outcome frames once. The
+    snapshot is identical to the sequential one.
+    """
 
     if feature_frame.empty:
         horizons = [
@@ -1803,16 +2001,34 @@ def build_pattern_outlook_snapshot(
             if context_frame is not None
             else pd.DataFrame(index=feature_frame.index)
         )
-        horizons = [
-            _build_nested_horizon_outlook(
-                horizon=horizon,
-                feature_frame=feature_frame,
-                context_frame=aligned_context,
-                outcomes=outcomes,
-                current_date=current_date,
+        states, momentum = _nested_predictor_frames(feature_frame)
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        executor: ProcessPoolExecutor | None = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=int(workers),
+                mp_context=process_pool_context(),
+                initializer=_init_nested_worker,
+                initargs=(momentum, aligned_context, states, outcomes),
             )
-            for horizon in OUTLOOK_HORIZONS
-        ]
+        try:
+            horizons = [
+                _build_nested_horizon_outlook(
+                    horizon=horizon,
+                    feature_frame=feature_frame,
+                    context_frame=aligned_context,
+                    outcomes=outcomes,
+                    current_date=current_date,
+                    states=states,
+                    momentum=momentum,
+                    executor=executor,
+                    workers=int(workers),
+                )
+                for horizon in OUTLOOK_HORIZONS
+            ]
+        finally:
+            if executor is not None:
+                executor.shutdown()
     return {
         "schema_version": PATTERN_OUTLOOK_SCHEMA_VERSION,
         "status": (
@@ -1954,22 +2170,66 @@ def prepare_overview_futures_macro_pattern_inputs(
     }
 
 
+def pattern_outlook_cache_key(prepared: dict[str, Any]) -> str | None:
+    """Key a finished outlook by its input fingerprint and every version it depends on."""
+
+    input_fingerprint = str(prepared.get("input_fingerprint") or "")
+    if len(input_fingerprint) != 64:
+        return None
+    encoded = json.dumps(
+        {
+            "input_fingerprint": input_fingerprint,
+            "selected_symbols": list(prepared.get("selected_symbols") or ()),
+            "feature_schema_version": PATTERN_STATE_SCHEMA_VERSION,
+            "algorithm_version": PATTERN_ALGORITHM_VERSION,
+            "outlook_schema_version": PATTERN_OUTLOOK_SCHEMA_VERSION,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def build_overview_futures_macro_pattern_outlook_from_inputs(
     prepared: dict[str, Any],
+    *,
+    max_workers: int | None = 1,
+    cache: PatternOutlookCache | None = None,
 ) -> dict[str, Any]:
-    """Run nested pattern validation from one prepared point-in-time input bundle."""
+    """Run nested pattern validation from one prepared point-in-time input bundle.
+
+    With a ``cache``, a snapshot finished earlier for the same input fingerprint
+    and versions is read back instead of rerunning the validation. Session
+    evidence is always taken from ``prepared``; it does not enter the key.
+    """
+
+    key = pattern_outlook_cache_key(prepared) if cache is not None else None
+    cached = cache.load(key) if cache is not None and key is not None else None
+    if cached is not None:
+        snapshot = cached
+    else:
+        snapshot = _build_overview_pattern_outlook(prepared, max_workers=max_workers)
+        if cache is not None and key is not None:
+            cache.store(key, snapshot)
+    snapshot["session"] = dict(prepared["session"])
+    snapshot["input_fingerprint"] = str(prepared["input_fingerprint"])
+    snapshot["input_evidence"] = dict(prepared["input_evidence"])
+    return snapshot
+
 
-    snapshot = build_pattern_outlook_snapshot(
+def _build_overview_pattern_outlook(
+    prepared: dict[str, Any],
+    *,
+    max_workers: int | None,
+) -> dict[str, Any]:
+    return build_pattern_outlook_snapshot(
         prepared["candles"],
         prepared["features"],
         dict(prepared["current_pattern"]),
         selected_symbols=tuple(prepared["selected_symbols"]),
         context_frame=prepared["context_frame"],
+        max_workers=max_workers,
     )
-    snapshot["session"] = dict(prepared["session"])
-    snapshot["input_fingerprint"] = str(prepared["input_fingerprint"])
-    snapshot["input_evidence"] = dict(prepared["input_evidence"])
-    return snapshot
 
 
 def load_overview_futures_macro_pattern_outlook(
@@ -1980,8 +2240,14 @@ def load_overview_futures_macro_pattern_outlook(
     cache_ttl_seconds: int = PATTERN_OUTLOOK_CACHE_TTL_SECONDS,
     force_refresh: bool = False,
     evaluation_time: datetime | None = None,
+    max_workers: int | None = 1,
+    cache: PatternOutlookCache | None = None,
 ) -> dict[str, Any]:
-    """Load stored daily futures and cache the outlook by latest daily marker."""
+    """Load stored daily futures and cache the outlook by latest daily marker.
+
+    ``force_refresh`` only bypasses the in-process marker cache; a ``cache``
+    is keyed by input content and still serves an unchanged input bundle.
+    """
 
     query = query_fn or _default_query
     selected_symbols = tuple(
@@ -2014,7 +2280,47 @@ def load_overview_futures_macro_pattern_outlook(
         years=years,
         evaluation_time=evaluated_at,
     )
-    snapshot = build_overview_futures_macro_pattern_outlook_from_inputs(prepared)
+    snapshot = build_overview_futures_macro_pattern_outlook_from_inputs(
+        prepared,
+        max_workers=max_workers,
+        cache=cache,
+    )
     if cache_ttl_seconds > 0:
         _PATTERN_OUTLOOK_CACHE[cache_key] = (now, snapshot)
     return snapshot
+
+
+def warm_overview_futures_macro_pattern_outlook_cache(
+    *,
+    query_fn: QueryFn | None = None,
+    years: int = FUTURES_MACRO_HISTORY_YEARS,
+    evaluation_time: datetime | None = None,
+    max_workers: int | None = 1,
+    cache: PatternOutlookCache | None = None,
+) -> dict[str, Any]:
+    """Finish the outlook for the current inputs ahead of the next reader."""
+
+    store = cache if cache is not None else default_pattern_outlook_cache()
+    if store is None:
+        return {"status": "disabled", "input_fingerprint": None, "duration_sec": 0.0}
+    started = monotonic()
+    prepared = prepare_overview_futures_macro_pattern_inputs(
+        query_fn=query_fn,
+        years=years,
+        evaluation_time=evaluation_time,
+    )
+    key = pattern_outlook_cache_key(prepared)
+    status = "unavailable"
+    if key is not None:
+        if store.load(key) is not None:
+            status = "hit"
+        else:
+            snapshot = _build_overview_pattern_outlook(prepared, max_workers=max_workers)
+            status = "stored" if store.store(key, snapshot) else "not_stored"
+    return {
+        "status": status,
+        "input_fingerprint": prepared.get("input_fingerprint"),
+        "as_of_date": prepared.get("as_of_date"),
+        "cache_key": key,
+        "duration_sec": round(monotonic() - started, 3),
+    }
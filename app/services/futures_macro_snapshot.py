@@ -18,6 +18,9 @@ from app.services.futures_macro_pattern_validation import (
     prepare_overview_futures_macro_pattern_inputs,
 )
 from app.services.futures_macro_pattern import PATTERN_STATE_SCHEMA_VERSION
+from app.services.futures_macro_pattern_outlook_cache import (
+    default_pattern_outlook_cache,
+)
 from app.services.futures_macro_thermometer import (
     _default_query,
     _latest_daily_cache_marker,
@@ -333,8 +336,17 @@ def materialize_overview_futures_macro_snapshot(
     write_fn: Callable[[dict[str, object], dict[str, object]], object] | None = None,
     now_fn: Callable[[], str] | None = None,
     evaluation_time: datetime | None = None,
+    pattern_max_workers: int | None = 1,
 ) -> dict[str, Any]:
-    """Calculate once per compatible daily marker and persist the compact result."""
+    """Calculate once per compatible daily marker and persist the compact result.
+
+    Nested pattern validation runs on ``pattern_max_workers`` processes
+    (``None`` = one per CPU); the stored result does not depend on it.
+    Ingestion jobs and Streamlit threads share their process, so the default
+    stays in-process; pass more only from a caller that owns the process.
+    A finished outlook for the same input fingerprint is read from the
+    shared pattern outlook cache instead of being validated again.
+    """
 
     marker = (marker_fn or _current_source_marker)()
     if not marker:
@@ -435,7 +447,9 @@ def materialize_overview_futures_macro_snapshot(
         build_outlook = outlook_builder
     elif prepared is not None:
         build_outlook = lambda: build_overview_futures_macro_pattern_outlook_from_inputs(
-            prepared
+            prepared,
+            max_workers=pattern_max_workers,
+            cache=default_pattern_outlook_cache(),
         )
     else:
         build_outlook = lambda: load_overview_futures_macro_pattern_outlook(
@@ -443,6 +457,7 @@ def materialize_overview_futures_macro_snapshot(
             force_refresh=True,
             cache_ttl_seconds=0,
             evaluation_time=evaluated_at,
+            max_workers=pattern_max_workers,
         )
     materialized_at = (
         now_fn
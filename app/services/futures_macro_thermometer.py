@@ -260,25 +260,10 @@ CAUTION_LINES = [
 
 
 def _default_query(db_name: str, sql: str, params: Sequence[Any] | None = None) -> list[dict[str, Any]]:
-    import pymysql
-
-    conn = pymysql.connect(
-        host="localhost",
-        user="root",
-        password="1234",
-        port=3306,
-        charset="utf8mb4",
-        autocommit=True,
-        cursorclass=pymysql.cursors.DictCursor,
-    )
-    try:
-        with conn.cursor() as cur:
-            cur.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
-            cur.execute(f"USE {db_name}")
-            cur.execute(sql, params)
-            return list(cur.fetchall())
-    finally:
-        conn.close()
+    from finance.data.db.mysql import mysql_client
+
+    with mysql_client(db_name) as db:
+        return db.query(sql, params)
 
 
 def _instrument_rows(query_fn: QueryFn) -> list[dict[str, Any]]:
@@ -7,13 +7,27 @@ from typing import Any
 import pandas as pd
 
 from finance.data.institutional_13f import SEC_13F_SOURCE_CAVEATS
+from finance.data.db.mysql import MySQLClient
+from finance.data.institutional_13f_summary import (
+    DB_META as SUMMARY_DB,
+    load_db_timestamp,
+    load_institutional_13f_summary_targets,
+    load_manager_accession_pointer,
+    load_stale_institutional_13f_summary_targets,
+    refresh_institutional_13f_popularity,
+    replace_institutional_13f_manager_summary,
+    sync_institutional_13f_summary_schema,
+)
 from finance.loaders.institutional_13f import (
+    iter_institutional_13f_portfolio_bundles,
     load_institutional_13f_interest,
+    load_institutional_13f_manager_summary,
     load_institutional_13f_manager_watchlist,
     load_institutional_13f_managers,
     load_institutional_13f_managers_by_ciks,
     load_institutional_13f_portfolio_bundle,
     load_institutional_13f_popularity_ranking,
+    popularity_aggregate_sql,
     load_institutional_13f_refresh_status,
 )
 from finance.loaders.price import load_price_history
@@ -318,6 +332,10 @@ def _num(value: Any, default: float = 0.0) -> float:
         return default
 
 
+def _optional_num(value: Any) -> float | None:
+    return None if value is None else _num(value)
+
+
 def _money_label(value: Any) -> str:
     numeric = _num(value)
     if abs(numeric) >= 1_000_000_000:
@@ -1853,6 +1871,83 @@ def build_institutional_portfolio_model(
     }
 
 
+def build_institutional_portfolio_model_from_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild `build_institutional_portfolio_model` output from materialized summary rows."""
+    snapshot = dict(summary.get("snapshot") or {})
+    holdings = [
+        {
+            "issuer_name": _text(row.get("issuer_name")) or "-",
+            "holding_symbol": _text(row.get("holding_symbol")),
+            "symbol_source": _text(row.get("symbol_source")),
+            "mapping_status": _text(row.get("mapping_status")),
+            "cusip": _text(row.get("cusip")),
+            "figi": _text(row.get("figi")),
+            "title_of_class": _text(row.get("title_of_class")),
+            "reported_value": _num(row.get("reported_value")),
+            "shares_or_principal_amount": _num(row.get("shares_or_principal_amount")),
+            "amount_type": _text(row.get("amount_type")),
+            "put_call": _text(row.get("put_call")),
+            "sector": _text(row.get("sector")),
+            "industry": _text(row.get("industry")),
+            "weight_pct": _num(row.get("weight_pct")),
+            "source_ref": _text(row.get("source_ref")),
+        }
+        for row in summary.get("positions") or []
+    ]
+    changes = [
+        {
+            "change_type": _text(row.get("change_type")),
+            "issuer_name": _text(row.get("issuer_name")),
+            "holding_symbol": _text(row.get("holding_symbol")),
+            "cusip": _text(row.get("cusip")),
+            "latest_reported_value": _optional_num(row.get("latest_reported_value")),
+            "previous_reported_value": _optional_num(row.get("previous_reported_value")),
+            "value_delta": _num(row.get("value_delta")),
+            "latest_shares_or_principal": _optional_num(row.get("latest_shares_or_principal")),
+            "previous_shares_or_principal": _optional_num(row.get("previous_shares_or_principal")),
+            "share_delta": _num(row.get("share_delta")),
+            "weight_pct": _optional_num(row.get("weight_pct")),
+        }
+        for row in summary.get("changes") or []
+    ]
+    sector_exposure = [
+        {
+            "sector": _text(row.get("sector")) or "Unmapped",
+            "reported_value": _num(row.get("reported_value")),
+            "weight_pct": _num(row.get("weight_pct")),
+            "holding_count": int(_num(row.get("holding_count"))),
+        }
+        for row in summary.get("sectors") or []
+    ]
+    return {
+        "summary": {
+            "manager_name": _text(snapshot.get("manager_name")) or "Unknown manager",
+            "cik": _text(snapshot.get("cik")),
+            "latest_report_period": _date_label(snapshot.get("report_period")),
+            "latest_filing_date": _date_label(snapshot.get("filing_date")),
+            "previous_report_period": _date_label(snapshot.get("previous_report_period")),
+            "previous_filing_date": _date_label(snapshot.get("previous_filing_date")),
+            "accession_number": _text(snapshot.get("accession_number")),
+            "source_ref": _text(snapshot.get("source_ref")),
+            "collected_at": _text(snapshot.get("collected_at")),
+            "total_reported_value": round(_num(snapshot.get("total_reported_value")), 4),
+            "holding_count": int(_num(snapshot.get("holding_count"))),
+        },
+        "holdings": holdings,
+        "changes": changes,
+        "change_summary": _change_summary(changes),
+        "sector_exposure": sector_exposure,
+        "caveats": list(INSTITUTIONAL_PORTFOLIO_CAVEATS),
+        "boundary": {
+            "recommendation": False,
+            "trade_signal": False,
+            "live_trading": False,
+            "registry_write": False,
+            "saved_portfolio_write": False,
+        },
+    }
+
+
 def build_institutional_interest_model(query: str, holder_rows: pd.DataFrame | None) -> dict[str, Any]:
     rows = _records(holder_rows)
     holders: list[dict[str, Any]] = []
@@ -1936,7 +2031,18 @@ def load_institutional_refresh_status() -> dict[str, Any]:
 
 def load_institutional_portfolio_model(cik: str) -> dict[str, Any]:
     try:
-        bundle = load_institutional_13f_portfolio_bundle(cik)
+        summary = load_institutional_13f_manager_summary(cik)
+        if summary is not None:
+            model = build_institutional_portfolio_model_from_summary(summary)
+        else:
+            bundle = load_institutional_13f_portfolio_bundle(cik)
+            model = build_institutional_portfolio_model(
+                manager=bundle.get("manager"),
+                latest_filing=bundle.get("latest_filing"),
+                latest_holdings=bundle.get("latest_holdings"),
+                previous_filing=bundle.get("previous_filing"),
+                previous_holdings=bundle.get("previous_holdings"),
+            )
     except Exception as exc:
         return {
             "status": "error",
@@ -1947,13 +2053,6 @@ def load_institutional_portfolio_model(cik: str) -> dict[str, Any]:
                 latest_holdings=pd.DataFrame(),
             ),
         }
-    model = build_institutional_portfolio_model(
-        manager=bundle.get("manager"),
-        latest_filing=bundle.get("latest_filing"),
-        latest_holdings=bundle.get("latest_holdings"),
-        previous_filing=bundle.get("previous_filing"),
-        previous_holdings=bundle.get("previous_holdings"),
-    )
     report_period = _text((model.get("summary") or {}).get("latest_report_period"))
     symbols = _portfolio_symbols(list(model.get("holdings") or []))
     if report_period and symbols:
@@ -2022,3 +2121,94 @@ def load_institutional_popularity_model(report_period: str | None = None, *, lim
             "model": build_institutional_popularity_model(pd.DataFrame(), report_period=report_period),
         }
     return {"status": "ok", "message": "", "model": build_institutional_popularity_model(rows, report_period=report_period)}
+
+
+def materialize_institutional_13f_summaries(
+    *,
+    source_dataset: str | None = None,
+    ciks: list[str] | None = None,
+    host: str = "localhost",
+    user: str = "root",
+    password: str = "1234",
+    port: int = 3306,
+) -> dict[str, Any]:
+    """Write per-manager change / sector summaries and per-CUSIP popularity for refreshed 13F rows.
+
+    Targets are the managers and report periods with filings from `source_dataset`,
+    or from `ciks` when no dataset label is given, plus every stored summary whose
+    CUSIP mappings or asset profile sectors changed since it was written. With
+    neither scope only those drifted summaries are refreshed. Each manager's
+    latest effective quarter goes through the same `build_institutional_portfolio_model`
+    the live read path uses, so the studio can read the summary tables instead.
+    """
+    db = MySQLClient(host, user, password, port)
+    try:
+        db.use_db(SUMMARY_DB)
+        sync_institutional_13f_summary_schema(db)
+        # Taken before any holdings are read, so a mapping written mid-run marks the summary stale.
+        materialized_at = load_db_timestamp(db)
+        if source_dataset or ciks:
+            targets = load_institutional_13f_summary_targets(db, source_dataset=source_dataset, ciks=ciks)
+        else:
+            targets = {"ciks": [], "report_periods": []}
+        stale = load_stale_institutional_13f_summary_targets(db)
+        targets = {
+            name: list(dict.fromkeys([*targets[name], *stale[name]]))
+            for name in ("ciks", "report_periods")
+        }
+        managers_written = 0
+        rows_written = 0
+        for cik, bundle in iter_institutional_13f_portfolio_bundles(
+            targets["ciks"], host=host, user=user, password=password, port=port
+        ):
+            if not bundle.get("latest_filing"):
+                continue
+            model = build_institutional_portfolio_model(
+                manager=bundle.get("manager"),
+                latest_filing=bundle.get("latest_filing"),
+                latest_holdings=bundle.get("latest_holdings"),
+                previous_filing=bundle.get("previous_filing"),
+                previous_holdings=bundle.get("previous_holdings"),
+            )
+            summary = model["summary"]
+            if not summary.get("latest_report_period"):
+                continue
+            rows_written += replace_institutional_13f_manager_summary(
+                db,
+                snapshot={
+                    "cik": cik,
+                    "report_period": summary["latest_report_period"],
+                    "manager_name": summary["manager_name"],
+                    "accession_number": summary["accession_number"],
+                    "latest_accession_number": load_manager_accession_pointer(db, cik),
+                    "filing_date": summary["latest_filing_date"],
+                    "previous_report_period": summary["previous_report_period"],
+                    "previous_filing_date": summary["previous_filing_date"],
+                    "source_ref": summary["source_ref"],
+                    "collected_at": summary["collected_at"],
+                    "total_reported_value": summary["total_reported_value"],
+                    "holding_count": summary["holding_count"],
+                    "materialized_at": materialized_at,
+                },
+                positions=model["holdings"],
+                changes=model["changes"],
+                sectors=model["sector_exposure"],
+            )
+            managers_written += 1
+        popularity_rows = 0
+        for report_period in targets["report_periods"]:
+            popularity_rows += refresh_institutional_13f_popularity(
+                db,
+                report_period,
+                aggregate_sql=popularity_aggregate_sql(force_index=False),
+            )
+    finally:
+        db.close()
+    return {
+        "managers_materialized": managers_written,
+        "stale_managers": len(stale["ciks"]),
+        "manager_summary_rows_written": rows_written,
+        "report_periods": targets["report_periods"],
+        "popularity_rows_written": popularity_rows,
+        "rows_written": rows_written + popularity_rows,
+    }
@@ -62,10 +62,13 @@ from .valuation import (
     EntryPriceUnavailableError,
     ItemValueLane,
     PositionLedgerSummary,
+    ValuationAuditError,
     ValuationInputError,
+    assert_value_curves_agree,
     assess_corporate_action_consistency,
     build_direct_security_value_lane,
     modified_dietz_return,
+    modified_dietz_returns,
     resolve_direct_security_entry,
 )
 from .selected_strategy import (
@@ -162,10 +165,13 @@ __all__ = [
     "EntryPriceUnavailableError",
     "ItemValueLane",
     "PositionLedgerSummary",
+    "ValuationAuditError",
     "ValuationInputError",
+    "assert_value_curves_agree",
     "assess_corporate_action_consistency",
     "build_direct_security_value_lane",
     "modified_dietz_return",
+    "modified_dietz_returns",
     "resolve_direct_security_entry",
     "SelectedStrategyContract",
     "SelectedStrategyInputError",
@@ -5,10 +5,17 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Callable, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .persistence import MonitoringItemRecord, MonitoringRepository, PortfolioGroupRecord
-from .valuation import ItemValueLane, modified_dietz_return
+from .valuation import (
+    ItemValueLane,
+    assert_value_curves_agree,
+    modified_dietz_return,
+    modified_dietz_returns,
+    nullable_floats,
+)
 from .diagnosis import DIAGNOSIS_POLICY_VERSION, DiagnosisFact, project_diagnoses
 from .macro_context import MACRO_CONTEXT_VERSION, MacroContext, MacroObservation
 from .market_chart import MarketChartLoader, build_selected_item_market_chart
@@ -104,7 +111,10 @@ def calculate_group_metrics(
     if group_curve.empty or "date" not in group_curve or "total_value" not in group_curve:
         return _empty_metrics(capital)
     frame = group_curve.copy()
-    frame["date"] = pd.to_datetime(frame["date"], errors="coerce").dt.normalize()
+    dates = frame["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+    frame["date"] = dates.dt.normalize()
     frame["total_value"] = pd.to_numeric(frame["total_value"], errors="coerce")
     for column in (
         "gross_contributions",
@@ -193,7 +203,10 @@ def _normalized_lane_curve(lane: ItemValueLane) -> pd.DataFrame:
     frame = lane.curve.copy()
     if "date" not in frame or "total_value" not in frame:
         return pd.DataFrame(columns=["date", "total_value"])
-    frame["date"] = pd.to_datetime(frame["date"], errors="coerce").dt.normalize()
+    dates = frame["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+    frame["date"] = dates.dt.normalize()
     frame["total_value"] = pd.to_numeric(frame["total_value"], errors="coerce")
     for column in (
         "external_flow",
@@ -318,11 +331,163 @@ def _decision_lifecycle_from_lane(
     return dict(getattr(readiness, "decision_lifecycle", {}) or {})
 
 
+def _lane_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame:
+        return np.full(len(frame), np.nan)
+    return frame[column].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _item_value_arrays(
+    item: MonitoringItemRecord,
+    lane: ItemValueLane | None,
+    timeline: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Array form of `_value_at` and `_cashflow_at` over every timeline date."""
+
+    initial = float(lane.initial_capital if lane is not None else item.initial_capital)
+    values = np.full(len(timeline), initial)
+    contributions = np.full(len(timeline), initial)
+    withdrawals = np.zeros(len(timeline))
+    external_flow = np.zeros(len(timeline))
+    if lane is not None:
+        frame = _normalized_lane_curve(lane)
+        lane_dates = frame["date"].to_numpy(dtype="datetime64[ns]")
+        positions = np.searchsorted(lane_dates, timeline, side="right") - 1
+        covered = (timeline >= np.datetime64(lane.effective_start_date, "ns")) & (
+            positions >= 0
+        )
+        latest = positions[covered]
+        values[covered] = _lane_column(frame, "total_value")[latest]
+        lane_contributions = _lane_column(frame, "cumulative_contributions")[latest]
+        contributions[covered] = np.where(
+            np.isnan(lane_contributions), initial, lane_contributions
+        )
+        lane_withdrawals = _lane_column(frame, "cumulative_withdrawals")[latest]
+        withdrawals[covered] = np.where(
+            np.isnan(lane_withdrawals), 0.0, lane_withdrawals
+        )
+        exact = covered.copy()
+        exact[covered] = lane_dates[latest] == timeline[covered]
+        lane_flow = _lane_column(frame, "external_flow")[positions[exact]]
+        external_flow[exact] = np.where(np.isnan(lane_flow), 0.0, lane_flow)
+    if (
+        item.status == "ended"
+        and item.tracking_end_effective_date is not None
+        and item.exit_value is not None
+    ):
+        values[
+            timeline >= np.datetime64(item.tracking_end_effective_date, "ns")
+        ] = float(item.exit_value)
+    return values, contributions, withdrawals, external_flow
+
+
+def _group_value_curve(
+    ordered_items: Sequence[MonitoringItemRecord],
+    valid_lanes: Mapping[str, ItemValueLane],
+    timeline_dates: Sequence[date],
+    invested_capital: Decimal,
+) -> pd.DataFrame:
+    """Float64 group curve: as-of item values by searchsorted, Dietz by cumprod."""
+
+    timeline = np.asarray(
+        [np.datetime64(on_date, "ns") for on_date in timeline_dates],
+        dtype="datetime64[ns]",
+    )
+    columns: dict[str, Any] = {
+        "date": pd.Series([pd.Timestamp(on_date) for on_date in timeline_dates])
+    }
+    total = np.zeros(len(timeline))
+    gross_contributions = np.zeros(len(timeline))
+    gross_withdrawals = np.zeros(len(timeline))
+    external_flow = np.zeros(len(timeline))
+    for item in ordered_items:
+        values, contributions, withdrawals, item_flow = _item_value_arrays(
+            item,
+            valid_lanes.get(item.monitoring_item_id),
+            timeline,
+        )
+        columns[f"item:{item.monitoring_item_id}"] = values
+        total += values
+        gross_contributions += contributions
+        gross_withdrawals += withdrawals
+        external_flow += item_flow
+    previous_total = np.concatenate(([float(invested_capital)], total[:-1]))
+    daily_return = modified_dietz_returns(previous_total, total, external_flow)
+    columns["total_value"] = total
+    columns["external_flow"] = external_flow
+    columns["gross_contributions"] = gross_contributions
+    columns["gross_withdrawals"] = gross_withdrawals
+    columns["daily_flow_adjusted_return"] = nullable_floats(daily_return)
+    columns["unit_value"] = nullable_floats(np.cumprod(1.0 + daily_return))
+    return pd.DataFrame(columns)
+
+
+def _decimal_group_curve(
+    ordered_items: Sequence[MonitoringItemRecord],
+    valid_lanes: Mapping[str, ItemValueLane],
+    timeline_dates: Sequence[date],
+    invested_capital: Decimal,
+) -> pd.DataFrame:
+    """Date-by-item Decimal aggregation kept as the audit reference."""
+
+    rows: list[dict[str, Any]] = []
+    group_unit_value: Decimal | None = Decimal("1")
+    previous_total = invested_capital
+    for on_date in timeline_dates:
+        row: dict[str, Any] = {"date": pd.Timestamp(on_date)}
+        total = Decimal("0")
+        gross_contributions = Decimal("0")
+        gross_withdrawals = Decimal("0")
+        external_flow = Decimal("0")
+        for item in ordered_items:
+            lane = valid_lanes.get(item.monitoring_item_id)
+            value = _value_at(item, lane, on_date)
+            contributions, withdrawals, item_flow = _cashflow_at(
+                item,
+                lane,
+                on_date,
+            )
+            row[f"item:{item.monitoring_item_id}"] = float(value)
+            total += value
+            gross_contributions += contributions
+            gross_withdrawals += withdrawals
+            external_flow += item_flow
+        row["total_value"] = float(total)
+        row["external_flow"] = float(external_flow)
+        row["gross_contributions"] = float(gross_contributions)
+        row["gross_withdrawals"] = float(gross_withdrawals)
+        daily_return = modified_dietz_return(
+            previous_total,
+            total,
+            external_flow,
+        )
+        if daily_return is None or group_unit_value is None:
+            group_unit_value = None
+        else:
+            group_unit_value *= Decimal("1") + daily_return
+        row["daily_flow_adjusted_return"] = (
+            float(daily_return) if daily_return is not None else None
+        )
+        row["unit_value"] = (
+            float(group_unit_value) if group_unit_value is not None else None
+        )
+        rows.append(row)
+        previous_total = total
+    return pd.DataFrame(rows)
+
+
 def align_group_value_lanes(
     items: Sequence[MonitoringItemRecord],
     lanes: Mapping[str, ItemValueLane | BaseException],
+    *,
+    decimal_audit: bool = False,
 ) -> GroupValueResult:
-    """Align item lanes on one conservative common basis without interpolation."""
+    """Align item lanes on one conservative common basis without interpolation.
+
+    The daily group curve is aggregated in float64; `decimal_audit=True` also
+    runs the date-by-item Decimal aggregation and raises `ValuationAuditError`
+    when the two disagree beyond `LANE_AUDIT_TOLERANCE`.
+    """
 
     ordered_items = list(items)
     failures: dict[str, str] = {}
@@ -407,50 +572,20 @@ def align_group_value_lanes(
                 if start_date <= value.date() <= basis_date
             )
 
-    rows: list[dict[str, Any]] = []
-    group_unit_value: Decimal | None = Decimal("1")
-    previous_total = invested_capital
-    for on_date in sorted(value for value in timeline if start_date <= value <= basis_date):
-        row: dict[str, Any] = {"date": pd.Timestamp(on_date)}
-        total = Decimal("0")
-        gross_contributions = Decimal("0")
-        gross_withdrawals = Decimal("0")
-        external_flow = Decimal("0")
-        for item in ordered_items:
-            lane = valid_lanes.get(item.monitoring_item_id)
-            value = _value_at(item, lane, on_date)
-            contributions, withdrawals, item_flow = _cashflow_at(
-                item,
-                lane,
-                on_date,
-            )
-            row[f"item:{item.monitoring_item_id}"] = float(value)
-            total += value
-            gross_contributions += contributions
-            gross_withdrawals += withdrawals
-            external_flow += item_flow
-        row["total_value"] = float(total)
-        row["external_flow"] = float(external_flow)
-        row["gross_contributions"] = float(gross_contributions)
-        row["gross_withdrawals"] = float(gross_withdrawals)
-        daily_return = modified_dietz_return(
-            previous_total,
-            total,
-            external_flow,
-        )
-        if daily_return is None or group_unit_value is None:
-            group_unit_value = None
-        else:
-            group_unit_value *= Decimal("1") + daily_return
-        row["daily_flow_adjusted_return"] = (
-            float(daily_return) if daily_return is not None else None
-        )
-        row["unit_value"] = (
-            float(group_unit_value) if group_unit_value is not None else None
+    timeline_dates = sorted(
+        value for value in timeline if start_date <= value <= basis_date
+    )
+    curve = _group_value_curve(
+        ordered_items, valid_lanes, timeline_dates, invested_capital
+    )
+    if decimal_audit:
+        assert_value_curves_agree(
+            curve,
+            _decimal_group_curve(
+                ordered_items, valid_lanes, timeline_dates, invested_capital
+            ),
+            subject="group curve",
         )
-        rows.append(row)
-        previous_total = total
-    curve = pd.DataFrame(rows)
     contribution_by_item: dict[str, Decimal] = {}
     for item in ordered_items:
         lane = valid_lanes.get(item.monitoring_item_id)
@@ -5,6 +5,7 @@ from datetime import date
 from decimal import Decimal, InvalidOperation
 from typing import Any, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .commands import EndResolution, EntryResolution
@@ -19,6 +20,7 @@ from .schemas import FundingMode
 
 END_RETURN_GAP_TOLERANCE = Decimal("0.005")
 SESSION_CONTINUITY_GAP_TOLERANCE = Decimal("0.01")
+LANE_AUDIT_TOLERANCE = 1e-9
 
 
 class EntryPriceUnavailableError(ValueError):
@@ -33,6 +35,10 @@ class ValuationInputError(ValueError):
     pass
 
 
+class ValuationAuditError(ValueError):
+    pass
+
+
 @dataclass(frozen=True)
 class CorporateActionReview:
     status: str
@@ -56,6 +62,17 @@ class PositionLedgerSummary:
     initial_capital: Decimal | None = None
 
 
+@dataclass(frozen=True)
+class _LaneLedger:
+    curve: pd.DataFrame
+    review: CorporateActionReview
+    invalid_flow_return: bool
+    units: Decimal
+    cumulative_contributions: Decimal
+    cumulative_withdrawals: Decimal
+    final_total: Decimal
+
+
 @dataclass(frozen=True)
 class ItemValueLane:
     monitoring_item_id: str
@@ -123,7 +140,10 @@ def _prepare_history(history: pd.DataFrame | Iterable[dict[str, Any]]) -> pd.Dat
             columns=["date", "close", "adj_close", "dividends", "stock_splits"]
         )
     normalized = frame.copy()
-    normalized["date"] = pd.to_datetime(normalized["date"], errors="coerce").dt.normalize()
+    dates = normalized["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+    normalized["date"] = dates.dt.normalize()
     for column in ("close", "adj_close", "dividends", "stock_splits"):
         if column not in normalized.columns:
             normalized[column] = 0.0 if column in {"dividends", "stock_splits"} else float("nan")
@@ -257,75 +277,279 @@ def modified_dietz_return(
     return (end_value - begin_value - net_external_flow) / denominator
 
 
-def build_direct_security_value_lane(
-    item: MonitoringItemRecord,
-    history: pd.DataFrame | Iterable[dict[str, Any]],
-    position_events: Sequence[PositionEventRecord] = (),
-) -> ItemValueLane:
-    """Build a split-first position ledger with flow-adjusted performance."""
+def modified_dietz_returns(
+    begin_values: np.ndarray,
+    end_values: np.ndarray,
+    net_external_flows: np.ndarray,
+) -> np.ndarray:
+    """Vectorized `modified_dietz_return`; NaN where the denominator is not positive."""
+
+    denominator = begin_values + 0.5 * net_external_flows
+    valid = denominator > 0
+    result = np.full(denominator.shape, np.nan)
+    result[valid] = (
+        end_values[valid] - begin_values[valid] - net_external_flows[valid]
+    ) / denominator[valid]
+    return result
+
+
+def nullable_floats(values: np.ndarray) -> np.ndarray | list[None]:
+    # Row-dict frames hold NaN for partly missing columns and None for empty ones.
+    return [None] * len(values) if np.isnan(values).all() else values
+
+
+def _forward_fill(
+    count: int,
+    positions: np.ndarray,
+    values: Sequence[float],
+    initial: float,
+) -> np.ndarray:
+    filled = np.full(count, float(initial))
+    if len(positions):
+        marker = np.full(count, -1)
+        marker[positions] = np.arange(len(positions))
+        latest = np.maximum.accumulate(marker)
+        known = latest >= 0
+        filled[known] = np.asarray(values, dtype=float)[latest[known]]
+    return filled
+
+
+def _corporate_action_review_arrays(
+    raw_return_index: np.ndarray,
+    adjusted_return_index: np.ndarray,
+) -> CorporateActionReview:
+    """Float64 form of `assess_corporate_action_consistency` for full-length lanes."""
 
-    if item.source_type != "direct_security" or item.instrument_kind not in {"stock", "etf"}:
-        raise ValuationInputError("A direct stock or ETF item is required.")
-    if item.entry_close <= 0 or item.initial_capital <= 0:
-        raise ValuationInputError("positive entry close and initial capital are required.")
-    event_records = tuple(position_events)
-    position_eligible = is_position_ledger_item(item)
-    if event_records and not position_eligible:
-        raise ValuationInputError(
-            "Position events require a stock or ETF held by share count."
+    for values in (raw_return_index, adjusted_return_index):
+        if not np.all(np.isfinite(values) & (values > 0)):
+            raise ValuationInputError("Return index values must be positive and finite.")
+    if not len(raw_return_index) or len(raw_return_index) != len(adjusted_return_index):
+        return CorporateActionReview(
+            status="NOT_AVAILABLE",
+            total_return_gap=None,
+            max_session_gap=None,
+            reasons=("Adjusted-close cross-check coverage is unavailable.",),
         )
-    projection = (
-        project_position_events(item, event_records)
-        if position_eligible
-        else None
+    total_return_gap = abs(
+        (raw_return_index[-1] - 1.0) - (adjusted_return_index[-1] - 1.0)
     )
-    initial_contract = projection.initial_contract if projection is not None else None
-    effective_start_date = (
-        initial_contract.effective_start_date
-        if initial_contract is not None
-        else item.effective_start_date
+    session_gaps = np.abs(
+        (raw_return_index[1:] / raw_return_index[:-1] - 1.0)
+        - (adjusted_return_index[1:] / adjusted_return_index[:-1] - 1.0)
     )
-    frame = _prepare_history(history)
-    frame = frame.loc[
-        frame["date"] >= pd.Timestamp(effective_start_date)
-    ].copy()
-    if frame.empty or frame.iloc[0]["date"].date() != effective_start_date:
-        raise EntryPriceUnavailableError(
-            f"No usable close exists on effective start {effective_start_date.isoformat()}."
-        )
-    if projection is not None:
-        units = Decimal(projection.initial_contract.initial_shares)
-    else:
-        units = _initial_units(item)
-    initial_capital = (
-        initial_contract.initial_capital
-        if initial_contract is not None
-        else item.initial_capital
+    max_session_gap = float(session_gaps.max()) if session_gaps.size else 0.0
+    reasons: list[str] = []
+    if total_return_gap > float(END_RETURN_GAP_TOLERANCE):
+        reasons.append("End total-return gap exceeds 0.50%p.")
+    if max_session_gap > float(SESSION_CONTINUITY_GAP_TOLERANCE):
+        reasons.append("Single-session continuity gap exceeds 1.00%p.")
+    return CorporateActionReview(
+        status="DATA_REVIEW" if reasons else "READY",
+        total_return_gap=_decimal(float(total_return_gap)),
+        max_session_gap=_decimal(max_session_gap),
+        reasons=tuple(reasons),
     )
-    if initial_capital <= 0:
-        raise ValuationInputError("effective initial capital must be positive.")
 
-    split_factors: dict[date, Decimal] = {}
-    for row_index, row in frame.iterrows():
-        if row_index == frame.index[0]:
-            continue
-        factor = _decimal(row["stock_splits"])
-        if factor is not None and factor > 0 and factor != 1:
-            split_factors[row["date"].date()] = factor
-    snapshots = (
-        validate_position_sequence(item, projection, split_factors)
-        if projection is not None
-        else ()
+
+def _unavailable_review() -> CorporateActionReview:
+    return CorporateActionReview(
+        status="NOT_AVAILABLE",
+        total_return_gap=None,
+        max_session_gap=None,
+        reasons=("Adjusted-close cross-check coverage is unavailable.",),
     )
-    trades_by_date: dict[date, list[Any]] = {}
-    if projection is not None:
-        available_dates = {timestamp.date() for timestamp in frame["date"]}
-        for trade in projection.trades:
-            if trade.trade_date not in available_dates:
+
+
+def _apply_trades(
+    trades: Sequence[Any],
+    units: Decimal,
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """Apply one session's trades in order; returns units, flow, contributions, withdrawals."""
+
+    external_flow = Decimal("0")
+    contributions = Decimal("0")
+    withdrawals = Decimal("0")
+    for trade in trades:
+        if trade.execution_price is None or trade.execution_price <= 0:
+            raise ValuationInputError("Effective trades require a positive price.")
+        quantity = Decimal(trade.quantity)
+        if trade.position_effect == "buy":
+            contribution = quantity * trade.execution_price + trade.fee_usd
+            units += quantity
+            contributions += contribution
+            external_flow += contribution
+        else:
+            withdrawal = quantity * trade.execution_price - trade.fee_usd
+            if withdrawal <= 0:
                 raise ValuationInputError(
-                    "Every effective trade requires an exact stored market date."
+                    "Sell withdrawal must remain positive after fees."
                 )
-            trades_by_date.setdefault(trade.trade_date, []).append(trade)
+            units -= quantity
+            withdrawals += withdrawal
+            external_flow -= withdrawal
+        if units < 1:
+            raise ValuationInputError(
+                "A partial sell must leave at least one share."
+            )
+    return units, external_flow, contributions, withdrawals
+
+
+def _vector_lane_ledger(
+    frame: pd.DataFrame,
+    *,
+    units: Decimal,
+    initial_capital: Decimal,
+    trades_by_date: dict[date, list[Any]],
+    flow_indexed: bool,
+) -> _LaneLedger:
+    """Float64 lane: sparse Decimal corporate-action/trade events, array daily math."""
+
+    count = len(frame)
+    close = frame["close"].to_numpy(dtype=float)
+    splits = frame["stock_splits"].to_numpy(dtype=float)
+    dividends = frame["dividends"].to_numpy(dtype=float)
+    split_rows = np.isfinite(splits) & (splits > 0) & (splits != 1)
+    dividend_rows = np.isfinite(dividends) & (dividends > 0)
+    split_rows[0] = dividend_rows[0] = False
+    trade_rows = np.zeros(count, dtype=bool)
+    trades_at_row: dict[int, list[Any]] = {}
+    if trades_by_date:
+        row_by_date = {timestamp.date(): index for index, timestamp in enumerate(frame["date"])}
+        for trade_date, trades in trades_by_date.items():
+            trades_at_row[row_by_date[trade_date]] = trades
+            trade_rows[row_by_date[trade_date]] = True
+
+    # Only split, trade, and dividend sessions touch the Decimal ledger; other
+    # sessions carry the previous state forward.
+    event_positions = np.flatnonzero(split_rows | dividend_rows | trade_rows)
+    initial_units = units
+    dividend_cash = Decimal("0")
+    cumulative_contributions = initial_capital
+    cumulative_withdrawals = Decimal("0")
+    event_units: list[float] = []
+    event_dividend_cash: list[float] = []
+    event_contributions: list[float] = []
+    event_withdrawals: list[float] = []
+    external_flow = np.zeros(count)
+    for position in event_positions:
+        if split_rows[position]:
+            units *= _decimal(float(splits[position]))
+        trades = trades_at_row.get(int(position))
+        if trades:
+            units, flow, contributions, withdrawals = _apply_trades(trades, units)
+            cumulative_contributions += contributions
+            cumulative_withdrawals += withdrawals
+            external_flow[position] = float(flow)
+        if dividend_rows[position]:
+            dividend_cash += units * _decimal(float(dividends[position]))
+        event_units.append(float(units))
+        event_dividend_cash.append(float(dividend_cash))
+        event_contributions.append(float(cumulative_contributions))
+        event_withdrawals.append(float(cumulative_withdrawals))
+
+    unit_values = _forward_fill(count, event_positions, event_units, float(initial_units))
+    dividend_values = _forward_fill(count, event_positions, event_dividend_cash, 0.0)
+    market_value = unit_values * close
+    total_value = market_value + dividend_values
+    previous_total = np.concatenate(([float(initial_capital)], total_value[:-1]))
+    daily_return = modified_dietz_returns(previous_total, total_value, external_flow)
+    # An invalid Dietz day is NaN, which cumprod carries through the rest of the index.
+    flow_adjusted_index = np.cumprod(1.0 + daily_return)
+    raw_index = (
+        flow_adjusted_index if flow_indexed else total_value / float(initial_capital)
+    )
+    adj_close = frame["adj_close"].to_numpy(dtype=float)
+    usable_adjusted = np.isfinite(adj_close) & (adj_close > 0) & (not flow_indexed)
+    adjusted_rows = np.logical_and.accumulate(usable_adjusted & usable_adjusted[0])
+    adjusted_index = np.where(adjusted_rows, adj_close / adj_close[0], np.nan)
+    adjusted_value = float(initial_capital) * adjusted_index
+
+    curve = pd.DataFrame(
+        {
+            "date": frame["date"].to_numpy(),
+            "effective_units": unit_values,
+            "close": close,
+            "market_value": market_value,
+            "dividend_cash": dividend_values,
+            "total_value": total_value,
+            "raw_return_index": nullable_floats(raw_index),
+            "adjusted_return_index": nullable_floats(adjusted_index),
+            "adjusted_value": nullable_floats(adjusted_value),
+            "external_flow": external_flow,
+            "cumulative_contributions": _forward_fill(
+                count, event_positions, event_contributions, float(initial_capital)
+            ),
+            "cumulative_withdrawals": _forward_fill(
+                count, event_positions, event_withdrawals, 0.0
+            ),
+            "daily_flow_adjusted_return": nullable_floats(daily_return),
+            "flow_adjusted_index": nullable_floats(flow_adjusted_index),
+        }
+    )
+    review = (
+        _corporate_action_review_arrays(raw_index, adjusted_index)
+        if not flow_indexed and bool(adjusted_rows[-1])
+        else _unavailable_review()
+    )
+    return _LaneLedger(
+        curve=curve,
+        review=review,
+        invalid_flow_return=bool(np.isnan(daily_return).any()),
+        units=units,
+        cumulative_contributions=cumulative_contributions,
+        cumulative_withdrawals=cumulative_withdrawals,
+        final_total=units * _decimal(float(close[-1])) + dividend_cash,
+    )
+
+
+def assert_value_curves_agree(
+    actual: pd.DataFrame,
+    expected: pd.DataFrame,
+    *,
+    subject: str,
+    tolerance: float = LANE_AUDIT_TOLERANCE,
+) -> None:
+    """Raise `ValuationAuditError` unless two value curves match column by column."""
+
+    if list(actual.columns) != list(expected.columns) or len(actual) != len(expected):
+        raise ValuationAuditError(f"Float {subject} shape differs from the Decimal audit.")
+    if not actual["date"].equals(expected["date"]):
+        raise ValuationAuditError(f"Float {subject} dates differ from the Decimal audit.")
+    for column in actual.columns.drop("date"):
+        actual_values = pd.to_numeric(actual[column], errors="coerce").to_numpy(dtype=float)
+        expected_values = pd.to_numeric(expected[column], errors="coerce").to_numpy(dtype=float)
+        if not np.allclose(
+            actual_values,
+            expected_values,
+            rtol=tolerance,
+            atol=tolerance,
+            equal_nan=True,
+        ):
+            raise ValuationAuditError(
+                f"Float {subject} disagrees with the Decimal audit on {column}."
+            )
+
+
+def _assert_lane_agreement(fast: _LaneLedger, audit: _LaneLedger) -> None:
+    assert_value_curves_agree(fast.curve, audit.curve, subject="valuation lane")
+    if (
+        fast.review.status != audit.review.status
+        or fast.invalid_flow_return != audit.invalid_flow_return
+        or (fast.units, fast.cumulative_contributions, fast.cumulative_withdrawals, fast.final_total)
+        != (audit.units, audit.cumulative_contributions, audit.cumulative_withdrawals, audit.final_total)
+    ):
+        raise ValuationAuditError("Float valuation lane ledger differs from the Decimal audit.")
+
+
+def _decimal_lane_ledger(
+    frame: pd.DataFrame,
+    *,
+    units: Decimal,
+    initial_capital: Decimal,
+    trades_by_date: dict[date, list[Any]],
+    flow_indexed: bool,
+) -> _LaneLedger:
+    """Row-by-row Decimal ledger kept as the audit reference for the float lane."""
 
     dividend_cash = Decimal("0")
     cumulative_contributions = initial_capital
@@ -348,29 +572,11 @@ def build_direct_security_value_lane(
             split_factor = _decimal(row["stock_splits"])
             if split_factor is not None and split_factor > 0 and split_factor != 1:
                 units *= split_factor
-        external_flow = Decimal("0")
-        for trade in trades_by_date.get(row_date, []):
-            if trade.execution_price is None or trade.execution_price <= 0:
-                raise ValuationInputError("Effective trades require a positive price.")
-            quantity = Decimal(trade.quantity)
-            if trade.position_effect == "buy":
-                contribution = quantity * trade.execution_price + trade.fee_usd
-                units += quantity
-                cumulative_contributions += contribution
-                external_flow += contribution
-            else:
-                withdrawal = quantity * trade.execution_price - trade.fee_usd
-                if withdrawal <= 0:
-                    raise ValuationInputError(
-                        "Sell withdrawal must remain positive after fees."
-                    )
-                units -= quantity
-                cumulative_withdrawals += withdrawal
-                external_flow -= withdrawal
-            if units < 1:
-                raise ValuationInputError(
-                    "A partial sell must leave at least one share."
-                )
+        units, external_flow, contributions, withdrawals = _apply_trades(
+            trades_by_date.get(row_date, []), units
+        )
+        cumulative_contributions += contributions
+        cumulative_withdrawals += withdrawals
         if row_index != frame.index[0]:
             dividend = _decimal(row["dividends"])
             if dividend is not None and dividend > 0:
@@ -389,12 +595,12 @@ def build_direct_security_value_lane(
             flow_adjusted_index *= Decimal("1") + daily_return
         raw_index = (
             flow_adjusted_index
-            if event_records
+            if flow_indexed
             else total_value / initial_capital
         )
         adj_close = _decimal(row["adj_close"])
         if (
-            event_records
+            flow_indexed
             or not adjusted_complete
             or adj_close is None
             or adj_close <= 0
@@ -442,27 +648,134 @@ def build_direct_security_value_lane(
     review = (
         assess_corporate_action_consistency(raw_indexes, adjusted_indexes)
         if (
-            not event_records
+            not flow_indexed
             and adjusted_complete
             and len(adjusted_indexes) == len(raw_indexes)
         )
-        else CorporateActionReview(
-            status="NOT_AVAILABLE",
-            total_return_gap=None,
-            max_session_gap=None,
-            reasons=("Adjusted-close cross-check coverage is unavailable.",),
+        else _unavailable_review()
+    )
+    return _LaneLedger(
+        curve=pd.DataFrame(rows),
+        review=review,
+        invalid_flow_return=invalid_flow_return,
+        units=units,
+        cumulative_contributions=cumulative_contributions,
+        cumulative_withdrawals=cumulative_withdrawals,
+        final_total=previous_total,
+    )
+
+
+def build_direct_security_value_lane(
+    item: MonitoringItemRecord,
+    history: pd.DataFrame | Iterable[dict[str, Any]],
+    position_events: Sequence[PositionEventRecord] = (),
+    *,
+    decimal_audit: bool = False,
+) -> ItemValueLane:
+    """Build a split-first position ledger with flow-adjusted performance.
+
+    Daily values are computed in float64. With `decimal_audit=True` the lane is
+    also replayed through the row-by-row Decimal ledger and `ValuationAuditError`
+    is raised unless both agree within `LANE_AUDIT_TOLERANCE`.
+    """
+
+    if item.source_type != "direct_security" or item.instrument_kind not in {"stock", "etf"}:
+        raise ValuationInputError("A direct stock or ETF item is required.")
+    if item.entry_close <= 0 or item.initial_capital <= 0:
+        raise ValuationInputError("positive entry close and initial capital are required.")
+    event_records = tuple(position_events)
+    position_eligible = is_position_ledger_item(item)
+    if event_records and not position_eligible:
+        raise ValuationInputError(
+            "Position events require a stock or ETF held by share count."
         )
+    projection = (
+        project_position_events(item, event_records)
+        if position_eligible
+        else None
     )
+    initial_contract = projection.initial_contract if projection is not None else None
+    effective_start_date = (
+        initial_contract.effective_start_date
+        if initial_contract is not None
+        else item.effective_start_date
+    )
+    frame = _prepare_history(history)
+    frame = frame.loc[
+        frame["date"] >= pd.Timestamp(effective_start_date)
+    ].copy()
+    if frame.empty or frame.iloc[0]["date"].date() != effective_start_date:
+        raise EntryPriceUnavailableError(
+            f"No usable close exists on effective start {effective_start_date.isoformat()}."
+        )
+    if projection is not None:
+        units = Decimal(projection.initial_contract.initial_shares)
+    else:
+        units = _initial_units(item)
+    initial_capital = (
+        initial_contract.initial_capital
+        if initial_contract is not None
+        else item.initial_capital
+    )
+    if initial_capital <= 0:
+        raise ValuationInputError("effective initial capital must be positive.")
+
+    split_factors: dict[date, Decimal] = {}
+    split_rows = frame.iloc[1:]
+    split_rows = split_rows.loc[
+        (split_rows["stock_splits"] > 0) & (split_rows["stock_splits"] != 1)
+    ]
+    for timestamp, value in zip(split_rows["date"], split_rows["stock_splits"]):
+        factor = _decimal(float(value))
+        if factor is not None:
+            split_factors[timestamp.date()] = factor
+    snapshots = (
+        validate_position_sequence(item, projection, split_factors)
+        if projection is not None
+        else ()
+    )
+    trades_by_date: dict[date, list[Any]] = {}
+    if projection is not None:
+        available_dates = {timestamp.date() for timestamp in frame["date"]}
+        for trade in projection.trades:
+            if trade.trade_date not in available_dates:
+                raise ValuationInputError(
+                    "Every effective trade requires an exact stored market date."
+                )
+            trades_by_date.setdefault(trade.trade_date, []).append(trade)
+
+    ledger = _vector_lane_ledger(
+        frame,
+        units=units,
+        initial_capital=initial_capital,
+        trades_by_date=trades_by_date,
+        flow_indexed=bool(event_records),
+    )
+    if decimal_audit:
+        _assert_lane_agreement(
+            ledger,
+            _decimal_lane_ledger(
+                frame,
+                units=units,
+                initial_capital=initial_capital,
+                trades_by_date=trades_by_date,
+                flow_indexed=bool(event_records),
+            ),
+        )
+    review = ledger.review
+    units = ledger.units
+    cumulative_contributions = ledger.cumulative_contributions
+    cumulative_withdrawals = ledger.cumulative_withdrawals
     lane_status = (
         "data_review"
         if (
             review.status == "DATA_REVIEW"
             or item.status == "data_review"
-            or invalid_flow_return
+            or ledger.invalid_flow_return
         )
         else item.status
     )
-    curve = pd.DataFrame(rows)
+    curve = ledger.curve
     curve["data_status"] = lane_status
     position = None
     if projection is not None:
@@ -511,7 +824,7 @@ def build_direct_security_value_lane(
             current_shares=units,
             cumulative_contributions=cumulative_contributions,
             cumulative_withdrawals=cumulative_withdrawals,
-            pnl=previous_total
+            pnl=ledger.final_total
             + cumulative_withdrawals
             - cumulative_contributions,
             event_rows=tuple(event_rows),
@@ -11,6 +11,8 @@ import streamlit as st
 
 from finance.data.futures_market import DEFAULT_CORE_FUTURES_SYMBOLS
 from finance.data.nyse_db import load_nyse_listing_universe_status
+from app.jobs.ingestion.common import _resolve_ohlcv_execution_profile
+from app.jobs.job_telemetry import load_throughput_distribution, throughput_position
 from app.jobs.result_artifacts import write_run_artifacts
 from app.jobs.preflight_checks import (
     check_asset_profile_prerequisites,
@@ -113,7 +115,7 @@ def _runtime_metadata() -> dict[str, Any]:
     }
 
 
-def _format_job_elapsed(job: dict[str, Any] | None, *, now: datetime | None = None) -> str:
+def _job_elapsed_seconds(job: dict[str, Any] | None, *, now: datetime | None = None) -> float | None:
     started_at = (job or {}).get("ui_started_at")
     if isinstance(started_at, datetime):
         started_at_dt = started_at
@@ -121,11 +123,18 @@ def _format_job_elapsed(job: dict[str, Any] | None, *, now: datetime | None = No
         try:
             started_at_dt = datetime.fromisoformat(str(started_at))
         except ValueError:
-            return "00:00:00"
+            return None
     else:
+        return None
+    return max(((now or datetime.now()) - started_at_dt).total_seconds(), 0.0)
+
+
+def _format_job_elapsed(job: dict[str, Any] | None, *, now: datetime | None = None) -> str:
+    elapsed = _job_elapsed_seconds(job, now=now)
+    if elapsed is None:
         return "00:00:00"
 
-    elapsed_seconds = max(int(((now or datetime.now()) - started_at_dt).total_seconds()), 0)
+    elapsed_seconds = int(elapsed)
     hours, remainder = divmod(elapsed_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -830,6 +839,28 @@ def _render_inline_running_hint(action: str, label: str, *, job: dict[str, Any]
         )
 
 
+def _format_live_throughput(
+    job: dict[str, Any],
+    *,
+    processed_symbols: int,
+    rows_written: int,
+    distribution: dict[str, Any],
+) -> str:
+    elapsed = _job_elapsed_seconds(job)
+    if not elapsed or processed_symbols <= 0:
+        return ""
+    symbols_rate = processed_symbols / elapsed
+    text = f" | 속도 `{symbols_rate:.2f}` symbols/s, `{rows_written / elapsed:,.0f}` rows/s"
+    history = distribution.get("symbols_per_sec")
+    if history:
+        position = {"slow": "느림", "fast": "빠름", "typical": "보통"}[throughput_position(symbols_rate, history)]
+        text += (
+            f" (이력 p50 `{history['p50']:.2f}`, p10-p90 `{history['p10']:.2f}-{history['p90']:.2f}`"
+            f" symbols/s, {position})"
+        )
+    return text
+
+
 def _build_progress_callback(job: dict[str, Any], *, label: str) -> Any:
     action = job.get("action")
     symbol_count = len(job.get("params", {}).get("symbols", []) or [])
@@ -842,8 +873,10 @@ def _build_progress_callback(job: dict[str, Any], *, label: str) -> Any:
     progress_meta = st.empty()
     progress_bar = st.progress(0)
 
+    throughput_history: dict[str, Any] = {}
     if action in {"collect_ohlcv", "daily_market_update"}:
         progress_text.info(f"`{label}` 실행 중입니다. OHLCV batch 진행률과 경과 시간을 표시합니다.")
+        throughput_history = load_throughput_distribution(str(job.get("job_name") or action))
     elif action in {"extended_statement_refresh", "collect_financial_statements"}:
         progress_text.info(f"`{label}` 실행 중입니다. statement ingestion 진행률과 경과 시간을 표시합니다.")
     else:
@@ -864,6 +897,12 @@ def _build_progress_callback(job: dict[str, Any], *, label: str) -> Any:
                 f"경과 `{_format_job_elapsed(job)}` | "
                 f"저장 rows `{event.get('rows_written', 0)}` | "
                 f"rate-limited `{event.get('rate_limited_symbols', 0)}`"
+                + _format_live_throughput(
+                    job,
+                    processed_symbols=processed_symbols,
+                    rows_written=int(event.get("rows_written", 0) or 0),
+                    distribution=throughput_history,
+                )
             )
             return
 
@@ -906,7 +945,7 @@ def _build_progress_callback(job: dict[str, Any], *, label: str) -> Any:
                 progress_bar.progress(percent)
                 if action == "pipeline_core_market_data":
                     progress_meta.caption(
-                        "현재 stage: `OHLCV` | "
+                        f"현재 stage: `{stage or 'OHLCV'}` | "
                         f"처리 `{processed_symbols}/{total_symbols}` symbols | "
                         f"batch `{event.get('batch_index', 0)}/{event.get('total_batches', 0)}` | "
                         f"경과 `{_format_job_elapsed(job)}` | "
@@ -1963,9 +2002,18 @@ def _render_large_run_guard(
     job_name: str,
     symbols: list[str],
     warn_threshold: int = 200,
+    execution_profile: str | None = None,
 ) -> bool:
     count = len(symbols)
-    estimate = estimate_duration_from_history(job_name, count)
+    write_settings: dict[str, Any] = {}
+    if execution_profile is not None:
+        _, write_settings = _resolve_ohlcv_execution_profile(execution_profile)
+    estimate = estimate_duration_from_history(
+        job_name,
+        count,
+        chunk_size=write_settings.get("chunk_size"),
+        max_workers=write_settings.get("max_workers"),
+    )
 
     if count == 0:
         return False
@@ -213,6 +213,7 @@ def render_operational_section(*, focused_action: str | None = None) -> Any:
             prefix="daily_market",
             job_name="daily_market_update",
             symbols=daily_symbols_input,
+            execution_profile=daily_execution_profile,
         )
         daily_collection_params = _build_ohlcv_collection_params(
             symbols=daily_symbols_input,
@@ -1922,6 +1923,8 @@ def render_manual_section(*, focused_action: str | None = None) -> Any:
             prefix="ohlcv",
             job_name="collect_ohlcv",
             symbols=ohlcv_symbols_input,
+            # Manual collection runs with the job's default profile.
+            execution_profile="managed_safe",
         )
         ohlcv_collection_params = _build_ohlcv_collection_params(
             symbols=ohlcv_symbols_input,
@@ -0,0 +1,5 @@
+"""Performance benchmarks for strategy kernels, transforms and loaders.
+
+Run `python -m benchmarks --help`. Fixtures are synthetic and deterministic;
+no provider or MySQL server is needed.
+"""
@@ -0,0 +1,115 @@
+"""CLI: `python -m benchmarks [--quick] [--compare] [--save-baseline] ...`."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.cases import CASE_SPECS, DEFAULT_MAX_ROWS, iter_cases
+from benchmarks.fixtures import SYMBOL_COUNTS, YEAR_SPANS
+from benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    BenchmarkResult,
+    compare_results,
+    load_baseline,
+    results_payload,
+    run_cases,
+    save_results,
+)
+
+# Committed reference timings; the file's `environment` block records the machine
+# they were taken on, so re-save it with --save-baseline when that machine changes.
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+QUICK_SYMBOL_COUNTS = (10, 100)
+QUICK_YEAR_SPANS = (5,)
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in value.split(",") if part.strip())
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    groups = sorted({spec.group for spec in CASE_SPECS})
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--group", action="append", choices=groups, help="Run only this group (repeatable).")
+    parser.add_argument("--filter", help="Substring match on case id, e.g. 'gtaa3' or '[100x15y]'.")
+    parser.add_argument("--symbols", type=_int_list, help=f"Comma list of symbol counts (default {SYMBOL_COUNTS}).")
+    parser.add_argument("--years", type=_int_list, help=f"Comma list of year spans (default {YEAR_SPANS}).")
+    parser.add_argument("--quick", action="store_true", help="Only the 10/100 symbol x 5 year panels.")
+    parser.add_argument(
+        "--max-rows",
+        type=int,
+        default=DEFAULT_MAX_ROWS,
+        help="Skip panels with more symbol-days than this (default %(default)s).",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--list", action="store_true", help="List the selected cases and exit.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Merge this run into the baseline file.")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline file.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when --compare flags a case.")
+    parser.add_argument("--output", type=Path, help="Also write this run's results as JSON.")
+    return parser
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(
+        f"{result.case_id:<70} {result.time_min_sec * 1000:>10.2f} ms"
+        f" {result.time_median_sec * 1000:>10.2f} ms {result.peak_memory_mb:>10.1f} MB",
+        flush=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    symbol_counts = args.symbols or (QUICK_SYMBOL_COUNTS if args.quick else SYMBOL_COUNTS)
+    year_spans = args.years or (QUICK_YEAR_SPANS if args.quick else YEAR_SPANS)
+    cases = iter_cases(
+        groups=args.group,
+        name_filter=args.filter,
+        symbol_counts=symbol_counts,
+        year_spans=year_spans,
+        max_rows=args.max_rows,
+    )
+    if args.list:
+        for case in cases:
+            print(case.case_id)
+        return 0
+    if not cases:
+        print("No benchmark cases selected.", file=sys.stderr)
+        return 2
+
+    print(f"{'case':<70} {'min':>13} {'median':>13} {'peak':>13}")
+    results = run_cases(cases, repeat=args.repeat, warmup=args.warmup, on_result=_print_result)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results_payload(results), indent=2, sort_keys=True), encoding="utf-8")
+
+    exit_code = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"\nNo baseline at {args.baseline}; run with --save-baseline first.", file=sys.stderr)
+        else:
+            comparisons = compare_results(results, load_baseline(args.baseline), tolerance=args.tolerance)
+            regressed = [item for item in comparisons if item.regressed]
+            print(f"\nCompared {len(comparisons)} case(s) against {args.baseline} (tolerance {args.tolerance:.0%}).")
+            for item in regressed:
+                print(f"REGRESSION {item.case_id}: {'; '.join(item.reasons)}")
+            if not regressed:
+                print("No regressions.")
+            elif args.fail_on_regression:
+                exit_code = 1
+
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"\nBaseline updated: {args.baseline}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
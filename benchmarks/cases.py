@@ -0,0 +1,321 @@
+"""Benchmark case registry.
+
+Each spec expands over the fixture grid (symbols x years) up to its own
+`max_symbols` and the run-wide `max_rows` cap, so the default run stays
+short while `--max-rows` unlocks the 5,000 symbol x 30 year panels.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+
+from benchmarks.fixtures import (
+    SYMBOL_COUNTS,
+    YEAR_SPANS,
+    SQLitePriceDatabase,
+    fixture_rows,
+    fixture_symbols,
+    synthetic_price_history,
+    synthetic_strategy_dfs,
+    synthetic_strategy_result,
+)
+from benchmarks.harness import BenchmarkCase
+from finance import strategy as strategy_module
+from finance import transform
+from finance.data import data as data_module
+from finance.data.db import mysql as mysql_module
+from finance.data.price_store import PriceStore
+from finance.performance import make_monthly_weighted_portfolio, portfolio_performance_summary
+from finance.swing import RiskOnMomentumConfig, prepare_swing_feature_frame, run_risk_on_momentum_backtest
+
+DEFAULT_MAX_ROWS = 2_000_000
+SCORE_MONTHS = (1, 3, 6, 12)
+SCORE_COLUMNS = tuple(f"{months}MReturn" for months in SCORE_MONTHS)
+
+
+@dataclass(frozen=True)
+class CaseSpec:
+    group: str
+    name: str
+    build: Callable[[int, int], tuple[Callable[[], Any], Callable[[Any], Any], Callable[[Any], None] | None]]
+    max_symbols: int = max(SYMBOL_COUNTS)
+    fixed_symbols: int | None = None
+
+
+# ---------------------------------------------------------------------------
+# shared, cached inputs (built outside the measured region)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=2)
+def _daily_dfs(n_symbols: int, years: int) -> dict[str, pd.DataFrame]:
+    return synthetic_strategy_dfs(n_symbols, years)
+
+
+@lru_cache(maxsize=2)
+def _monthly_dfs(n_symbols: int, years: int) -> dict[str, pd.DataFrame]:
+    return transform.filter_ohlcv(_daily_dfs(n_symbols, years), "month_end")
+
+
+@lru_cache(maxsize=2)
+def _strategy_input(n_symbols: int, years: int) -> dict[str, pd.DataFrame]:
+    """The price-only sample chain: MA200 -> month end -> interval returns -> align -> score."""
+    dfs = transform.add_ma(_daily_dfs(n_symbols, years), 200)
+    dfs = transform.filter_ohlcv(dfs, "month_end")
+    dfs = transform.add_interval_returns(dfs, list(SCORE_MONTHS))
+    dfs = transform.align_dfs_by_date_intersection(dfs)
+    return transform.add_avg_score(dfs, return_cols=SCORE_COLUMNS)
+
+
+@lru_cache(maxsize=1)
+def _sqlite_prices(n_symbols: int, years: int) -> SQLitePriceDatabase:
+    return SQLitePriceDatabase(synthetic_price_history(n_symbols, years))
+
+
+def _static(value_factory: Callable[[], Any], run: Callable[[Any], Any]):
+    return value_factory, run, None
+
+
+# ---------------------------------------------------------------------------
+# strategy kernels
+# ---------------------------------------------------------------------------
+
+def _strategy_case(kernel: Callable[[dict], Any]):
+    def build(n_symbols: int, years: int):
+        return _static(lambda: _strategy_input(n_symbols, years), kernel)
+
+    return build
+
+
+def _gtaa3(dfs: dict) -> Any:
+    return strategy_module.gtaa3(dfs, 10_000, 3, "MA200")
+
+
+def _equal_weight(dfs: dict) -> Any:
+    return strategy_module.equal_weight(dfs, 10_000, 1)
+
+
+def _risk_parity(dfs: dict) -> Any:
+    return strategy_module.risk_parity_trend(dfs, 10_000)
+
+
+def _dual_momentum(dfs: dict) -> Any:
+    return strategy_module.dual_momentum(dfs, 10_000, top=1)
+
+
+def _global_relative_strength(dfs: dict) -> Any:
+    return strategy_module.global_relative_strength_allocation(dfs, 10_000, top=4)
+
+
+# ---------------------------------------------------------------------------
+# transforms
+# ---------------------------------------------------------------------------
+
+def _daily_transform(fn: Callable[[dict], Any]):
+    def build(n_symbols: int, years: int):
+        return _static(lambda: _daily_dfs(n_symbols, years), fn)
+
+    return build
+
+
+def _monthly_transform(fn: Callable[[dict], Any]):
+    def build(n_symbols: int, years: int):
+        return _static(lambda: _monthly_dfs(n_symbols, years), fn)
+
+    return build
+
+
+def _build_add_avg_score(n_symbols: int, years: int):
+    def setup():
+        return transform.add_interval_returns(_monthly_dfs(n_symbols, years), list(SCORE_MONTHS))
+
+    return setup, lambda dfs: transform.add_avg_score(dfs, return_cols=SCORE_COLUMNS), None
+
+
+def _build_daily_swing_features(n_symbols: int, years: int):
+    return _static(lambda: synthetic_price_history(n_symbols, years), transform.add_daily_swing_features)
+
+
+# ---------------------------------------------------------------------------
+# performance / swing
+# ---------------------------------------------------------------------------
+
+def _build_performance_summary(n_symbols: int, years: int):
+    return _static(
+        lambda: synthetic_strategy_result(years),
+        lambda result: portfolio_performance_summary(result, name="bench", freq="M"),
+    )
+
+
+def _build_monthly_weighted_portfolio(n_symbols: int, years: int):
+    def setup():
+        frames = []
+        for i in range(n_symbols):
+            daily = _daily_dfs(n_symbols, years)[fixture_symbols(n_symbols)[i]]
+            close = daily["Close"]
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "Date": daily["Date"],
+                        "Total Balance": 10_000.0 * close / close.iloc[0],
+                        "Total Return": close.pct_change().fillna(0.0),
+                    }
+                )
+            )
+        return frames
+
+    return setup, make_monthly_weighted_portfolio, None
+
+
+SWING_BENCH_CONFIG = RiskOnMomentumConfig(
+    macro_filter_enabled=False,
+    min_avg_dollar_volume_20d=0.0,
+    min_avg_volume_20d=0.0,
+    collect_scanner_rows=False,
+)
+
+
+def _swing_features(n_symbols: int, years: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # 합성 panel에는 재무제표가 없으므로 재무 필터를 통과시켜 실제 매매가 일어나게 한다.
+    history = synthetic_price_history(n_symbols, years)
+    features = prepare_swing_feature_frame(history)
+    features["financial_filter_pass"] = True
+    features["financial_filter_reason"] = "pass"
+    return history, features
+
+
+def _build_risk_on_momentum(n_symbols: int, years: int):
+    return _static(
+        lambda: _swing_features(n_symbols, years),
+        lambda state: run_risk_on_momentum_backtest(state[0], config=SWING_BENCH_CONFIG, prepared_features=state[1]),
+    )
+
+
+# ---------------------------------------------------------------------------
+# loaders against the SQLite stand-in
+# ---------------------------------------------------------------------------
+
+def _patched_mysql(n_symbols: int, years: int):
+    database = _sqlite_prices(n_symbols, years)
+    patcher = patch.object(mysql_module, "MySQLClient", database.client_factory)
+    patcher.start()
+    return patcher
+
+
+def _build_load_ohlcv_many(n_symbols: int, years: int):
+    symbols = fixture_symbols(n_symbols)
+    return (
+        lambda: _patched_mysql(n_symbols, years),
+        lambda _: data_module.load_ohlcv_many_mysql(symbols),
+        lambda patcher: patcher.stop(),
+    )
+
+
+def _build_iter_ohlcv(n_symbols: int, years: int):
+    symbols = fixture_symbols(n_symbols)
+
+    def run(_):
+        for _symbol, _frame in data_module.iter_ohlcv_mysql(symbols):
+            pass
+
+    return lambda: _patched_mysql(n_symbols, years), run, lambda patcher: patcher.stop()
+
+
+def _store_state(n_symbols: int, years: int, *, synced: bool) -> tuple[PriceStore, str]:
+    root = tempfile.mkdtemp(prefix="price_store_bench_")
+    store = PriceStore(root, fetch_rows=_sqlite_prices(n_symbols, years).fetch_rows)
+    if synced:
+        store.sync(fixture_symbols(n_symbols))
+    return store, root
+
+
+def _build_price_store_sync(n_symbols: int, years: int):
+    symbols = fixture_symbols(n_symbols)
+
+    def run(state):
+        store, _ = state
+        store.clear()
+        store.sync(symbols)
+
+    return (
+        lambda: _store_state(n_symbols, years, synced=False),
+        run,
+        lambda state: shutil.rmtree(state[1], ignore_errors=True),
+    )
+
+
+def _build_price_store_matrix(n_symbols: int, years: int):
+    symbols = fixture_symbols(n_symbols)
+    return (
+        lambda: _store_state(n_symbols, years, synced=True),
+        lambda state: state[0].load_matrix(symbols, field="close"),
+        lambda state: shutil.rmtree(state[1], ignore_errors=True),
+    )
+
+
+CASE_SPECS: tuple[CaseSpec, ...] = (
+    CaseSpec("strategy", "equal_weight", _strategy_case(_equal_weight), max_symbols=1_000),
+    CaseSpec("strategy", "gtaa3", _strategy_case(_gtaa3), max_symbols=1_000),
+    CaseSpec("strategy", "risk_parity_trend", _strategy_case(_risk_parity), max_symbols=1_000),
+    CaseSpec("strategy", "dual_momentum", _strategy_case(_dual_momentum), max_symbols=1_000),
+    CaseSpec("strategy", "global_relative_strength", _strategy_case(_global_relative_strength), max_symbols=1_000),
+    CaseSpec("transform", "add_ma", _daily_transform(lambda dfs: transform.add_ma(dfs, (20, 60, 200)))),
+    CaseSpec("transform", "filter_ohlcv_month_end", _daily_transform(lambda dfs: transform.filter_ohlcv(dfs, "month_end"))),
+    CaseSpec("transform", "align_dfs_by_date_intersection", _daily_transform(transform.align_dfs_by_date_intersection)),
+    CaseSpec("transform", "slice_ohlcv", _daily_transform(lambda dfs: transform.slice_ohlcv(dfs, start="2020-01-01"))),
+    CaseSpec(
+        "transform",
+        "add_interval_returns",
+        _monthly_transform(lambda dfs: transform.add_interval_returns(dfs, list(SCORE_MONTHS))),
+    ),
+    CaseSpec("transform", "add_avg_score", _build_add_avg_score),
+    CaseSpec(
+        "transform",
+        "select_rows_by_interval_with_ends",
+        _monthly_transform(lambda dfs: transform.select_rows_by_interval_with_ends(dfs, 3)),
+    ),
+    CaseSpec("transform", "add_daily_swing_features", _build_daily_swing_features, max_symbols=1_000),
+    CaseSpec("performance", "portfolio_performance_summary", _build_performance_summary, fixed_symbols=1),
+    CaseSpec("performance", "make_monthly_weighted_portfolio", _build_monthly_weighted_portfolio, fixed_symbols=10),
+    CaseSpec("swing", "run_risk_on_momentum_backtest", _build_risk_on_momentum, max_symbols=100),
+    CaseSpec("loader", "load_ohlcv_many_mysql", _build_load_ohlcv_many),
+    CaseSpec("loader", "iter_ohlcv_mysql", _build_iter_ohlcv),
+    CaseSpec("loader", "price_store_sync", _build_price_store_sync),
+    CaseSpec("loader", "price_store_load_matrix", _build_price_store_matrix),
+)
+
+
+def iter_cases(
+    *,
+    groups: Iterable[str] | None = None,
+    name_filter: str | None = None,
+    symbol_counts: Iterable[int] = SYMBOL_COUNTS,
+    year_spans: Iterable[int] = YEAR_SPANS,
+    max_rows: int = DEFAULT_MAX_ROWS,
+) -> list[BenchmarkCase]:
+    """Expand CASE_SPECS over the fixture grid, skipping sizes above the caps."""
+    wanted_groups = set(groups) if groups else None
+    cases: list[BenchmarkCase] = []
+    for spec in CASE_SPECS:
+        if wanted_groups is not None and spec.group not in wanted_groups:
+            continue
+        counts = [spec.fixed_symbols] if spec.fixed_symbols is not None else list(symbol_counts)
+        for n_symbols in counts:
+            if n_symbols > spec.max_symbols:
+                continue
+            for years in year_spans:
+                if spec.fixed_symbols is None and fixture_rows(n_symbols, years) > max_rows:
+                    continue
+                setup, run, teardown = spec.build(n_symbols, years)
+                case = BenchmarkCase(spec.group, spec.name, n_symbols, years, setup, run, teardown)
+                if name_filter and name_filter not in case.case_id:
+                    continue
+                cases.append(case)
+    return cases
@@ -0,0 +1,201 @@
+"""Deterministic synthetic price fixtures for the benchmark suite."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterator
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+FIXTURE_END_DATE = "2025-12-31"
+FIXTURE_SEED = 20_240_101
+SYMBOL_COUNTS = (10, 100, 1_000, 5_000)
+YEAR_SPANS = (5, 15, 30)
+
+HISTORY_COLUMNS = ["symbol", "date", "open", "high", "low", "close", "adj_close", "volume", "dividends", "stock_splits"]
+STRATEGY_COLUMN_MAP = {
+    "date": "Date",
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "adj_close": "Adj Close",
+    "volume": "Volume",
+    "dividends": "Dividends",
+    "stock_splits": "Stock Splits",
+}
+
+
+def fixture_rows(n_symbols: int, years: int) -> int:
+    return int(n_symbols) * int(years) * TRADING_DAYS_PER_YEAR
+
+
+def fixture_symbols(n_symbols: int) -> list[str]:
+    return [f"S{i:05d}" for i in range(int(n_symbols))]
+
+
+def fixture_dates(years: int) -> pd.DatetimeIndex:
+    return pd.bdate_range(end=FIXTURE_END_DATE, periods=int(years) * TRADING_DAYS_PER_YEAR)
+
+
+@lru_cache(maxsize=4)
+def synthetic_price_arrays(n_symbols: int, years: int, seed: int = FIXTURE_SEED) -> dict[str, np.ndarray]:
+    """
+    Geometric random-walk OHLCV as (days, symbols) float64 arrays.
+
+    Each symbol gets its own drift / volatility so rankings, trend filters and
+    liquidity gates see a realistic spread; the same (n_symbols, years, seed)
+    always yields identical arrays.
+    """
+    rng = np.random.default_rng(seed)
+    n_days = int(years) * TRADING_DAYS_PER_YEAR
+    drift = rng.normal(0.0003, 0.0004, n_symbols)
+    vol = rng.uniform(0.008, 0.03, n_symbols)
+    start_price = rng.uniform(10.0, 300.0, n_symbols)
+    log_returns = rng.standard_normal((n_days, n_symbols)) * vol + drift
+    close = start_price * np.exp(np.cumsum(log_returns, axis=0))
+    gap = rng.normal(0.0, 0.003, (n_days, n_symbols))
+    open_ = close * np.exp(gap)
+    spread = np.abs(rng.normal(0.0, 0.006, (n_days, n_symbols)))
+    high = np.maximum(open_, close) * (1.0 + spread)
+    low = np.minimum(open_, close) * (1.0 - spread)
+    base_volume = rng.uniform(2e5, 2e7, n_symbols)
+    volume = np.round(base_volume * rng.lognormal(0.0, 0.35, (n_days, n_symbols)))
+    return {"open": open_, "high": high, "low": low, "close": close, "volume": volume}
+
+
+def synthetic_price_history(n_symbols: int, years: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """Loader-style long-form rows ordered by (symbol, date)."""
+    arrays = synthetic_price_arrays(n_symbols, years, seed)
+    dates = fixture_dates(years)
+    symbols = fixture_symbols(n_symbols)
+    n_days = len(dates)
+    data = {
+        "symbol": np.repeat(np.asarray(symbols, dtype=object), n_days),
+        "date": np.tile(dates.to_numpy(), n_symbols),
+    }
+    for field in ("open", "high", "low", "close"):
+        data[field] = arrays[field].T.reshape(-1)
+    data["adj_close"] = data["close"]
+    data["volume"] = arrays["volume"].T.reshape(-1)
+    data["dividends"] = np.zeros(n_days * n_symbols)
+    data["stock_splits"] = np.zeros(n_days * n_symbols)
+    return pd.DataFrame(data, columns=HISTORY_COLUMNS)
+
+
+def synthetic_strategy_dfs(n_symbols: int, years: int, seed: int = FIXTURE_SEED) -> dict[str, pd.DataFrame]:
+    """Ticker-keyed OHLCV dict in the shape `adapt_price_history_to_strategy_dfs` returns."""
+    arrays = synthetic_price_arrays(n_symbols, years, seed)
+    dates = fixture_dates(years)
+    dfs: dict[str, pd.DataFrame] = {}
+    for j, symbol in enumerate(fixture_symbols(n_symbols)):
+        dfs[symbol] = pd.DataFrame(
+            {
+                "Date": dates,
+                "Ticker": symbol,
+                "Open": arrays["open"][:, j],
+                "High": arrays["high"][:, j],
+                "Low": arrays["low"][:, j],
+                "Close": arrays["close"][:, j],
+                "Adj Close": arrays["close"][:, j],
+                "Volume": arrays["volume"][:, j],
+                "Dividends": 0.0,
+                "Stock Splits": 0.0,
+            }
+        )
+    return dfs
+
+
+def synthetic_strategy_result(years: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """Month-end `Date` / `Total Balance` / `Total Return` frame like a strategy result."""
+    rng = np.random.default_rng(seed + years)
+    dates = pd.date_range(end=FIXTURE_END_DATE, periods=int(years) * 12, freq="ME")
+    returns = rng.normal(0.006, 0.04, len(dates))
+    returns[0] = 0.0
+    balance = 10_000.0 * np.cumprod(1.0 + returns)
+    return pd.DataFrame({"Date": dates, "Total Balance": balance, "Total Return": returns})
+
+
+# ---------------------------------------------------------------------------
+# SQLite stand-in for the MySQL price table
+# ---------------------------------------------------------------------------
+
+_PLACEHOLDER = re.compile(r"%s")
+
+
+class SQLitePriceDatabase:
+    """
+    In-memory `nyse_price_history` with the subset of the MySQLClient surface
+    the price loaders use (`use_db`, `query`, `stream`, `close`).
+
+    `client_factory` can replace `finance.data.db.mysql.MySQLClient` so the
+    real loader code (SQL building, batching, typed conversion) runs unchanged
+    against SQLite.
+    """
+
+    def __init__(self, history: pd.DataFrame, *, timeframe: str = "1d") -> None:
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE nyse_price_history ("
+            "symbol TEXT, timeframe TEXT, date TEXT, open REAL, high REAL, low REAL, close REAL, "
+            "adj_close REAL, volume INTEGER, dividends REAL, stock_splits REAL, "
+            "PRIMARY KEY (symbol, timeframe, date))"
+        )
+        dates = pd.to_datetime(history["date"]).dt.strftime("%Y-%m-%d").to_numpy()
+        rows = zip(
+            history["symbol"].to_numpy(),
+            [timeframe] * len(history),
+            dates,
+            *(history[field].to_numpy().tolist() for field in HISTORY_COLUMNS[2:]),
+        )
+        self.conn.executemany("INSERT INTO nyse_price_history VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
+        self.conn.commit()
+
+    @staticmethod
+    def _sql(sql: str) -> str:
+        return _PLACEHOLDER.sub("?", sql)
+
+    def fetch_rows(self, symbols: list[str], timeframe: str, after: str | None) -> pd.DataFrame:
+        """`PriceStore(fetch_rows=...)` hook."""
+        placeholders = ",".join("?" * len(symbols))
+        sql = f"SELECT {', '.join(HISTORY_COLUMNS)} FROM nyse_price_history WHERE symbol IN ({placeholders}) AND timeframe=?"
+        params: list = [*symbols, timeframe]
+        if after is not None:
+            sql += " AND date > ?"
+            params.append(after)
+        sql += " ORDER BY symbol, date"
+        return pd.DataFrame(self.conn.execute(sql, params).fetchall(), columns=HISTORY_COLUMNS)
+
+    def client_factory(self, *args, **kwargs) -> "_SQLiteClient":
+        return _SQLiteClient(self)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class _SQLiteClient:
+    def __init__(self, database: SQLitePriceDatabase) -> None:
+        self._database = database
+
+    def use_db(self, name: str) -> None:
+        pass
+
+    def query(self, sql: str, params=None) -> list[dict]:
+        cur = self._database.conn.execute(self._database._sql(sql), list(params or []))
+        names = [column[0] for column in cur.description]
+        return [dict(zip(names, row)) for row in cur.fetchall()]
+
+    def stream(self, sql: str, params=None, *, batch_size: int = 10_000) -> Iterator[list[tuple]]:
+        cur = self._database.conn.execute(self._database._sql(sql), list(params or []))
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
+    def close(self) -> None:
+        pass
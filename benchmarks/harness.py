@@ -0,0 +1,208 @@
+"""Timing / peak-memory measurement and baseline comparison."""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+BASELINE_FORMAT_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+# 이 아래 시간/메모리 차이는 측정 잡음으로 본다.
+MIN_TIME_DELTA_SEC = 0.005
+MIN_MEMORY_DELTA_MB = 1.0
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    One measured call.
+
+    `setup()` builds the inputs outside the measured region and returns the
+    object passed to `run(state)`; `teardown(state)` releases it.
+    """
+
+    group: str
+    name: str
+    n_symbols: int
+    years: int
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    teardown: Callable[[Any], None] | None = None
+
+    @property
+    def case_id(self) -> str:
+        return f"{self.group}.{self.name}[{self.n_symbols}x{self.years}y]"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    case_id: str
+    group: str
+    name: str
+    n_symbols: int
+    years: int
+    repeat: int
+    time_min_sec: float
+    time_median_sec: float
+    peak_memory_mb: float
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    case_id: str
+    time_ratio: float | None
+    memory_ratio: float | None
+    regressed: bool
+    reasons: list[str] = field(default_factory=list)
+
+
+def measure_case(case: BenchmarkCase, *, repeat: int = 3, warmup: int = 1) -> BenchmarkResult:
+    """Best-of-`repeat` wall time, then one traced run for the allocation peak."""
+    state = case.setup()
+    try:
+        for _ in range(max(int(warmup), 0)):
+            case.run(state)
+        timings: list[float] = []
+        for _ in range(max(int(repeat), 1)):
+            gc.collect()
+            t0 = perf_counter()
+            case.run(state)
+            timings.append(perf_counter() - t0)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            case.run(state)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        if case.teardown is not None:
+            case.teardown(state)
+
+    return BenchmarkResult(
+        case_id=case.case_id,
+        group=case.group,
+        name=case.name,
+        n_symbols=case.n_symbols,
+        years=case.years,
+        repeat=len(timings),
+        time_min_sec=round(min(timings), 6),
+        time_median_sec=round(statistics.median(timings), 6),
+        peak_memory_mb=round(peak / (1024 * 1024), 3),
+    )
+
+
+def run_cases(
+    cases: Iterable[BenchmarkCase],
+    *,
+    repeat: int = 3,
+    warmup: int = 1,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        result = measure_case(case, repeat=repeat, warmup=warmup)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def environment_info() -> dict[str, Any]:
+    return {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def results_payload(results: list[BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "results": {result.case_id: asdict(result) for result in results},
+    }
+
+
+def save_results(path: Path, results: list[BenchmarkResult], *, merge: bool = True) -> dict[str, Any]:
+    """Write results as a baseline; `merge` keeps cases not measured in this run."""
+    payload = results_payload(results)
+    if merge and path.exists():
+        previous = load_baseline(path)
+        payload["results"] = {**previous.get("results", {}), **payload["results"]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    return payload
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if int(payload.get("format_version") or 0) != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark baseline format: {payload.get('format_version')!r}")
+    return payload
+
+
+def compare_results(
+    results: list[BenchmarkResult],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[BenchmarkComparison]:
+    """
+    Flag cases slower or larger than baseline by more than `tolerance`.
+
+    Time compares best-of-N (`time_min_sec`), the least noisy statistic;
+    absolute deltas under MIN_TIME_DELTA_SEC / MIN_MEMORY_DELTA_MB are ignored.
+    """
+    base_results = baseline.get("results", {})
+    comparisons: list[BenchmarkComparison] = []
+    for result in results:
+        base = base_results.get(result.case_id)
+        if base is None:
+            comparisons.append(BenchmarkComparison(result.case_id, None, None, False, ["no baseline"]))
+            continue
+        reasons: list[str] = []
+        base_time = float(base.get("time_min_sec") or 0.0)
+        base_memory = float(base.get("peak_memory_mb") or 0.0)
+        time_ratio = result.time_min_sec / base_time if base_time > 0 else None
+        memory_ratio = result.peak_memory_mb / base_memory if base_memory > 0 else None
+        if (
+            time_ratio is not None
+            and time_ratio > 1.0 + tolerance
+            and result.time_min_sec - base_time > MIN_TIME_DELTA_SEC
+        ):
+            reasons.append(f"time {base_time:.4f}s -> {result.time_min_sec:.4f}s (x{time_ratio:.2f})")
+        if (
+            memory_ratio is not None
+            and memory_ratio > 1.0 + tolerance
+            and result.peak_memory_mb - base_memory > MIN_MEMORY_DELTA_MB
+        ):
+            reasons.append(f"peak memory {base_memory:.1f}MB -> {result.peak_memory_mb:.1f}MB (x{memory_ratio:.2f})")
+        comparisons.append(
+            BenchmarkComparison(
+                result.case_id,
+                None if time_ratio is None else round(time_ratio, 3),
+                None if memory_ratio is None else round(memory_ratio, 3),
+                bool(reasons),
+                reasons,
+            )
+        )
+    return comparisons
@@ -4,18 +4,28 @@ import re
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import redirect_stderr, redirect_stdout
-from typing import Any, Callable, Iterable, Optional, Literal
+from typing import Any, Callable, Iterable, Iterator, Optional, Literal
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from .db.mysql import MySQLClient
+from .db.mysql import MySQLClient, mysql_client
 from .db.schema import PRICE_SCHEMAS  # 방금 추가한 것
+from .price_store import invalidate_price_store, record_price_writes
+from .provider_gate import YAHOO_PROVIDER, pause_provider, provider_slot
 
 
 TABLE = "nyse_price_history"
+STAGE_TABLE = "nyse_price_history_stage"
 DB_PRICE = "finance_price"
 Interval = Literal["1d", "1wk", "1mo"]
+WriteMode = Literal["bulk", "upsert"]
+PRICE_ROW_COLUMNS = (
+    "symbol", "timeframe", "`date`",
+    "open", "high", "low", "close", "adj_close", "volume",
+    "dividends", "stock_splits",
+)
 PRICE_VALUE_COLUMNS = [
     "Open",
     "High",
@@ -174,6 +184,92 @@ def _delete_ohlcv_rows(
     db.execute(sql, params)
 
 
+def _price_rows_from_frame(sym: str, timeframe: str, d: pd.DataFrame, cols: dict[str, str]) -> list[tuple]:
+    """
+    다운로드 프레임을 컬럼 배열 단위로 INSERT 튜플 목록으로 바꾼다.
+
+    object 배열로 꺼내면 값이 파이썬 float/int가 되고, 결측은 None으로 치환한다.
+    iterrows + _to_none과 같은 튜플을 만들지만 행 단위 Series 생성이 없다.
+    """
+    n = len(d)
+    arrays: list[Any] = [[sym] * n, [timeframe] * n, d["Date"].tolist()]
+    for name in PRICE_VALUE_COLUMNS:
+        column = cols.get(name.lower())
+        if column is None:
+            arrays.append([None] * n)
+            continue
+        values = d[column].to_numpy(dtype=object)
+        values[d[column].isna().to_numpy()] = None
+        arrays.append(values.tolist())
+    return list(zip(*arrays))
+
+
+def _invalidate_price_store_for_write(
+    rows: list[tuple],
+    *,
+    timeframe: str,
+    deleted_symbols: list[str] | None = None,
+    deleted_from: str | None = None,
+    db: MySQLClient | None = None,
+) -> None:
+    """
+    방금 쓴 구간부터 로컬 price store 파티션을 무효화한다.
+
+    rows는 (symbol, timeframe, date, ...) 튜플. 삭제 구간이 있으면 그 시작일(None이면 전체)도 반영.
+    db가 주어지면 같은 구간을 write log에도 남겨 다른 프로세스의 store도 변경을 알게 한다.
+    """
+    first_written: dict[str, Any] = {}
+    for row in rows:
+        sym, day = row[0], pd.Timestamp(row[2])
+        if sym not in first_written or day < first_written[sym]:
+            first_written[sym] = day
+    for sym in deleted_symbols or []:
+        if deleted_from is None:
+            first_written[sym] = None
+        elif first_written.get(sym, pd.Timestamp.max) is not None:
+            first_written[sym] = min(first_written.get(sym, pd.Timestamp.max), pd.Timestamp(deleted_from))
+    if first_written:
+        if db is not None:
+            record_price_writes(db, first_written, timeframe=timeframe)
+        invalidate_price_store(first_written, timeframe=timeframe)
+
+
+def _bulk_merge_ohlcv_rows(db: MySQLClient, rows: list[tuple]) -> tuple[float, float]:
+    """
+    rows를 세션 임시 테이블에 적재한 뒤 nyse_price_history로 한 문장에 merge한다.
+
+    pymysql executemany는 INSERT ... VALUES를 max_allowed_packet 이내의 multi-row 문장으로 묶는다.
+    반환값은 (stage 적재 초, merge 초).
+    """
+    column_sql = ", ".join(PRICE_ROW_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(PRICE_ROW_COLUMNS))
+
+    stage_started = time.perf_counter()
+    db.execute(f"TRUNCATE TABLE {STAGE_TABLE}")
+    db.executemany(f"INSERT INTO {STAGE_TABLE} ({column_sql}) VALUES ({placeholders})", rows)
+    stage_load_sec = time.perf_counter() - stage_started
+
+    merge_started = time.perf_counter()
+    db.execute(
+        f"""
+        INSERT INTO {TABLE} ({column_sql})
+        SELECT {column_sql}
+        FROM {STAGE_TABLE} AS s
+        ORDER BY s.seq
+        ON DUPLICATE KEY UPDATE
+            open = s.open,
+            high = s.high,
+            low  = s.low,
+            close = s.close,
+            adj_close = s.adj_close,
+            volume = s.volume,
+            dividends = s.dividends,
+            stock_splits = s.stock_splits
+        """
+    )
+    return stage_load_sec, time.perf_counter() - merge_started
+
+
 def get_ohlcv(
     tickers: list[str],
     start: str | None = None,
@@ -213,7 +309,7 @@ def get_ohlcv(
 
     stdout_buffer = io.StringIO()
     stderr_buffer = io.StringIO()
-    with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
+    with provider_slot(YAHOO_PROVIDER), redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
         df = yf.download(**download_kwargs)
     provider_output = "\n".join(
         part.strip()
@@ -415,13 +511,19 @@ def store_ohlcv_to_mysql(
     replace_requested_range: bool = True,
     return_stats: bool = False,
     progress_callback: Optional[Callable[[dict[str, Any]], None]] = None,
+    write_mode: WriteMode = "bulk",
 ):
     """
     symbols + (start/end 또는 period)로 yfinance OHLCV를 가져와 DB에 UPSERT.
 
     - start/end가 주어지면 start/end 우선
     - start/end가 없으면 period 사용
+    - write_mode="bulk": 배치를 세션 임시 테이블에 multi-row INSERT로 적재한 뒤
+      INSERT ... SELECT ... ON DUPLICATE KEY UPDATE 한 문장으로 merge
+    - write_mode="upsert": 배치 행을 nyse_price_history에 바로 executemany UPSERT
     """
+    if write_mode not in ("bulk", "upsert"):
+        raise ValueError(f"Unsupported write_mode: {write_mode!r}")
     symbols = [s for s in symbols if s and str(s).strip()]
     if not symbols:
         return {
@@ -436,8 +538,11 @@ def store_ohlcv_to_mysql(
             "cooldown_events": [],
             "timing_breakdown": {
                 "fetch_sec": 0.0,
+                "serialize_sec": 0.0,
                 "delete_sec": 0.0,
                 "upsert_sec": 0.0,
+                "stage_load_sec": 0.0,
+                "merge_sec": 0.0,
                 "retry_sleep_sec": 0.0,
                 "cooldown_sleep_sec": 0.0,
                 "inter_batch_sleep_sec": 0.0,
@@ -479,26 +584,7 @@ def store_ohlcv_to_mysql(
             if d.empty:
                 continue
 
-            def col(name, default=None):
-                return cols.get(name.lower(), default)
-
-            for _, r in d.iterrows():
-                rows.append(
-                    (
-                        sym,
-                        timeframe,
-                        r["Date"],
-                        _to_none(r.get(col("Open"))),
-                        _to_none(r.get(col("High"))),
-                        _to_none(r.get(col("Low"))),
-                        _to_none(r.get(col("Close"))),
-                        _to_none(r.get(col("Adj Close"))),
-                        _to_none(r.get(col("Volume"))),
-                        _to_none(r.get(col("Dividends"))),
-                        _to_none(r.get(col("Stock Splits"))),
-                    )
-                )
-
+            rows.extend(_price_rows_from_frame(sym, timeframe, d, cols))
             loaded_symbols.append(sym)
 
         return rows, loaded_symbols
@@ -517,7 +603,9 @@ def store_ohlcv_to_mysql(
                     interval=interval,
                     return_provider_output=True,
                 )
+                serialize_started = time.perf_counter()
                 rows, loaded_symbols = rows_from_downloaded_frames(dfs, interval)
+                serialize_elapsed_sec = time.perf_counter() - serialize_started
                 loaded_symbol_set = set(loaded_symbols)
                 missing_symbols = [sym for sym in batch if sym not in loaded_symbol_set]
                 provider_diag = _classify_provider_output(
@@ -530,7 +618,8 @@ def store_ohlcv_to_mysql(
                     "rows": rows,
                     "loaded_symbols": loaded_symbols,
                     "missing_symbols": missing_symbols,
-                    "fetch_elapsed_sec": time.perf_counter() - fetch_started,
+                    "fetch_elapsed_sec": time.perf_counter() - fetch_started - serialize_elapsed_sec,
+                    "serialize_elapsed_sec": serialize_elapsed_sec,
                     "retry_sleep_sec": retry_sleep_sec,
                     "rate_limit_hit": provider_diag["rate_limit_hit"],
                     "rate_limited_symbols": provider_diag["rate_limited_symbols"],
@@ -562,6 +651,7 @@ def store_ohlcv_to_mysql(
     try:
         db.use_db(DB_PRICE)
         db.execute(PRICE_SCHEMAS["price_history"])
+        db.execute(PRICE_SCHEMAS["price_write_log"])
 
         upsert_sql = """
         INSERT INTO nyse_price_history
@@ -582,6 +672,8 @@ def store_ohlcv_to_mysql(
             dividends = VALUES(dividends),
             stock_splits = VALUES(stock_splits)
         """
+        if write_mode == "bulk":
+            db.execute(PRICE_SCHEMAS["price_history_stage"])
 
         total_symbols = len(symbols)
         total_batches = (total_symbols + max(chunk_size, 1) - 1) // max(chunk_size, 1)
@@ -594,8 +686,11 @@ def store_ohlcv_to_mysql(
         provider_message_batches: list[dict[str, Any]] = []
         cooldown_events: list[dict[str, Any]] = []
         total_fetch_sec = 0.0
+        total_serialize_sec = 0.0
         total_delete_sec = 0.0
         total_upsert_sec = 0.0
+        total_stage_load_sec = 0.0
+        total_merge_sec = 0.0
         total_retry_sleep_sec = 0.0
         total_cooldown_sleep_sec = 0.0
         total_inter_batch_sleep_sec = 0.0
@@ -649,6 +744,7 @@ def store_ohlcv_to_mysql(
             for batch_index, batch, result in sorted(window_results, key=lambda item: item[0]):
                 rows = result["rows"]
                 total_fetch_sec += float(result.get("fetch_elapsed_sec") or 0.0)
+                total_serialize_sec += float(result.get("serialize_elapsed_sec") or 0.0)
                 total_retry_sleep_sec += float(result.get("retry_sleep_sec") or 0.0)
                 if rows:
                     if replace_requested_range and requested_end is not None:
@@ -662,8 +758,22 @@ def store_ohlcv_to_mysql(
                         )
                         total_delete_sec += time.perf_counter() - delete_started
                     upsert_started = time.perf_counter()
-                    db.executemany(upsert_sql, rows)
+                    if write_mode == "bulk":
+                        stage_load_sec, merge_sec = _bulk_merge_ohlcv_rows(db, rows)
+                        total_stage_load_sec += stage_load_sec
+                        total_merge_sec += merge_sec
+                    else:
+                        db.executemany(upsert_sql, rows)
                     total_upsert_sec += time.perf_counter() - upsert_started
+                    _invalidate_price_store_for_write(
+                        rows,
+                        timeframe=interval,
+                        deleted_symbols=result["loaded_symbols"]
+                        if replace_requested_range and requested_end is not None
+                        else None,
+                        deleted_from=requested_start,
+                        db=db,
+                    )
                     inserted += len(rows)
                     total_written_batches += 1
 
@@ -734,6 +844,8 @@ def store_ohlcv_to_mysql(
                                 "processed_symbols": processed_symbols,
                             }
                         )
+                    # 같은 프로세스의 다른 Yahoo 경로(fundamentals 등)도 cooldown 동안 새 요청을 멈춘다.
+                    pause_provider(YAHOO_PROVIDER, rate_limit_cooldown_sec)
                     total_cooldown_sleep_sec += _sleep_with_jitter(rate_limit_cooldown_sec, sleep_jitter_ratio)
             else:
                 consecutive_rate_limit_batches = 0
@@ -741,6 +853,11 @@ def store_ohlcv_to_mysql(
             total_inter_batch_sleep_sec += _sleep_with_jitter(sleep, sleep_jitter_ratio)
 
     finally:
+        if write_mode == "bulk":
+            try:
+                db.execute(f"DROP TEMPORARY TABLE IF EXISTS {STAGE_TABLE}")
+            except Exception:
+                pass
         db.close()
 
     total_completed_batches = next_batch_index - 1
@@ -754,10 +871,14 @@ def store_ohlcv_to_mysql(
         "provider_no_data_symbols": sorted(provider_no_data_symbols),
         "provider_message_batches": provider_message_batches,
         "cooldown_events": cooldown_events,
+        "write_mode": write_mode,
         "timing_breakdown": {
             "fetch_sec": round(total_fetch_sec, 3),
+            "serialize_sec": round(total_serialize_sec, 3),
             "delete_sec": round(total_delete_sec, 3),
             "upsert_sec": round(total_upsert_sec, 3),
+            "stage_load_sec": round(total_stage_load_sec, 3),
+            "merge_sec": round(total_merge_sec, 3),
             "retry_sleep_sec": round(total_retry_sleep_sec, 3),
             "cooldown_sleep_sec": round(total_cooldown_sleep_sec, 3),
             "inter_batch_sleep_sec": round(total_inter_batch_sleep_sec, 3),
@@ -774,54 +895,182 @@ def store_ohlcv_to_mysql(
     return stats if return_stats else inserted
 
 
+OHLCV_VALUE_FIELDS = ("open", "high", "low", "close", "adj_close", "volume", "dividends", "stock_splits")
+OHLCV_FETCH_SIZE = 20_000
+
+
+def _ohlcv_select_sql(batch: list[str], timeframe: str, start: str | None, end: str | None) -> tuple[str, list[Any]]:
+    placeholders = ",".join(["%s"] * len(batch))
+
+    where = [f"symbol IN ({placeholders})", "timeframe=%s"]
+    params: list[Any] = list(batch) + [timeframe]
+
+    if start:
+        where.append("`date` >= %s")
+        params.append(start)
+    if end:
+        where.append("`date` <= %s")
+        params.append(end)
+
+    sql = f"""
+    SELECT
+        symbol, `date`, {", ".join(OHLCV_VALUE_FIELDS)}
+    FROM {TABLE}
+    WHERE {" AND ".join(where)}
+    ORDER BY symbol ASC, `date` ASC
+    """
+    return sql, params
+
+
+def _typed_ohlcv_columns(rows: list[tuple]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (symbol, date, open, ..., stock_splits) 튜플 배치를 타입 배열로 옮긴다.
+
+    반환: symbols(object), dates(datetime64[D]), values((8, n) float64, NULL은 NaN)
+    """
+    n = len(rows)
+    symbols = np.empty(n, dtype=object)
+    dates = np.empty(n, dtype="datetime64[D]")
+    values = np.empty((len(OHLCV_VALUE_FIELDS), n), dtype=np.float64)
+    columns = list(zip(*rows))
+    symbols[:] = columns[0]
+    dates[:] = columns[1]
+    for i in range(len(OHLCV_VALUE_FIELDS)):
+        # float64로 바로 채우면 None은 NaN이 된다.
+        values[i] = columns[2 + i]
+    return symbols, dates, values
+
+
+def _ohlcv_frame(symbols: np.ndarray, dates: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+    data: dict[str, Any] = {
+        "symbol": pd.array(symbols, dtype="str"),
+        "date": dates.astype("datetime64[s]"),
+    }
+    for i, field in enumerate(OHLCV_VALUE_FIELDS):
+        column = values[i]
+        if field == "volume" and not np.isnan(column).any():
+            # dict 경로와 같게 NULL이 없으면 BIGINT volume은 int64로 둔다.
+            column = column.astype(np.int64)
+        data[field] = column
+    # 방금 만든 배열이므로 블록 통합 복사를 피한다.
+    return pd.DataFrame(data, copy=False)
+
+
+def _iter_typed_ohlcv_batches(
+    symbols: list[str],
+    *,
+    start: str | None,
+    end: str | None,
+    timeframe: str,
+    host,
+    user,
+    password,
+    port,
+    chunk_size: int,
+    fetch_size: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    with mysql_client(DB_PRICE, host=host, user=user, password=password, port=port) as db:
+        for i in range(0, len(symbols), chunk_size):
+            sql, params = _ohlcv_select_sql(symbols[i:i+chunk_size], timeframe, start, end)
+            for rows in db.stream(sql, params, batch_size=fetch_size):
+                yield _typed_ohlcv_columns(rows)
+
+
+def iter_ohlcv_mysql(
+    symbols: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    timeframe: str = "1d",
+    host=None,
+    user=None,
+    password=None,
+    port=None,
+    chunk_size: int = 800,
+    fetch_size: int = OHLCV_FETCH_SIZE,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    심볼별 (symbol, frame)을 symbol 오름차순으로 내보내는 스트리밍 로더.
+
+    쿼리 하나의 ORDER BY는 그 chunk 안에서만 순서를 보장하므로, 심볼을 먼저 정렬해
+    chunk마다 연속된 심볼 구간을 맡긴다. 결과는 전체 stream에서 symbol/date 순이 되고,
+    배치 경계에 걸친 심볼 꼬리만 들고 있다가 다음 배치와 합쳐 내보낸다.
+    한 번에 메모리에 있는 것은 심볼 하나 + fetch 배치 하나.
+    """
+    symbols = sorted(set(symbols))
+    if not symbols:
+        return
+
+    pending: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    pending_symbol: str | None = None
+
+    def flush() -> tuple[str, pd.DataFrame]:
+        sym_arr = np.concatenate([part[0] for part in pending])
+        date_arr = np.concatenate([part[1] for part in pending])
+        value_arr = np.concatenate([part[2] for part in pending], axis=1)
+        return str(pending_symbol), _ohlcv_frame(sym_arr, date_arr, value_arr)
+
+    for batch_symbols, batch_dates, batch_values in _iter_typed_ohlcv_batches(
+        symbols,
+        start=start,
+        end=end,
+        timeframe=timeframe,
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+        chunk_size=chunk_size,
+        fetch_size=fetch_size,
+    ):
+        boundaries = np.flatnonzero(batch_symbols[1:] != batch_symbols[:-1]) + 1
+        starts = [0, *boundaries.tolist()]
+        stops = [*boundaries.tolist(), len(batch_symbols)]
+        for lo, hi in zip(starts, stops):
+            sym = batch_symbols[lo]
+            if pending and sym != pending_symbol:
+                yield flush()
+                pending = []
+            pending_symbol = sym
+            pending.append((batch_symbols[lo:hi], batch_dates[lo:hi], batch_values[:, lo:hi]))
+
+    if pending:
+        yield flush()
+
+
 def load_ohlcv_many_mysql(
     symbols: list[str],
     start: str | None = None,
     end: str | None = None,
     timeframe: str = "1d",
-    host="localhost",
-    user="root",
-    password="1234",
-    port=3306,
+    host=None,
+    user=None,
+    password=None,
+    port=None,
     chunk_size: int = 800,  # IN 절 너무 길어지는 것 방지
+    fetch_size: int = OHLCV_FETCH_SIZE,
 ) -> pd.DataFrame:
     if not symbols:
         return pd.DataFrame()
 
-    db = MySQLClient(host, user, password, port)
-    try:
-        db.use_db(DB_PRICE)
-
-        out = []
-        for i in range(0, len(symbols), chunk_size):
-            batch = symbols[i:i+chunk_size]
-            placeholders = ",".join(["%s"] * len(batch))
-
-            where = [f"symbol IN ({placeholders})", "timeframe=%s"]
-            params = list(batch) + [timeframe]
-
-            if start:
-                where.append("`date` >= %s")
-                params.append(start)
-            if end:
-                where.append("`date` <= %s")
-                params.append(end)
-
-            sql = f"""
-            SELECT
-                symbol, `date`, open, high, low, close, adj_close, volume,
-                dividends, stock_splits
-            FROM {TABLE}
-            WHERE {" AND ".join(where)}
-            ORDER BY symbol ASC, `date` ASC
-            """
-            out.extend(db.query(sql, params))
-
-        df = pd.DataFrame(out)
-        if df.empty:
-            return df
-        df["date"] = pd.to_datetime(df["date"])
-        return df
-
-    finally:
-        db.close()
+    # 접속 정보가 None이면 FINANCE_MYSQL_* 환경변수/기본값을 쓰는 공용 풀 커넥션을 빌린다.
+    # dict 행 목록 대신 unbuffered tuple cursor 배치를 타입 배열로 옮겨 쌓는다.
+    parts = list(
+        _iter_typed_ohlcv_batches(
+            symbols,
+            start=start,
+            end=end,
+            timeframe=timeframe,
+            host=host,
+            user=user,
+            password=password,
+            port=port,
+            chunk_size=chunk_size,
+            fetch_size=fetch_size,
+        )
+    )
+    if not parts:
+        return pd.DataFrame()
+    return _ohlcv_frame(
+        np.concatenate([part[0] for part in parts]),
+        np.concatenate([part[1] for part in parts]),
+        np.concatenate([part[2] for part in parts], axis=1),
+    )
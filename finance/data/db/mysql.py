@@ -1,16 +1,313 @@
 # finance/data/db/mysql.py
 
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
 import pymysql
 
 
-class MySQLClient:
-    def __init__(self, host, user, password, port=3306, charset="utf8mb4"):
-        self.conn = pymysql.connect(
-            host=host, user=user, password=password, port=port,
-            charset=charset, autocommit=True,
+DEFAULT_MYSQL_HOST = "localhost"
+DEFAULT_MYSQL_USER = "root"
+DEFAULT_MYSQL_PASSWORD = "1234"
+DEFAULT_MYSQL_PORT = 3306
+
+# 한 프로세스의 최악 동시 checkout: overview automation job 4개 x core pipeline stage thread 5개
+# x 중첩 client 2개 = 40. 여기에 Streamlit 세션 여유를 더해도 MySQL 기본 max_connections(151) 아래다.
+DEFAULT_POOL_MAX_SIZE = 48
+DEFAULT_POOL_HEALTH_CHECK_INTERVAL_SEC = 30.0
+DEFAULT_POOL_CHECKOUT_TIMEOUT_SEC = 30.0
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    try:
+        return int(raw) if raw not in (None, "") else default
+    except ValueError:
+        return default
+
+
+def resolve_mysql_settings(host=None, user=None, password=None, port=None) -> tuple[str, str, str, int]:
+    """
+    명시 인자 > FINANCE_MYSQL_* 환경변수 > 로컬 기본값 순으로 접속 정보를 정한다.
+    """
+    return (
+        str(host or os.getenv("FINANCE_MYSQL_HOST") or DEFAULT_MYSQL_HOST),
+        str(user or os.getenv("FINANCE_MYSQL_USER") or DEFAULT_MYSQL_USER),
+        str(password if password is not None else os.getenv("FINANCE_MYSQL_PASSWORD", DEFAULT_MYSQL_PASSWORD)),
+        int(port or _env_int("FINANCE_MYSQL_PORT", DEFAULT_MYSQL_PORT)),
+    )
+
+
+class MySQLPoolTimeout(RuntimeError):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+@dataclass
+class _PooledConnection:
+    conn: Any
+    last_used: float = field(default_factory=time.monotonic)
+    database: str | None = None
+
+
+class MySQLConnectionPool:
+    """
+    동일 접속 정보(host/user/port/charset)에 대한 프로세스 공용 커넥션 풀.
+
+    - 최대 max_size개의 커넥션을 유지하고, 모두 사용 중이면 checkout_timeout 동안 대기
+    - health_check_interval 이상 놀던 커넥션은 checkout 시 ping으로 확인 후 죽었으면 폐기
+    - 커넥션별 현재 DB를 기억해 같은 DB로의 재진입은 USE를 생략
+    """
+
+    def __init__(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        port: int = DEFAULT_MYSQL_PORT,
+        charset: str = "utf8mb4",
+        *,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        health_check_interval: float = DEFAULT_POOL_HEALTH_CHECK_INTERVAL_SEC,
+        checkout_timeout: float | None = DEFAULT_POOL_CHECKOUT_TIMEOUT_SEC,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.host = host
+        self.user = user
+        self.password = password
+        self.port = port
+        self.charset = charset
+        self.max_size = int(max_size)
+        self.health_check_interval = float(health_check_interval)
+        self.checkout_timeout = checkout_timeout
+
+        self._cond = threading.Condition()
+        self._idle: list[_PooledConnection] = []
+        self._in_use = 0
+        self._ensured_databases: set[str] = set()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "discarded": 0,
+            "health_check_failures": 0,
+        }
+
+    def _connect(self):
+        return pymysql.connect(
+            host=self.host, user=self.user, password=self.password, port=self.port,
+            charset=self.charset, autocommit=True,
             cursorclass=pymysql.cursors.DictCursor,  # ✅ dict로 받기
         )
 
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, entry: _PooledConnection) -> bool:
+        if time.monotonic() - entry.last_used < self.health_check_interval:
+            return True
+        try:
+            entry.conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self) -> _PooledConnection:
+        deadline = None if self.checkout_timeout is None else time.monotonic() + self.checkout_timeout
+        with self._cond:
+            waited_from = None
+            while True:
+                while self._idle:
+                    entry = self._idle.pop()
+                    if self._is_healthy(entry):
+                        self._in_use += 1
+                        self._stats["hits"] += 1
+                        self._record_wait(waited_from)
+                        return entry
+                    self._stats["health_check_failures"] += 1
+                    self._stats["discarded"] += 1
+                    self._close_quietly(entry.conn)
+                if self._in_use < self.max_size:
+                    self._in_use += 1
+                    self._stats["misses"] += 1
+                    self._record_wait(waited_from)
+                    break
+                if waited_from is None:
+                    waited_from = time.monotonic()
+                    self._stats["waits"] += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._record_wait(waited_from)
+                    raise MySQLPoolTimeout(
+                        f"No MySQL connection available for {self.user}@{self.host}:{self.port} "
+                        f"within {self.checkout_timeout}s (max_size={self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+        # 실제 연결은 락 밖에서 맺는다.
+        try:
+            return _PooledConnection(conn=self._connect())
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def _record_wait(self, waited_from: float | None) -> None:
+        if waited_from is not None:
+            self._stats["wait_seconds"] += time.monotonic() - waited_from
+
+    def release(self, entry: _PooledConnection, *, discard: bool = False) -> None:
+        if not discard and not getattr(entry.conn, "open", True):
+            discard = True
+        with self._cond:
+            self._in_use -= 1
+            if discard or len(self._idle) >= self.max_size:
+                self._stats["discarded"] += 1
+                self._close_quietly(entry.conn)
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+    def ensure_database(self, db_name: str, execute) -> None:
+        # CREATE DATABASE IF NOT EXISTS는 풀(프로세스)당 DB별로 한 번만 보낸다.
+        if db_name in self._ensured_databases:
+            return
+        execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
+        with self._cond:
+            self._ensured_databases.add(db_name)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                **self._stats,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "max_size": self.max_size,
+            }
+
+    def close(self) -> None:
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._ensured_databases.clear()
+        for entry in idle:
+            self._close_quietly(entry.conn)
+
+
+_POOL_LOCK = threading.Lock()
+_POOLS: dict[tuple, MySQLConnectionPool] = {}
+_POOL_PID = os.getpid()
+_POOL_CONFIG: dict[str, Any] = {
+    "max_size": _env_int("FINANCE_MYSQL_POOL_SIZE", DEFAULT_POOL_MAX_SIZE),
+    "health_check_interval": DEFAULT_POOL_HEALTH_CHECK_INTERVAL_SEC,
+    "checkout_timeout": DEFAULT_POOL_CHECKOUT_TIMEOUT_SEC,
+}
+
+
+def configure_mysql_pool(
+    *,
+    max_size: int | None = None,
+    health_check_interval: float | None = None,
+    checkout_timeout: float | None = None,
+) -> dict[str, Any]:
+    """
+    풀 설정을 바꾼다. 이미 만들어진 풀에도 즉시 반영된다.
+    """
+    updates = {
+        "max_size": max_size,
+        "health_check_interval": health_check_interval,
+        "checkout_timeout": checkout_timeout,
+    }
+    if max_size is not None and max_size < 1:
+        raise ValueError("max_size must be >= 1")
+    with _POOL_LOCK:
+        for key, value in updates.items():
+            if value is not None:
+                _POOL_CONFIG[key] = value
+        for pool in _POOLS.values():
+            with pool._cond:
+                pool.max_size = int(_POOL_CONFIG["max_size"])
+                pool.health_check_interval = float(_POOL_CONFIG["health_check_interval"])
+                pool.checkout_timeout = _POOL_CONFIG["checkout_timeout"]
+                pool._cond.notify_all()
+        return dict(_POOL_CONFIG)
+
+
+def get_mysql_pool(host=None, user=None, password=None, port=None, charset="utf8mb4") -> MySQLConnectionPool:
+    global _POOL_PID
+    host, user, password, port = resolve_mysql_settings(host, user, password, port)
+    key = (host, user, password, port, charset)
+    with _POOL_LOCK:
+        if _POOL_PID != os.getpid():
+            # fork된 자식은 부모 소켓을 공유하면 안 되므로 풀을 새로 만든다.
+            _POOLS.clear()
+            _POOL_PID = os.getpid()
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = MySQLConnectionPool(host, user, password, port, charset, **_POOL_CONFIG)
+            _POOLS[key] = pool
+        return pool
+
+
+def get_mysql_pool_stats() -> dict[str, dict[str, Any]]:
+    """
+    풀별 hit/miss/wait 지표. 키는 `user@host:port`.
+    """
+    with _POOL_LOCK:
+        pools = list(_POOLS.values())
+    return {f"{pool.user}@{pool.host}:{pool.port}": pool.stats() for pool in pools}
+
+
+def close_mysql_pools() -> None:
+    with _POOL_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+class MySQLClient:
+    def __init__(self, host=None, user=None, password=None, port=None, charset="utf8mb4", *, pooled=True):
+        self._pool: MySQLConnectionPool | None = None
+        self._entry: _PooledConnection | None = None
+        self._in_transaction = False
+        if pooled:
+            self._pool = get_mysql_pool(host, user, password, port, charset)
+            self._entry = self._pool.acquire()
+            self.conn = self._entry.conn
+        else:
+            host, user, password, port = resolve_mysql_settings(host, user, password, port)
+            self.conn = pymysql.connect(
+                host=host, user=user, password=password, port=port,
+                charset=charset, autocommit=True,
+                cursorclass=pymysql.cursors.DictCursor,  # ✅ dict로 받기
+            )
+
+    def __enter__(self) -> "MySQLClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __del__(self):
+        # close()를 빼먹은 호출부가 풀 슬롯을 영구히 점유하지 않도록 한다.
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def execute(self, sql: str, params=None):
         with self.conn.cursor() as cur:
             cur.execute(sql, params)
@@ -24,18 +321,75 @@ class MySQLClient:
             cur.execute(sql, params)
             return list(cur.fetchall())
 
+    def stream(self, sql: str, params=None, *, batch_size: int = 10_000) -> Iterator[list[tuple]]:
+        """
+        unbuffered tuple cursor(SSCursor)로 결과를 batch_size 행씩 흘려보낸다.
+
+        결과 전체를 클라이언트 메모리에 올리지 않으며, 다 읽기 전 중단해도
+        cursor close가 남은 행을 비워 커넥션을 재사용 가능한 상태로 돌려놓는다.
+        """
+        with self.conn.cursor(pymysql.cursors.SSCursor) as cur:
+            cur.execute(sql, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield list(rows)
+
     def begin(self):
         self.conn.begin()
+        self._in_transaction = True
 
     def commit(self):
         self.conn.commit()
+        self._in_transaction = False
 
     def rollback(self):
         self.conn.rollback()
+        self._in_transaction = False
 
     def use_db(self, db_name: str):
-        self.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
+        if self._entry is None:
+            self.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
+            self.execute(f"USE {db_name}")
+            return
+        if self._entry.database == db_name:
+            return
+        self._pool.ensure_database(db_name, self.execute)
         self.execute(f"USE {db_name}")
+        self._entry.database = db_name
 
     def close(self):
-        self.conn.close()
+        entry, self._entry = self._entry, None
+        if self._pool is None:
+            if getattr(self, "conn", None) is not None:
+                self.conn.close()
+            return
+        if entry is None:
+            return
+        discard = False
+        if self._in_transaction:
+            # 커밋/롤백 없이 반납된 트랜잭션은 다음 사용자에게 새지 않게 되돌린다.
+            try:
+                entry.conn.rollback()
+            except Exception:
+                discard = True
+            self._in_transaction = False
+        self._pool.release(entry, discard=discard)
+
+
+@contextmanager
+def mysql_client(db_name: str | None = None, **connect_kwargs) -> Iterator[MySQLClient]:
+    """
+    풀에서 커넥션을 빌려 db_name으로 전환한 뒤 블록이 끝나면 반납한다.
+
+    with mysql_client("finance_price") as db:
+        rows = db.query(...)
+    """
+    db = MySQLClient(**connect_kwargs)
+    try:
+        if db_name:
+            db.use_db(db_name)
+        yield db
+    finally:
+        db.close()
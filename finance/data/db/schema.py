@@ -301,7 +301,42 @@ PRICE_SCHEMAS = {
             KEY ix_symbol (symbol),
             KEY ix_date (`date`)
         );
-    """
+    """,
+    # bulk 적재용 세션 임시 테이블. seq 순서로 merge해서 배치 내 중복은 마지막 값이 남는다.
+    "price_history_stage": """
+        CREATE TEMPORARY TABLE IF NOT EXISTS nyse_price_history_stage (
+            seq BIGINT AUTO_INCREMENT PRIMARY KEY,
+
+            symbol VARCHAR(20) NOT NULL,
+            timeframe ENUM('1d','1wk','1mo') NOT NULL,
+            `date` DATE NOT NULL,
+
+            open DOUBLE NULL,
+            high DOUBLE NULL,
+            low  DOUBLE NULL,
+            close DOUBLE NULL,
+            adj_close DOUBLE NULL,
+            volume BIGINT NULL,
+
+            dividends DOUBLE NULL,
+            stock_splits DOUBLE NULL
+        );
+    """,
+    # writer가 배치마다 남기는 변경 로그. price store는 nyse_price_history 대신 이 인덱스만 읽어 변경을 감지한다.
+    # changed_from이 NULL이면 그 심볼의 전체 이력을 다시 쓴 것이다.
+    "price_write_log": """
+        CREATE TABLE IF NOT EXISTS nyse_price_write_log (
+            write_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+
+            symbol VARCHAR(20) NOT NULL,
+            timeframe ENUM('1d','1wk','1mo') NOT NULL,
+            changed_from DATE NULL,
+
+            written_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            KEY ix_symbol_timeframe_write (symbol, timeframe, write_id, changed_from)
+        );
+    """,
 }
 
 PIT_UNIVERSE_SCHEMAS = {
@@ -1479,6 +1514,126 @@ INSTITUTIONAL_13F_SCHEMAS = {
           KEY ix_latest_report_period (latest_report_period)
         );
     """,
+    "institutional_13f_ingest_progress": """
+        CREATE TABLE IF NOT EXISTS institutional_13f_ingest_progress (
+          source_dataset VARCHAR(128) NOT NULL,
+          accession_number VARCHAR(25) NOT NULL,
+          holdings_expected INT NOT NULL DEFAULT 0,
+          holdings_written INT NOT NULL DEFAULT 0,
+          completed_at TIMESTAMP NULL,
+
+          created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+          updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+          PRIMARY KEY (source_dataset, accession_number),
+          KEY ix_completed_at (completed_at)
+        );
+    """,
+    "institutional_13f_manager_snapshot": """
+        CREATE TABLE IF NOT EXISTS institutional_13f_manager_snapshot (
+          cik VARCHAR(10) NOT NULL,
+          report_period DATE NOT NULL,
+          manager_name VARCHAR(255) NOT NULL,
+
+          accession_number VARCHAR(25) NULL,
+          latest_accession_number VARCHAR(25) NULL,
+          filing_date DATE NULL,
+          previous_report_period DATE NULL,
+          previous_filing_date DATE NULL,
+          source_ref VARCHAR(1024) NULL,
+          collected_at TIMESTAMP NULL,
+
+          total_reported_value DOUBLE NOT NULL DEFAULT 0,
+          holding_count INT NOT NULL DEFAULT 0,
+          materialized_at TIMESTAMP NULL,
+
+          created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+          updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+          PRIMARY KEY (cik, report_period),
+          KEY ix_report_period (report_period)
+        );
+    """,
+    "institutional_13f_manager_position": """
+        CREATE TABLE IF NOT EXISTS institutional_13f_manager_position (
+          cik VARCHAR(10) NOT NULL,
+          report_period DATE NOT NULL,
+          position_rank INT NOT NULL,
+
+          issuer_name VARCHAR(255) NOT NULL,
+          holding_symbol VARCHAR(20) NULL,
+          symbol_source VARCHAR(64) NULL,
+          mapping_status VARCHAR(32) NULL,
+          cusip CHAR(9) NULL,
+          figi VARCHAR(16) NULL,
+          title_of_class VARCHAR(150) NULL,
+          reported_value DOUBLE NOT NULL DEFAULT 0,
+          shares_or_principal_amount DOUBLE NOT NULL DEFAULT 0,
+          amount_type VARCHAR(10) NULL,
+          put_call VARCHAR(10) NULL,
+          sector VARCHAR(100) NULL,
+          industry VARCHAR(150) NULL,
+          weight_pct DOUBLE NOT NULL DEFAULT 0,
+          source_ref VARCHAR(1024) NULL,
+
+          PRIMARY KEY (cik, report_period, position_rank),
+          KEY ix_report_period_cusip (report_period, cusip)
+        );
+    """,
+    "institutional_13f_manager_change": """
+        CREATE TABLE IF NOT EXISTS institutional_13f_manager_change (
+          cik VARCHAR(10) NOT NULL,
+          report_period DATE NOT NULL,
+          change_rank INT NOT NULL,
+
+          previous_report_period DATE NULL,
+          change_type VARCHAR(32) NOT NULL,
+          issuer_name VARCHAR(255) NULL,
+          holding_symbol VARCHAR(20) NULL,
+          cusip CHAR(9) NULL,
+          latest_reported_value DOUBLE NULL,
+          previous_reported_value DOUBLE NULL,
+          value_delta DOUBLE NOT NULL DEFAULT 0,
+          latest_shares_or_principal DOUBLE NULL,
+          previous_shares_or_principal DOUBLE NULL,
+          share_delta DOUBLE NOT NULL DEFAULT 0,
+          weight_pct DOUBLE NULL,
+
+          PRIMARY KEY (cik, report_period, change_rank),
+          KEY ix_report_period_change (report_period, change_type)
+        );
+    """,
+    "institutional_13f_manager_sector": """
+        CREATE TABLE IF NOT EXISTS institutional_13f_manager_sector (
+          cik VARCHAR(10) NOT NULL,
+          report_period DATE NOT NULL,
+          sector_rank INT NOT NULL,
+
+          sector VARCHAR(100) NOT NULL,
+          reported_value DOUBLE NOT NULL DEFAULT 0,
+          weight_pct DOUBLE NOT NULL DEFAULT 0,
+          holding_count INT NOT NULL DEFAULT 0,
+
+          PRIMARY KEY (cik, report_period, sector_rank)
+        );
+    """,
+    "institutional_13f_security_popularity": """
+        CREATE TABLE IF NOT EXISTS institutional_13f_security_popularity (
+          report_period DATE NOT NULL,
+          cusip CHAR(9) NOT NULL,
+
+          holding_symbol VARCHAR(20) NULL,
+          issuer_name VARCHAR(255) NULL,
+          holder_count INT NOT NULL DEFAULT 0,
+          holding_rows INT NOT NULL DEFAULT 0,
+          total_reported_value DECIMAL(28,4) NULL,
+          sample_managers TEXT NULL,
+          materialized_at TIMESTAMP NULL,
+
+          PRIMARY KEY (report_period, cusip),
+          KEY ix_period_rank (report_period, holder_count, total_reported_value)
+        );
+    """,
 }
 
 
@@ -50,16 +50,19 @@ def _safe_div(a, b):
 def _attach_price_asof(fund: pd.DataFrame, price: pd.DataFrame) -> pd.DataFrame:
     """
     period_end 기준으로 직전 거래일 종가(close)를 매칭.
-    pandas merge_asof(by=...)에서 'left keys must be sorted'가 재발하는 케이스를 피하기 위해
-    symbol별로 merge_asof를 수행한다.
+    전 종목을 period_end로 한 번 정렬한 뒤 merge_asof(by="symbol") 한 번으로 매칭하고,
+    결과는 기존과 같이 symbol(첫 등장 순) -> period_end 순서로 돌려준다.
     """
     if fund.empty:
         return fund
 
     f = fund.copy()
     f["symbol"] = f["symbol"].astype(str).str.strip()
-    f["period_end"] = pd.to_datetime(f["period_end"], errors="coerce")
-    f = f[f["period_end"].notna()].copy()
+    f["period_end"] = pd.to_datetime(f["period_end"], errors="coerce").astype("datetime64[ns]")
+    f = f[f["period_end"].notna()]
+    # symbol 첫 등장 순서 + period_end (lexsort는 stable)
+    symbol_codes, _ = pd.factorize(f["symbol"])
+    f = f.iloc[np.lexsort((f["period_end"].to_numpy(), symbol_codes))].reset_index(drop=True)
 
     if price is None or price.empty:
         f["price"] = None
@@ -67,44 +70,37 @@ def _attach_price_asof(fund: pd.DataFrame, price: pd.DataFrame) -> pd.DataFrame:
         f["price_match_gap_days"] = None
         return f
 
-    p = price.copy()
-    p["symbol"] = p["symbol"].astype(str).str.strip()
-    p["date"] = pd.to_datetime(p["date"], errors="coerce")
-    p = p[p["date"].notna()].copy()
-    # price를 symbol별 dict로 캐싱
-    price_map = {
-        sym: g.sort_values("date").reset_index(drop=True)
-        for sym, g in p.groupby("symbol", sort=False)
-    }
-
-    out_parts = []
-    for sym, g in f.groupby("symbol", sort=False):
-        gg = g.sort_values("period_end").reset_index(drop=True)
-        pg = price_map.get(sym)
-
-        if pg is None or pg.empty:
-            gg["price"] = None
-            gg["price_date"] = pd.NaT
-            gg["price_match_gap_days"] = None
-            out_parts.append(gg)
-            continue
-
-        merged = pd.merge_asof(
-            gg,
-            pg[["date", "close"]],
-            left_on="period_end",
-            right_on="date",
-            direction="backward",
-            allow_exact_matches=True,
-        )
-        merged = merged.rename(columns={"date": "price_date", "close": "price"})
-        merged["price_match_gap_days"] = (
-            merged["period_end"] - merged["price_date"]
-        ).dt.days.where(merged["price_date"].notna(), pd.NA)
-        out_parts.append(merged)
-
-    return pd.concat(out_parts, ignore_index=True)
-
+    p = pd.DataFrame(
+        {
+            "symbol": price["symbol"].astype(str).str.strip(),
+            "price_date": pd.to_datetime(price["date"], errors="coerce").astype("datetime64[ns]"),
+            "price": price["close"],
+        }
+    )
+    p = p[p["price_date"].notna()].sort_values("price_date", kind="mergesort")
+
+    # merge_asof는 on 키가 전역 정렬돼 있어야 하므로 행 위치만 들고 period_end로 정렬해 매칭
+    left = pd.DataFrame({"row": np.arange(len(f)), "symbol": f["symbol"], "period_end": f["period_end"]})
+    left = left.sort_values("period_end", kind="mergesort")
+    merged = pd.merge_asof(
+        left,
+        p,
+        left_on="period_end",
+        right_on="price_date",
+        by="symbol",
+        direction="backward",
+        allow_exact_matches=True,
+    )
+    rows = merged["row"].to_numpy()
+    price_date = pd.Series(pd.NaT, index=f.index, dtype=merged["price_date"].dtype)
+    price_date.iloc[rows] = merged["price_date"].to_numpy()
+    matched_price = pd.Series(np.nan, index=f.index, dtype=float)
+    matched_price.iloc[rows] = pd.to_numeric(merged["price"], errors="coerce").to_numpy(dtype=float)
+
+    f["price_date"] = price_date
+    f["price"] = matched_price
+    f["price_match_gap_days"] = (f["period_end"] - price_date).dt.days
+    return f
 
 
 def add_market_cap(df: pd.DataFrame) -> pd.DataFrame:
@@ -16,6 +16,7 @@ from finance.financial_source_policy import sanitize_quarterly_statement_flow_re
 
 from .db.mysql import MySQLClient
 from .db.schema import FUNDAMENTAL_SCHEMAS, sync_table_schema
+from .provider_gate import YAHOO_PROVIDER, provider_slot
 
 DB_FUND = "finance_fundamental"
 Freq = Literal["annual", "quarterly"]
@@ -1470,7 +1471,9 @@ def upsert_fundamentals(
                 last_err = None
                 for k in range(max_retry):
                     try:
-                        rows = _extract_required_fields(sym, freq, t)
+                        # DB 쓰기와 retry sleep은 slot 밖에 두어 OHLCV 경로가 그동안 Yahoo를 쓸 수 있게 한다.
+                        with provider_slot(YAHOO_PROVIDER):
+                            rows = _extract_required_fields(sym, freq, t)
                         if not rows:
                             logger.warning(f"{sym} | {freq} | empty statements")
                         all_rows.extend(rows)
@@ -4,6 +4,8 @@ import io
 import json
 import os
 import re
+import shutil
+import tempfile
 import time
 import urllib.error
 import urllib.parse
@@ -11,10 +13,12 @@ import urllib.request
 import zipfile
 from collections import defaultdict
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.holiday import USFederalHolidayCalendar
 from pandas.tseries.offsets import CustomBusinessDay
@@ -44,6 +48,10 @@ DATASET_FILE_KEYS = {
     "summarypage": ("SUMMARYPAGE",),
     "infotable": ("INFOTABLE", "INFOTABLE_SK"),
 }
+# Streaming ingestion reads INFOTABLE in chunks of this many rows.
+DEFAULT_INFOTABLE_CHUNK_ROWS = 50_000
+_DOWNLOAD_CHUNK_BYTES = 1 << 20
+_INFOTABLE_KEY_COLUMNS = ("ACCESSION_NUMBER", "INFOTABLE_SK", "CUSIP", "NAMEOFISSUER")
 _FORM_13F_BUSINESS_DAY = CustomBusinessDay(calendar=USFederalHolidayCalendar())
 _DATASET_FILENAME_RE = re.compile(
     r"(?P<start>\d{2}[a-z]{3}\d{4})-(?P<end>\d{2}[a-z]{3}\d{4})_form13f\.zip$",
@@ -209,6 +217,12 @@ def _date_text(value: Any) -> str | None:
     text = _clean_text(value)
     if not text:
         return None
+    return _parse_date_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> str | None:
+    # A data set repeats a few hundred distinct dates across its filings.
     parsed = pd.to_datetime(text, errors="coerce")
     if pd.isna(parsed):
         return None
@@ -368,6 +382,13 @@ def _build_effective_manager_rows(
         for row in holdings
         if str(row.get("accession_number") or "").strip()
     }
+    return _effective_manager_rows_for_accessions(filings, holding_accessions)
+
+
+def _effective_manager_rows_for_accessions(
+    filings: list[dict[str, Any]],
+    holding_accessions: set[str],
+) -> list[dict[str, Any]]:
     grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for filing in filings:
         cik = str(filing.get("cik") or "").strip()
@@ -426,6 +447,13 @@ def _complete_holding_accessions(
         accession = str(holding.get("accession_number") or "").strip()
         if accession:
             counts[accession] += 1
+    return _complete_accessions_from_counts(filings, counts)
+
+
+def _complete_accessions_from_counts(
+    filings: Iterable[dict[str, Any]],
+    counts: dict[str, int],
+) -> set[str]:
     complete: set[str] = set()
     for filing in filings:
         accession = str(filing.get("accession_number") or "").strip()
@@ -444,44 +472,12 @@ def normalize_sec_13f_frames(
 ) -> dict[str, list[dict[str, Any]]]:
     """Normalize official SEC 13F data set frames into DB-ready rows."""
     collected = collected_at or _now_utc_text()
-    submission_rows = _records(frames.get("submission"))
-    cover_by_accession = _index_by_accession(frames.get("coverpage"))
-    summary_by_accession = _index_by_accession(frames.get("summarypage"))
-
-    filing_rows: list[dict[str, Any]] = []
-    filing_by_accession: dict[str, dict[str, Any]] = {}
-    for row in submission_rows:
-        accession = _normalize_accession(row.get("ACCESSION_NUMBER"))
-        cik = _normalize_cik(row.get("CIK"))
-        if not accession or not cik:
-            continue
-        cover = cover_by_accession.get(accession, {})
-        summary = summary_by_accession.get(accession, {})
-        manager_name = _clean_text(cover.get("FILINGMANAGER_NAME")) or "Unknown manager"
-        filing = {
-            "accession_number": accession,
-            "cik": cik,
-            "manager_name": manager_name,
-            "submission_type": _clean_text(row.get("SUBMISSIONTYPE")) or "13F-HR",
-            "filing_date": _date_text(row.get("FILING_DATE")),
-            "period_of_report": _date_text(row.get("PERIODOFREPORT")),
-            "report_calendar_or_quarter": _date_text(cover.get("REPORTCALENDARORQUARTER")),
-            "is_amendment": _bool_flag(cover.get("ISAMENDMENT")),
-            "amendment_no": _int_value(cover.get("AMENDMENTNO")),
-            "amendment_type": _clean_text(cover.get("AMENDMENTTYPE")),
-            "report_type": _clean_text(cover.get("REPORTTYPE")),
-            "form13f_file_number": _clean_text(cover.get("FORM13FFILENUMBER")),
-            "table_entry_total": _int_value(summary.get("TABLEENTRYTOTAL")),
-            "table_value_total": _float_value(summary.get("TABLEVALUETOTAL")),
-            "is_confidential_omitted": _optional_bool_flag(summary.get("ISCONFIDENTIALOMITTED")),
-            "source_dataset": source_dataset,
-            "source_ref": _filing_source_ref(cik, accession, source_ref),
-            "collected_at": collected,
-        }
-        if not filing["filing_date"] or not filing["period_of_report"]:
-            continue
-        filing_rows.append(filing)
-        filing_by_accession[accession] = filing
+    filing_rows, filing_by_accession = _normalize_filing_rows(
+        frames,
+        source_dataset=source_dataset,
+        source_ref=source_ref,
+        collected_at=collected,
+    )
 
     holding_rows: list[dict[str, Any]] = []
     for row in _records(frames.get("infotable")):
@@ -536,6 +532,54 @@ def normalize_sec_13f_frames(
     }
 
 
+def _normalize_filing_rows(
+    frames: dict[str, pd.DataFrame],
+    *,
+    source_dataset: str,
+    source_ref: str | None,
+    collected_at: str,
+) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+    submission_rows = _records(frames.get("submission"))
+    cover_by_accession = _index_by_accession(frames.get("coverpage"))
+    summary_by_accession = _index_by_accession(frames.get("summarypage"))
+
+    filing_rows: list[dict[str, Any]] = []
+    filing_by_accession: dict[str, dict[str, Any]] = {}
+    for row in submission_rows:
+        accession = _normalize_accession(row.get("ACCESSION_NUMBER"))
+        cik = _normalize_cik(row.get("CIK"))
+        if not accession or not cik:
+            continue
+        cover = cover_by_accession.get(accession, {})
+        summary = summary_by_accession.get(accession, {})
+        manager_name = _clean_text(cover.get("FILINGMANAGER_NAME")) or "Unknown manager"
+        filing = {
+            "accession_number": accession,
+            "cik": cik,
+            "manager_name": manager_name,
+            "submission_type": _clean_text(row.get("SUBMISSIONTYPE")) or "13F-HR",
+            "filing_date": _date_text(row.get("FILING_DATE")),
+            "period_of_report": _date_text(row.get("PERIODOFREPORT")),
+            "report_calendar_or_quarter": _date_text(cover.get("REPORTCALENDARORQUARTER")),
+            "is_amendment": _bool_flag(cover.get("ISAMENDMENT")),
+            "amendment_no": _int_value(cover.get("AMENDMENTNO")),
+            "amendment_type": _clean_text(cover.get("AMENDMENTTYPE")),
+            "report_type": _clean_text(cover.get("REPORTTYPE")),
+            "form13f_file_number": _clean_text(cover.get("FORM13FFILENUMBER")),
+            "table_entry_total": _int_value(summary.get("TABLEENTRYTOTAL")),
+            "table_value_total": _float_value(summary.get("TABLEVALUETOTAL")),
+            "is_confidential_omitted": _optional_bool_flag(summary.get("ISCONFIDENTIALOMITTED")),
+            "source_dataset": source_dataset,
+            "source_ref": _filing_source_ref(cik, accession, source_ref),
+            "collected_at": collected_at,
+        }
+        if not filing["filing_date"] or not filing["period_of_report"]:
+            continue
+        filing_rows.append(filing)
+        filing_by_accession[accession] = filing
+    return filing_rows, filing_by_accession
+
+
 def _dataset_key_from_name(name: str) -> str | None:
     normalized_name = Path(name).name.upper()
     for key, tokens in DATASET_FILE_KEYS.items():
@@ -593,6 +637,162 @@ def download_sec_13f_dataset_zip(
         raise RuntimeError(f"SEC 13F dataset request failed: {dataset_url} ({exc.reason})") from exc
 
 
+def download_sec_13f_dataset_to_file(
+    dataset_url: str,
+    destination: str | Path,
+    *,
+    user_agent: str | None = None,
+    timeout: float = 60.0,
+) -> Path:
+    """Spool a SEC 13F data set zip to `destination` without holding it in memory."""
+    request = urllib.request.Request(
+        dataset_url,
+        headers={
+            "User-Agent": _resolve_user_agent(user_agent),
+            "Accept-Encoding": "gzip, deflate",
+        },
+    )
+    target = Path(destination)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response, target.open("wb") as handle:
+            shutil.copyfileobj(response, handle, _DOWNLOAD_CHUNK_BYTES)
+    except urllib.error.HTTPError as exc:
+        raise RuntimeError(f"SEC 13F dataset request failed {exc.code}: {dataset_url}") from exc
+    except urllib.error.URLError as exc:
+        raise RuntimeError(f"SEC 13F dataset request failed: {dataset_url} ({exc.reason})") from exc
+    return target
+
+
+def _dataset_members(zip_file: zipfile.ZipFile) -> dict[str, str]:
+    members: dict[str, str] = {}
+    for member in zip_file.namelist():
+        key = _dataset_key_from_name(member)
+        if key:
+            members[key] = member
+    return members
+
+
+def _iter_dataset_member_chunks(
+    zip_file: zipfile.ZipFile,
+    member: str,
+    *,
+    chunk_rows: int,
+    columns: Iterable[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    wanted = {column.upper() for column in columns} if columns is not None else None
+    with zip_file.open(member) as handle:
+        reader = pd.read_csv(
+            handle,
+            sep="\t",
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8",
+            chunksize=max(int(chunk_rows), 1),
+            usecols=(lambda column: str(column).strip().upper() in wanted) if wanted is not None else None,
+        )
+        for chunk in reader:
+            yield _normalize_frame_columns(chunk)
+
+
+def _clean_text_series(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Vectorized `_clean_text` over one string column."""
+    if column not in frame.columns:
+        return pd.Series(None, index=frame.index, dtype=object)
+    text = frame[column].astype(str).str.strip()
+    missing = text.eq("") | text.str.lower().isin(["nan", "none", "null"])
+    return text.astype(object).where(~missing, None)
+
+
+def _float_series(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Vectorized `_float_value`; unparseable text becomes NaN."""
+    text = _clean_text_series(frame, column)
+    return pd.to_numeric(text.str.replace(",", "", regex=False), errors="coerce")
+
+
+def _valid_infotable_mask(
+    chunk: pd.DataFrame,
+    accessions: Iterable[str],
+) -> tuple[pd.Series, pd.Series, pd.Series]:
+    accession = chunk.get("ACCESSION_NUMBER", pd.Series("", index=chunk.index)).astype(str).str.strip()
+    infotable_sk = _float_series(chunk, "INFOTABLE_SK")
+    mask = (
+        accession.isin(list(accessions))
+        & np.isfinite(infotable_sk.to_numpy(dtype=float))
+        & _clean_text_series(chunk, "CUSIP").notna()
+        & _clean_text_series(chunk, "NAMEOFISSUER").notna()
+    )
+    return mask, accession, infotable_sk
+
+
+def _normalize_infotable_chunk(
+    chunk: pd.DataFrame,
+    filings: pd.DataFrame,
+    *,
+    accessions: Iterable[str],
+    source_dataset: str,
+    source_ref: str | None,
+    collected_at: str,
+) -> pd.DataFrame:
+    """Normalize one INFOTABLE chunk to holding rows with column operations.
+
+    `filings` is indexed by accession number; rows outside `accessions` are dropped.
+    The result matches the holdings `normalize_sec_13f_frames` builds row by row.
+    """
+    mask, accession, infotable_sk = _valid_infotable_mask(chunk, accessions)
+    rows = chunk.loc[mask]
+    filing = filings.loc[accession[mask].to_numpy()]
+
+    def text(column: str) -> np.ndarray:
+        return _clean_text_series(rows, column).to_numpy()
+
+    def number(column: str) -> np.ndarray:
+        return _float_series(rows, column).to_numpy(dtype=float)
+
+    return pd.DataFrame(
+        {
+            "accession_number": accession[mask].to_numpy(),
+            "infotable_sk": np.trunc(infotable_sk[mask].to_numpy(dtype=float)).astype(np.int64),
+            "cik": filing["cik"].to_numpy(),
+            "manager_name": filing["manager_name"].to_numpy(),
+            "report_period": filing["period_of_report"].to_numpy(),
+            "filing_date": filing["filing_date"].to_numpy(),
+            "issuer_name": text("NAMEOFISSUER"),
+            "title_of_class": text("TITLEOFCLASS"),
+            "cusip": _clean_text_series(rows, "CUSIP").str.upper().to_numpy(),
+            "figi": text("FIGI"),
+            "reported_value": number("VALUE"),
+            "shares_or_principal_amount": number("SSHPRNAMT"),
+            "amount_type": text("SSHPRNAMTTYPE"),
+            "put_call": text("PUTCALL"),
+            "investment_discretion": text("INVESTMENTDISCRETION"),
+            "other_manager": text("OTHERMANAGER"),
+            "voting_auth_sole": number("VOTING_AUTH_SOLE"),
+            "voting_auth_shared": number("VOTING_AUTH_SHARED"),
+            "voting_auth_none": number("VOTING_AUTH_NONE"),
+            "holding_symbol": None,
+            "symbol_source": None,
+            "sector": None,
+            "industry": None,
+            "source_dataset": source_dataset,
+            "source_ref": filing["source_ref"].where(filing["source_ref"].notna(), source_ref).to_numpy(),
+            "collected_at": collected_at,
+        },
+        index=pd.RangeIndex(int(mask.sum())),
+    )
+
+
+def _frame_records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Rows as dicts of native Python values with NaN as None, built column-wise."""
+    names = [str(name) for name in frame.columns]
+    columns = []
+    for name in frame.columns:
+        values = frame[name]
+        if values.dtype.kind in "fO":
+            values = values.astype(object).where(values.notna(), None)
+        columns.append(values.tolist())
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
 def _sync_schema(db: MySQLClient) -> None:
     for table_name, create_sql in INSTITUTIONAL_13F_SCHEMAS.items():
         sync_table_schema(db, table_name, create_sql, DB_META)
@@ -605,20 +805,45 @@ def build_cusip_symbol_map_rows(
     source_ref: str | None = None,
 ) -> list[dict[str, Any]]:
     """Build conservative CUSIP-symbol map rows from unique asset profile name matches."""
+    return _cusip_symbol_map_rows(
+        holdings,
+        _unique_asset_profiles(asset_profiles),
+        seen=set(),
+        source_ref=source_ref,
+        verified_at=_now_utc_text(),
+    )
+
+
+def _unique_asset_profiles(
+    asset_profiles: pd.DataFrame | Iterable[dict[str, Any]] | None,
+) -> dict[str, dict[str, Any]]:
     profiles_by_key: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for profile in _profile_records(asset_profiles):
         symbol = _clean_text(profile.get("symbol"))
         name_key = _issuer_match_key(profile.get("long_name"))
         if symbol and name_key:
             profiles_by_key[name_key].append(profile)
+    return {key: rows[0] for key, rows in profiles_by_key.items() if len(rows) == 1}
+
 
-    unique_profiles = {key: rows[0] for key, rows in profiles_by_key.items() if len(rows) == 1}
+def _cusip_symbol_map_rows(
+    holdings: Iterable[dict[str, Any]],
+    unique_profiles: dict[str, dict[str, Any]],
+    *,
+    seen: set[tuple[str, str]],
+    source_ref: str | None,
+    verified_at: str,
+) -> list[dict[str, Any]]:
     out: list[dict[str, Any]] = []
-    seen: set[tuple[str, str]] = set()
-    verified_at = _now_utc_text()
+    if not unique_profiles:
+        return out
+    issuer_keys: dict[Any, str | None] = {}
     for holding in holdings:
         cusip = _clean_text(holding.get("cusip"))
-        issuer_key = _issuer_match_key(holding.get("issuer_name"))
+        issuer_name = holding.get("issuer_name")
+        if issuer_name not in issuer_keys:
+            issuer_keys[issuer_name] = _issuer_match_key(issuer_name)
+        issuer_key = issuer_keys[issuer_name]
         if not cusip or not issuer_key:
             continue
         profile = unique_profiles.get(issuer_key)
@@ -845,6 +1070,164 @@ def store_normalized_sec_13f_rows(
     }
 
 
+def _load_completed_accessions(db: MySQLClient, source_dataset: str) -> set[str]:
+    rows = db.query(
+        """
+        SELECT accession_number
+        FROM institutional_13f_ingest_progress
+        WHERE source_dataset = %s
+          AND completed_at IS NOT NULL
+        """,
+        (source_dataset,),
+    )
+    return {str(row["accession_number"]) for row in rows}
+
+
+def _upsert_ingest_progress_rows(db: MySQLClient, rows: list[dict[str, Any]]) -> int:
+    if not rows:
+        return 0
+    sql = """
+        INSERT INTO institutional_13f_ingest_progress (
+          source_dataset, accession_number, holdings_expected, holdings_written, completed_at
+        ) VALUES (
+          %(source_dataset)s, %(accession_number)s, %(holdings_expected)s, %(holdings_written)s, %(completed_at)s
+        )
+        ON DUPLICATE KEY UPDATE
+          holdings_expected = VALUES(holdings_expected),
+          holdings_written = VALUES(holdings_written),
+          completed_at = VALUES(completed_at)
+    """
+    db.executemany(sql, rows)
+    return len(rows)
+
+
+def store_sec_13f_dataset_zip_streaming(
+    db: MySQLClient,
+    zip_source: str | Path,
+    *,
+    source_dataset: str,
+    source_ref: str | None,
+    collected_at: str | None = None,
+    chunk_rows: int = DEFAULT_INFOTABLE_CHUNK_ROWS,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """UPSERT a SEC 13F data set zip while holding at most one INFOTABLE chunk in memory.
+
+    SUBMISSION, COVERPAGE and SUMMARYPAGE are small and read whole. INFOTABLE is
+    read twice in `chunk_rows` chunks: a key-column pass counts usable rows per
+    accession so only complete filings are written, as in `normalize_sec_13f_frames`,
+    then each chunk is normalized with column operations and upserted on its own.
+    Per-accession progress goes to `institutional_13f_ingest_progress`; accessions
+    already completed for `source_dataset` are skipped when the ingest is rerun.
+    """
+    collected = collected_at or _now_utc_text()
+    with zipfile.ZipFile(Path(zip_source)) as zip_file:
+        members = _dataset_members(zip_file)
+        frames: dict[str, pd.DataFrame] = {}
+        for key, member in members.items():
+            if key == "infotable":
+                continue
+            with zip_file.open(member) as handle:
+                frames[key] = pd.read_csv(handle, sep="\t", dtype=str, keep_default_na=False, encoding="utf-8")
+        filing_rows, filing_by_accession = _normalize_filing_rows(
+            frames,
+            source_dataset=source_dataset,
+            source_ref=source_ref,
+            collected_at=collected,
+        )
+        del frames
+        infotable_member = members.get("infotable")
+
+        holding_counts: dict[str, int] = defaultdict(int)
+        if infotable_member:
+            for chunk in _iter_dataset_member_chunks(
+                zip_file,
+                infotable_member,
+                chunk_rows=chunk_rows,
+                columns=_INFOTABLE_KEY_COLUMNS,
+            ):
+                mask, accession, _ = _valid_infotable_mask(chunk, filing_by_accession)
+                for value, count in accession[mask].value_counts().items():
+                    holding_counts[str(value)] += int(count)
+        complete_accessions = _complete_accessions_from_counts(filing_rows, holding_counts)
+
+        manager_rows = _effective_manager_rows_for_accessions(filing_rows, complete_accessions)
+        managers_written = _upsert_manager_rows(db, manager_rows)
+        filings_written = _upsert_filing_rows(db, filing_rows)
+
+        resumed = _load_completed_accessions(db, source_dataset) & complete_accessions
+        pending = complete_accessions - resumed
+        filings = pd.DataFrame(
+            [filing_by_accession[accession] for accession in sorted(pending)],
+            columns=["accession_number", "cik", "manager_name", "period_of_report", "filing_date", "source_ref"],
+        ).set_index("accession_number")
+        unique_profiles = _unique_asset_profiles(_load_asset_profile_rows_for_mapping(db))
+        seen_maps: set[tuple[str, str]] = set()
+        written_by_accession: dict[str, int] = defaultdict(int)
+        rows_read = holdings_written = mapping_written = completed = 0
+        if infotable_member and pending:
+            for chunk in _iter_dataset_member_chunks(zip_file, infotable_member, chunk_rows=chunk_rows):
+                rows_read += len(chunk)
+                holdings = _normalize_infotable_chunk(
+                    chunk,
+                    filings,
+                    accessions=pending,
+                    source_dataset=source_dataset,
+                    source_ref=source_ref,
+                    collected_at=collected,
+                )
+                if not holdings.empty:
+                    records = _frame_records(holdings)
+                    holdings_written += _upsert_holding_rows(db, records)
+                    mapping_written += _upsert_cusip_symbol_map_rows(
+                        db,
+                        _cusip_symbol_map_rows(
+                            records,
+                            unique_profiles,
+                            seen=seen_maps,
+                            source_ref=source_ref,
+                            verified_at=collected,
+                        ),
+                    )
+                    progress_rows = []
+                    for value, count in holdings["accession_number"].value_counts().items():
+                        accession = str(value)
+                        written_by_accession[accession] += int(count)
+                        done = written_by_accession[accession] == holding_counts[accession]
+                        completed += int(done)
+                        progress_rows.append(
+                            {
+                                "source_dataset": source_dataset,
+                                "accession_number": accession,
+                                "holdings_expected": holding_counts[accession],
+                                "holdings_written": written_by_accession[accession],
+                                "completed_at": collected if done else None,
+                            }
+                        )
+                    _upsert_ingest_progress_rows(db, progress_rows)
+                if progress_callback is not None:
+                    progress_callback(
+                        {
+                            "rows_read": rows_read,
+                            "holdings_written": holdings_written,
+                            "accessions_completed": completed,
+                            "accessions_pending": len(pending),
+                        }
+                    )
+
+    return {
+        "managers": manager_rows,
+        "filings": filing_rows,
+        "managers_written": managers_written,
+        "filings_written": filings_written,
+        "holdings_written": holdings_written,
+        "cusip_symbol_maps_written": mapping_written,
+        "rows_written": managers_written + filings_written + holdings_written,
+        "accessions_resumed": len(resumed),
+        "accessions_completed": completed,
+    }
+
+
 def _max_date_text(rows: Iterable[dict[str, Any]], key: str) -> str | None:
     dates = [_date_text(row.get(key)) for row in rows]
     present = [value for value in dates if value]
@@ -937,8 +1320,16 @@ def collect_and_store_sec_13f_dataset(
     user: str = "root",
     password: str = "1234",
     port: int = 3306,
+    streaming: bool = False,
+    chunk_rows: int = DEFAULT_INFOTABLE_CHUNK_ROWS,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
-    """Collect a SEC Form 13F official data set into finance_meta tables."""
+    """Collect a SEC Form 13F official data set into finance_meta tables.
+
+    With `streaming=True` a downloaded zip is spooled to a temp file and
+    INFOTABLE is upserted chunk by chunk via `store_sec_13f_dataset_zip_streaming`,
+    so memory stays bounded by `chunk_rows` and a rerun resumes by accession.
+    """
     if not dataset_zip_path and not dataset_url:
         raise ValueError("dataset_zip_path or dataset_url is required for SEC Form 13F collection")
 
@@ -947,6 +1338,18 @@ def collect_and_store_sec_13f_dataset(
 
     source_ref = str(dataset_url or dataset_zip_path or SEC_13F_DATASETS_PAGE)
     dataset_label = source_dataset or Path(str(dataset_zip_path or dataset_url)).stem or "sec_form_13f_dataset"
+    if streaming:
+        return _collect_and_store_sec_13f_dataset_streaming(
+            dataset_zip_path=dataset_zip_path,
+            dataset_url=dataset_url,
+            dataset_label=dataset_label,
+            source_ref=source_ref,
+            user_agent=user_agent,
+            request_timeout=request_timeout,
+            connection=(host, user, password, port),
+            chunk_rows=chunk_rows,
+            progress_callback=progress_callback,
+        )
     if dataset_zip_path:
         frames = read_sec_13f_dataset_zip(dataset_zip_path)
     else:
@@ -977,21 +1380,112 @@ def collect_and_store_sec_13f_dataset(
         filing_rows = write_counts["filings_written"]
         holding_rows = write_counts["holdings_written"]
         mapping_rows = write_counts["cusip_symbol_maps_written"]
-        refresh_status.update(
-            {
-                "managers_written": manager_rows,
-                "filings_written": filing_rows,
-                "holdings_written": holding_rows,
-                "rows_written": manager_rows + filing_rows + holding_rows,
-                "is_stale": not bool(refresh_status.get("latest_report_period")) or manager_rows + filing_rows + holding_rows <= 0,
-                "stale_reason": refresh_status.get("stale_reason")
-                or ("SEC Form 13F dataset wrote no rows." if manager_rows + filing_rows + holding_rows <= 0 else ""),
-            }
-        )
+        _apply_write_counts(refresh_status, manager_rows, filing_rows, holding_rows)
         _upsert_refresh_status_row(db, refresh_status)
     finally:
         db.close()
 
+    return _collect_result(
+        dataset_label=dataset_label,
+        source_ref=source_ref,
+        manager_rows=manager_rows,
+        filing_rows=filing_rows,
+        holding_rows=holding_rows,
+        mapping_rows=mapping_rows,
+        refresh_status=refresh_status,
+    )
+
+
+def _apply_write_counts(refresh_status: dict[str, Any], manager_rows: int, filing_rows: int, holding_rows: int) -> None:
+    rows_written = manager_rows + filing_rows + holding_rows
+    refresh_status.update(
+        {
+            "managers_written": manager_rows,
+            "filings_written": filing_rows,
+            "holdings_written": holding_rows,
+            "rows_written": rows_written,
+            "is_stale": not bool(refresh_status.get("latest_report_period")) or rows_written <= 0,
+            "stale_reason": refresh_status.get("stale_reason")
+            or ("SEC Form 13F dataset wrote no rows." if rows_written <= 0 else ""),
+        }
+    )
+
+
+def _collect_and_store_sec_13f_dataset_streaming(
+    *,
+    dataset_zip_path: str | Path | None,
+    dataset_url: str | None,
+    dataset_label: str,
+    source_ref: str,
+    user_agent: str | None,
+    request_timeout: float,
+    connection: tuple[str, str, str, int],
+    chunk_rows: int,
+    progress_callback: Callable[[dict[str, Any]], None] | None,
+) -> dict[str, Any]:
+    collected_at = _now_utc_text()
+    with tempfile.TemporaryDirectory(prefix="sec13f_") as spool_dir:
+        if dataset_zip_path:
+            zip_path = Path(dataset_zip_path)
+        else:
+            zip_path = download_sec_13f_dataset_to_file(
+                str(dataset_url),
+                Path(spool_dir) / "dataset.zip",
+                user_agent=user_agent,
+                timeout=float(request_timeout),
+            )
+        db = MySQLClient(*connection)
+        try:
+            db.use_db(DB_META)
+            _sync_schema(db)
+            write_counts = store_sec_13f_dataset_zip_streaming(
+                db,
+                zip_path,
+                source_dataset=dataset_label,
+                source_ref=source_ref,
+                collected_at=collected_at,
+                chunk_rows=chunk_rows,
+                progress_callback=progress_callback,
+            )
+            refresh_status = build_sec_13f_refresh_status(
+                source_dataset=dataset_label,
+                source_ref=source_ref,
+                collected_at=collected_at,
+                normalized={"managers": write_counts["managers"], "filings": write_counts["filings"]},
+            )
+            manager_rows = write_counts["managers_written"]
+            filing_rows = write_counts["filings_written"]
+            holding_rows = write_counts["holdings_written"]
+            _apply_write_counts(refresh_status, manager_rows, filing_rows, holding_rows)
+            _upsert_refresh_status_row(db, refresh_status)
+        finally:
+            db.close()
+
+    result = _collect_result(
+        dataset_label=dataset_label,
+        source_ref=source_ref,
+        manager_rows=manager_rows,
+        filing_rows=filing_rows,
+        holding_rows=holding_rows,
+        mapping_rows=write_counts["cusip_symbol_maps_written"],
+        refresh_status=refresh_status,
+    )
+    result["target_tables"].append("finance_meta.institutional_13f_ingest_progress")
+    result["accessions_resumed"] = write_counts["accessions_resumed"]
+    result["accessions_completed"] = write_counts["accessions_completed"]
+    return result
+
+
+def _collect_result(
+    *,
+    dataset_label: str,
+    source_ref: str,
+    manager_rows: int,
+    filing_rows: int,
+    holding_rows: int,
+    mapping_rows: int,
+    refresh_status: dict[str, Any],
+) -> dict[str, Any]:
     return {
         "source": "sec_form_13f_dataset",
         "source_dataset": dataset_label,
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from .db.mysql import MySQLClient
+from .db.schema import INSTITUTIONAL_13F_SCHEMAS, sync_table_schema
+
+
+DB_META = "finance_meta"
+SUMMARY_TABLES = (
+    "institutional_13f_manager_snapshot",
+    "institutional_13f_manager_position",
+    "institutional_13f_manager_change",
+    "institutional_13f_manager_sector",
+    "institutional_13f_security_popularity",
+)
+_POSITION_COLUMNS = (
+    "issuer_name",
+    "holding_symbol",
+    "symbol_source",
+    "mapping_status",
+    "cusip",
+    "figi",
+    "title_of_class",
+    "reported_value",
+    "shares_or_principal_amount",
+    "amount_type",
+    "put_call",
+    "sector",
+    "industry",
+    "weight_pct",
+    "source_ref",
+)
+_CHANGE_COLUMNS = (
+    "change_type",
+    "issuer_name",
+    "holding_symbol",
+    "cusip",
+    "latest_reported_value",
+    "previous_reported_value",
+    "value_delta",
+    "latest_shares_or_principal",
+    "previous_shares_or_principal",
+    "share_delta",
+    "weight_pct",
+)
+_SECTOR_COLUMNS = ("sector", "reported_value", "weight_pct", "holding_count")
+_SNAPSHOT_COLUMNS = (
+    "cik",
+    "report_period",
+    "manager_name",
+    "accession_number",
+    "latest_accession_number",
+    "filing_date",
+    "previous_report_period",
+    "previous_filing_date",
+    "source_ref",
+    "collected_at",
+    "total_reported_value",
+    "holding_count",
+    "materialized_at",
+)
+
+# Materialized rows freeze the symbol / sector the live path resolves at read
+# time from the CUSIP map, OpenFIGI resolutions and nyse_asset_profile. A
+# summary (alias `s`) has drifted once a mapping row for one of its CUSIPs was
+# written after `s.materialized_at`, or a profile now carries a different
+# sector / industry for one of its symbols. Profile rows are compared by value
+# because quote fields touch `updated_at` on every profile refresh.
+SUMMARY_REFERENCE_DRIFT_SQL = """
+(
+  EXISTS (
+    SELECT 1
+    FROM (
+      SELECT cusip FROM institutional_13f_manager_position
+      WHERE cik = s.cik AND report_period = s.report_period
+      UNION
+      SELECT cusip FROM institutional_13f_manager_change
+      WHERE cik = s.cik AND report_period = s.report_period
+    ) ref
+    WHERE EXISTS (
+        SELECT 1 FROM institutional_13f_cusip_symbol_map m
+        WHERE m.cusip = ref.cusip AND m.updated_at > s.materialized_at
+      )
+      OR EXISTS (
+        SELECT 1 FROM institutional_13f_identifier_resolution ir
+        WHERE ir.identifier_value = ref.cusip AND ir.updated_at > s.materialized_at
+      )
+  )
+  OR EXISTS (
+    SELECT 1
+    FROM institutional_13f_manager_position p
+    JOIN nyse_asset_profile ap
+      ON ap.symbol = p.holding_symbol
+    WHERE p.cik = s.cik
+      AND p.report_period = s.report_period
+      AND (
+        (NULLIF(TRIM(ap.sector), '') IS NOT NULL AND NOT (TRIM(ap.sector) <=> p.sector))
+        OR (NULLIF(TRIM(ap.industry), '') IS NOT NULL AND NOT (TRIM(ap.industry) <=> p.industry))
+      )
+  )
+)
+""".strip()
+
+_POPULARITY_DRIFT_SQL = """
+SELECT DISTINCT sp.report_period
+FROM institutional_13f_security_popularity sp
+WHERE EXISTS (
+    SELECT 1 FROM institutional_13f_cusip_symbol_map m
+    WHERE m.cusip = sp.cusip AND m.updated_at > sp.materialized_at
+  )
+  OR EXISTS (
+    SELECT 1 FROM institutional_13f_identifier_resolution ir
+    WHERE ir.identifier_value = sp.cusip AND ir.updated_at > sp.materialized_at
+  )
+ORDER BY sp.report_period
+"""
+
+
+def load_db_timestamp(db: MySQLClient) -> str:
+    """MySQL's clock, so `materialized_at` compares cleanly with `updated_at` columns."""
+    rows = db.query("SELECT CURRENT_TIMESTAMP AS db_now")
+    return str(rows[0]["db_now"])
+
+
+def sync_institutional_13f_summary_schema(db: MySQLClient) -> None:
+    for table_name in SUMMARY_TABLES:
+        sync_table_schema(db, table_name, INSTITUTIONAL_13F_SCHEMAS[table_name], DB_META)
+
+
+def load_institutional_13f_summary_targets(
+    db: MySQLClient,
+    *,
+    source_dataset: str | None = None,
+    ciks: Iterable[str] | None = None,
+) -> dict[str, list[str]]:
+    """Return the managers and report periods whose stored filings a refresh touched."""
+    if source_dataset:
+        where, params = "WHERE source_dataset = %s", (source_dataset,)
+    else:
+        selected = list(dict.fromkeys(str(cik).zfill(10) for cik in ciks or () if str(cik or "").strip()))
+        if not selected:
+            return {"ciks": [], "report_periods": []}
+        where, params = f"WHERE cik IN ({', '.join(['%s'] * len(selected))})", tuple(selected)
+    manager_rows = db.query(f"SELECT DISTINCT cik FROM institutional_13f_filing {where} ORDER BY cik", params)
+    period_rows = db.query(
+        f"SELECT DISTINCT period_of_report FROM institutional_13f_filing {where} ORDER BY period_of_report",
+        params,
+    )
+    return {
+        "ciks": [str(row["cik"]) for row in manager_rows if row.get("cik")],
+        "report_periods": [str(row["period_of_report"]) for row in period_rows if row.get("period_of_report")],
+    }
+
+
+def load_stale_institutional_13f_summary_targets(db: MySQLClient) -> dict[str, list[str]]:
+    """Return managers and popularity periods whose symbol / sector inputs changed since materialization."""
+    manager_rows = db.query(
+        f"""
+        SELECT DISTINCT s.cik
+        FROM institutional_13f_manager_snapshot s
+        WHERE {SUMMARY_REFERENCE_DRIFT_SQL}
+        ORDER BY s.cik
+        """
+    )
+    period_rows = db.query(_POPULARITY_DRIFT_SQL)
+    return {
+        "ciks": [str(row["cik"]) for row in manager_rows if row.get("cik")],
+        "report_periods": [str(row["report_period"]) for row in period_rows if row.get("report_period")],
+    }
+
+
+def load_manager_accession_pointer(db: MySQLClient, cik: str) -> str | None:
+    rows = db.query(
+        "SELECT latest_accession_number FROM institutional_13f_manager WHERE cik = %s LIMIT 1",
+        (str(cik).zfill(10),),
+    )
+    return str(rows[0]["latest_accession_number"]) if rows and rows[0].get("latest_accession_number") else None
+
+
+def replace_institutional_13f_manager_summary(
+    db: MySQLClient,
+    *,
+    snapshot: dict[str, Any],
+    positions: list[dict[str, Any]],
+    changes: list[dict[str, Any]],
+    sectors: list[dict[str, Any]],
+) -> int:
+    """Swap one manager-quarter's summary rows in a single transaction."""
+    cik = str(snapshot["cik"]).zfill(10)
+    report_period = snapshot["report_period"]
+    key = {"cik": cik, "report_period": report_period}
+    snapshot_row = {column: snapshot.get(column) for column in _SNAPSHOT_COLUMNS}
+    snapshot_row.update(key)
+    position_rows = [
+        {**key, "position_rank": rank, **{column: row.get(column) for column in _POSITION_COLUMNS}}
+        for rank, row in enumerate(positions, start=1)
+    ]
+    change_rows = [
+        {
+            **key,
+            "change_rank": rank,
+            "previous_report_period": snapshot.get("previous_report_period"),
+            **{column: row.get(column) for column in _CHANGE_COLUMNS},
+        }
+        for rank, row in enumerate(changes, start=1)
+    ]
+    sector_rows = [
+        {**key, "sector_rank": rank, **{column: row.get(column) for column in _SECTOR_COLUMNS}}
+        for rank, row in enumerate(sectors, start=1)
+    ]
+
+    db.begin()
+    try:
+        for table_name in (
+            "institutional_13f_manager_position",
+            "institutional_13f_manager_change",
+            "institutional_13f_manager_sector",
+        ):
+            db.execute(
+                f"DELETE FROM {table_name} WHERE cik = %(cik)s AND report_period = %(report_period)s",
+                key,
+            )
+        columns = ", ".join(_SNAPSHOT_COLUMNS)
+        values = ", ".join(
+            "COALESCE(%(materialized_at)s, CURRENT_TIMESTAMP)" if column == "materialized_at" else f"%({column})s"
+            for column in _SNAPSHOT_COLUMNS
+        )
+        updates = ", ".join(f"{column} = VALUES({column})" for column in _SNAPSHOT_COLUMNS[2:])
+        db.execute(
+            f"""
+            INSERT INTO institutional_13f_manager_snapshot ({columns})
+            VALUES ({values})
+            ON DUPLICATE KEY UPDATE {updates}
+            """,
+            snapshot_row,
+        )
+        for table_name, rank_column, value_columns, rows in (
+            ("institutional_13f_manager_position", "position_rank", _POSITION_COLUMNS, position_rows),
+            (
+                "institutional_13f_manager_change",
+                "change_rank",
+                ("previous_report_period", *_CHANGE_COLUMNS),
+                change_rows,
+            ),
+            ("institutional_13f_manager_sector", "sector_rank", _SECTOR_COLUMNS, sector_rows),
+        ):
+            if not rows:
+                continue
+            names = ("cik", "report_period", rank_column, *value_columns)
+            db.executemany(
+                f"""
+                INSERT INTO {table_name} ({", ".join(names)})
+                VALUES ({", ".join(f"%({name})s" for name in names)})
+                """,
+                rows,
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return 1 + len(position_rows) + len(change_rows) + len(sector_rows)
+
+
+def refresh_institutional_13f_popularity(db: MySQLClient, report_period: str, *, aggregate_sql: str) -> int:
+    """
+    Recompute one period's per-CUSIP holder counts and value totals inside MySQL.
+
+    `aggregate_sql` is the read-side per-CUSIP aggregate with one
+    `report_period` placeholder, so stored rows match the live ranking.
+    """
+    db.begin()
+    try:
+        db.execute(
+            "DELETE FROM institutional_13f_security_popularity WHERE report_period = %s",
+            (report_period,),
+        )
+        db.execute(
+            f"""
+            INSERT INTO institutional_13f_security_popularity (
+              report_period, cusip, holding_symbol, issuer_name, holder_count,
+              holding_rows, total_reported_value, sample_managers, materialized_at
+            )
+            SELECT
+              agg.report_period, agg.cusip, agg.holding_symbol, agg.issuer_name, agg.holder_count,
+              agg.holding_rows, agg.total_reported_value, agg.sample_managers, CURRENT_TIMESTAMP
+            FROM (
+              {aggregate_sql}
+            ) agg
+            """,
+            (report_period,),
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    rows = db.query(
+        "SELECT COUNT(*) AS row_count FROM institutional_13f_security_popularity WHERE report_period = %s",
+        (report_period,),
+    )
+    return int(rows[0]["row_count"]) if rows else 0
@@ -0,0 +1,627 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from finance.data.db.mysql import mysql_client
+
+
+DB_PRICE = "finance_price"
+PRICE_TABLE = "nyse_price_history"
+PRICE_WRITE_LOG_TABLE = "nyse_price_write_log"
+PRICE_STORE_FIELDS = ("open", "high", "low", "close", "adj_close", "volume", "dividends", "stock_splits")
+PRICE_STORE_FORMAT_VERSION = 3
+PRICE_STORE_DIR_ENV = "FINANCE_PRICE_STORE_DIR"
+PRICE_STORE_ENABLED_ENV = "FINANCE_PRICE_STORE"
+DEFAULT_PRICE_STORE_DIR = Path(__file__).resolve().parents[2] / ".aiworkspace" / "cache" / "price_store"
+SYNC_CHUNK_SIZE = 800
+
+FetchRows = Callable[[list[str], str, "str | None"], pd.DataFrame]
+FetchVersions = Callable[[list[str], str, dict[str, int]], dict[str, dict[str, Any]]]
+
+
+def price_store_enabled() -> bool:
+    raw = str(os.getenv(PRICE_STORE_ENABLED_ENV, "1")).strip().lower()
+    return raw not in {"0", "false", "off", "no"}
+
+
+def _utc_now_string() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _to_day(value: Any) -> np.datetime64 | None:
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    if pd.isna(ts):
+        return None
+    return np.datetime64(ts.date(), "D")
+
+
+def _fetch_rows_from_mysql(symbols: list[str], timeframe: str, after: str | None) -> pd.DataFrame:
+    """Read nyse_price_history rows strictly after `after` (all rows when None)."""
+    out: list[dict[str, Any]] = []
+    with mysql_client(DB_PRICE) as db:
+        for i in range(0, len(symbols), SYNC_CHUNK_SIZE):
+            batch = symbols[i : i + SYNC_CHUNK_SIZE]
+            placeholders = ",".join(["%s"] * len(batch))
+            where = [f"symbol IN ({placeholders})", "timeframe = %s"]
+            params: list[Any] = list(batch) + [timeframe]
+            if after is not None:
+                where.append("`date` > %s")
+                params.append(after)
+            sql = f"""
+            SELECT symbol, `date`, {", ".join(PRICE_STORE_FIELDS)}
+            FROM {PRICE_TABLE}
+            WHERE {" AND ".join(where)}
+            ORDER BY symbol ASC, `date` ASC
+            """
+            out.extend(db.query(sql, params))
+    return pd.DataFrame(out)
+
+
+def _is_missing_write_log(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return PRICE_WRITE_LOG_TABLE in message and ("doesn't exist" in message or "1146" in message)
+
+
+def load_price_write_marks(symbols: Iterable[str], timeframe: str = "1d") -> dict[str, int]:
+    """
+    Latest `nyse_price_write_log.write_id` per symbol.
+
+    Answered from the `(symbol, timeframe, write_id)` index alone, so the cost
+    does not grow with the symbols' price history. Symbols never written
+    through the log (or a database without the log yet) are simply absent.
+    """
+    ordered = list(dict.fromkeys(str(symbol).upper() for symbol in symbols if symbol))
+    out: dict[str, int] = {}
+    try:
+        with mysql_client(DB_PRICE) as db:
+            for i in range(0, len(ordered), SYNC_CHUNK_SIZE):
+                batch = ordered[i : i + SYNC_CHUNK_SIZE]
+                sql = f"""
+                SELECT symbol, MAX(write_id) AS write_id
+                FROM {PRICE_WRITE_LOG_TABLE}
+                WHERE symbol IN ({",".join(["%s"] * len(batch))}) AND timeframe = %s
+                GROUP BY symbol
+                """
+                for row in db.query(sql, [*batch, timeframe]):
+                    out[str(row["symbol"]).upper()] = int(row["write_id"])
+    except Exception as exc:
+        if not _is_missing_write_log(exc):
+            raise
+        return {}
+    return out
+
+
+def _fetch_versions_from_mysql(
+    symbols: list[str],
+    timeframe: str,
+    marks: dict[str, int],
+) -> dict[str, dict[str, Any]]:
+    """
+    Per-symbol latest `write_id` plus `changed_from`: the earliest date written
+    after the symbol's `marks` write id ("all" when a write replaced the whole
+    history). Only the write log is read, never `nyse_price_history` itself,
+    and the second query runs only for symbols that were actually written.
+    """
+    latest = load_price_write_marks(symbols, timeframe)
+    out = {symbol: {"write_id": write_id, "changed_from": None} for symbol, write_id in latest.items()}
+    changed = [symbol for symbol, write_id in latest.items() if symbol in marks and write_id > marks[symbol]]
+    if not changed:
+        return out
+    with mysql_client(DB_PRICE) as db:
+        for i in range(0, len(changed), SYNC_CHUNK_SIZE):
+            batch = changed[i : i + SYNC_CHUNK_SIZE]
+            params: list[Any] = []
+            for symbol in batch:
+                params.extend([symbol, marks[symbol]])
+            params.append(timeframe)
+            sql = f"""
+            SELECT
+                symbol,
+                MIN(changed_from) AS changed_from,
+                MAX(changed_from IS NULL) AS rewrote_all
+            FROM {PRICE_WRITE_LOG_TABLE}
+            WHERE ({" OR ".join(["(symbol = %s AND write_id > %s)"] * len(batch))}) AND timeframe = %s
+            GROUP BY symbol
+            """
+            for row in db.query(sql, params):
+                version = out[str(row["symbol"]).upper()]
+                if int(row["rewrote_all"] or 0):
+                    version["changed_from"] = "all"
+                elif row["changed_from"] is not None:
+                    version["changed_from"] = str(_to_day(row["changed_from"]))
+    return out
+
+
+def record_price_writes(db: Any, first_written: dict[str, Any], *, timeframe: str) -> None:
+    """
+    Append one write-log row per symbol on `db` (already using `finance_price`).
+
+    `first_written` maps symbol -> earliest written or deleted date, None when
+    the whole history was replaced. Every writer of `nyse_price_history` calls
+    this after its write so stores in other processes can see the change.
+    """
+    if not first_written:
+        return
+    params: list[Any] = []
+    for symbol, day in first_written.items():
+        day = _to_day(day)
+        params.extend([str(symbol).upper(), timeframe, None if day is None else str(day)])
+    db.execute(
+        f"""
+        INSERT INTO {PRICE_WRITE_LOG_TABLE} (symbol, timeframe, changed_from)
+        VALUES {", ".join(["(%s, %s, %s)"] * len(first_written))}
+        """,
+        params,
+    )
+
+
+class PriceStore:
+    """
+    On-disk columnar mirror of `nyse_price_history`.
+
+    Each (timeframe, symbol) partition holds a `datetime64[D]` date vector and
+    a `(len(PRICE_STORE_FIELDS), n)` float64 block, both saved as `.npy` and
+    opened with `mmap_mode="r"`, so reading one field of one symbol touches a
+    single contiguous slice. `meta.json` records the high-water mark used for
+    incremental sync and a `dirty_from` date set by writers; a dirty partition
+    is truncated to rows before that date and refilled from MySQL on the next
+    sync. Files are written under a fresh generation id and published by
+    replacing `meta.json`, so concurrent readers never see a half-written pair.
+
+    Local invalidation only covers writers in this process, so every sync also
+    compares each partition's recorded `source_version` (the latest
+    `nyse_price_write_log.write_id`) with the log that writers append to.
+    Rows written by another process or host are refilled from the earliest
+    date logged since that id, and a write that replaced the whole history
+    forces a full reload. The check reads only the log's index, so a warm
+    read never aggregates the price table. A store given a custom
+    `fetch_rows` without `fetch_versions` skips this check and trusts its own
+    marks.
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        fetch_rows: FetchRows | None = None,
+        fetch_versions: FetchVersions | None = None,
+    ):
+        self.root = Path(root or os.getenv(PRICE_STORE_DIR_ENV) or DEFAULT_PRICE_STORE_DIR)
+        self._fetch_rows = fetch_rows or _fetch_rows_from_mysql
+        if fetch_versions is None and fetch_rows is None:
+            fetch_versions = _fetch_versions_from_mysql
+        self._fetch_versions = fetch_versions
+        self._lock = threading.Lock()
+
+    # -- partition io -------------------------------------------------------
+
+    def partition_dir(self, symbol: str, timeframe: str = "1d") -> Path:
+        return self.root / timeframe / str(symbol).upper()
+
+    def read_meta(self, symbol: str, timeframe: str = "1d") -> dict[str, Any] | None:
+        path = self.partition_dir(symbol, timeframe) / "meta.json"
+        try:
+            meta = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if meta.get("format_version") != PRICE_STORE_FORMAT_VERSION:
+            return None
+        return meta
+
+    def _write_meta(self, part: Path, meta: dict[str, Any]) -> None:
+        tmp = part / f"meta.{uuid.uuid4().hex}.tmp"
+        tmp.write_text(json.dumps(meta, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, part / "meta.json")
+
+    def _read_arrays(self, symbol: str, timeframe: str) -> tuple[np.ndarray, np.ndarray] | None:
+        part = self.partition_dir(symbol, timeframe)
+        # 한 번 재시도: meta를 읽은 직후 writer가 이전 generation을 지웠을 수 있다.
+        for _ in range(2):
+            meta = self.read_meta(symbol, timeframe)
+            if meta is None:
+                return None
+            generation = meta.get("generation")
+            if generation is None:
+                empty = np.empty(0, dtype="datetime64[D]")
+                return empty, np.empty((len(PRICE_STORE_FIELDS), 0), dtype=np.float64)
+            try:
+                dates = np.load(part / f"dates.{generation}.npy", mmap_mode="r")
+                values = np.load(part / f"values.{generation}.npy", mmap_mode="r")
+                return dates, values
+            except FileNotFoundError:
+                continue
+        return None
+
+    def _write_partition(
+        self,
+        symbol: str,
+        timeframe: str,
+        dates: np.ndarray,
+        values: np.ndarray,
+        *,
+        planned_dirty_from: str | None = None,
+        source_version: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        part = self.partition_dir(symbol, timeframe)
+        part.mkdir(parents=True, exist_ok=True)
+        previous = self.read_meta(symbol, timeframe) or {}
+        # 동기화 도중 writer가 invalidate 했다면 그 표시를 유지해 다음 sync가 다시 채우게 한다.
+        dirty_from = previous.get("dirty_from")
+        if dirty_from == planned_dirty_from:
+            dirty_from = None
+
+        generation = None
+        if len(dates):
+            generation = uuid.uuid4().hex[:12]
+            np.save(part / f"dates.{generation}.npy", np.ascontiguousarray(dates, dtype="datetime64[D]"))
+            np.save(part / f"values.{generation}.npy", np.ascontiguousarray(values, dtype=np.float64))
+
+        meta = {
+            "format_version": PRICE_STORE_FORMAT_VERSION,
+            "symbol": str(symbol).upper(),
+            "timeframe": timeframe,
+            "generation": generation,
+            "rows": int(len(dates)),
+            "high_water": str(dates[-1]) if len(dates) else None,
+            "dirty_from": dirty_from,
+            "source_version": _recorded_version(source_version),
+            "synced_at": _utc_now_string(),
+        }
+        self._write_meta(part, meta)
+
+        old_generation = previous.get("generation")
+        if old_generation and old_generation != generation:
+            for name in (f"dates.{old_generation}.npy", f"values.{old_generation}.npy"):
+                try:
+                    (part / name).unlink()
+                except FileNotFoundError:
+                    pass
+        return meta
+
+    # -- sync / invalidate --------------------------------------------------
+
+    def needs_sync(self, symbol: str, timeframe: str = "1d") -> bool:
+        meta = self.read_meta(symbol, timeframe)
+        return meta is None or meta.get("dirty_from") is not None
+
+    def invalidate(
+        self,
+        symbols: Iterable[str] | dict[str, Any],
+        *,
+        timeframe: str = "1d",
+        from_date: Any = None,
+    ) -> int:
+        """
+        Mark cached partitions stale from `from_date` onward.
+
+        `symbols` may be a mapping of symbol -> first written date so one call
+        can cover a whole write batch. A missing date invalidates the whole
+        partition. Returns the number of partitions that were marked.
+        """
+        if isinstance(symbols, dict):
+            items = list(symbols.items())
+        else:
+            items = [(symbol, from_date) for symbol in symbols]
+
+        marked = 0
+        with self._lock:
+            for symbol, dirty_from in items:
+                meta = self.read_meta(symbol, timeframe)
+                if meta is None:
+                    # 파티션 디렉터리만 있으면 첫 sync가 진행 중이므로 전체 무효 표시를 남긴다.
+                    if not self.partition_dir(symbol, timeframe).is_dir():
+                        continue
+                    meta = {
+                        "format_version": PRICE_STORE_FORMAT_VERSION,
+                        "symbol": str(symbol).upper(),
+                        "timeframe": timeframe,
+                        "generation": None,
+                        "rows": 0,
+                        "high_water": None,
+                        "dirty_from": None,
+                    }
+                    dirty_from = None
+                day = _to_day(dirty_from)
+                new_dirty = "all" if day is None else str(day)
+                current = meta.get("dirty_from")
+                if current == "all" or (current is not None and new_dirty != "all" and current <= new_dirty):
+                    continue
+                meta["dirty_from"] = new_dirty
+                self._write_meta(self.partition_dir(symbol, timeframe), meta)
+                marked += 1
+        return marked
+
+    def sync(
+        self,
+        symbols: Iterable[str],
+        *,
+        timeframe: str = "1d",
+        only_stale: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Bring partitions up to date with MySQL using per-symbol high-water marks.
+
+        With `only_stale=True` only missing or invalidated partitions are
+        touched, which is what the read path uses; a plain sync additionally
+        pulls rows newer than each clean partition's high-water mark. When the
+        store can read source versions, a partition whose version still matches
+        MySQL is clean and one that differs is stale under either mode.
+        """
+        ordered = list(dict.fromkeys(str(symbol).upper() for symbol in symbols if symbol))
+        stats = {
+            "symbols": len(ordered),
+            "synced_symbols": 0,
+            "rows_fetched": 0,
+            "full_loads": 0,
+            "source_changed": 0,
+        }
+
+        metas = {symbol: self.read_meta(symbol, timeframe) for symbol in ordered}
+        versions: dict[str, dict[str, Any]] | None = None
+        if self._fetch_versions is not None and ordered:
+            marks = {
+                symbol: int(meta["source_version"]["write_id"])
+                for symbol, meta in metas.items()
+                if meta is not None
+                and meta.get("source_version")
+                and meta["source_version"].get("write_id") is not None
+            }
+            versions = self._fetch_versions(ordered, timeframe, marks)
+
+        plans: dict[
+            str | None,
+            list[tuple[str, str | None, np.ndarray | None, np.ndarray | None, dict[str, Any] | None]],
+        ] = {}
+        for symbol in ordered:
+            meta = metas[symbol]
+            version = None if versions is None else versions.get(symbol, _EMPTY_SOURCE_VERSION)
+            if meta is None:
+                self.partition_dir(symbol, timeframe).mkdir(parents=True, exist_ok=True)
+                plans.setdefault(None, []).append((symbol, None, None, None, version))
+                stats["full_loads"] += 1
+                continue
+            dirty_from = meta.get("dirty_from")
+            if version is not None:
+                if _recorded_version(version) == meta.get("source_version"):
+                    if dirty_from is None:
+                        continue
+                else:
+                    stats["source_changed"] += 1
+                    dirty_from = _merge_dirty_from(dirty_from, _source_dirty_from(meta, version))
+            elif only_stale and dirty_from is None:
+                continue
+            arrays = self._read_arrays(symbol, timeframe)
+            if arrays is None or dirty_from == "all":
+                plans.setdefault(None, []).append((symbol, meta.get("dirty_from"), None, None, version))
+                stats["full_loads"] += 1
+                continue
+            dates, values = arrays
+            if dirty_from is not None:
+                keep = int(np.searchsorted(dates, np.datetime64(dirty_from, "D"), side="left"))
+                dates, values = dates[:keep], values[:, :keep]
+            high_water = str(dates[-1]) if len(dates) else None
+            plans.setdefault(high_water, []).append((symbol, meta.get("dirty_from"), dates, values, version))
+
+        for high_water, entries in plans.items():
+            batch_symbols = [symbol for symbol, _, _, _, _ in entries]
+            fetched = self._fetch_rows(batch_symbols, timeframe, high_water)
+            grouped = self._group_fetched(fetched)
+            for symbol, planned_dirty_from, base_dates, base_values, version in entries:
+                new_dates, new_values = grouped.get(symbol, (None, None))
+                if base_dates is None:
+                    base_dates = np.empty(0, dtype="datetime64[D]")
+                    base_values = np.empty((len(PRICE_STORE_FIELDS), 0), dtype=np.float64)
+                if new_dates is not None:
+                    stats["rows_fetched"] += int(len(new_dates))
+                    dates = np.concatenate([np.asarray(base_dates), new_dates])
+                    values = np.concatenate([np.asarray(base_values), new_values], axis=1)
+                else:
+                    dates, values = np.asarray(base_dates), np.asarray(base_values)
+                with self._lock:
+                    self._write_partition(
+                        symbol,
+                        timeframe,
+                        dates,
+                        values,
+                        planned_dirty_from=planned_dirty_from,
+                        source_version=version,
+                    )
+                stats["synced_symbols"] += 1
+        return stats
+
+    @staticmethod
+    def _group_fetched(fetched: pd.DataFrame) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        if fetched is None or fetched.empty:
+            return {}
+        frame = fetched.copy()
+        frame["symbol"] = frame["symbol"].astype(str).str.upper()
+        frame["date"] = pd.to_datetime(frame["date"], errors="coerce")
+        frame = frame.dropna(subset=["date"]).sort_values(["symbol", "date"], kind="stable")
+        frame = frame.drop_duplicates(["symbol", "date"], keep="last")
+
+        dates = frame["date"].to_numpy().astype("datetime64[D]")
+        values = np.empty((len(PRICE_STORE_FIELDS), len(frame)), dtype=np.float64)
+        for row, field in enumerate(PRICE_STORE_FIELDS):
+            if field in frame.columns:
+                values[row] = pd.to_numeric(frame[field], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                values[row] = np.nan
+
+        symbols = frame["symbol"].to_numpy()
+        boundaries = np.flatnonzero(symbols[1:] != symbols[:-1]) + 1
+        starts = np.concatenate([[0], boundaries])
+        stops = np.concatenate([boundaries, [len(symbols)]])
+        return {
+            str(symbols[start]): (dates[start:stop], values[:, start:stop])
+            for start, stop in zip(starts, stops)
+        }
+
+    # -- reads ---------------------------------------------------------------
+
+    def _slices(
+        self,
+        symbols: Iterable[str],
+        timeframe: str,
+        start: Any,
+        end: Any,
+    ) -> list[tuple[str, np.ndarray, np.ndarray]]:
+        start_day, end_day = _to_day(start), _to_day(end)
+        out = []
+        for symbol in sorted(dict.fromkeys(str(symbol).upper() for symbol in symbols if symbol)):
+            arrays = self._read_arrays(symbol, timeframe)
+            if arrays is None:
+                continue
+            dates, values = arrays
+            lo = 0 if start_day is None else int(np.searchsorted(dates, start_day, side="left"))
+            hi = len(dates) if end_day is None else int(np.searchsorted(dates, end_day, side="right"))
+            if hi > lo:
+                out.append((symbol, dates[lo:hi], values[:, lo:hi]))
+        return out
+
+    def load_history(
+        self,
+        symbols: Iterable[str],
+        *,
+        start: Any = None,
+        end: Any = None,
+        timeframe: str = "1d",
+    ) -> pd.DataFrame:
+        """Long-form rows ordered like `load_ohlcv_many_mysql` (symbol, date)."""
+        return self._history_frame(self._slices(symbols, timeframe, start, end))
+
+    def iter_history(
+        self,
+        symbols: Iterable[str],
+        *,
+        start: Any = None,
+        end: Any = None,
+        timeframe: str = "1d",
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """Per-symbol frames in `load_history` order, one mapped partition at a time."""
+        start_day, end_day = _to_day(start), _to_day(end)
+        for symbol in sorted(dict.fromkeys(str(symbol).upper() for symbol in symbols if symbol)):
+            frame = self._history_frame(self._slices([symbol], timeframe, start_day, end_day))
+            if not frame.empty:
+                yield symbol, frame
+
+    @staticmethod
+    def _history_frame(slices: list[tuple[str, np.ndarray, np.ndarray]]) -> pd.DataFrame:
+        if not slices:
+            return pd.DataFrame()
+        lengths = [len(dates) for _, dates, _ in slices]
+        data: dict[str, Any] = {
+            "symbol": np.repeat([symbol for symbol, _, _ in slices], lengths),
+            "date": np.concatenate([dates for _, dates, _ in slices]).astype("datetime64[s]"),
+        }
+        values = np.concatenate([values for _, _, values in slices], axis=1)
+        for row, field in enumerate(PRICE_STORE_FIELDS):
+            data[field] = values[row]
+        volume = data["volume"]
+        if not np.isnan(volume).any():
+            # MySQL 경로(_ohlcv_frame)와 같게 NULL이 없으면 BIGINT volume은 int64로 돌려준다.
+            data["volume"] = volume.astype(np.int64)
+        frame = pd.DataFrame(data)
+        frame["symbol"] = frame["symbol"].astype(str)
+        return frame
+
+    def load_matrix(
+        self,
+        symbols: Iterable[str],
+        *,
+        field: str = "close",
+        start: Any = None,
+        end: Any = None,
+        timeframe: str = "1d",
+    ) -> pd.DataFrame:
+        """Wide date x symbol matrix of one field, matching `pivot` on the long form."""
+        row = PRICE_STORE_FIELDS.index(field)
+        slices = self._slices(symbols, timeframe, start, end)
+        if not slices:
+            return pd.DataFrame()
+        all_dates = np.unique(np.concatenate([dates for _, dates, _ in slices]))
+        matrix = np.full((len(all_dates), len(slices)), np.nan, dtype=np.float64)
+        for col, (_, dates, values) in enumerate(slices):
+            matrix[np.searchsorted(all_dates, dates), col] = values[row]
+        index = pd.DatetimeIndex(all_dates.astype("datetime64[s]"), name="date")
+        return pd.DataFrame(matrix, index=index, columns=[symbol for symbol, _, _ in slices])
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+_EMPTY_SOURCE_VERSION: dict[str, Any] = {"write_id": 0, "changed_from": None}
+
+
+def _recorded_version(version: dict[str, Any] | None) -> dict[str, Any] | None:
+    """The part of a source version stored in `meta.json`."""
+    if version is None:
+        return None
+    return {"write_id": int(version["write_id"])}
+
+
+def _source_dirty_from(meta: dict[str, Any], version: dict[str, Any]) -> str | None:
+    """Where a partition must be refilled from to match a changed source version."""
+    recorded = meta.get("source_version")
+    if not recorded or recorded.get("write_id") is None:
+        return "all"
+    if int(version["write_id"]) < int(recorded["write_id"]):
+        # 로그가 비워졌거나 다른 DB를 가리키면 기준점이 없으므로 전체를 다시 읽는다.
+        return "all"
+    changed_from = version.get("changed_from")
+    if changed_from == "all":
+        return "all"
+    high_water = meta.get("high_water")
+    if changed_from is not None and high_water is not None and changed_from <= high_water:
+        return changed_from
+    # high-water 이후 행만 바뀌었으면 평소의 증분 fetch로 충분하다.
+    return None
+
+
+def _merge_dirty_from(current: str | None, new: str | None) -> str | None:
+    if current is None:
+        return new
+    if new is None:
+        return current
+    if "all" in (current, new):
+        return "all"
+    return min(current, new)
+
+
+_DEFAULT_STORE: PriceStore | None = None
+_DEFAULT_STORE_LOCK = threading.Lock()
+
+
+def get_price_store() -> PriceStore:
+    global _DEFAULT_STORE
+    with _DEFAULT_STORE_LOCK:
+        root = Path(os.getenv(PRICE_STORE_DIR_ENV) or DEFAULT_PRICE_STORE_DIR)
+        if _DEFAULT_STORE is None or _DEFAULT_STORE.root != root:
+            _DEFAULT_STORE = PriceStore(root)
+        return _DEFAULT_STORE
+
+
+def sync_price_store(symbols: Iterable[str], *, timeframe: str = "1d") -> dict[str, Any]:
+    """Pull rows past each symbol's high-water mark into the default store."""
+    return get_price_store().sync(symbols, timeframe=timeframe)
+
+
+def invalidate_price_store(
+    symbols: Iterable[str] | dict[str, Any],
+    *,
+    timeframe: str = "1d",
+    from_date: Any = None,
+) -> int:
+    """Called by MySQL writers so the next read refills the touched range."""
+    return get_price_store().invalidate(symbols, timeframe=timeframe, from_date=from_date)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+"""
+provider_gate.py — 외부 provider 호출 동시성 / cooldown 공유
+
+같은 프로세스의 수집 경로(OHLCV, fundamentals …)가 한 provider를 부를 때
+네트워크 호출만 `provider_slot(name)`으로 감싼다. slot 수는 provider 한도에 맞춘
+BoundedSemaphore라서 DB 쓰기는 slot 밖에서 진행되고, 한 stage의 upsert와
+다른 stage의 fetch가 겹칠 수 있다.
+rate limit을 만난 경로가 `pause_provider(name, seconds)`를 부르면 그 시각까지
+모든 경로의 새 slot 획득이 기다리므로 cooldown이 다른 stage에도 걸린다.
+"""
+
+YAHOO_PROVIDER = "yahoo"
+# OHLCV 프로필의 최대 worker 2개 + fundamentals fetch 1개.
+PROVIDER_MAX_CONCURRENCY = {YAHOO_PROVIDER: 3}
+DEFAULT_PROVIDER_MAX_CONCURRENCY = 1
+
+
+class ProviderGate:
+    def __init__(self, name: str, max_concurrency: int):
+        self.name = name
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """`seconds` 동안 새 slot을 내주지 않는다. 겹치면 더 늦은 쪽이 남는다."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + float(seconds))
+
+    def remaining_pause(self) -> float:
+        with self._lock:
+            return max(self._paused_until - time.monotonic(), 0.0)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        while True:
+            wait = self.remaining_pause()
+            if wait > 0:
+                time.sleep(wait)
+            self._slots.acquire()
+            # slot을 기다리는 동안 다른 경로가 cooldown을 걸었을 수 있다.
+            if self.remaining_pause() <= 0:
+                break
+            self._slots.release()
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+
+_GATES: dict[str, ProviderGate] = {}
+_GATES_LOCK = threading.Lock()
+
+
+def get_provider_gate(name: str) -> ProviderGate:
+    with _GATES_LOCK:
+        gate = _GATES.get(name)
+        if gate is None:
+            gate = ProviderGate(name, PROVIDER_MAX_CONCURRENCY.get(name, DEFAULT_PROVIDER_MAX_CONCURRENCY))
+            _GATES[name] = gate
+        return gate
+
+
+def provider_slot(name: str):
+    """provider 네트워크 호출 한 번을 감싼다."""
+    return get_provider_gate(name).slot()
+
+
+def pause_provider(name: str, seconds: float) -> None:
+    """rate limit cooldown을 같은 provider를 쓰는 모든 경로에 건다."""
+    get_provider_gate(name).pause(seconds)
@@ -8,6 +8,7 @@ from .data.data import (
 from .loaders import (
     load_price_strategy_dfs
 )
+from .panel import PanelFrameView, PricePanel
 from .transform import (
     add_avg_score,
     add_ma,
@@ -20,14 +21,44 @@ from .transform import (
 )
 
 class BacktestEngine:
+    """
+    panel=True 이면 데이터를 `PricePanel`(dates × symbols × fields float64 block)로 보관하고
+    transform을 date 축 vectorized 연산으로 수행한다.
+    `self.dfs`는 두 모드 모두에서 ticker-keyed dict(또는 panel view)로 읽고 쓸 수 있다.
+    """
 
-    def __init__(self, tickers, period, option):
+    def __init__(self, tickers, period, option, panel=False):
         self.tickers = tickers
         self.period = period
         self.option = option
-        self.dfs = None
+        self.panel_mode = bool(panel)
+        self.panel = None
+        self._dfs = None
+        self._panel_view = None
         self.result = None
 
+    @property
+    def dfs(self):
+        if self.panel is None:
+            return self._dfs
+        # PricePanel은 immutable이라 transform마다 새 panel이 된다; 같은 panel이면 view(와 frame 캐시)를 재사용.
+        if self._panel_view is None or self._panel_view.panel is not self.panel:
+            self._panel_view = self.panel.to_dfs()
+        return self._panel_view
+
+    @dfs.setter
+    def dfs(self, value):
+        if isinstance(value, PanelFrameView):
+            self.panel = value.panel
+            self._panel_view = value
+            self._dfs = None
+        elif self.panel_mode and value:
+            self.panel = PricePanel.from_dfs(value)
+            self._dfs = None
+        else:
+            self.panel = None
+            self._dfs = value
+
     # =====================
     # Data
     # =====================
@@ -51,35 +82,59 @@ class BacktestEngine:
     # Transform
     # =====================
     def add_ma(self, windows):
-        self.dfs = add_ma(self.dfs, windows)
+        if self.panel is not None:
+            self.panel = self.panel.add_ma(windows)
+        else:
+            self.dfs = add_ma(self.dfs, windows)
         return self
 
     def filter_by_period(self):
-        self.dfs = filter_ohlcv(self.dfs, self.option)
+        if self.panel is not None:
+            self.panel = self.panel.filter_period(self.option)
+        else:
+            self.dfs = filter_ohlcv(self.dfs, self.option)
         return self
 
     def align_dates(self):
-        self.dfs = align_dfs_by_date_intersection(self.dfs)
+        if self.panel is not None:
+            self.panel = self.panel.align_dates()
+        else:
+            self.dfs = align_dfs_by_date_intersection(self.dfs)
         return self
 
     def slice(self, start=None, end=None):
-        self.dfs = slice_ohlcv(self.dfs, start, end)
+        if self.panel is not None:
+            self.panel = self.panel.slice(start, end)
+        else:
+            self.dfs = slice_ohlcv(self.dfs, start, end)
         return self
 
     def drop_columns(self, cols):
-        self.dfs = drop_columns(self.dfs, cols)
+        if self.panel is not None:
+            self.panel = self.panel.drop_columns(cols)
+        else:
+            self.dfs = drop_columns(self.dfs, cols)
         return self
 
     def add_interval_returns(self, intervals):
-        self.dfs = add_interval_returns(self.dfs, intervals)
+        if self.panel is not None:
+            self.panel = self.panel.add_interval_returns(intervals)
+        else:
+            self.dfs = add_interval_returns(self.dfs, intervals)
         return self
 
     def add_avg_score(self, return_cols=("1MReturn", "3MReturn", "6MReturn", "12MReturn"), weights=None, out_col="Avg Score"):
-        self.dfs = add_avg_score(self.dfs, return_cols=return_cols, weights=weights, out_col=out_col)
+        if self.panel is not None:
+            self.panel = self.panel.add_avg_score(return_cols=return_cols, weights=weights, out_col=out_col)
+        else:
+            self.dfs = add_avg_score(self.dfs, return_cols=return_cols, weights=weights, out_col=out_col)
         return self
 
     def interval(self, interval):
-        self.dfs = select_rows_by_interval_with_ends(self.dfs, interval)
+        if self.panel is not None:
+            self.panel = self.panel.select_rows_by_interval_with_ends(interval)
+        else:
+            self.dfs = select_rows_by_interval_with_ends(self.dfs, interval)
         return self
 
     # =====================
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass
-from typing import Mapping, Sequence
+from typing import Iterator, Mapping, Sequence, overload
+
+import numpy as np
 
 
 JOINT_PATH_COMPONENT = "joint_macro_paths"
@@ -33,6 +36,145 @@ class SimulationPath:
     rate_paths_pct: Mapping[str, tuple[float, ...]]
 
 
+def _row_tuple(values: np.ndarray) -> tuple[float, ...]:
+    return tuple(values[~np.isnan(values)].tolist())
+
+
+@dataclass(frozen=True, eq=False)
+class SimulationPathBundle(SequenceABC):
+    """Column-major joint draws; one row per path, `SimulationPath` views on demand.
+
+    Rate arrays are (paths x points) per instrument and the monthly MoM array is
+    (paths x months). `from_paths` left-pads shorter rate paths and right-pads
+    shorter MoM paths with NaN so trailing-window target checks match the
+    per-path tuple form.
+    """
+
+    path_ids: tuple[str, ...]
+    weights: np.ndarray
+    q4_core_pce_pct: np.ndarray
+    remaining_monthly_mom_pct: np.ndarray
+    policy_net_steps: np.ndarray
+    year_end_policy_midpoint_pct: np.ndarray
+    rate_paths_pct: Mapping[str, np.ndarray]
+
+    def __post_init__(self) -> None:
+        count = len(self.path_ids)
+        columns = (
+            self.weights,
+            self.q4_core_pce_pct,
+            self.policy_net_steps,
+            self.year_end_policy_midpoint_pct,
+        )
+        if any(np.ndim(values) != 1 or len(values) != count for values in columns):
+            raise ValueError("path bundle columns must have one value per path")
+        matrices = (self.remaining_monthly_mom_pct, *self.rate_paths_pct.values())
+        if any(np.ndim(values) != 2 or len(values) != count for values in matrices):
+            raise ValueError("path bundle matrices must have one row per path")
+
+    @classmethod
+    def from_paths(
+        cls,
+        paths: Sequence[SimulationPath],
+        *,
+        instruments: Sequence[str] | None = None,
+    ) -> "SimulationPathBundle":
+        """Stack per-path tuples; only `instruments` are copied when given."""
+
+        rows = tuple(paths)
+        names = (
+            tuple(instruments)
+            if instruments is not None
+            else tuple(dict.fromkeys(name for path in rows for name in path.rate_paths_pct))
+        )
+        rate_paths: dict[str, np.ndarray] = {}
+        for name in names:
+            values: list[tuple[float, ...]] = []
+            for path in rows:
+                if name not in path.rate_paths_pct:
+                    raise ValueError(f"path {path.path_id} is missing {name}")
+                values.append(
+                    _finite_path(path.rate_paths_pct[name], field=f"{name} path")
+                )
+            width = max((len(row) for row in values), default=0)
+            matrix = np.full((len(values), width), np.nan)
+            for index, row in enumerate(values):
+                matrix[index, width - len(row) :] = row
+            rate_paths[name] = matrix
+        months = max((len(path.remaining_monthly_mom_pct) for path in rows), default=0)
+        remaining = np.full((len(rows), months), np.nan)
+        for index, path in enumerate(rows):
+            if not path.remaining_monthly_mom_pct:
+                raise ValueError("remaining monthly path cannot be empty")
+            remaining[index, : len(path.remaining_monthly_mom_pct)] = [
+                float(value) for value in path.remaining_monthly_mom_pct
+            ]
+        return cls(
+            path_ids=tuple(str(path.path_id) for path in rows),
+            weights=np.asarray([float(path.weight) for path in rows], dtype=float),
+            q4_core_pce_pct=np.asarray(
+                [float(path.q4_core_pce_pct) for path in rows], dtype=float
+            ),
+            remaining_monthly_mom_pct=remaining,
+            policy_net_steps=np.asarray(
+                [int(path.policy_net_steps) for path in rows], dtype=int
+            ),
+            year_end_policy_midpoint_pct=np.asarray(
+                [float(path.year_end_policy_midpoint_pct) for path in rows],
+                dtype=float,
+            ),
+            rate_paths_pct=rate_paths,
+        )
+
+    def __len__(self) -> int:
+        return len(self.path_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> SimulationPath: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[SimulationPath, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> SimulationPath | tuple[SimulationPath, ...]:
+        if isinstance(index, slice):
+            return tuple(self._path(row) for row in range(*index.indices(len(self))))
+        row = int(index)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("path bundle index out of range")
+        return self._path(row)
+
+    def __iter__(self) -> Iterator[SimulationPath]:
+        for row in range(len(self)):
+            yield self._path(row)
+
+    def _path(self, row: int) -> SimulationPath:
+        return SimulationPath(
+            path_id=self.path_ids[row],
+            weight=float(self.weights[row]),
+            q4_core_pce_pct=float(self.q4_core_pce_pct[row]),
+            remaining_monthly_mom_pct=_row_tuple(self.remaining_monthly_mom_pct[row]),
+            policy_net_steps=int(self.policy_net_steps[row]),
+            year_end_policy_midpoint_pct=float(self.year_end_policy_midpoint_pct[row]),
+            rate_paths_pct={
+                name: _row_tuple(values[row])
+                for name, values in self.rate_paths_pct.items()
+            },
+        )
+
+    def mean_remaining_mom_pct(self) -> np.ndarray:
+        # Joint draws share MoM rows per q4 value, so average each distinct row once.
+        rows, inverse = np.unique(
+            self.remaining_monthly_mom_pct, axis=0, return_inverse=True
+        )
+        means = np.asarray(
+            [sum(values) / len(values) for values in map(_row_tuple, rows)],
+            dtype=float,
+        )
+        return means[inverse.reshape(-1)]
+
+
 @dataclass(frozen=True)
 class RateTargetCondition:
     instrument: str
@@ -120,80 +262,103 @@ def compose_rate_path(
     )
 
 
-def _normalized_paths(paths: Sequence[SimulationPath]) -> tuple[tuple[SimulationPath, float], ...]:
+def _as_bundle(
+    paths: Sequence[SimulationPath] | SimulationPathBundle,
+    *,
+    instruments: Sequence[str] = (),
+) -> SimulationPathBundle:
+    if isinstance(paths, SimulationPathBundle):
+        return paths
     if not paths:
         raise ValueError("simulation paths cannot be empty")
-    raw: list[tuple[SimulationPath, float]] = []
-    for path in paths:
-        weight = _finite(path.weight, field="path weight")
-        if weight < 0.0:
-            raise ValueError("path weights cannot be negative")
-        _finite(path.q4_core_pce_pct, field="q4_core_pce_pct")
-        _finite(path.year_end_policy_midpoint_pct, field="year_end midpoint")
-        if not path.remaining_monthly_mom_pct:
-            raise ValueError("remaining monthly path cannot be empty")
-        raw.append((path, weight))
-    total = sum(weight for _path, weight in raw)
+    return SimulationPathBundle.from_paths(paths, instruments=instruments)
+
+
+def _path_sum(values: np.ndarray) -> float:
+    # Builtin float sum over path order, so masses match the per-path tuple form.
+    return float(sum(values.tolist()))
+
+
+def _normalized_weights(bundle: SimulationPathBundle) -> np.ndarray:
+    if not len(bundle):
+        raise ValueError("simulation paths cannot be empty")
+    weights = np.asarray(bundle.weights, dtype=float)
+    if not np.all(np.isfinite(weights)):
+        raise ValueError("path weight must be finite")
+    if np.any(weights < 0.0):
+        raise ValueError("path weights cannot be negative")
+    if not np.all(np.isfinite(bundle.q4_core_pce_pct)):
+        raise ValueError("q4_core_pce_pct must be finite")
+    if not np.all(np.isfinite(bundle.year_end_policy_midpoint_pct)):
+        raise ValueError("year_end midpoint must be finite")
+    if bundle.remaining_monthly_mom_pct.shape[1] == 0:
+        raise ValueError("remaining monthly path cannot be empty")
+    total = _path_sum(weights)
     if total <= 0.0:
         raise ValueError("simulation paths must contain positive mass")
-    return tuple((path, weight / total) for path, weight in raw)
+    return weights / total
 
 
-def _condition_matches(path: SimulationPath, target: RateTargetCondition) -> bool:
-    if target.instrument not in path.rate_paths_pct:
-        raise ValueError(f"path {path.path_id} is missing {target.instrument}")
-    values = _finite_path(
-        path.rate_paths_pct[target.instrument], field=f"{target.instrument} path"
-    )
+def _target_mask(bundle: SimulationPathBundle, target: RateTargetCondition) -> np.ndarray:
+    values = bundle.rate_paths_pct.get(target.instrument)
+    if values is None:
+        raise ValueError(f"path {bundle.path_ids[0]} is missing {target.instrument}")
+    if values.shape[1] == 0:
+        raise ValueError(f"{target.instrument} path cannot be empty")
     lower = _finite(target.zone_lower_pct, field="zone_lower_pct")
     upper = _finite(target.zone_upper_pct, field="zone_upper_pct")
     buffer = _finite(target.buffer_pct, field="buffer_pct")
-    if lower > upper or buffer < 0.0 or int(target.hold_days) <= 0:
+    hold_days = int(target.hold_days)
+    if lower > upper or buffer < 0.0 or hold_days <= 0:
         raise ValueError("target zone configuration is invalid")
+    # NaN padding compares False, so shorter paths keep their trailing-window result.
     condition = str(target.condition).upper()
     if condition == "REACH":
-        return max(values) >= lower
+        return np.any(values >= lower, axis=1)
     if condition == "BREAK":
-        return sum(value > upper + buffer for value in values[-5:]) >= 3
+        return np.count_nonzero(values[:, -5:] > upper + buffer, axis=1) >= 3
     if condition == "HOLD":
-        return len(values) >= int(target.hold_days) and all(
-            value > upper + buffer for value in values[-int(target.hold_days) :]
-        )
+        if values.shape[1] < hold_days:
+            return np.zeros(len(bundle), dtype=bool)
+        return np.all(values[:, -hold_days:] > upper + buffer, axis=1)
     raise ValueError("target condition must be REACH, BREAK, or HOLD")
 
 
 def calculate_target_probability(
-    paths: Sequence[SimulationPath],
+    paths: Sequence[SimulationPath] | SimulationPathBundle,
     target: RateTargetCondition,
 ) -> float:
     """Return the total normalized likelihood mass that satisfies a rate target."""
 
-    return sum(
-        weight for path, weight in _normalized_paths(paths) if _condition_matches(path, target)
-    )
+    bundle = _as_bundle(paths, instruments=(target.instrument,))
+    weights = _normalized_weights(bundle)
+    return _path_sum(weights[_target_mask(bundle, target)])
 
 
 def _weighted_quantiles(
-    values: Sequence[float],
-    weights: Sequence[float],
+    values: Sequence[float] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
 ) -> dict[str, float]:
-    ordered = sorted(zip(values, weights, strict=True), key=lambda item: item[0])
-    total = sum(weight for _value, weight in ordered)
+    value_array = np.asarray(values, dtype=float)
+    weight_array = np.asarray(weights, dtype=float)
+    if value_array.shape != weight_array.shape:
+        raise ValueError("weighted quantiles require one weight per value")
+    order = np.argsort(value_array, kind="stable")
+    ordered = value_array[order]
+    cumulative = np.cumsum(weight_array[order])
+    total = _path_sum(weight_array[order])
     if total <= 0.0:
         raise ValueError("weighted quantiles require positive mass")
     labels = (("p05", 0.05), ("p20", 0.20), ("p50", 0.50), ("p80", 0.80), ("p95", 0.95))
-    result: dict[str, float] = {}
-    for label, quantile in labels:
-        threshold = quantile * total
-        cumulative = 0.0
-        selected = ordered[-1][0]
-        for value, weight in ordered:
-            cumulative += weight
-            if cumulative + 1e-15 >= threshold:
-                selected = value
-                break
-        result[label] = float(selected)
-    return result
+    positions = np.searchsorted(
+        cumulative + 1e-15,
+        [quantile * total for _label, quantile in labels],
+        side="left",
+    )
+    return {
+        label: float(ordered[min(int(position), ordered.size - 1)])
+        for (label, _quantile), position in zip(labels, positions)
+    }
 
 
 def _policy_step_label(steps: int) -> str:
@@ -212,8 +377,20 @@ def _policy_step_label(steps: int) -> str:
     return "hike_3_plus"
 
 
+def _labelled_mass(
+    codes: np.ndarray,
+    names: Sequence[str],
+    weights: np.ndarray,
+) -> dict[str, float]:
+    """Sum weights per label, keyed in first-appearance order like a dict fold."""
+
+    totals = np.bincount(codes, weights=weights, minlength=len(names))
+    _unique, first = np.unique(codes, return_index=True)
+    return {names[int(code)]: float(totals[code]) for code in codes[np.sort(first)]}
+
+
 def condition_paths_on_target(
-    paths: Sequence[SimulationPath],
+    paths: Sequence[SimulationPath] | SimulationPathBundle,
     target: RateTargetCondition,
     *,
     minimum_supporting_paths: int,
@@ -221,29 +398,24 @@ def condition_paths_on_target(
 ) -> ReverseScenarioSummary:
     """Summarize target-consistent paths or fail closed when conditional support is sparse."""
 
-    normalized = _normalized_paths(paths)
-    selected = [
-        (path, weight)
-        for path, weight in normalized
-        if _condition_matches(path, target)
-    ]
-    target_probability = sum(weight for _path, weight in selected)
+    bundle = _as_bundle(paths, instruments=(target.instrument,))
+    normalized = _normalized_weights(bundle)
+    selected = np.flatnonzero(_target_mask(bundle, target))
+    target_probability = _path_sum(normalized[selected])
     if target_probability > 0.0:
-        conditional = [
-            (path, weight / target_probability) for path, weight in selected
-        ]
-        effective = 1.0 / sum(weight**2 for _path, weight in conditional)
+        conditional = normalized[selected] / target_probability
+        effective = 1.0 / _path_sum(conditional**2)
     else:
-        conditional = []
+        conditional = np.empty(0)
         effective = 0.0
     if (
-        len(selected) < int(minimum_supporting_paths)
+        selected.size < int(minimum_supporting_paths)
         or effective < float(minimum_effective_paths)
     ):
         return ReverseScenarioSummary(
             status="NOT_AVAILABLE",
             target_probability=target_probability,
-            supporting_path_count=len(selected),
+            supporting_path_count=int(selected.size),
             effective_path_count=effective,
             q4_core_pce_quantiles_pct=None,
             required_remaining_mom_quantiles_pct=None,
@@ -251,88 +423,87 @@ def condition_paths_on_target(
             year_end_policy_target_probabilities=None,
         )
 
-    conditional_weights = [weight for _path, weight in conditional]
-    policy: dict[str, float] = {}
-    targets: dict[str, float] = {}
-    for path, weight in conditional:
-        step_label = _policy_step_label(int(path.policy_net_steps))
-        policy[step_label] = policy.get(step_label, 0.0) + weight
-        target_label = f"{path.year_end_policy_midpoint_pct:.4f}"
-        targets[target_label] = targets.get(target_label, 0.0) + weight
+    step_names = tuple(_policy_step_label(steps) for steps in range(-3, 4))
+    step_codes = np.clip(bundle.policy_net_steps[selected].astype(int), -3, 3) + 3
+    midpoints, inverse = np.unique(
+        bundle.year_end_policy_midpoint_pct[selected], return_inverse=True
+    )
+    midpoint_labels = [f"{float(value):.4f}" for value in midpoints]
+    target_names = tuple(dict.fromkeys(midpoint_labels))
+    target_codes = np.asarray(
+        [target_names.index(label) for label in midpoint_labels], dtype=int
+    )[inverse.reshape(-1)]
     return ReverseScenarioSummary(
         status="AVAILABLE",
         target_probability=target_probability,
-        supporting_path_count=len(selected),
+        supporting_path_count=int(selected.size),
         effective_path_count=effective,
         q4_core_pce_quantiles_pct=_weighted_quantiles(
-            [path.q4_core_pce_pct for path, _weight in conditional],
-            conditional_weights,
+            bundle.q4_core_pce_pct[selected], conditional
         ),
         required_remaining_mom_quantiles_pct=_weighted_quantiles(
-            [
-                sum(path.remaining_monthly_mom_pct)
-                / len(path.remaining_monthly_mom_pct)
-                for path, _weight in conditional
-            ],
-            conditional_weights,
+            bundle.mean_remaining_mom_pct()[selected], conditional
+        ),
+        policy_net_step_probabilities=_labelled_mass(
+            step_codes, step_names, conditional
+        ),
+        year_end_policy_target_probabilities=_labelled_mass(
+            target_codes, target_names, conditional
         ),
-        policy_net_step_probabilities=policy,
-        year_end_policy_target_probabilities=targets,
     )
 
 
-def posterior_target_probability_for_next_pce(
-    paths: Sequence[SimulationPath],
-    target: RateTargetCondition,
+def _next_pce_weights(
+    bundle: SimulationPathBundle,
     *,
     observed_mom_pct: float,
     observation_noise_pct: float,
-) -> float:
-    """Reweight joint paths by a proposed next print instead of firing a threshold rule."""
-
+) -> tuple[np.ndarray, float]:
     observed = _finite(observed_mom_pct, field="observed_mom_pct")
     noise = _finite(observation_noise_pct, field="observation_noise_pct")
     if noise <= 0.0:
         raise ValueError("observation_noise_pct must be positive")
-    weighted: list[tuple[SimulationPath, float]] = []
-    for path, prior_weight in _normalized_paths(paths):
-        expected = _finite(
-            path.remaining_monthly_mom_pct[0], field="next path MoM"
-        )
-        likelihood = math.exp(-0.5 * ((observed - expected) / noise) ** 2)
-        weighted.append((path, prior_weight * likelihood))
-    denominator = sum(weight for _path, weight in weighted)
+    prior = _normalized_weights(bundle)
+    expected = bundle.remaining_monthly_mom_pct[:, 0]
+    if not np.all(np.isfinite(expected)):
+        raise ValueError("next path MoM must be finite")
+    weighted = prior * np.exp(-0.5 * ((observed - expected) / noise) ** 2)
+    denominator = _path_sum(weighted)
     if denominator <= 0.0:
         raise ValueError("next PCE scenario has no supported likelihood mass")
-    return sum(
-        weight
-        for path, weight in weighted
-        if _condition_matches(path, target)
-    ) / denominator
+    return weighted, denominator
+
+
+def posterior_target_probability_for_next_pce(
+    paths: Sequence[SimulationPath] | SimulationPathBundle,
+    target: RateTargetCondition,
+    *,
+    observed_mom_pct: float,
+    observation_noise_pct: float,
+) -> float:
+    """Reweight joint paths by a proposed next print instead of firing a threshold rule."""
+
+    bundle = _as_bundle(paths, instruments=(target.instrument,))
+    weighted, denominator = _next_pce_weights(
+        bundle,
+        observed_mom_pct=observed_mom_pct,
+        observation_noise_pct=observation_noise_pct,
+    )
+    return _path_sum(weighted[_target_mask(bundle, target)]) / denominator
 
 
 def posterior_policy_hike_probability_for_next_pce(
-    paths: Sequence[SimulationPath],
+    paths: Sequence[SimulationPath] | SimulationPathBundle,
     *,
     observed_mom_pct: float,
     observation_noise_pct: float,
 ) -> float:
     """Reweight the validated joint paths and return positive net-policy mass."""
 
-    observed = _finite(observed_mom_pct, field="observed_mom_pct")
-    noise = _finite(observation_noise_pct, field="observation_noise_pct")
-    if noise <= 0.0:
-        raise ValueError("observation_noise_pct must be positive")
-    weighted: list[tuple[SimulationPath, float]] = []
-    for path, prior_weight in _normalized_paths(paths):
-        expected = _finite(
-            path.remaining_monthly_mom_pct[0], field="next path MoM"
-        )
-        likelihood = math.exp(-0.5 * ((observed - expected) / noise) ** 2)
-        weighted.append((path, prior_weight * likelihood))
-    denominator = sum(weight for _path, weight in weighted)
-    if denominator <= 0.0:
-        raise ValueError("next PCE scenario has no supported likelihood mass")
-    return sum(
-        weight for path, weight in weighted if int(path.policy_net_steps) > 0
-    ) / denominator
+    bundle = _as_bundle(paths)
+    weighted, denominator = _next_pce_weights(
+        bundle,
+        observed_mom_pct=observed_mom_pct,
+        observation_noise_pct=observation_noise_pct,
+    )
+    return _path_sum(weighted[bundle.policy_net_steps > 0]) / denominator
@@ -14,7 +14,7 @@ from finance.inflation_path import (
     calculate_q4_over_q4,
     required_constant_mom_for_q4_target,
 )
-from finance.inflation_policy_simulation import SimulationPath
+from finance.inflation_policy_simulation import SimulationPath, SimulationPathBundle
 from finance.inflation_policy_validation import (
     ContinuousValidationPrediction,
     calculate_continuous_metrics,
@@ -62,7 +62,7 @@ class JointRatePathArtifact:
     validation_metrics: dict[str, object]
     publication_status: str
     reason_codes: tuple[str, ...]
-    paths: tuple[SimulationPath, ...]
+    paths: Sequence[SimulationPath]
 
 
 def _timestamp(value: object) -> datetime:
@@ -227,6 +227,17 @@ def _resample(values: Sequence[float], *, size: int) -> np.ndarray:
     )
 
 
+def _resampled_deltas(
+    episodes: Sequence[RateEpisode], instrument: str, *, size: int
+) -> np.ndarray:
+    """Resample each episode once; rows are episodes, columns path points."""
+
+    sampled = np.stack(
+        [_resample(row.rate_paths_pct[instrument], size=size) for row in episodes]
+    )
+    return sampled - sampled[:, :1]
+
+
 def _scaled_endpoint_samples(
     origin: RateEpisode,
     candidates: Sequence[RateEpisode],
@@ -383,6 +394,7 @@ def validate_dynamic_resistance_reach(
     """Validate empirical path reach probabilities against PIT dynamic zones."""
 
     ordered = tuple(sorted(episodes, key=lambda row: row.origin_date))
+    dgs10_deltas: dict[int, np.ndarray] = {}
     probability_rows: list[tuple[float, float]] = []
     scale_cache: dict[int, float] = {}
     observations = [
@@ -396,8 +408,8 @@ def validate_dynamic_resistance_reach(
             if row.origin_date.year < origin.origin_date.year
         ]
         candidates = [
-            row
-            for row in training
+            index
+            for index, row in enumerate(training)
             if abs(row.origin_month - origin.origin_month) <= 2
         ]
         if len(candidates) < 20:
@@ -428,22 +440,24 @@ def validate_dynamic_resistance_reach(
         )
         if selected is None:
             continue
-        scale = scale_cache.setdefault(
-            origin.origin_date.year,
-            _select_rate_scale(training, instrument="DGS10"),
-        )
-        raw_deltas: list[np.ndarray] = []
-        for candidate in candidates:
-            sampled = _resample(candidate.rate_paths_pct["DGS10"], size=21)
-            raw_deltas.append(sampled - sampled[0])
-        center = np.median(np.asarray(raw_deltas), axis=0)
-        projected = [
-            current + center + scale * (raw_delta - center)
-            for raw_delta in raw_deltas
-        ]
-        probability = sum(
-            float(np.max(path)) >= float(selected.zone_lower_pct)
-            for path in projected
+        if origin.origin_date.year not in scale_cache:
+            scale_cache[origin.origin_date.year] = _select_rate_scale(
+                training, instrument="DGS10"
+            )
+        scale = scale_cache[origin.origin_date.year]
+        # training is a prefix of ordered, so candidate positions index both;
+        # each episode is resampled once across all origins.
+        for index in candidates:
+            if index not in dgs10_deltas:
+                sampled = _resample(ordered[index].rate_paths_pct["DGS10"], size=21)
+                dgs10_deltas[index] = sampled - sampled[0]
+        raw_deltas = np.stack([dgs10_deltas[index] for index in candidates])
+        center = np.median(raw_deltas, axis=0)
+        projected = current + center + scale * (raw_deltas - center)
+        probability = int(
+            np.count_nonzero(
+                projected.max(axis=1) >= float(selected.zone_lower_pct)
+            )
         ) / len(projected)
         actual = float(
             max(origin.rate_paths_pct["DGS10"]) >= selected.zone_lower_pct
@@ -528,8 +542,11 @@ def simulate_joint_rate_paths(
     rate_scales: Mapping[str, object],
     sample_count: int,
     seed: int,
-) -> tuple[SimulationPath, ...]:
-    """Apply empirical ranks while preserving validated current marginals."""
+) -> SimulationPathBundle:
+    """Apply empirical ranks while preserving validated current marginals.
+
+    Paths come back as one array bundle; iterate it for `SimulationPath` views.
+    """
 
     library = tuple(episodes)
     if not library or int(sample_count) <= 0:
@@ -546,7 +563,6 @@ def simulate_joint_rate_paths(
     )
     rng = np.random.default_rng(int(seed))
     chosen_indices = rng.integers(0, len(library), size=count)
-    chosen = [library[int(index)] for index in chosen_indices]
     q4_draws = rng.choice(
         q4_values,
         size=count,
@@ -556,58 +572,51 @@ def simulate_joint_rate_paths(
         steps, size=count, replace=True, p=policy_probabilities
     )
     assigned_q4 = _rank_assign(
-        np.asarray([row.q4_core_pce_pct for row in chosen], dtype=float),
+        np.asarray([row.q4_core_pce_pct for row in library], dtype=float)[
+            chosen_indices
+        ],
         np.asarray(q4_draws, dtype=float),
     )
     assigned_policy = _rank_assign(
-        np.asarray([row.policy_net_steps for row in chosen], dtype=float),
+        np.asarray([row.policy_net_steps for row in library], dtype=float)[
+            chosen_indices
+        ],
         np.asarray(policy_draws, dtype=float),
     ).astype(int)
-    path_points = max(5, len(tuple(forecast_months)) * 4 + 1)
-    median_deltas: dict[str, np.ndarray] = {}
+    months = tuple(forecast_months)
+    path_points = max(5, len(months) * 4 + 1)
+    rate_paths: dict[str, np.ndarray] = {}
     for instrument in RATE_INSTRUMENTS:
-        deltas = []
-        for row in library:
-            sampled = _resample(row.rate_paths_pct[instrument], size=path_points)
-            deltas.append(sampled - sampled[0])
-        median_deltas[instrument] = np.median(np.asarray(deltas), axis=0)
-
-    paths: list[SimulationPath] = []
-    for index, historical in enumerate(chosen):
-        rate_paths: dict[str, tuple[float, ...]] = {}
-        for instrument in RATE_INSTRUMENTS:
-            sampled = _resample(
-                historical.rate_paths_pct[instrument], size=path_points
-            )
-            raw_delta = sampled - sampled[0]
-            center = median_deltas[instrument]
-            scale = float(rate_scales[instrument])
-            projected = rates[instrument] + center + scale * (raw_delta - center)
-            projected[0] = rates[instrument]
-            rate_paths[instrument] = tuple(float(value) for value in projected)
-        q4 = float(assigned_q4[index])
-        required_mom = required_constant_mom_for_q4_target(
-            levels,
-            forecast_months=forecast_months,
-            target_q4_over_q4=q4,
+        deltas = _resampled_deltas(library, instrument, size=path_points)
+        center = np.median(deltas, axis=0)
+        scale = float(rate_scales[instrument])
+        projected = rates[instrument] + center + scale * (
+            deltas[chosen_indices] - center
         )
-        policy_steps = int(assigned_policy[index])
-        paths.append(
-            SimulationPath(
-                path_id=f"joint-{index:05d}",
-                weight=1.0 / count,
-                q4_core_pce_pct=q4,
-                remaining_monthly_mom_pct=tuple(
-                    required_mom for _month in forecast_months
-                ),
-                policy_net_steps=policy_steps,
-                year_end_policy_midpoint_pct=(
-                    float(current_policy_midpoint_pct) + 0.25 * policy_steps
-                ),
-                rate_paths_pct=rate_paths,
-            )
+        projected[:, 0] = rates[instrument]
+        rate_paths[instrument] = projected
+    required_by_q4 = {
+        float(q4): required_constant_mom_for_q4_target(
+            levels,
+            forecast_months=months,
+            target_q4_over_q4=float(q4),
         )
-    return tuple(paths)
+        for q4 in np.unique(assigned_q4)
+    }
+    required_mom = np.asarray(
+        [required_by_q4[float(q4)] for q4 in assigned_q4], dtype=float
+    )
+    return SimulationPathBundle(
+        path_ids=tuple(f"joint-{index:05d}" for index in range(count)),
+        weights=np.full(count, 1.0 / count),
+        q4_core_pce_pct=assigned_q4,
+        remaining_monthly_mom_pct=np.repeat(required_mom[:, None], len(months), axis=1),
+        policy_net_steps=assigned_policy,
+        year_end_policy_midpoint_pct=(
+            float(current_policy_midpoint_pct) + 0.25 * assigned_policy
+        ),
+        rate_paths_pct=rate_paths,
+    )
 
 
 def fit_joint_rate_path_artifact(
@@ -699,7 +708,7 @@ def fit_joint_rate_path_artifact(
     )
     if len(candidates) < 20:
         reasons.append("current_horizon_episode_support_too_small")
-    paths: tuple[SimulationPath, ...] = ()
+    paths: Sequence[SimulationPath] = ()
     if not reasons:
         paths = simulate_joint_rate_paths(
             candidates,
@@ -24,12 +24,14 @@ from .factors import (
     load_factor_snapshot,
     load_factors,
     load_statement_factor_snapshot_shadow,
+    load_statement_factors_data_version,
     load_statement_factors_shadow,
     load_statement_quality_snapshot_strict,
 )
 from .fundamentals import (
     load_fundamental_snapshot,
     load_fundamentals,
+    load_statement_fundamentals_data_version,
     load_statement_fundamentals_shadow,
     load_statement_shadow_coverage_summary,
 )
@@ -41,6 +43,8 @@ from .nasdaq100_valuation import (
 from .price import (
     load_latest_market_date,
     load_latest_prices,
+    iter_price_history,
+    load_price_data_version,
     load_price_freshness_summary,
     load_price_history,
     load_price_matrix,
@@ -67,6 +71,7 @@ from .institutional_13f import (
     load_institutional_13f_previous_filing,
 )
 from .universe import (
+    load_asset_profile_data_version,
     load_asset_profile_status_summary,
     load_pit_universe_members,
     load_pit_universe_membership_snapshots,
@@ -79,9 +84,11 @@ __all__ = [
     "load_latest_market_date",
     "load_latest_prices",
     "load_price_history",
+    "iter_price_history",
     "load_futures_ohlcv",
     "load_futures_daily_coverage",
     "load_price_freshness_summary",
+    "load_price_data_version",
     "load_price_window_summary",
     "load_price_matrix",
     "load_etf_operability_snapshot",
@@ -90,6 +97,7 @@ __all__ = [
     "load_fundamentals",
     "load_fundamental_snapshot",
     "load_statement_fundamentals_shadow",
+    "load_statement_fundamentals_data_version",
     "load_statement_shadow_coverage_summary",
     "load_macro_series_observations",
     "load_macro_snapshot",
@@ -100,6 +108,7 @@ __all__ = [
     "load_factor_matrix",
     "load_statement_factor_snapshot_shadow",
     "load_statement_factors_shadow",
+    "load_statement_factors_data_version",
     "load_statement_quality_snapshot_strict",
     "load_statement_values",
     "load_statement_filings",
@@ -122,6 +131,7 @@ __all__ = [
     "load_institutional_13f_popularity_ranking",
     "load_institutional_13f_interest",
     "load_asset_profile_status_summary",
+    "load_asset_profile_data_version",
     "load_symbol_lifecycle_coverage_summary",
     "load_pit_universe_members",
     "load_pit_universe_membership_snapshots",
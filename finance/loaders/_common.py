@@ -6,7 +6,7 @@ from datetime import datetime
 import pandas as pd
 
 from finance.data.asset_profile import load_symbols_from_asset_profile
-from finance.data.db.mysql import MySQLClient
+from finance.data.db.mysql import mysql_client
 
 
 VALID_FREQS = {"annual", "quarterly"}
@@ -97,13 +97,9 @@ def normalize_timeframe(timeframe: str | None) -> str:
 
 
 def _query_symbols(table: str) -> list[str]:
-    db = MySQLClient("localhost", "root", "1234", 3306)
-    try:
-        db.use_db("finance_meta")
+    with mysql_client("finance_meta") as db:
         rows = db.query(f"SELECT symbol FROM {table} ORDER BY symbol")
         return [row["symbol"] for row in rows if row.get("symbol")]
-    finally:
-        db.close()
 
 
 def _merge_unique(*groups: list[str]) -> list[str]:
@@ -151,3 +147,40 @@ def resolve_loader_symbols(
         )
 
     raise ValueError(f"Unsupported universe_source: {universe_source!r}")
+
+
+def query_table_data_version(
+    db_name: str,
+    table: str,
+    symbols: str | Iterable[str] | None,
+    *,
+    filters: dict[str, object] | None = None,
+    max_columns: Iterable[str] = (),
+) -> tuple[object, ...]:
+    """
+    Return `(row_count, MAX(column)...)` for the symbols' rows in one table.
+
+    Cheap enough to run before every cached read: callers compare the tuple
+    with the one their cached result was built under instead of reloading.
+    """
+    resolved_symbols = parse_symbol_list(symbols)
+    if not resolved_symbols:
+        return ()
+
+    max_columns = list(max_columns)
+    where = [f"symbol IN ({','.join(['%s'] * len(resolved_symbols))})"]
+    params: list[object] = list(resolved_symbols)
+    for column, value in (filters or {}).items():
+        where.append(f"`{column}` = %s")
+        params.append(value)
+    select = ["COUNT(*) AS row_count", *[f"MAX(`{column}`) AS max_{column}" for column in max_columns]]
+    sql = f"SELECT {', '.join(select)} FROM {table} WHERE {' AND '.join(where)}"
+    with mysql_client(db_name) as db:
+        rows = db.query(sql, params)
+
+    row = rows[0] if rows else {}
+    return (
+        table,
+        int(row.get("row_count") or 0),
+        *[None if row.get(f"max_{column}") is None else str(row[f"max_{column}"]) for column in max_columns],
+    )
@@ -11,6 +11,7 @@ from finance.financial_source_policy import filter_safe_quarterly_statement_rows
 from ._common import (
     normalize_date_range,
     normalize_loader_freq,
+    query_table_data_version,
     resolve_loader_symbols,
     validate_snapshot_inputs,
 )
@@ -363,3 +364,22 @@ def load_statement_factors_shadow(
         freq=normalized_freq,
         form_type_column="form_type",
     )
+
+
+def load_statement_factors_data_version(
+    symbols: str | Iterable[str],
+    *,
+    freq: str = "annual",
+) -> tuple[object, ...]:
+    """Fingerprint both tables `load_statement_factors_shadow` joins for `symbols`."""
+    normalized_freq = normalize_loader_freq(freq)
+    return tuple(
+        query_table_data_version(
+            "finance_fundamental",
+            table,
+            symbols,
+            filters={"freq": normalized_freq},
+            max_columns=("period_end", "updated_at"),
+        )
+        for table in ("nyse_factors_statement", "nyse_fundamentals_statement")
+    )
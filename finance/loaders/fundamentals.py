@@ -10,6 +10,7 @@ from finance.financial_source_policy import filter_safe_quarterly_statement_rows
 from ._common import (
     normalize_date_range,
     normalize_loader_freq,
+    query_table_data_version,
     resolve_loader_symbols,
     validate_snapshot_inputs,
 )
@@ -197,6 +198,21 @@ def load_statement_fundamentals_shadow(
     )
 
 
+def load_statement_fundamentals_data_version(
+    symbols: str | Iterable[str],
+    *,
+    freq: str = "annual",
+) -> tuple[object, ...]:
+    """Fingerprint the statement shadow rows behind `load_statement_fundamentals_shadow`."""
+    return query_table_data_version(
+        "finance_fundamental",
+        "nyse_fundamentals_statement",
+        symbols,
+        filters={"freq": normalize_loader_freq(freq)},
+        max_columns=("period_end", "updated_at"),
+    )
+
+
 def load_statement_shadow_coverage_summary(
     symbols: str | Iterable[str] | None = None,
     *,
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import pandas as pd
 
 from finance.data.db.mysql import MySQLClient
+from finance.data.institutional_13f_summary import SUMMARY_REFERENCE_DRIFT_SQL
 
 
 DB_META = "finance_meta"
@@ -347,10 +348,10 @@ def _latest_report_period(db: MySQLClient) -> str | None:
     return str(value) if value else None
 
 
-def _load_popularity_rows(db: MySQLClient, report_period: str, *, limit: int, force_index: bool) -> list[dict[str, Any]]:
+def popularity_aggregate_sql(*, force_index: bool) -> str:
+    """Per-CUSIP holder aggregate for one `report_period` placeholder, unordered."""
     index_clause = " FORCE INDEX(ix_report_period_cusip_cik)" if force_index else ""
-    return db.query(
-        f"""
+    return f"""
         SELECT
           h.report_period,
           h.cusip,
@@ -377,6 +378,38 @@ def _load_popularity_rows(db: MySQLClient, report_period: str, *, limit: int, fo
         WHERE h.report_period = %s
           AND (h.put_call IS NULL OR h.put_call = '')
         GROUP BY h.report_period, h.cusip
+    """
+
+
+def _load_popularity_rows(db: MySQLClient, report_period: str, *, limit: int, force_index: bool) -> list[dict[str, Any]]:
+    return db.query(
+        f"""
+        {popularity_aggregate_sql(force_index=force_index)}
+        ORDER BY holder_count DESC, total_reported_value DESC, issuer_name ASC
+        LIMIT %s
+        """,
+        (report_period, int(limit)),
+    )
+
+
+def _latest_summary_report_period(db: MySQLClient) -> str | None:
+    rows = db.query(
+        """
+        SELECT MAX(report_period) AS report_period
+        FROM institutional_13f_security_popularity
+        """
+    )
+    value = rows[0].get("report_period") if rows else None
+    return str(value) if value else None
+
+
+def _load_summary_popularity_rows(db: MySQLClient, report_period: str, *, limit: int) -> list[dict[str, Any]]:
+    return db.query(
+        """
+        SELECT report_period, cusip, holding_symbol, issuer_name, holder_count,
+               holding_rows, total_reported_value, sample_managers
+        FROM institutional_13f_security_popularity
+        WHERE report_period = %s
         ORDER BY holder_count DESC, total_reported_value DESC, issuer_name ASC
         LIMIT %s
         """,
@@ -842,6 +875,10 @@ def load_institutional_13f_portfolio_bundle(
         password=password,
         port=port,
     )
+    return _portfolio_bundle(history)
+
+
+def _portfolio_bundle(history: list[dict[str, Any]]) -> dict[str, Any]:
     available = [row for row in history if row.get("available")]
     latest_effective = available[0] if available else None
     previous_effective = available[1] if len(available) > 1 else None
@@ -858,6 +895,100 @@ def load_institutional_13f_portfolio_bundle(
     }
 
 
+def iter_institutional_13f_portfolio_bundles(
+    ciks: Iterable[str],
+    *,
+    host: str = "localhost",
+    user: str = "root",
+    password: str = "1234",
+    port: int = 3306,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield `(cik, bundle)` like `load_institutional_13f_portfolio_bundle` over one DB connection."""
+
+    db = _connect(host, user, password, port)
+    try:
+        for cik in ciks:
+            normalized_cik = str(cik).zfill(10)
+            history = _load_effective_history_from_db(db, normalized_cik, limit=8)
+            yield normalized_cik, _portfolio_bundle(history)
+    finally:
+        db.close()
+
+
+def load_institutional_13f_manager_summary(
+    cik: str,
+    *,
+    host: str = "localhost",
+    user: str = "root",
+    password: str = "1234",
+    port: int = 3306,
+) -> dict[str, Any] | None:
+    """Load the materialized latest-quarter view of one manager, or None when absent or stale.
+
+    A snapshot is stale once the manager's latest accession pointer moved past
+    the one it was materialized from, or once the CUSIP mappings and asset
+    profiles its symbols and sectors came from have changed.
+    """
+
+    normalized_cik = str(cik).zfill(10)
+    db = _connect(host, user, password, port)
+    try:
+        try:
+            snapshots = db.query(
+                f"""
+                SELECT s.*
+                FROM (
+                  SELECT latest.*
+                  FROM institutional_13f_manager_snapshot latest
+                  JOIN institutional_13f_manager m
+                    ON m.cik = latest.cik
+                   AND m.latest_accession_number <=> latest.latest_accession_number
+                  WHERE latest.cik = %s
+                  ORDER BY latest.report_period DESC
+                  LIMIT 1
+                ) s
+                WHERE NOT {SUMMARY_REFERENCE_DRIFT_SQL}
+                """,
+                (normalized_cik,),
+            )
+        except Exception:
+            return None
+        if not snapshots:
+            return None
+        snapshot = snapshots[0]
+        key = (normalized_cik, snapshot.get("report_period"))
+        positions = db.query(
+            """
+            SELECT *
+            FROM institutional_13f_manager_position
+            WHERE cik = %s AND report_period = %s
+            ORDER BY position_rank
+            """,
+            key,
+        )
+        changes = db.query(
+            """
+            SELECT *
+            FROM institutional_13f_manager_change
+            WHERE cik = %s AND report_period = %s
+            ORDER BY change_rank
+            """,
+            key,
+        )
+        sectors = db.query(
+            """
+            SELECT *
+            FROM institutional_13f_manager_sector
+            WHERE cik = %s AND report_period = %s
+            ORDER BY sector_rank
+            """,
+            key,
+        )
+    finally:
+        db.close()
+    return {"snapshot": snapshot, "positions": positions, "changes": changes, "sectors": sectors}
+
+
 def load_institutional_13f_popularity_ranking(
     report_period: str | None = None,
     *,
@@ -867,7 +998,11 @@ def load_institutional_13f_popularity_ranking(
     password: str = "1234",
     port: int = 3306,
 ) -> pd.DataFrame:
-    """Rank securities by distinct 13F managers holding them for one report period."""
+    """Rank securities by distinct 13F managers holding them for one report period.
+
+    Reads the materialized `institutional_13f_security_popularity` rows and only
+    aggregates the holdings table for a period that has not been materialized.
+    """
     db = _connect(host, user, password, port)
     columns = [
         "report_period",
@@ -880,15 +1015,22 @@ def load_institutional_13f_popularity_ranking(
         "sample_managers",
     ]
     try:
-        period = str(report_period or "").strip() or _latest_report_period(db)
-        if not period:
-            return _empty_frame(columns)
         try:
-            rows = _load_popularity_rows(db, period, limit=limit, force_index=True)
-        except Exception as exc:
-            if "ix_report_period_cusip_cik" not in str(exc):
-                raise
-            rows = _load_popularity_rows(db, period, limit=limit, force_index=False)
+            period = str(report_period or "").strip() or _latest_summary_report_period(db)
+            rows = _load_summary_popularity_rows(db, period, limit=limit) if period else []
+        except Exception:
+            # Summary tables are created by the first materialization run.
+            period, rows = str(report_period or "").strip(), []
+        if not rows:
+            period = period or _latest_report_period(db)
+            if not period:
+                return _empty_frame(columns)
+            try:
+                rows = _load_popularity_rows(db, period, limit=limit, force_index=True)
+            except Exception as exc:
+                if "ix_report_period_cusip_cik" not in str(exc):
+                    raise
+                rows = _load_popularity_rows(db, period, limit=limit, force_index=False)
     finally:
         db.close()
 
@@ -1,19 +1,142 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
-from finance.data.db.mysql import MySQLClient
-from finance.data.data import load_ohlcv_many_mysql
+from finance.data.db.mysql import mysql_client
+from finance.data.data import iter_ohlcv_mysql, load_ohlcv_many_mysql
+from finance.data.price_store import (
+    PRICE_WRITE_LOG_TABLE,
+    get_price_store,
+    load_price_write_marks,
+    price_store_enabled,
+)
 
-from ._common import normalize_date_range, normalize_timeframe, normalize_timestamp, resolve_loader_symbols
+from ._common import (
+    normalize_date_range,
+    normalize_timeframe,
+    normalize_timestamp,
+    parse_symbol_list,
+    resolve_loader_symbols,
+)
 
 
 VALID_PRICE_FIELDS = {"open", "high", "low", "close", "adj_close", "volume", "dividends", "stock_splits"}
 VALID_LATEST_PRICE_FIELDS = {"open", "high", "low", "close", "adj_close"}
 
 
+def _datetime_values(dates: pd.Series) -> np.ndarray:
+    if dates.dtype != "datetime64[ns]":
+        dates = pd.to_datetime(dates)
+    return dates.to_numpy(dtype="datetime64[ns]")
+
+
+def _is_sorted_by_symbol_date(symbols: np.ndarray, dates: np.ndarray) -> bool:
+    if len(symbols) < 2:
+        return True
+    same_symbol = symbols[1:] == symbols[:-1]
+    ordered = (symbols[1:] > symbols[:-1]) | (same_symbol & (dates[1:] >= dates[:-1]))
+    return bool(ordered.all())
+
+
+@dataclass(frozen=True)
+class PreloadedPriceHistory:
+    """
+    Long-form history already in memory, served in place of MySQL/store reads.
+
+    Covers `requested_symbols` (plus every symbol present in `history`) over
+    `[start, end]` (None = unbounded) for one timeframe; requests outside that
+    coverage fall through to the regular read path. A requested symbol with
+    no rows is served as an empty result, like the database would.
+    """
+
+    history: pd.DataFrame
+    start: pd.Timestamp | None = None
+    end: pd.Timestamp | None = None
+    timeframe: str = "1d"
+    requested_symbols: frozenset[str] = frozenset()
+    _ranges: dict[str, tuple[int, int]] = field(init=False, repr=False, compare=False)
+    _dates: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        history = self.history
+        symbols = history["symbol"].astype(str).to_numpy()
+        dates = _datetime_values(history["date"])
+        # sweep worker는 부모가 정렬해 둔 shared memory view를 받는다; 이미 정렬돼 있으면
+        # 그대로 써야 worker마다 전체 사본이 생기지 않는다.
+        if not _is_sorted_by_symbol_date(symbols, dates):
+            history = history.sort_values(["symbol", "date"], kind="stable").reset_index(drop=True)
+            symbols = history["symbol"].astype(str).to_numpy()
+            dates = _datetime_values(history["date"])
+        boundaries = np.flatnonzero(symbols[1:] != symbols[:-1]) + 1 if len(symbols) else np.array([], dtype=int)
+        starts = [0, *boundaries.tolist()] if len(symbols) else []
+        stops = [*boundaries.tolist(), len(symbols)] if len(symbols) else []
+        object.__setattr__(self, "history", history)
+        object.__setattr__(self, "_ranges", {str(symbols[lo]): (lo, hi) for lo, hi in zip(starts, stops)})
+        object.__setattr__(self, "_dates", dates)
+
+    @property
+    def symbols(self) -> frozenset[str]:
+        return frozenset(self._ranges)
+
+    def covers(
+        self,
+        symbols: Iterable[str],
+        start: pd.Timestamp | None,
+        end: pd.Timestamp | None,
+        timeframe: str,
+    ) -> bool:
+        if timeframe != self.timeframe:
+            return False
+        if self.start is not None and (start is None or start < self.start):
+            return False
+        if self.end is not None and (end is None or end > self.end):
+            return False
+        return all(symbol in self._ranges or symbol in self.requested_symbols for symbol in symbols)
+
+    def select(self, symbols: Iterable[str], start: pd.Timestamp | None, end: pd.Timestamp | None) -> pd.DataFrame:
+        parts = []
+        for symbol in sorted(set(symbols)):
+            lo, hi = self._ranges.get(symbol, (0, 0))
+            if start is not None:
+                lo = lo + int(np.searchsorted(self._dates[lo:hi], np.datetime64(start, "ns"), side="left"))
+            if end is not None:
+                hi = lo + int(np.searchsorted(self._dates[lo:hi], np.datetime64(end, "ns"), side="right"))
+            if hi > lo:
+                parts.append(np.arange(lo, hi))
+        if not parts:
+            return pd.DataFrame()
+        return self.history.iloc[np.concatenate(parts)].reset_index(drop=True)
+
+
+_PRELOADED_PRICE_HISTORY: ContextVar[PreloadedPriceHistory | None] = ContextVar(
+    "finance_preloaded_price_history",
+    default=None,
+)
+
+
+@contextmanager
+def use_preloaded_price_history(preloaded: PreloadedPriceHistory) -> Iterator[PreloadedPriceHistory]:
+    """Serve covered `load_price_history`/`iter_price_history` calls from memory."""
+    token = _PRELOADED_PRICE_HISTORY.set(preloaded)
+    try:
+        yield preloaded
+    finally:
+        _PRELOADED_PRICE_HISTORY.reset(token)
+
+
+def _preloaded_for(symbols: list[str], start, end, timeframe: str) -> PreloadedPriceHistory | None:
+    preloaded = _PRELOADED_PRICE_HISTORY.get()
+    if preloaded is not None and preloaded.covers(symbols, start, end, timeframe):
+        return preloaded
+    return None
+
+
 def load_price_history(
     symbols: str | Iterable[str] | None = None,
     *,
@@ -21,20 +144,33 @@ def load_price_history(
     start: str | None = None,
     end: str | None = None,
     timeframe: str = "1d",
+    use_store: bool = True,
 ) -> pd.DataFrame:
     """
-    Load long-form OHLCV history from MySQL for the resolved symbol set.
+    Load long-form OHLCV history for the resolved symbol set.
+
+    Rows are served from the local columnar price store, which first pulls
+    any missing, invalidated, or source-changed symbols from MySQL. `use_store=False` (or
+    `FINANCE_PRICE_STORE=0`) reads MySQL directly.
     """
     resolved_symbols = resolve_loader_symbols(symbols=symbols, universe_source=universe_source)
     start_ts, end_ts = normalize_date_range(start=start, end=end)
     normalized_timeframe = normalize_timeframe(timeframe)
 
-    df = load_ohlcv_many_mysql(
-        resolved_symbols,
-        start=start_ts.strftime("%Y-%m-%d") if start_ts is not None else None,
-        end=end_ts.strftime("%Y-%m-%d") if end_ts is not None else None,
-        timeframe=normalized_timeframe,
-    )
+    preloaded = _preloaded_for(resolved_symbols, start_ts, end_ts, normalized_timeframe)
+    if preloaded is not None:
+        df = preloaded.select(resolved_symbols, start_ts, end_ts)
+    elif use_store and price_store_enabled():
+        store = get_price_store()
+        store.sync(resolved_symbols, timeframe=normalized_timeframe, only_stale=True)
+        df = store.load_history(resolved_symbols, start=start_ts, end=end_ts, timeframe=normalized_timeframe)
+    else:
+        df = load_ohlcv_many_mysql(
+            resolved_symbols,
+            start=start_ts.strftime("%Y-%m-%d") if start_ts is not None else None,
+            end=end_ts.strftime("%Y-%m-%d") if end_ts is not None else None,
+            timeframe=normalized_timeframe,
+        )
     if df.empty:
         return df
 
@@ -53,6 +189,50 @@ def load_price_history(
     return df[ordered_columns]
 
 
+def iter_price_history(
+    symbols: str | Iterable[str] | None = None,
+    *,
+    universe_source: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    timeframe: str = "1d",
+    use_store: bool = True,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Yield `(symbol, frame)` pairs with the same columns as `load_price_history`.
+
+    Symbols arrive in ascending order across the whole stream (the MySQL path
+    sorts symbols before splitting them into query chunks), each symbol once
+    with its rows in date order. Only one symbol's rows are held at a time, so
+    per-symbol reductions over a wide universe never materialize the full
+    long-form history.
+    """
+    resolved_symbols = resolve_loader_symbols(symbols=symbols, universe_source=universe_source)
+    start_ts, end_ts = normalize_date_range(start=start, end=end)
+    normalized_timeframe = normalize_timeframe(timeframe)
+
+    preloaded = _preloaded_for(resolved_symbols, start_ts, end_ts, normalized_timeframe)
+    if preloaded is not None:
+        for symbol in sorted(set(resolved_symbols)):
+            frame = preloaded.select([symbol], start_ts, end_ts)
+            if not frame.empty:
+                yield symbol, frame
+        return
+
+    if use_store and price_store_enabled():
+        store = get_price_store()
+        store.sync(resolved_symbols, timeframe=normalized_timeframe, only_stale=True)
+        yield from store.iter_history(resolved_symbols, start=start_ts, end=end_ts, timeframe=normalized_timeframe)
+        return
+
+    yield from iter_ohlcv_mysql(
+        resolved_symbols,
+        start=start_ts.strftime("%Y-%m-%d") if start_ts is not None else None,
+        end=end_ts.strftime("%Y-%m-%d") if end_ts is not None else None,
+        timeframe=normalized_timeframe,
+    )
+
+
 def load_price_matrix(
     symbols: str | Iterable[str] | None = None,
     *,
@@ -61,6 +241,7 @@ def load_price_matrix(
     start: str | None = None,
     end: str | None = None,
     timeframe: str = "1d",
+    use_store: bool = True,
 ) -> pd.DataFrame:
     """
     Load a wide price matrix indexed by date and columned by symbol.
@@ -69,12 +250,27 @@ def load_price_matrix(
     if normalized_field not in VALID_PRICE_FIELDS:
         raise ValueError(f"Unsupported price field: {field!r}")
 
+    if use_store and price_store_enabled():
+        resolved_symbols = resolve_loader_symbols(symbols=symbols, universe_source=universe_source)
+        start_ts, end_ts = normalize_date_range(start=start, end=end)
+        normalized_timeframe = normalize_timeframe(timeframe)
+        store = get_price_store()
+        store.sync(resolved_symbols, timeframe=normalized_timeframe, only_stale=True)
+        return store.load_matrix(
+            resolved_symbols,
+            field=normalized_field,
+            start=start_ts,
+            end=end_ts,
+            timeframe=normalized_timeframe,
+        )
+
     history = load_price_history(
         symbols=symbols,
         universe_source=universe_source,
         start=start,
         end=end,
         timeframe=timeframe,
+        use_store=False,
     )
     if history.empty:
         return history
@@ -106,9 +302,7 @@ def load_latest_prices(
     if not resolved_symbols:
         return pd.DataFrame()
 
-    db = MySQLClient("localhost", "root", "1234", 3306)
-    try:
-        db.use_db("finance_price")
+    with mysql_client("finance_price") as db:
         placeholders = ",".join(["%s"] * len(resolved_symbols))
         latest_where = [f"symbol IN ({placeholders})", "timeframe = %s"]
         latest_params: list[object] = list(resolved_symbols) + [normalized_timeframe]
@@ -137,8 +331,6 @@ def load_latest_prices(
         ORDER BY ph.symbol ASC
         """
         rows = db.query(sql, latest_params + [normalized_timeframe])
-    finally:
-        db.close()
 
     df = pd.DataFrame(rows)
     if df.empty:
@@ -165,9 +357,7 @@ def load_price_freshness_summary(
     normalized_timeframe = normalize_timeframe(timeframe)
     end_ts = normalize_timestamp(end, field_name="end") if end is not None else None
 
-    db = MySQLClient("localhost", "root", "1234", 3306)
-    try:
-        db.use_db("finance_price")
+    with mysql_client("finance_price") as db:
         placeholders = ",".join(["%s"] * len(resolved_symbols))
         where = [f"symbol IN ({placeholders})", "timeframe = %s"]
         params: list[object] = list(resolved_symbols) + [normalized_timeframe]
@@ -188,8 +378,6 @@ def load_price_freshness_summary(
         ORDER BY symbol ASC
         """
         rows = db.query(sql, params)
-    finally:
-        db.close()
 
     df = pd.DataFrame(rows)
     if df.empty:
@@ -255,12 +443,8 @@ def load_price_window_summary(
         ORDER BY symbol ASC
     """
 
-    db = MySQLClient("localhost", "root", "1234", 3306)
-    try:
-        db.use_db("finance_price")
+    with mysql_client("finance_price") as db:
         rows = db.query(sql, params)
-    finally:
-        db.close()
 
     df = pd.DataFrame(rows)
     if df.empty:
@@ -287,9 +471,7 @@ def load_latest_market_date(
     normalized_timeframe = normalize_timeframe(timeframe)
     end_ts = normalize_timestamp(end, field_name="end") if end is not None else None
 
-    db = MySQLClient("localhost", "root", "1234", 3306)
-    try:
-        db.use_db("finance_price")
+    with mysql_client("finance_price") as db:
         where = ["timeframe = %s"]
         params: list[object] = [normalized_timeframe]
 
@@ -303,8 +485,6 @@ def load_latest_market_date(
         WHERE {" AND ".join(where)}
         """
         rows = db.query(sql, params)
-    finally:
-        db.close()
 
     if not rows:
         return None
@@ -313,3 +493,24 @@ def load_latest_market_date(
     if latest_market_date is None:
         return None
     return pd.to_datetime(latest_market_date, errors="coerce")
+
+
+def load_price_data_version(
+    symbols: str | Iterable[str],
+    *,
+    timeframe: str = "1d",
+) -> tuple[object, ...]:
+    """
+    Fingerprint the stored price rows for `symbols` by their latest write-log id.
+
+    Every write to `nyse_price_history` (appends, adj_close restatements after
+    a dividend or split, replaced ranges) appends to `nyse_price_write_log`
+    under an increasing id, so the largest id over `symbols` moves whenever
+    any of their rows change. Only the log's index is read, the same lookup
+    the price store syncs against, so a cache hit never scans the price table.
+    """
+    resolved_symbols = parse_symbol_list(symbols)
+    if not resolved_symbols:
+        return ()
+    marks = load_price_write_marks(resolved_symbols, normalize_timeframe(timeframe))
+    return (PRICE_WRITE_LOG_TABLE, max(marks.values(), default=0))
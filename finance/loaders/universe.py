@@ -7,7 +7,7 @@ import pandas as pd
 from finance.data.pit_universe import PIT_UNIVERSE_METHOD_VERSION
 from finance.data.db.mysql import MySQLClient
 
-from ._common import normalize_date_range, parse_symbol_list, resolve_loader_symbols
+from ._common import normalize_date_range, parse_symbol_list, query_table_data_version, resolve_loader_symbols
 
 PIT_UNIVERSE_MEMBER_COLUMNS = [
     "universe_code",
@@ -139,6 +139,11 @@ def load_asset_profile_status_summary(
     return df
 
 
+def load_asset_profile_data_version(symbols: str | Iterable[str]) -> tuple[object, ...]:
+    """Fingerprint the asset-profile rows behind `load_asset_profile_status_summary`."""
+    return query_table_data_version("finance_meta", "nyse_asset_profile", symbols, max_columns=("updated_at",))
+
+
 def load_symbol_lifecycle_coverage_summary(
     symbols: str | Iterable[str] | None = None,
     *,
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import pandas as pd
+
+"""
+panel.py — Columnar date × symbol × field panel
+
+`BacktestEngine`의 기본 데이터 모델은 ticker-keyed dict({ 'AAPL': df, ... })이고,
+`transform.py`의 함수들은 심볼마다 DataFrame을 복사하며 루프를 돈다.
+
+이 모듈은 같은 데이터를 하나의 float64 블록으로 보관한다.
+    * values  : (dates, symbols, fields) float64
+    * present : (dates, symbols) bool  — 심볼별로 실제 row가 존재하는 날짜
+    * labels  : 문자열 컬럼(예: "Row Kind")용 (dates, symbols) object 배열
+
+transform은 date 축을 따라 한 번에 계산된다. 심볼별 rolling / shift는
+각 심볼의 "실제 row 순서"를 기준으로 하므로 dict 경로와 결과가 같다.
+기존 전략 코드는 `to_dfs()`가 돌려주는 dict-like view로 그대로 동작한다.
+"""
+
+PANEL_DATE_COL = "Date"
+PANEL_SYMBOL_COL = "Ticker"
+
+_PERIOD_FREQ = {
+    "month_start": ("BMS", "head"),
+    "month_end": ("BME", "tail"),
+    "year_start": ("BYS", "head"),
+    "year_end": ("BYE", "tail"),
+}
+
+
+@dataclass(frozen=True)
+class PricePanel:
+    """Aligned float64 block with a shared date index and per-symbol row masks."""
+
+    dates: pd.DatetimeIndex
+    symbols: tuple[str, ...]
+    fields: tuple[str, ...]
+    values: np.ndarray
+    present: np.ndarray
+    labels: dict[str, np.ndarray] = field(default_factory=dict)
+    columns: tuple[str, ...] = ()
+
+    # =====================
+    # Construction / views
+    # =====================
+    @classmethod
+    def from_dfs(cls, dfs: Mapping[str, pd.DataFrame], date_col: str = PANEL_DATE_COL) -> "PricePanel":
+        """
+        ticker-keyed dict을 panel로 변환한다.
+        숫자형 컬럼은 float64 block으로, 나머지 문자열 컬럼은 labels로 보관한다.
+        같은 날짜가 중복되면 마지막 row를 사용한다.
+        """
+        if isinstance(dfs, PanelFrameView):
+            return dfs.panel
+
+        symbols = tuple(dfs.keys())
+        if not symbols:
+            raise ValueError("panel로 변환할 데이터가 없습니다.")
+
+        frames: list[pd.DataFrame] = []
+        columns: list[str] = []
+        numeric_cols: list[str] = []
+        label_cols: list[str] = []
+        for symbol in symbols:
+            df = dfs[symbol]
+            if date_col not in df.columns:
+                raise KeyError(f"[{symbol}] '{date_col}' 컬럼이 없습니다.")
+            d = df.copy()
+            d[date_col] = pd.to_datetime(d[date_col])
+            d = d.sort_values(date_col).drop_duplicates(subset=[date_col], keep="last")
+            frames.append(d)
+            for col in d.columns:
+                if col in columns:
+                    continue
+                columns.append(col)
+                if col in (date_col, PANEL_SYMBOL_COL):
+                    continue
+                if pd.api.types.is_numeric_dtype(d[col]) or pd.api.types.is_bool_dtype(d[col]):
+                    numeric_cols.append(col)
+                else:
+                    label_cols.append(col)
+
+        dates = pd.DatetimeIndex(
+            np.unique(np.concatenate([frame[date_col].to_numpy() for frame in frames])),
+            name=date_col,
+        )
+        n_dates, n_symbols, n_fields = len(dates), len(symbols), len(numeric_cols)
+        values = np.full((n_dates, n_symbols, n_fields), np.nan, dtype=np.float64)
+        present = np.zeros((n_dates, n_symbols), dtype=bool)
+        labels = {col: np.full((n_dates, n_symbols), None, dtype=object) for col in label_cols}
+
+        for j, frame in enumerate(frames):
+            rows = dates.get_indexer(frame[date_col])
+            present[rows, j] = True
+            for k, col in enumerate(numeric_cols):
+                if col in frame.columns:
+                    values[rows, j, k] = pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=np.float64)
+            for col in label_cols:
+                if col in frame.columns:
+                    labels[col][rows, j] = frame[col].to_numpy(dtype=object)
+
+        return cls(
+            dates=dates,
+            symbols=symbols,
+            fields=tuple(numeric_cols),
+            values=values,
+            present=present,
+            labels=labels,
+            columns=tuple(columns),
+        )
+
+    def to_dfs(self) -> "PanelFrameView":
+        """기존 dict API와 호환되는 read view를 돌려준다."""
+        return PanelFrameView(self)
+
+    def field(self, name: str) -> np.ndarray:
+        """(dates, symbols) 2-D view. 존재하지 않는 row는 NaN."""
+        if name not in self.fields:
+            raise KeyError(f"'{name}' 컬럼이 없습니다.")
+        return np.where(self.present, self.values[:, :, self.fields.index(name)], np.nan)
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        j = self.symbols.index(symbol)
+        rows = np.flatnonzero(self.present[:, j])
+        data: dict[str, object] = {}
+        for col in self.columns:
+            if col == PANEL_DATE_COL:
+                data[col] = self.dates[rows]
+            elif col == PANEL_SYMBOL_COL:
+                data[col] = [symbol] * len(rows)
+            elif col in self.labels:
+                data[col] = self.labels[col][rows, j]
+            else:
+                data[col] = self.values[rows, j, self.fields.index(col)]
+        return pd.DataFrame(data, columns=list(self.columns))
+
+    # =====================
+    # Transforms
+    # =====================
+    def add_ma(self, windows=(5, 10, 20, 60, 120), price_col: str = "Close", prefix: str = "MA") -> "PricePanel":
+        """`transform.add_ma`와 동일: 심볼별 row 기준 rolling 평균 후 가장 긴 MA가 NaN인 row 제외."""
+        if isinstance(windows, int):
+            windows = (windows,)
+        price = self._require_field(price_col)
+        order, _ = _compact_order(self.present)
+        compact = pd.DataFrame(np.take_along_axis(price, order, axis=0))
+
+        new_fields = {
+            f"{prefix}{w}": _scatter(
+                compact.rolling(window=w, min_periods=w).mean().to_numpy(),
+                order,
+                self.present,
+            )
+            for w in windows
+        }
+        out = self._with_fields(new_fields)
+        return out._drop_rows_where_nan(f"{prefix}{max(windows)}")
+
+    def filter_period(self, option: str) -> "PricePanel":
+        """`transform.filter_ohlcv`와 동일: 기간별 첫/마지막 실제 거래일 + 기간 배당금 합계."""
+        if option not in _PERIOD_FREQ:
+            raise ValueError(f"지원하지 않는 option입니다: {option}")
+        freq, selector = _PERIOD_FREQ[option]
+        dividends = self._require_field("Dividends")
+
+        if len(self.dates) == 0:
+            return self
+        grouped = pd.Series(np.arange(len(self.dates)), index=self.dates).groupby(pd.Grouper(freq=freq))
+        codes = grouped.ngroup().to_numpy()
+        bin_labels = pd.DatetimeIndex(list(grouped.groups.keys()))[codes]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+
+        row_index = np.arange(len(self.dates))[:, None]
+        if selector == "head":
+            picked = np.minimum.reduceat(np.where(self.present, row_index, len(self.dates)), starts, axis=0)
+            valid = picked < len(self.dates)
+        else:
+            picked = np.maximum.reduceat(np.where(self.present, row_index, -1), starts, axis=0)
+            valid = picked >= 0
+        dividend_sums = np.add.reduceat(np.where(self.present, np.nan_to_num(dividends), 0.0), starts, axis=0)
+
+        period_idx, symbol_idx = np.nonzero(valid)
+        rows = picked[period_idx, symbol_idx]
+        present = np.zeros_like(self.present)
+        present[rows, symbol_idx] = True
+
+        # dict 경로는 기간 합계를 bin label(Date)로 reindex하므로,
+        # 선택된 거래일이 label과 같은 경우에만 합계가 붙고 나머지는 0이 된다.
+        on_label = np.asarray(self.dates == bin_labels)[rows]
+        values = self.values.copy()
+        values[rows, symbol_idx, self.fields.index("Dividends")] = np.where(
+            on_label,
+            dividend_sums[period_idx, symbol_idx],
+            0.0,
+        )
+        return replace(self, values=values, present=present)._compact_dates()
+
+    def align_dates(self) -> "PricePanel":
+        """`transform.align_dfs_by_date_intersection`와 동일: 모든 심볼에 row가 있는 날짜만 유지."""
+        keep = self.present.all(axis=1)
+        if not keep.any():
+            raise ValueError("공통 Date가 없습니다.")
+        return self._take_dates(keep)
+
+    def slice(self, start=None, end=None) -> "PricePanel":
+        """`transform.slice_ohlcv`와 동일: end가 None이면 오늘 날짜까지."""
+        end_ts = pd.Timestamp.today().normalize() if end is None else pd.to_datetime(end)
+        keep = self.dates <= end_ts
+        if start is not None:
+            keep &= self.dates >= pd.to_datetime(start)
+        return self._take_dates(np.asarray(keep))
+
+    def drop_columns(self, cols) -> "PricePanel":
+        if isinstance(cols, str):
+            cols = [cols]
+        missing = [c for c in cols if c not in self.fields and c not in self.labels]
+        if missing:
+            raise KeyError(f"{missing} not found in axis")
+        keep_idx = [k for k, name in enumerate(self.fields) if name not in cols]
+        return replace(
+            self,
+            fields=tuple(self.fields[k] for k in keep_idx),
+            values=self.values[:, :, keep_idx],
+            labels={name: arr for name, arr in self.labels.items() if name not in cols},
+            columns=tuple(c for c in self.columns if c not in cols),
+        )
+
+    def add_interval_returns(
+        self,
+        return_intervals: list,
+        price_col: str = "Close",
+        suffix: str = "MReturn",
+    ) -> "PricePanel":
+        """`transform.add_interval_returns`와 동일: 심볼별 row 기준 (P_t / P_{t-n}) - 1."""
+        price = self._require_field(price_col)
+        order, _ = _compact_order(self.present)
+        compact = np.take_along_axis(price, order, axis=0)
+
+        new_fields = {}
+        for n in return_intervals:
+            shifted = np.full_like(compact, np.nan)
+            if n < len(compact):
+                shifted[n:] = compact[: len(compact) - n]
+            new_fields[f"{n}{suffix}"] = _scatter(compact / shifted - 1, order, self.present)
+        out = self._with_fields(new_fields)
+        return out._drop_rows_where_nan(f"{max(return_intervals)}{suffix}")
+
+    def add_avg_score(
+        self,
+        return_cols=("1MReturn", "3MReturn", "6MReturn", "12MReturn"),
+        weights: dict[str, float] | None = None,
+        out_col: str = "Avg Score",
+    ) -> "PricePanel":
+        """`transform.add_avg_score`와 동일한 NaN-skip 평균 / 가중 평균."""
+        missing = [c for c in return_cols if c not in self.fields]
+        if missing:
+            raise KeyError(f"다음 컬럼이 없습니다 : {missing}")
+
+        selected = self.values[:, :, [self.fields.index(c) for c in return_cols]]
+        active = ~np.isnan(selected)
+        filled = np.where(active, selected, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if weights is None:
+                count = active.sum(axis=2)
+                score = np.where(count > 0, filled.sum(axis=2) / count, np.nan)
+            else:
+                weight_vec = np.array([float(weights.get(c, 0.0)) for c in return_cols], dtype=np.float64)
+                denom = (active * weight_vec).sum(axis=2)
+                denom = np.where(denom == 0.0, np.nan, denom)
+                score = (filled * weight_vec).sum(axis=2) / denom
+        return self._with_fields({out_col: score})
+
+    def select_rows_by_interval_with_ends(self, interval: int) -> "PricePanel":
+        """`transform.select_rows_by_interval_with_ends`와 동일: 심볼별 첫/마지막 row는 항상 포함."""
+        if interval <= 0:
+            raise ValueError("interval은 1이상의 정수여야 합니다")
+        ordinal = np.cumsum(self.present, axis=0) - 1
+        counts = self.present.sum(axis=0)
+        keep = self.present & ((ordinal % interval == 0) | (ordinal == counts - 1))
+        return replace(self, present=keep)._compact_dates()
+
+    # =====================
+    # Internal helpers
+    # =====================
+    def _require_field(self, name: str) -> np.ndarray:
+        if name not in self.fields:
+            raise KeyError(f"'{name}' 컬럼이 없습니다.")
+        return self.values[:, :, self.fields.index(name)]
+
+    def _with_fields(self, new_fields: dict[str, np.ndarray]) -> "PricePanel":
+        fields = list(self.fields)
+        columns = list(self.columns)
+        existing = {name: arr for name, arr in new_fields.items() if name in fields}
+        appended = {name: arr for name, arr in new_fields.items() if name not in fields}
+
+        values = self.values
+        if existing:
+            values = values.copy()
+            for name, arr in existing.items():
+                values[:, :, fields.index(name)] = arr
+        if appended:
+            values = np.concatenate([values, np.stack(list(appended.values()), axis=2)], axis=2)
+            fields.extend(appended.keys())
+            columns.extend(name for name in appended if name not in columns)
+        return replace(self, fields=tuple(fields), values=values, columns=tuple(columns))
+
+    def _drop_rows_where_nan(self, name: str) -> "PricePanel":
+        present = self.present & ~np.isnan(self._require_field(name))
+        return replace(self, present=present)._compact_dates()
+
+    def _take_dates(self, keep: np.ndarray) -> "PricePanel":
+        if keep.all():
+            return self
+        return replace(
+            self,
+            dates=self.dates[keep],
+            values=self.values[keep],
+            present=self.present[keep],
+            labels={name: arr[keep] for name, arr in self.labels.items()},
+        )
+
+    def _compact_dates(self) -> "PricePanel":
+        return self._take_dates(self.present.any(axis=1))
+
+
+class PanelFrameView(Mapping):
+    """
+    `PricePanel`을 기존 ticker-keyed dict처럼 읽는 view.
+    심볼별 DataFrame은 처음 접근할 때 만들어지고 캐시된다.
+    """
+
+    def __init__(self, panel: PricePanel) -> None:
+        self.panel = panel
+        self._frames: dict[str, pd.DataFrame] = {}
+
+    def __getitem__(self, symbol: str) -> pd.DataFrame:
+        if symbol not in self._frames:
+            if symbol not in self.panel.symbols:
+                raise KeyError(symbol)
+            self._frames[symbol] = self.panel.frame(symbol)
+        return self._frames[symbol]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.panel.symbols)
+
+    def __len__(self) -> int:
+        return len(self.panel.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.panel.symbols
+
+
+def _compact_order(present: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    심볼별 실제 row를 위로 모으는 row 순서.
+    compact[k, j] 는 j 심볼의 k번째 실제 row이며, rolling / shift를 심볼 row 기준으로 계산할 수 있다.
+    """
+    order = np.argsort(~present, axis=0, kind="stable")
+    return order, present.sum(axis=0)
+
+
+def _scatter(compact: np.ndarray, order: np.ndarray, present: np.ndarray) -> np.ndarray:
+    out = np.empty_like(compact)
+    np.put_along_axis(out, order, compact, axis=0)
+    out[~present] = np.nan
+    return out
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from multiprocessing.context import BaseContext
+
+"""
+process_pool.py — process pool start method 선택
+
+sweep / swing batch / futures pattern validation이 같은 규칙으로 worker를 띄운다.
+fork는 부모가 데운 캐시와 배열을 복사 없이 물려주지만, 다른 thread가
+pymysql · connection pool · HTTP lock을 잡은 순간에 fork하면 자식이 그 lock에서 멈출 수 있다.
+그래서 fork는 현재 프로세스에 thread가 하나뿐일 때만 쓰고,
+Streamlit 세션이나 job thread 안에서는 forkserver(없으면 spawn)로 띄운다.
+forkserver/spawn worker는 initializer 인자를 pickle로 받으므로
+호출부는 필요한 입력을 shared memory layout이나 initargs로 모두 넘겨야 한다.
+"""
+
+
+def process_pool_context() -> BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    for method in ("forkserver", "spawn"):
+        if method in methods:
+            return multiprocessing.get_context(method)
+    return multiprocessing.get_context()
@@ -8,13 +8,17 @@ Path split:
   DB-backed runtime samples that validate the loader/engine/strategy path
 """
 
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from math import comb
-from functools import lru_cache
+from typing import Any
 from IPython.display import display
 import pandas as pd
 import numpy as np
 from .engine import BacktestEngine
 from .strategy import (
+    AvgDollarVolumeMatrix,
     EqualWeightStrategy,
     GTAA3Strategy,
     GlobalRelativeStrengthStrategy,
@@ -44,15 +48,20 @@ from finance.data.asset_profile import(
 )
 from finance.data.macro import collect_and_store_macro_series
 from .loaders import (
+    iter_price_history,
+    load_asset_profile_data_version,
     load_asset_profile_status_summary,
     load_factor_snapshot,
     load_macro_snapshot,
-    load_price_history,
+    load_price_data_version,
     load_statement_factor_snapshot_shadow,
+    load_statement_factors_data_version,
     load_statement_factors_shadow,
+    load_statement_fundamentals_data_version,
     load_statement_fundamentals_shadow,
     load_statement_quality_snapshot_strict,
 )
+from .snapshot_cache import PinnedSnapshotInputs, VersionedSnapshotCache
 
 from .data.fundamentals import(
     upsert_fundamentals
@@ -665,7 +674,7 @@ def get_gtaa3_from_db(
     effective_defensive_tickers = _normalize_symbol_list(
         defensive_tickers if defensive_tickers is not None else GTAA_DEFAULT_DEFENSIVE_TICKERS
     )
-    avg_dollar_volume_20d_by_date: dict[str, dict[pd.Timestamp, float]] = {}
+    avg_dollar_volume_20d_by_date: AvgDollarVolumeMatrix | None = None
     if float(min_avg_dollar_volume_20d_m or 0.0) > 0.0:
         avg_dollar_volume_20d_by_date = _get_cached_snapshot_strategy_avg_dollar_volume_20d(
             symbols=tickers,
@@ -1369,12 +1378,63 @@ def _filter_global_relative_strength_usable_dfs(
     return filtered, excluded_tickers
 
 
-def _clone_price_df_map(price_dfs: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
-    return {symbol: df.copy(deep=True) for symbol, df in price_dfs.items()}
+_SNAPSHOT_INPUT_CACHE = VersionedSnapshotCache()
+_PINNED_SNAPSHOT_INPUTS: ContextVar[PinnedSnapshotInputs | None] = ContextVar(
+    "finance_pinned_snapshot_inputs",
+    default=None,
+)
+_SNAPSHOT_INPUT_RECORDER: ContextVar[dict[Hashable, Any] | None] = ContextVar(
+    "finance_snapshot_input_recorder",
+    default=None,
+)
+
+
+def snapshot_input_cache_stats() -> dict[str, object]:
+    """strict snapshot 입력 캐시의 hit/miss/stale/eviction 통계."""
+    return _SNAPSHOT_INPUT_CACHE.stats()
+
+
+def clear_snapshot_input_cache() -> None:
+    _SNAPSHOT_INPUT_CACHE.clear()
+
 
+@contextmanager
+def record_snapshot_inputs() -> Iterator[dict[Hashable, Any]]:
+    """블록 안에서 읽은 snapshot 입력을 key별로 모은다. sweep이 worker에 pin할 입력을 고른다."""
+    recorded: dict[Hashable, Any] = {}
+    token = _SNAPSHOT_INPUT_RECORDER.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _SNAPSHOT_INPUT_RECORDER.reset(token)
 
-@lru_cache(maxsize=12)
-def _cached_snapshot_strategy_price_dfs(
+
+@contextmanager
+def use_pinned_snapshot_inputs(pinned: PinnedSnapshotInputs) -> Iterator[PinnedSnapshotInputs]:
+    """pin된 key는 data version 조회 없이 고정값으로 돌려준다."""
+    token = _PINNED_SNAPSHOT_INPUTS.set(pinned)
+    try:
+        yield pinned
+    finally:
+        _PINNED_SNAPSHOT_INPUTS.reset(token)
+
+
+def _get_snapshot_input(
+    key: tuple[Hashable, ...],
+    load_version: Callable[[], Hashable],
+    build: Callable[[], Any],
+) -> Any:
+    pinned = _PINNED_SNAPSHOT_INPUTS.get()
+    if pinned is not None and key in pinned:
+        return pinned.get(key)
+    value = _SNAPSHOT_INPUT_CACHE.get_or_build(key, load_version(), build)
+    recorded = _SNAPSHOT_INPUT_RECORDER.get()
+    if recorded is not None:
+        recorded[key] = value
+    return value
+
+
+def _build_snapshot_strategy_price_dfs_from_db(
     symbols_key: tuple[str, ...],
     option: str,
     start: str | None,
@@ -1401,22 +1461,17 @@ def _get_cached_snapshot_strategy_price_dfs(
     end: str | None,
     timeframe: str,
     trend_filter_window: int | None,
-) -> dict[str, pd.DataFrame]:
+) -> Mapping[str, pd.DataFrame]:
     symbols_key = tuple(_normalize_symbol_list(symbols))
-    return _clone_price_df_map(
-        _cached_snapshot_strategy_price_dfs(
-            symbols_key,
-            option,
-            start,
-            end,
-            timeframe,
-            trend_filter_window,
-        )
+    args = (symbols_key, option, start, end, timeframe, trend_filter_window)
+    return _get_snapshot_input(
+        ("snapshot_strategy_price_dfs", *args),
+        lambda: load_price_data_version(symbols_key, timeframe=timeframe),
+        lambda: _build_snapshot_strategy_price_dfs_from_db(*args),
     )
 
 
-@lru_cache(maxsize=12)
-def _cached_snapshot_strategy_price_first_dates(
+def _build_snapshot_strategy_price_first_dates(
     symbols_key: tuple[str, ...],
     option: str,
     start: str | None,
@@ -1463,69 +1518,73 @@ def _get_cached_snapshot_strategy_price_first_dates(
     timeframe: str,
     trend_filter_window: int | None,
     min_history_months: int,
-) -> dict[str, pd.Timestamp | None]:
+) -> Mapping[str, pd.Timestamp | None]:
     symbols_key = tuple(_normalize_symbol_list(symbols))
-    return dict(
-        _cached_snapshot_strategy_price_first_dates(
-            symbols_key,
-            option,
-            start,
-            end,
-            timeframe,
-            trend_filter_window,
-            int(min_history_months),
-        )
+    args = (symbols_key, option, start, end, timeframe, trend_filter_window, int(min_history_months))
+    return _get_snapshot_input(
+        ("snapshot_strategy_price_first_dates", *args),
+        lambda: load_price_data_version(symbols_key, timeframe=timeframe),
+        lambda: _build_snapshot_strategy_price_first_dates(*args),
     )
 
 
-@lru_cache(maxsize=12)
-def _cached_snapshot_strategy_avg_dollar_volume_20d(
+def _build_snapshot_strategy_avg_dollar_volume_20d(
     symbols_key: tuple[str, ...],
     start: str | None,
     end: str | None,
     timeframe: str,
     lookback_days: int,
-) -> dict[str, dict[pd.Timestamp, float]]:
+) -> AvgDollarVolumeMatrix:
+    empty = AvgDollarVolumeMatrix(dates=np.array([], dtype="datetime64[ns]"), symbols=(), values=np.empty((0, 0)))
     if lookback_days <= 0:
-        return {}
+        return empty
 
     history_start = _history_start_with_buffer(
         start,
         days=max(int(lookback_days) * 5, 60),
     )
-    history = load_price_history(
+    # 심볼 단위로 흘려받아 전체 long-form 이력을 한꺼번에 들고 있지 않는다.
+    symbols: list[str] = []
+    per_symbol: list[tuple[np.ndarray, np.ndarray]] = []
+    for symbol, history in iter_price_history(
         symbols=list(symbols_key),
         start=history_start,
         end=end,
         timeframe=timeframe,
-    )
-    if history.empty:
-        return {}
-
-    working = history.copy()
-    working["symbol"] = working["symbol"].astype(str).str.strip().str.upper()
-    working["date"] = pd.to_datetime(working["date"], errors="coerce")
-    working["close"] = pd.to_numeric(working["close"], errors="coerce")
-    working["volume"] = pd.to_numeric(working["volume"], errors="coerce")
-    working = working.dropna(subset=["symbol", "date", "close", "volume"]).sort_values(["symbol", "date"])
-    if working.empty:
-        return {}
-
-    result: dict[str, dict[pd.Timestamp, float]] = {}
-    for symbol, group in working.groupby("symbol", sort=False):
-        symbol_df = group[["date", "close", "volume"]].copy()
-        symbol_df["dollar_volume"] = symbol_df["close"] * symbol_df["volume"]
-        symbol_df["avg_dollar_volume_20d"] = (
-            symbol_df["dollar_volume"]
+    ):
+        symbol_df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(history["date"], errors="coerce"),
+                "close": pd.to_numeric(history["close"], errors="coerce"),
+                "volume": pd.to_numeric(history["volume"], errors="coerce"),
+            }
+        )
+        symbol_df = symbol_df.dropna(subset=["date", "close", "volume"]).sort_values("date", kind="stable")
+        if symbol_df.empty:
+            continue
+        avg_dollar_volume = (
+            (symbol_df["close"] * symbol_df["volume"])
             .rolling(window=int(lookback_days), min_periods=int(lookback_days))
             .mean()
+            .to_numpy(dtype=float)
         )
-        valid = symbol_df.dropna(subset=["avg_dollar_volume_20d"])
-        result[str(symbol)] = {
-            pd.Timestamp(row["date"]).normalize(): float(row["avg_dollar_volume_20d"])
-            for _, row in valid.iterrows()
-        }
-    return result
+        valid = ~np.isnan(avg_dollar_volume)
+        symbols.append(str(symbol).strip().upper())
+        per_symbol.append(
+            (
+                pd.DatetimeIndex(symbol_df["date"]).normalize().as_unit("ns").to_numpy()[valid],
+                avg_dollar_volume[valid],
+            )
+        )
+    if not symbols:
+        return empty
+
+    # 거래일 합집합 x 심볼 float32 matrix. 값이 없는 칸은 NaN으로 남는다.
+    dates = np.unique(np.concatenate([symbol_dates for symbol_dates, _ in per_symbol]))
+    values = np.full((len(dates), len(symbols)), np.nan, dtype=np.float32)
+    for col, (symbol_dates, symbol_values) in enumerate(per_symbol):
+        values[np.searchsorted(dates, symbol_dates), col] = symbol_values
+    return AvgDollarVolumeMatrix(dates=dates, symbols=tuple(symbols), values=values)
 
 
 def _get_cached_snapshot_strategy_avg_dollar_volume_20d(
@@ -1535,35 +1594,18 @@ def _get_cached_snapshot_strategy_avg_dollar_volume_20d(
     end: str | None,
     timeframe: str,
     lookback_days: int = STRICT_INVESTABILITY_DEFAULT_LIQUIDITY_LOOKBACK_DAYS,
-) -> dict[str, dict[pd.Timestamp, float]]:
+) -> AvgDollarVolumeMatrix:
     symbols_key = tuple(_normalize_symbol_list(symbols))
-    cached = _cached_snapshot_strategy_avg_dollar_volume_20d(
-        symbols_key,
-        start,
-        end,
-        timeframe,
-        int(lookback_days),
+    args = (symbols_key, start, end, timeframe, int(lookback_days))
+    return _get_snapshot_input(
+        ("snapshot_strategy_avg_dollar_volume_20d", *args),
+        lambda: load_price_data_version(symbols_key, timeframe=timeframe),
+        lambda: _build_snapshot_strategy_avg_dollar_volume_20d(*args),
     )
-    return {
-        str(symbol): dict(per_date)
-        for symbol, per_date in cached.items()
-    }
 
 
-@lru_cache(maxsize=12)
-def _cached_statement_factors_shadow(
-    symbols_key: tuple[str, ...],
-    freq: str,
-    end: str | None,
-) -> pd.DataFrame:
-    factor_history = load_statement_factors_shadow(
-        symbols=list(symbols_key),
-        freq=freq,
-        end=end,
-    )
-    if factor_history is None:
-        return pd.DataFrame()
-    return factor_history.copy(deep=True)
+def _frame_or_empty(frame: pd.DataFrame | None) -> pd.DataFrame:
+    return pd.DataFrame() if frame is None else frame
 
 
 def _get_cached_statement_factors_shadow(
@@ -1573,23 +1615,11 @@ def _get_cached_statement_factors_shadow(
     end: str | None,
 ) -> pd.DataFrame:
     symbols_key = tuple(_normalize_symbol_list(symbols))
-    return _cached_statement_factors_shadow(symbols_key, freq, end).copy(deep=True)
-
-
-@lru_cache(maxsize=12)
-def _cached_statement_fundamentals_shadow(
-    symbols_key: tuple[str, ...],
-    freq: str,
-    end: str | None,
-) -> pd.DataFrame:
-    statement_shadow = load_statement_fundamentals_shadow(
-        symbols=list(symbols_key),
-        freq=freq,
-        end=end,
+    return _get_snapshot_input(
+        ("statement_factors_shadow", symbols_key, freq, end),
+        lambda: load_statement_factors_data_version(symbols_key, freq=freq),
+        lambda: _frame_or_empty(load_statement_factors_shadow(symbols=list(symbols_key), freq=freq, end=end)),
     )
-    if statement_shadow is None:
-        return pd.DataFrame()
-    return statement_shadow.copy(deep=True)
 
 
 def _get_cached_statement_fundamentals_shadow(
@@ -1599,17 +1629,11 @@ def _get_cached_statement_fundamentals_shadow(
     end: str | None,
 ) -> pd.DataFrame:
     symbols_key = tuple(_normalize_symbol_list(symbols))
-    return _cached_statement_fundamentals_shadow(symbols_key, freq, end).copy(deep=True)
-
-
-@lru_cache(maxsize=12)
-def _cached_asset_profile_status_summary(
-    symbols_key: tuple[str, ...],
-) -> pd.DataFrame:
-    summary = load_asset_profile_status_summary(list(symbols_key))
-    if summary is None:
-        return pd.DataFrame()
-    return summary.copy(deep=True)
+    return _get_snapshot_input(
+        ("statement_fundamentals_shadow", symbols_key, freq, end),
+        lambda: load_statement_fundamentals_data_version(symbols_key, freq=freq),
+        lambda: _frame_or_empty(load_statement_fundamentals_shadow(symbols=list(symbols_key), freq=freq, end=end)),
+    )
 
 
 def _get_cached_asset_profile_status_summary(
@@ -1617,7 +1641,11 @@ def _get_cached_asset_profile_status_summary(
     symbols,
 ) -> pd.DataFrame:
     symbols_key = tuple(_normalize_symbol_list(symbols))
-    return _cached_asset_profile_status_summary(symbols_key).copy(deep=True)
+    return _get_snapshot_input(
+        ("asset_profile_status_summary", symbols_key),
+        lambda: load_asset_profile_data_version(symbols_key),
+        lambda: _frame_or_empty(load_asset_profile_status_summary(list(symbols_key))),
+    )
 
 
 def _build_dynamic_pit_membership_map(
@@ -2187,7 +2215,7 @@ def _run_statement_shadow_snapshot_from_db(
         trend_filter_window=(trend_filter_window if trend_filter_enabled else None),
         min_history_months=int(min_history_months or 0),
     )
-    avg_dollar_volume_20d_by_date: dict[str, dict[pd.Timestamp, float]] = {}
+    avg_dollar_volume_20d_by_date: AvgDollarVolumeMatrix | None = None
     if float(min_avg_dollar_volume_20d_m or 0.0) > 0.0:
         avg_dollar_volume_20d_by_date = _get_cached_snapshot_strategy_avg_dollar_volume_20d(
             symbols=candidate_tickers,
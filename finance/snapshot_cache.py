@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+SNAPSHOT_CACHE_MAX_MB_ENV = "FINANCE_SNAPSHOT_CACHE_MAX_MB"
+DEFAULT_SNAPSHOT_CACHE_MAX_MB = 512
+
+
+def snapshot_cache_max_bytes() -> int:
+    raw = str(os.getenv(SNAPSHOT_CACHE_MAX_MB_ENV, DEFAULT_SNAPSHOT_CACHE_MAX_MB)).strip()
+    try:
+        megabytes = float(raw)
+    except ValueError:
+        megabytes = float(DEFAULT_SNAPSHOT_CACHE_MAX_MB)
+    return max(int(megabytes * 1024 * 1024), 0)
+
+
+def _freeze(value: Any) -> Any:
+    # mapping은 저장 시점에 한 번만 읽기 전용으로 감싼다.
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    # 읽기 전용 proxy는 pickle되지 않으므로 process 경계를 넘길 때 dict로 되돌린다.
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+def _share(value: Any) -> Any:
+    """
+    Hand out a cached value without duplicating its data.
+
+    Frames are returned as shallow copies: under pandas copy-on-write a
+    caller's column writes land in its own buffers, never in the cached
+    frame. Mappings are already read-only proxies.
+    """
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=False)
+    if isinstance(value, Mapping) and any(isinstance(item, pd.DataFrame) for item in value.values()):
+        return MappingProxyType({key: _share(item) for key, item in value.items()})
+    return value
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Approximate the memory a cached value holds (frames measured deeply)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(getattr(value, "nbytes", None), (int, np.integer)):
+        # ndarray와 배열 묶음(`AvgDollarVolumeMatrix` 등)은 스스로 크기를 알린다.
+        return int(value.nbytes)
+    if isinstance(value, Mapping):
+        size = sys.getsizeof(value)
+        if not value:
+            return size
+        first_key, first_item = next(iter(value.items()))
+        if isinstance(first_item, (Mapping, pd.DataFrame, np.ndarray)):
+            return size + sum(sys.getsizeof(key) + estimate_nbytes(item) for key, item in value.items())
+        # 스칼라 값 mapping은 첫 항목 크기로 근사해 수백만 항목을 하나씩 세지 않는다.
+        return size + len(value) * (sys.getsizeof(first_key) + sys.getsizeof(first_item))
+    return int(sys.getsizeof(value))
+
+
+@dataclass
+class _CacheEntry:
+    version: Hashable
+    value: Any
+    nbytes: int
+
+
+class VersionedSnapshotCache:
+    """
+    In-memory LRU of loader results keyed on arguments plus a data version.
+
+    A lookup only hits when the stored version equals the caller's current
+    one, so new or rewritten source rows (a different version tuple) rebuild
+    the entry instead of serving stale data. The cache is bounded by the
+    estimated size of its values rather than by entry count, and evicts the
+    least recently used entries first. Values larger than the whole budget
+    are returned without being stored.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = snapshot_cache_max_bytes() if max_bytes is None else max(int(max_bytes), 0)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "evictions": 0,
+            "oversized": 0,
+        }
+
+    def get_or_build(self, key: Hashable, version: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return _share(entry.value)
+            if entry is not None:
+                self._stats["stale"] += 1
+                self._drop(key)
+            self._stats["misses"] += 1
+
+        # 빌드는 락 밖에서 한다. 같은 키가 동시에 빌드되면 나중 결과가 남는다.
+        value = _freeze(build())
+        nbytes = estimate_nbytes(value)
+        with self._lock:
+            if nbytes > self.max_bytes:
+                self._stats["oversized"] += 1
+            else:
+                if key in self._entries:
+                    self._drop(key)
+                self._entries[key] = _CacheEntry(version=version, value=value, nbytes=nbytes)
+                self._bytes += nbytes
+                while self._bytes > self.max_bytes and self._entries:
+                    self._drop(next(iter(self._entries)))
+                    self._stats["evictions"] += 1
+        return _share(value)
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class PinnedSnapshotInputs:
+    """
+    Loader results fixed for the duration of one batch of runs.
+
+    A parameter sweep reads its inputs at one point in time; every variant
+    should see exactly those inputs without another version query. Pinned
+    values are stored and handed out like cache hits, and `to_payload()`
+    returns picklable copies to rebuild the pins in worker processes.
+    """
+
+    def __init__(self, values: Mapping[Hashable, Any] | None = None):
+        self._values = {key: _freeze(value) for key, value in (values or {}).items()}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: Hashable) -> Any:
+        return _share(self._values[key])
+
+    def to_payload(self) -> dict[Hashable, Any]:
+        return {key: _thaw(value) for key, value in self._values.items()}
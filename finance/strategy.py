@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
 
 """
 3️⃣ strategy.py — Decision & Simulation Layer
@@ -50,15 +52,14 @@ def equal_weight(
 
     base_df = dfs[tickers[0]].sort_values("Date").reset_index(drop=True)
     dates = base_df["Date"]
+    closes_mat = _strategy_matrix(dfs, tickers, "Close")
 
-    rows = []
+    rows = _ResultColumns()
 
-    prev_close = None
-    prev_end_balance = None
     prev_total_balance = None
     for i, date in enumerate(dates):
 
-        closes = [dfs[t].iloc[i]["Close"] for t in tickers]
+        closes = list(closes_mat[i])
 
         # =========================
         # Return & End Balance
@@ -72,10 +73,9 @@ def equal_weight(
             end_balances = [0] * n_assets
             total_balance = start_balance
         else:
-            returns = [(c / pc) - 1 for c, pc in zip(closes, prev_close)]
-            end_balances = [
-                nb * (1 + r) for nb, r in zip(next_balances, returns)
-            ]
+            return_vec = (closes_mat[i] / closes_mat[i - 1]) - 1
+            returns = list(return_vec)
+            end_balances = list(np.asarray(next_balances) * (1 + return_vec))
 
             total_balance = sum(end_balances)
             total_return = (
@@ -111,11 +111,9 @@ def equal_weight(
             "Rebalancing": rebalancing
         })
 
-        prev_close = closes
-        prev_end_balance = end_balances
         prev_total_balance = total_balance
 
-    return pd.DataFrame(rows)
+    return rows.to_frame()
 
 
 
@@ -146,7 +144,7 @@ def gtaa3(
     drawdown_guardrail_benchmark: str | None = None,
     drawdown_guardrail_df: pd.DataFrame | None = None,
     min_avg_dollar_volume_20d_m: float = 0.0,
-    avg_dollar_volume_20d_by_date: dict[str, dict[pd.Timestamp, float]] | None = None,
+    avg_dollar_volume_20d_by_date: "AvgDollarVolumeMatrix | dict[str, dict[pd.Timestamp, float]] | None" = None,
     rebalance_interval: int = 1,
 ) -> dict:
     """
@@ -206,14 +204,28 @@ def gtaa3(
     )
     guardrail_close_history: list[float] = []
     strategy_balance_history: list[float] = []
-    effective_avg_dollar_volume = dict(avg_dollar_volume_20d_by_date or {})
+    effective_avg_dollar_volume = _as_avg_dollar_volume_matrix(avg_dollar_volume_20d_by_date)
 
     base_df = dfs[tickers[0]].sort_values("Date").reset_index(drop=True)
     dates = base_df["Date"]
+    normalized_dates = [pd.to_datetime(date).normalize() for date in dates]
+
+    closes_mat = _float_matrix(_strategy_matrix(dfs, tickers, "Close"))
+    scores_mat = _float_matrix(_strategy_matrix(dfs, tickers, score_col))
+    mas_mat = _float_matrix(_strategy_matrix(dfs, tickers, filter_ma))
+    # 랭킹 key: NaN score는 가장 뒤로 (-inf)
+    score_key_mat = np.where(np.isnan(scores_mat), -np.inf, scores_mat)
+    with np.errstate(invalid="ignore"):
+        investable_mat = (closes_mat >= mas_mat) & (closes_mat >= max(float(min_price or 0.0), 0.0))
+    liquidity_ok_mat = _liquidity_pass_matrix(
+        effective_avg_dollar_volume,
+        tickers,
+        normalized_dates,
+        min_avg_dollar_volume_20d_m,
+    )
 
-    rows = []
+    rows = _ResultColumns()
 
-    prev_close = None
     prev_total_balance = None
     end_ticker_to_index: list[tuple[str, int]] = []
     next_balances: list[float] = []
@@ -221,29 +233,16 @@ def gtaa3(
 
     for i, date in enumerate(dates):
 
-        closes = [dfs[t].iloc[i]["Close"] for t in tickers]
-        scores = [dfs[t].iloc[i][score_col] for t in tickers]
-        mas = [dfs[t].iloc[i][filter_ma] for t in tickers]
+        scores = scores_mat[i]
 
-        current_date = pd.to_datetime(date).normalize()
-        liquidity_excluded_tickers: list[str] = []
-        available_idx: list[int] = []
-        for idx, ticker in enumerate(tickers):
-            avg_dollar_volume = (effective_avg_dollar_volume.get(ticker) or {}).get(current_date)
-            if not _passes_min_avg_dollar_volume(avg_dollar_volume, float(min_avg_dollar_volume_20d_m or 0.0)):
-                liquidity_excluded_tickers.append(ticker)
-                continue
-            available_idx.append(idx)
-
-        top_idx = np.array(
-            sorted(
-                available_idx,
-                key=lambda idx: float(scores[idx]) if pd.notna(scores[idx]) else float("-inf"),
-                reverse=True,
-            )[:n_assets],
-            dtype=int,
-        )
-        next_ticker = [tickers[i] for i in top_idx]
+        current_date = normalized_dates[i]
+        liquidity_ok = liquidity_ok_mat[i]
+        liquidity_excluded_tickers = [tickers[idx] for idx in np.flatnonzero(~liquidity_ok)]
+        available_idx = np.flatnonzero(liquidity_ok)
+
+        # stable 정렬이므로 동점이면 dfs 순서를 유지한다 (기존 sorted(reverse=True)와 동일).
+        top_idx = available_idx[np.argsort(-score_key_mat[i, available_idx], kind="stable")][:n_assets]
+        next_ticker = [tickers[idx] for idx in top_idx]
         raw_selected_tickers = next_ticker.copy()
         raw_selected_scores = [float(scores[idx]) for idx in top_idx]
 
@@ -251,7 +250,7 @@ def gtaa3(
         signal_ticker_to_index = [
             (ticker, idx)
             for ticker, idx in zip(next_ticker, top_idx)
-            if closes[idx] >= mas[idx] and _passes_min_price(closes[idx], min_price)
+            if investable_mat[i, idx]
         ]
         overlay_rejected_tickers = [ticker for ticker in next_ticker if ticker not in {t for t, _ in signal_ticker_to_index}]
         defensive_fill_tickers: list[str] = []
@@ -298,11 +297,7 @@ def gtaa3(
             candidate_pairs = [
                 (ticker, idx)
                 for ticker, idx in candidate_pairs
-                if closes[idx] >= mas[idx] and _passes_min_price(closes[idx], min_price)
-                and _passes_min_avg_dollar_volume(
-                    (effective_avg_dollar_volume.get(ticker) or {}).get(current_date),
-                    float(min_avg_dollar_volume_20d_m or 0.0),
-                )
+                if investable_mat[i, idx] and liquidity_ok[idx]
             ]
             candidate_pairs.sort(key=lambda item: float(scores[item[1]]), reverse=True)
             return candidate_pairs
@@ -316,16 +311,13 @@ def gtaa3(
         
         
         if i == 0:
-            returns = [np.nan] * n_assets
             end_balances = [0] * n_assets
             total_balance = start_balance
         else:
-            returns = [(c / pc) - 1 for c, pc in zip(closes, prev_close)]
-            end_ticker_return = [returns[idx] for _, idx in end_ticker_to_index]
+            held_idx = [idx for _, idx in end_ticker_to_index]
+            end_ticker_return = (closes_mat[i, held_idx] / closes_mat[i - 1, held_idx]) - 1
 
-            end_balances = [
-                nb * (1 + r) for nb, r in zip(next_balances, end_ticker_return)
-            ]
+            end_balances = list(np.asarray(next_balances, dtype=float) * (1 + end_ticker_return))
 
             total_balance = sum(end_balances) + cash
             total_return = (
@@ -434,7 +426,6 @@ def gtaa3(
         row.update(guardrail_fields)
         rows.append(row)
 
-        prev_close = closes
         end_ticker_to_index = next_ticker_to_index
         prev_total_balance = total_balance
         strategy_balance_history.append(float(total_balance))
@@ -444,7 +435,7 @@ def gtaa3(
             else np.nan
         )
 
-    return pd.DataFrame(rows)
+    return rows.to_frame()
 
 
 def _passes_min_price(close_value: float, min_price: float) -> bool:
@@ -452,16 +443,150 @@ def _passes_min_price(close_value: float, min_price: float) -> bool:
     return float(close_value) >= threshold
 
 
-def _passes_min_avg_dollar_volume(
-    avg_dollar_volume: float | None,
+@dataclass(frozen=True)
+class AvgDollarVolumeMatrix:
+    """
+    20일 평균 거래대금을 (거래일, 심볼) float32 배열 하나로 담는다.
+
+    `dict[symbol][Timestamp] -> float` 대신 쓰는 조회 구조로, 전략은 리밸런싱 날짜 x 티커
+    값을 `take`로 한 번에 꺼내 threshold 비교 한 번으로 liquidity mask를 만든다.
+    값이 없는 칸은 NaN이며 filter에서 탈락한다. 배열은 읽기 전용이라 캐시에서 그대로 공유된다.
+    """
+
+    dates: np.ndarray
+    symbols: tuple[str, ...]
+    values: np.ndarray
+
+    def __post_init__(self) -> None:
+        dates = np.asarray(self.dates, dtype="datetime64[ns]")
+        values = np.asarray(self.values, dtype=np.float32).reshape(len(dates), len(self.symbols))
+        dates.setflags(write=False)
+        values.setflags(write=False)
+        object.__setattr__(self, "dates", dates)
+        object.__setattr__(self, "symbols", tuple(self.symbols))
+        object.__setattr__(self, "values", values)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.dates.nbytes + self.values.nbytes)
+
+    @classmethod
+    def from_mapping(
+        cls,
+        avg_dollar_volume_20d_by_date: Mapping[str, Mapping[pd.Timestamp, float | None]],
+    ) -> "AvgDollarVolumeMatrix":
+        """기존 `dict[symbol][date]` 입력을 같은 조회 결과를 내는 matrix로 바꾼다."""
+        symbols = tuple(avg_dollar_volume_20d_by_date.keys())
+        per_symbol = [avg_dollar_volume_20d_by_date[symbol] or {} for symbol in symbols]
+        all_dates = pd.DatetimeIndex([date for by_date in per_symbol for date in by_date.keys()])
+        dates = np.unique(all_dates.as_unit("ns").to_numpy()) if len(all_dates) else np.array([], dtype="datetime64[ns]")
+        values = np.full((len(dates), len(symbols)), np.nan, dtype=np.float32)
+        for col, by_date in enumerate(per_symbol):
+            if not by_date:
+                continue
+            rows = np.searchsorted(dates, pd.DatetimeIndex(list(by_date.keys())).as_unit("ns").to_numpy())
+            values[rows, col] = pd.to_numeric(pd.Series(list(by_date.values()), dtype=object), errors="coerce").to_numpy(
+                dtype=np.float32
+            )
+        return cls(dates=dates, symbols=symbols, values=values)
+
+    def take(self, dates: list[pd.Timestamp], tickers: list[str]) -> np.ndarray:
+        """`dates` x `tickers` 값을 꺼낸다. 정확히 같은 날짜만 매칭하고 나머지는 NaN."""
+        out = np.full((len(dates), len(tickers)), np.nan, dtype=np.float32)
+        if not len(self.dates) or not len(dates) or not tickers:
+            return out
+        wanted = pd.DatetimeIndex(dates).as_unit("ns").to_numpy()
+        rows = np.minimum(np.searchsorted(self.dates, wanted), len(self.dates) - 1)
+        row_hit = self.dates[rows] == wanted
+        col_by_symbol = {symbol: col for col, symbol in enumerate(self.symbols)}
+        cols = np.array([col_by_symbol.get(ticker, -1) for ticker in tickers], dtype=np.int64)
+        col_hit = cols >= 0
+        out[np.ix_(row_hit, col_hit)] = self.values[np.ix_(rows[row_hit], cols[col_hit])]
+        return out
+
+
+def _as_avg_dollar_volume_matrix(
+    avg_dollar_volume_20d_by_date: AvgDollarVolumeMatrix | Mapping[str, Mapping[pd.Timestamp, float]] | None,
+) -> AvgDollarVolumeMatrix:
+    if isinstance(avg_dollar_volume_20d_by_date, AvgDollarVolumeMatrix):
+        return avg_dollar_volume_20d_by_date
+    return AvgDollarVolumeMatrix.from_mapping(avg_dollar_volume_20d_by_date or {})
+
+
+#-------------------
+# Simulation kernels
+#-------------------
+# price-only 전략은 날짜마다 `dfs[t].iloc[i][...]`를 티커 수만큼 호출했다.
+# 아래 helper는 Close / score / MA 컬럼을 (dates, tickers) 2-D 배열로 한 번만 꺼내고,
+# 랭킹 / 필터 / 잔고 이월을 배열 slice 위에서 처리하게 해준다.
+# 결과 row 구성과 수치 연산 순서는 기존 루프와 같게 유지한다.
+
+def _strategy_matrix(
+    dfs: dict,
+    tickers: list[str],
+    column: str,
+    *,
+    sort_dates: bool = False,
+    required: bool = True,
+) -> np.ndarray:
+    """
+    dfs[t][column] 을 (dates, tickers) 2-D 배열로 꺼낸다.
+
+    sort_dates=True 이면 전략 루프가 하던 것처럼 Date 정렬 후 위치 기준으로 맞춘다.
+    required=False 이면 컬럼이 없는 티커는 NaN으로 채운다 (`row.get(column, np.nan)`와 동일).
+    """
+    columns = []
+    for ticker in tickers:
+        df = dfs[ticker]
+        if sort_dates:
+            df = df.sort_values("Date").reset_index(drop=True)
+        if column in df.columns:
+            columns.append(df[column].to_numpy())
+        elif required:
+            raise KeyError(column)
+        else:
+            columns.append(np.full(len(df), np.nan))
+    return np.column_stack(columns)
+
+
+def _float_matrix(values: np.ndarray) -> np.ndarray:
+    if values.dtype != object:
+        return values.astype(float, copy=False)
+    return pd.DataFrame(values).apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+
+
+def _liquidity_pass_matrix(
+    avg_dollar_volume_20d_by_date: AvgDollarVolumeMatrix | Mapping[str, Mapping[pd.Timestamp, float]] | None,
+    tickers: list[str],
+    dates: list[pd.Timestamp],
     min_avg_dollar_volume_20d_m: float,
-) -> bool:
+) -> np.ndarray:
+    """최소 20일 평균 거래대금(백만 달러) 조건을 (dates, tickers) bool mask로 한 번에 평가한다. 값이 없으면 탈락."""
     threshold = max(float(min_avg_dollar_volume_20d_m or 0.0), 0.0) * 1_000_000.0
     if threshold <= 0:
-        return True
-    if avg_dollar_volume is None or pd.isna(avg_dollar_volume):
-        return False
-    return float(avg_dollar_volume) >= threshold
+        return np.ones((len(dates), len(tickers)), dtype=bool)
+    volumes = _as_avg_dollar_volume_matrix(avg_dollar_volume_20d_by_date).take(dates, tickers)
+    with np.errstate(invalid="ignore"):
+        return volumes >= np.float32(threshold)
+
+
+class _ResultColumns:
+    """전략 result row를 컬럼 단위로 모았다가 마지막에 한 번에 DataFrame으로 만든다."""
+
+    def __init__(self) -> None:
+        self._columns: dict[str, list] = {}
+        self._count = 0
+
+    def append(self, row: dict) -> None:
+        for key in row:
+            if key not in self._columns:
+                self._columns[key] = [np.nan] * self._count
+        for key, column in self._columns.items():
+            column.append(row.get(key, np.nan))
+        self._count += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self._columns)
 
 
 def risk_parity_trend(
@@ -508,16 +633,25 @@ def risk_parity_trend(
     strategy_balance_history: list[float] = []
 
     # 수익률/변동성 계산을 위해 Close 행렬 구성 (shape: [T, N])
-    closes_mat = np.column_stack([dfs[t].sort_values("Date").reset_index(drop=True)["Close"].values for t in tickers])
+    closes_mat = _strategy_matrix(dfs, tickers, "Close", sort_dates=True)
 
     # 간단 수익률 (T, N)
     rets_mat = (closes_mat[1:] / closes_mat[:-1]) - 1
     rets_mat = np.vstack([np.full((1, rets_mat.shape[1]), np.nan), rets_mat])
 
-    rows = []
+    # 트렌드 필터 (T, N): MA 컬럼이 없거나 NaN이면 탈락
+    mas_mat = _float_matrix(_strategy_matrix(dfs, tickers, filter_ma, required=False))
+    closes_float_mat = _float_matrix(closes_mat)
+    with np.errstate(invalid="ignore"):
+        trend_ok_mat = (
+            ~np.isnan(mas_mat)
+            & (closes_float_mat >= mas_mat)
+            & (closes_float_mat >= max(float(min_price or 0.0), 0.0))
+        )
+
+    rows = _ResultColumns()
 
     prev_total_balance = None
-    prev_close = None
 
     # 현재 들고 있는 포지션 정보
     held_ticker_idx = []   # 투자중인 티커 index들
@@ -525,7 +659,6 @@ def risk_parity_trend(
     cash = 0.0
 
     for i, date in enumerate(dates):
-        closes = closes_mat[i].tolist()
 
         # =========================
         # 1) End Balance / Total Return
@@ -537,8 +670,8 @@ def risk_parity_trend(
         else:
             # 보유 자산 수익률만 적용
             if held_ticker_idx:
-                asset_returns = [ (closes[j] / prev_close[j]) - 1 for j in held_ticker_idx ]
-                end_balances = [ b * (1 + r) for b, r in zip(next_balances, asset_returns) ]
+                asset_returns = (closes_mat[i, held_ticker_idx] / closes_mat[i - 1, held_ticker_idx]) - 1
+                end_balances = (np.asarray(next_balances, dtype=float) * (1 + asset_returns)).tolist()
             else:
                 end_balances = []
 
@@ -589,16 +722,8 @@ def risk_parity_trend(
         if rebalancing:
             # Risk Parity 진단은 최종 보유 전 단계인 trend-eligible universe와
             # inverse-vol 입력을 함께 남겨야 결과 비중이 왜 그렇게 나왔는지 설명할 수 있다.
-            for j, t in enumerate(tickers):
-                ma_val = dfs[t].iloc[i].get(filter_ma, np.nan)
-                if (
-                    pd.notna(ma_val)
-                    and closes[j] >= float(ma_val)
-                    and _passes_min_price(closes[j], min_price)
-                ):
-                    eligible.append(j)
-                else:
-                    trend_rejected_tickers.append(t)
+            eligible = np.flatnonzero(trend_ok_mat[i]).tolist()
+            trend_rejected_tickers = [tickers[j] for j in np.flatnonzero(~trend_ok_mat[i])]
 
             for j in eligible:
                 start_idx = max(0, i - vol_window + 1)
@@ -712,7 +837,6 @@ def risk_parity_trend(
         row.update(guardrail_fields)
         rows.append(row)
 
-        prev_close = closes
         prev_total_balance = total_balance
         strategy_balance_history.append(float(total_balance))
         guardrail_close_history.append(
@@ -721,7 +845,7 @@ def risk_parity_trend(
             else np.nan
         )
 
-    return pd.DataFrame(rows)
+    return rows.to_frame()
 
 
 def dual_momentum(
@@ -783,15 +907,26 @@ def dual_momentum(
     base_df = dfs[risky_tickers[0]].sort_values("Date").reset_index(drop=True)
     dates = base_df["Date"].tolist()
 
+    ticker_index = {t: j for j, t in enumerate(tickers)}
+    risky_idx = np.array([ticker_index[t] for t in risky_tickers], dtype=int)
+    closes_mat = _float_matrix(_strategy_matrix(dfs, tickers, "Close", sort_dates=True))
+    scores_mat = _float_matrix(_strategy_matrix(dfs, tickers, lookback_col, sort_dates=True, required=False))
+    mas_mat = _float_matrix(_strategy_matrix(dfs, tickers, filter_ma, sort_dates=True, required=False))
+    with np.errstate(invalid="ignore"):
+        investable_mat = (
+            ~np.isnan(mas_mat)
+            & (closes_mat >= mas_mat)
+            & (closes_mat >= max(float(min_price or 0.0), 0.0))
+        )
+
     # 보유 상태
     held = []            # 보유 티커 리스트
     next_balances = []   # 보유 티커별 다음 투자금
     cash = 0.0
 
     prev_total_balance = None
-    prev_close = {t: None for t in tickers}
 
-    rows = []
+    rows = _ResultColumns()
 
     def _concentration_status(
         *,
@@ -807,18 +942,6 @@ def dual_momentum(
         return "balanced_top_n"
 
     for i, date in enumerate(dates):
-        # 현재가/지표 로드
-        close_now = {}
-        score_now = {}
-        ma_now = {}
-
-        for t in tickers:
-            df = dfs[t].sort_values("Date").reset_index(drop=True)
-            row = df.iloc[i]
-
-            close_now[t] = float(row["Close"])
-            score_now[t] = float(row[lookback_col]) if pd.notna(row.get(lookback_col, np.nan)) else np.nan
-            ma_now[t] = float(row[filter_ma]) if pd.notna(row.get(filter_ma, np.nan)) else np.nan
 
         # =========================
         # 1) End Balance / Total Return
@@ -832,14 +955,17 @@ def dual_momentum(
             # 보유 자산 평가
             end_balances = []
             if held:
-                for t, b in zip(held, next_balances):
-                    pc = prev_close[t]
-                    r = (close_now[t] / pc) - 1 if (pc is not None and pc != 0) else 0.0
-                    end_balances.append(b * (1 + r))
+                held_idx = [ticker_index[t] for t in held]
+                current_close = closes_mat[i, held_idx]
+                previous_close = closes_mat[i - 1, held_idx]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    held_returns = np.where(previous_close != 0, (current_close / previous_close) - 1, 0.0)
+                end_balances = (np.asarray(next_balances, dtype=float) * (1 + held_returns)).tolist()
 
             # 현금(또는 cash_ticker 기반 현금 수익률 적용)
-            if cash_ticker is not None and cash > 0 and prev_close[cash_ticker] is not None:
-                r_cash = (close_now[cash_ticker] / prev_close[cash_ticker]) - 1
+            if cash_ticker is not None and cash > 0:
+                cash_j = ticker_index[cash_ticker]
+                r_cash = (closes_mat[i, cash_j] / closes_mat[i - 1, cash_j]) - 1
                 cash_proxy_return = float(r_cash)
                 cash = cash * (1 + r_cash)
             else:
@@ -893,20 +1019,14 @@ def dual_momentum(
                 cash = base_balance
                 cash_reasons = list(risk_off_reasons)
             else:
-                risky_scores = [(t, score_now[t]) for t in risky_tickers if pd.notna(score_now[t])]
-                risky_scores.sort(key=lambda x: x[1])
-                raw_selected = risky_scores[-top:][::-1]
-                picked = [t for t, _ in raw_selected]
-                raw_selected_tickers = [t for t, _ in raw_selected]
-                raw_selected_scores = [float(score) for _, score in raw_selected]
-
-                invest = [
-                    t
-                    for t in picked
-                    if pd.notna(ma_now[t])
-                    and close_now[t] >= ma_now[t]
-                    and _passes_min_price(close_now[t], min_price)
-                ]
+                scored_idx = risky_idx[~np.isnan(scores_mat[i, risky_idx])]
+                # 오름차순 stable 정렬 후 뒤에서 top개를 역순으로 (기존 list.sort + [-top:][::-1]과 동일)
+                ranked_idx = scored_idx[np.argsort(scores_mat[i, scored_idx], kind="stable")]
+                raw_selected_idx = ranked_idx[-top:][::-1]
+                raw_selected_tickers = [tickers[j] for j in raw_selected_idx]
+                raw_selected_scores = [float(scores_mat[i, j]) for j in raw_selected_idx]
+
+                invest = [tickers[j] for j in raw_selected_idx if investable_mat[i, j]]
                 trend_rejected_tickers = [ticker for ticker in raw_selected_tickers if ticker not in invest]
 
                 if len(invest) == 0:
@@ -1001,9 +1121,6 @@ def dual_momentum(
         row.update(guardrail_fields)
         rows.append(row)
 
-        # prev update
-        for t in tickers:
-            prev_close[t] = close_now[t]
         prev_total_balance = total_balance
         strategy_balance_history.append(float(total_balance))
         guardrail_close_history.append(
@@ -1012,7 +1129,7 @@ def dual_momentum(
             else np.nan
         )
 
-    return pd.DataFrame(rows)
+    return rows.to_frame()
 
 
 def global_relative_strength_allocation(
@@ -1056,13 +1173,22 @@ def global_relative_strength_allocation(
 
     base_df = dfs[risky_tickers[0]].sort_values("Date").reset_index(drop=True)
     dates = base_df["Date"].tolist()
+    row_kinds = base_df["Row Kind"].tolist() if "Row Kind" in base_df.columns else [None] * len(dates)
+
+    ticker_index = {ticker: j for j, ticker in enumerate(tickers)}
+    risky_idx = np.array([ticker_index[ticker] for ticker in risky_tickers], dtype=int)
+    closes_mat = _float_matrix(_strategy_matrix(dfs, tickers, "Close", sort_dates=True))
+    scores_mat = _float_matrix(_strategy_matrix(dfs, tickers, score_col, sort_dates=True, required=False))
+    mas_mat = _float_matrix(_strategy_matrix(dfs, tickers, filter_ma, sort_dates=True, required=False))
+    with np.errstate(invalid="ignore"):
+        rankable_mat = ~np.isnan(scores_mat) & (closes_mat >= max(float(min_price or 0.0), 0.0))
+        trend_ok_mat = ~np.isnan(mas_mat) & (closes_mat >= mas_mat)
 
     held: list[str] = []
     next_balances: list[float] = []
     cash = 0.0
     prev_total_balance: float | None = None
-    prev_close: dict[str, float | None] = {ticker: None for ticker in tickers}
-    rows: list[dict] = []
+    rows = _ResultColumns()
     signal_index = 0
 
     def _concentration_status(
@@ -1079,18 +1205,8 @@ def global_relative_strength_allocation(
         return "balanced_top_n"
 
     for i, date in enumerate(dates):
-        row_kind = str(base_df.iloc[i].get("Row Kind") or "signal").strip().lower()
+        row_kind = str(row_kinds[i] or "signal").strip().lower()
         valuation_only = row_kind == "valuation"
-        close_now: dict[str, float] = {}
-        score_now: dict[str, float] = {}
-        ma_now: dict[str, float] = {}
-
-        for ticker in tickers:
-            ticker_df = dfs[ticker].sort_values("Date").reset_index(drop=True)
-            row = ticker_df.iloc[i]
-            close_now[ticker] = float(row["Close"])
-            score_now[ticker] = float(row[score_col]) if pd.notna(row.get(score_col, np.nan)) else np.nan
-            ma_now[ticker] = float(row[filter_ma]) if pd.notna(row.get(filter_ma, np.nan)) else np.nan
 
         if i == 0:
             end_balances: list[float] = []
@@ -1098,19 +1214,17 @@ def global_relative_strength_allocation(
             total_return = np.nan
             cash_proxy_return = np.nan
         else:
-            end_balances = []
-            for ticker, balance in zip(held, next_balances):
-                previous_close = prev_close[ticker]
-                asset_return = (
-                    (close_now[ticker] / previous_close) - 1
-                    if previous_close not in (None, 0)
-                    else 0.0
-                )
-                end_balances.append(float(balance) * (1.0 + asset_return))
+            held_idx = [ticker_index[ticker] for ticker in held]
+            current_close = closes_mat[i, held_idx]
+            previous_close = closes_mat[i - 1, held_idx]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                asset_returns = np.where(previous_close != 0, (current_close / previous_close) - 1, 0.0)
+            end_balances = (np.asarray(next_balances, dtype=float) * (1.0 + asset_returns)).tolist()
 
             cash_proxy_return = np.nan
-            if cash > 0 and cash_ticker is not None and prev_close[cash_ticker] not in (None, 0):
-                cash_return = (close_now[cash_ticker] / prev_close[cash_ticker]) - 1
+            cash_j = ticker_index.get(cash_ticker) if cash_ticker is not None else None
+            if cash > 0 and cash_j is not None and closes_mat[i - 1, cash_j] != 0:
+                cash_return = (closes_mat[i, cash_j] / closes_mat[i - 1, cash_j]) - 1
                 cash_proxy_return = float(cash_return)
                 cash = float(cash) * (1.0 + cash_return)
 
@@ -1126,21 +1240,13 @@ def global_relative_strength_allocation(
         cash_reasons: list[str] = []
 
         if rebalancing:
-            ranked_candidates = [
-                (ticker, score_now[ticker])
-                for ticker in risky_tickers
-                if pd.notna(score_now[ticker]) and _passes_min_price(close_now[ticker], min_price)
-            ]
-            ranked_candidates.sort(key=lambda item: float(item[1]), reverse=True)
-            raw_selected = ranked_candidates[:top]
-            raw_selected_tickers = [ticker for ticker, _ in raw_selected]
-            raw_selected_scores = [float(score) for _, score in raw_selected]
-
-            selected = [
-                ticker
-                for ticker, _ in raw_selected
-                if pd.notna(ma_now[ticker]) and close_now[ticker] >= ma_now[ticker]
-            ]
+            candidate_idx = risky_idx[rankable_mat[i, risky_idx]]
+            # stable 정렬이므로 동점이면 risky universe 순서를 유지한다.
+            raw_selected_idx = candidate_idx[np.argsort(-scores_mat[i, candidate_idx], kind="stable")][:top]
+            raw_selected_tickers = [tickers[j] for j in raw_selected_idx]
+            raw_selected_scores = [float(scores_mat[i, j]) for j in raw_selected_idx]
+
+            selected = [tickers[j] for j in raw_selected_idx if trend_ok_mat[i, j]]
             trend_rejected_tickers = [ticker for ticker in raw_selected_tickers if ticker not in selected]
 
             base_balance = float(start_balance if i == 0 else total_balance)
@@ -1219,10 +1325,8 @@ def global_relative_strength_allocation(
             signal_index += 1
 
         prev_total_balance = float(total_balance)
-        for ticker in tickers:
-            prev_close[ticker] = close_now[ticker]
 
-    return pd.DataFrame(rows)
+    return rows.to_frame()
 
 
 
@@ -1494,7 +1598,7 @@ def quality_snapshot_equal_weight(
     drawdown_guardrail_benchmark: str | None = None,
     drawdown_guardrail_df: pd.DataFrame | None = None,
     first_valid_price_dates: dict[str, pd.Timestamp | None] | None = None,
-    avg_dollar_volume_20d_by_date: dict[str, dict[pd.Timestamp, float]] | None = None,
+    avg_dollar_volume_20d_by_date: AvgDollarVolumeMatrix | dict[str, dict[pd.Timestamp, float]] | None = None,
 ) -> pd.DataFrame:
     """
     Monthly snapshot-based quality strategy.
@@ -1554,7 +1658,13 @@ def quality_snapshot_equal_weight(
     base_df = price_dfs[tickers[0]].sort_values("Date").reset_index(drop=True)
     dates = pd.to_datetime(base_df["Date"]).tolist()
     effective_first_valid_dates = dict(first_valid_price_dates or {})
-    effective_avg_dollar_volume = dict(avg_dollar_volume_20d_by_date or {})
+    selection_position = {ticker: idx for idx, ticker in enumerate(selection_tickers)}
+    liquidity_ok_mat = _liquidity_pass_matrix(
+        avg_dollar_volume_20d_by_date,
+        selection_tickers,
+        [pd.Timestamp(date).normalize() for date in dates],
+        min_avg_dollar_volume_20d_m,
+    )
     if not effective_first_valid_dates:
         for ticker in tickers:
             working = price_dfs[ticker][["Date", "Close"]].copy()
@@ -1814,10 +1924,7 @@ def quality_snapshot_equal_weight(
                     ):
                         history_excluded_tickers.append(ticker)
                         continue
-                    if not _passes_min_avg_dollar_volume(
-                        (effective_avg_dollar_volume.get(ticker) or {}).get(snapshot_key),
-                        float(min_avg_dollar_volume_20d_m or 0.0),
-                    ):
+                    if not liquidity_ok_mat[i, selection_position[ticker]]:
                         liquidity_excluded_tickers.append(ticker)
                         continue
                     available_tickers.add(ticker)
@@ -2060,7 +2167,7 @@ class GTAA3Strategy(Strategy):
         drawdown_guardrail_benchmark: str | None = None,
         drawdown_guardrail_df: pd.DataFrame | None = None,
         min_avg_dollar_volume_20d_m: float = 0.0,
-        avg_dollar_volume_20d_by_date: dict[str, dict[pd.Timestamp, float]] | None = None,
+        avg_dollar_volume_20d_by_date: AvgDollarVolumeMatrix | dict[str, dict[pd.Timestamp, float]] | None = None,
         rebalance_interval: int = 1,
     ):
         self.start_balance = start_balance
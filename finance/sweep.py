@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import inspect
+import itertools
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from . import sample
+from .loaders._common import normalize_timestamp
+from .loaders.price import (
+    _PRELOADED_PRICE_HISTORY,
+    PreloadedPriceHistory,
+    load_price_history,
+    use_preloaded_price_history,
+)
+from .performance import portfolio_performance_summary
+from .process_pool import process_pool_context
+from .snapshot_cache import PinnedSnapshotInputs
+
+"""
+sweep.py — 파라미터 sweep runner
+
+`sample.get_*_from_db` 하나는 설정 하나에 대해 가격을 다시 읽고 다시 변환한다.
+sweep은 grid 전체가 쓸 가격 이력을 한 번만 읽어 shared memory에 올리고,
+각 설정은 process pool worker에서 같은 runner를 그대로 호출한다.
+runner 안의 `load_price_history`/`iter_price_history` 호출은
+`use_preloaded_price_history`가 메모리에서 잘라 돌려주므로 DB/store 왕복이 없다.
+가격 외 입력(benchmark/universe용 statement·profile snapshot, 유동성 matrix 등)은
+첫 설정을 부모에서 돌리며 기록한 뒤 pin해서 넘기므로, 같은 입력을 읽는 설정은
+data version 조회도 없이 그 값을 쓴다. 기록에 없는 입력만 평소 경로로 읽는다.
+
+결과는 설정마다 `portfolio_performance_summary` 한 행(+ 파라미터 컬럼)으로 흘려보낸다.
+"""
+
+# runner 내부 warmup buffer(최대 3년) + 장기 guardrail lookback 여유분
+SWEEP_HISTORY_BUFFER_YEARS = 5
+_HISTORY_FIELDS = ("open", "high", "low", "close", "adj_close", "volume", "dividends", "stock_splits")
+_SYMBOL_PARAMS = (
+    "tickers",
+    "defensive_tickers",
+    "cash_ticker",
+    "benchmark_ticker",
+    "market_regime_benchmark",
+    "guardrail_reference_ticker",
+    "dynamic_candidate_tickers",
+)
+_STATEMENT_SHADOW_DEFAULT_SYMBOLS = (
+    *sample.STRICT_DEFAULT_DEFENSIVE_TICKERS,
+    sample.STRICT_MARKET_REGIME_DEFAULT_BENCHMARK,
+)
+_OPTION_FREQ = {"month_start": "M", "month_end": "M", "year_start": "Y", "year_end": "Y"}
+
+
+@dataclass(frozen=True)
+class SweepStrategySpec:
+    runner: Callable[..., pd.DataFrame]
+    default_symbols: tuple[str, ...] = ()
+
+
+SWEEP_STRATEGIES: dict[str, SweepStrategySpec] = {
+    "equal_weight": SweepStrategySpec(sample.get_equal_weight_from_db, ("VIG", "SCHD", "DGRO", "GLD")),
+    "gtaa3": SweepStrategySpec(
+        sample.get_gtaa3_from_db,
+        (
+            *sample.GTAA_DEFAULT_TICKERS,
+            *sample.GTAA_DEFAULT_DEFENSIVE_TICKERS,
+            sample.STRICT_MARKET_REGIME_DEFAULT_BENCHMARK,
+        ),
+    ),
+    "global_relative_strength": SweepStrategySpec(
+        sample.get_global_relative_strength_from_db,
+        (*sample.GLOBAL_RELATIVE_STRENGTH_DEFAULT_TICKERS, sample.GLOBAL_RELATIVE_STRENGTH_DEFAULT_CASH_TICKER),
+    ),
+    "risk_parity_trend": SweepStrategySpec(
+        sample.get_risk_parity_trend_from_db,
+        ("SPY", "TLT", "GLD", "IEF", "LQD", sample.STRICT_MARKET_REGIME_DEFAULT_BENCHMARK),
+    ),
+    "dual_momentum": SweepStrategySpec(
+        sample.get_dual_momentum_from_db,
+        ("QQQ", "SPY", "IWM", "SOXX", "BIL", sample.STRICT_MARKET_REGIME_DEFAULT_BENCHMARK),
+    ),
+    # statement shadow 전략의 후보 유니버스는 tickers / dynamic_candidate_tickers로 받은 만큼만 가격이 preload된다.
+    "statement_quality_snapshot_shadow": SweepStrategySpec(
+        sample.get_statement_quality_snapshot_shadow_from_db, _STATEMENT_SHADOW_DEFAULT_SYMBOLS
+    ),
+    "statement_value_snapshot_shadow": SweepStrategySpec(
+        sample.get_statement_value_snapshot_shadow_from_db, _STATEMENT_SHADOW_DEFAULT_SYMBOLS
+    ),
+    "statement_quality_value_snapshot_shadow": SweepStrategySpec(
+        sample.get_statement_quality_value_snapshot_shadow_from_db, _STATEMENT_SHADOW_DEFAULT_SYMBOLS
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    index: int
+    params: dict[str, Any]
+    summary: pd.DataFrame | None
+    error: str | None = None
+
+    def to_row(self) -> dict[str, Any]:
+        row: dict[str, Any] = {"Config": self.index}
+        row.update({key: _param_cell(value) for key, value in self.params.items()})
+        if self.summary is not None and not self.summary.empty:
+            row.update(self.summary.iloc[0].to_dict())
+        row["Error"] = self.error
+        return row
+
+
+def _param_cell(value: Any) -> Any:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(str(item) for item in value)
+    if isinstance(value, Mapping):
+        return ",".join(f"{key}={item}" for key, item in value.items())
+    return value
+
+
+def expand_param_grid(param_grid: Mapping[str, Sequence[Any]] | Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """
+    `{"top": [2, 3], "interval": [1, 3]}` → 4개 설정 (itertools.product 순서).
+    이미 설정 dict 목록이면 그대로 복사해서 돌려준다.
+    """
+    if isinstance(param_grid, Mapping):
+        keys = list(param_grid.keys())
+        value_lists = [list(param_grid[key]) for key in keys]
+        return [dict(zip(keys, combo)) for combo in itertools.product(*value_lists)]
+    return [dict(config) for config in param_grid]
+
+
+def _validate_params(strategy: str, spec: SweepStrategySpec, configs: list[dict[str, Any]]) -> None:
+    accepted = set(inspect.signature(spec.runner).parameters)
+    for config in configs:
+        unknown = sorted(set(config) - accepted)
+        if unknown:
+            raise ValueError(f"Unsupported sweep parameters for {strategy!r}: {unknown}")
+
+
+def _config_symbols(spec: SweepStrategySpec, config: Mapping[str, Any]) -> set[str]:
+    symbols = {str(symbol).strip().upper() for symbol in spec.default_symbols}
+    for key in _SYMBOL_PARAMS:
+        value = config.get(key)
+        if value is None:
+            continue
+        values = [value] if isinstance(value, str) else list(value)
+        symbols.update(str(symbol).strip().upper() for symbol in values if str(symbol).strip())
+    return symbols
+
+
+def _preload_window(configs: list[dict[str, Any]]) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
+    starts = [normalize_timestamp(config.get("start"), field_name="start") for config in configs]
+    ends = [normalize_timestamp(config.get("end"), field_name="end") for config in configs]
+    start = None
+    if starts and all(value is not None for value in starts):
+        start = min(starts) - pd.DateOffset(years=SWEEP_HISTORY_BUFFER_YEARS)
+    end = max(ends) if ends and all(value is not None for value in ends) else None
+    return start, end
+
+
+def _config_name(strategy: str, config: Mapping[str, Any], varying: Sequence[str]) -> str:
+    if not varying:
+        return strategy
+    return f"{strategy}[" + ", ".join(f"{key}={_param_cell(config.get(key))}" for key in varying) + "]"
+
+
+# ---------------------------------------------------------------------------
+# shared memory layout
+# ---------------------------------------------------------------------------
+
+def _share_history(history: pd.DataFrame) -> tuple[shared_memory.SharedMemory, dict[str, Any]]:
+    """long-form 이력을 (symbol code, date, field…) 컬럼 배열로 하나의 shared memory 블록에 복사한다."""
+    n = len(history)
+    symbols, codes = np.unique(history["symbol"].astype(str).to_numpy(), return_inverse=True)
+    nbytes = max(n * (4 + 8 + 8 * len(_HISTORY_FIELDS)), 1)
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    layout = {"name": shm.name, "rows": n, "symbols": symbols.tolist()}
+    code_arr, date_arr, value_arr = _history_views(shm, n)
+    code_arr[:] = codes
+    date_arr[:] = pd.to_datetime(history["date"]).to_numpy(dtype="datetime64[ns]").view(np.int64)
+    for i, field in enumerate(_HISTORY_FIELDS):
+        value_arr[i] = pd.to_numeric(history[field], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return shm, layout
+
+
+def _history_views(shm: shared_memory.SharedMemory, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    date_offset = 8 * len(_HISTORY_FIELDS) * n
+    code_offset = date_offset + 8 * n
+    values = np.ndarray((len(_HISTORY_FIELDS), n), dtype=np.float64, buffer=shm.buf, offset=0)
+    dates = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=date_offset)
+    codes = np.ndarray((n,), dtype=np.int32, buffer=shm.buf, offset=code_offset)
+    return codes, dates, values
+
+
+def _history_from_shared(shm: shared_memory.SharedMemory, layout: Mapping[str, Any]) -> pd.DataFrame:
+    n = int(layout["rows"])
+    codes, dates, values = _history_views(shm, n)
+    data: dict[str, Any] = {
+        "symbol": np.asarray(layout["symbols"], dtype=object)[codes] if n else np.empty(0, dtype=object),
+        "date": dates.view("datetime64[ns]"),
+    }
+    for i, field in enumerate(_HISTORY_FIELDS):
+        data[field] = values[i]
+    # shared memory 버퍼를 그대로 가리키는 view; 블록은 worker 수명 동안 열어 둔다.
+    return pd.DataFrame(data, copy=False)
+
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_sweep_worker(
+    layout: Mapping[str, Any] | None,
+    preload: Mapping[str, Any] | None,
+    pinned_inputs: Mapping[Any, Any] | None = None,
+) -> None:
+    if pinned_inputs:
+        sample._PINNED_SNAPSHOT_INPUTS.set(PinnedSnapshotInputs(pinned_inputs))
+    if layout is None or preload is None:
+        return
+    shm = shared_memory.SharedMemory(name=layout["name"])
+    _WORKER_STATE["shm"] = shm
+    history = _history_from_shared(shm, layout)
+    _PRELOADED_PRICE_HISTORY.set(PreloadedPriceHistory(history, **preload))
+
+
+def _run_sweep_config(
+    strategy: str,
+    index: int,
+    params: dict[str, Any],
+    name: str,
+    freq: str,
+) -> SweepResult:
+    spec = SWEEP_STRATEGIES[strategy]
+    try:
+        result = spec.runner(**params)
+        summary = portfolio_performance_summary(result, name=name, freq=freq)
+    except Exception as exc:
+        return SweepResult(index=index, params=params, summary=None, error=f"{type(exc).__name__}: {exc}")
+    return SweepResult(index=index, params=params, summary=summary)
+
+
+def _run_first_sweep_config(
+    strategy: str,
+    index: int,
+    params: dict[str, Any],
+    name: str,
+    freq: str,
+) -> tuple[SweepResult, PinnedSnapshotInputs]:
+    with sample.record_snapshot_inputs() as recorded:
+        result = _run_sweep_config(strategy, index, params, name, freq)
+    return result, PinnedSnapshotInputs(recorded)
+
+
+def iter_parameter_sweep(
+    strategy: str,
+    param_grid: Mapping[str, Sequence[Any]] | Iterable[Mapping[str, Any]],
+    *,
+    base_params: Mapping[str, Any] | None = None,
+    max_workers: int | None = None,
+    freq: str | None = None,
+    preload_prices: bool = True,
+) -> Iterator[SweepResult]:
+    """
+    grid의 각 설정을 실행하고 끝나는 순서대로 `SweepResult`를 내보낸다.
+
+    - strategy: `SWEEP_STRATEGIES` key
+    - param_grid: runner keyword → 후보 값 목록, 또는 설정 dict 목록
+    - base_params: 모든 설정에 공통으로 넘길 runner keyword (start/end/tickers 등)
+    - max_workers: 1 이하이면 현재 프로세스에서 순서대로 실행
+    - preload_prices: False이면 가격 preload와 snapshot 입력 pin 없이 설정마다 평소 경로로 읽는다
+    """
+    if strategy not in SWEEP_STRATEGIES:
+        raise ValueError(f"Unsupported sweep strategy: {strategy!r}")
+    spec = SWEEP_STRATEGIES[strategy]
+    grid_configs = expand_param_grid(param_grid)
+    configs = [{**dict(base_params or {}), **config} for config in grid_configs]
+    if not configs:
+        return
+    _validate_params(strategy, spec, configs)
+
+    varying = [key for key in dict.fromkeys(key for config in grid_configs for key in config)]
+    option = str(configs[0].get("option") or "month_end")
+    effective_freq = freq or _OPTION_FREQ.get(option, "M")
+    timeframe = str(configs[0].get("timeframe") or "1d")
+    jobs = [(i, config, _config_name(strategy, config, varying)) for i, config in enumerate(configs)]
+
+    preloaded: PreloadedPriceHistory | None = None
+    preload_kwargs: dict[str, Any] | None = None
+    symbols: set[str] = set()
+    for config in configs:
+        symbols |= _config_symbols(spec, config)
+    if preload_prices and symbols:
+        start, end = _preload_window(configs)
+        history = load_price_history(symbols=sorted(symbols), start=start, end=end, timeframe=timeframe)
+        if history.empty:
+            history = pd.DataFrame(columns=["symbol", "date", *_HISTORY_FIELDS])
+        preload_kwargs = {
+            "start": start,
+            "end": end,
+            "timeframe": timeframe,
+            "requested_symbols": frozenset(symbols),
+        }
+        preloaded = PreloadedPriceHistory(history, **preload_kwargs)
+
+    workers = max_workers if max_workers is not None else min(len(jobs), os.cpu_count() or 1)
+    # 첫 설정은 부모에서 실행해 공유 캐시를 데우고, 읽은 가격 외 입력을 나머지 설정에 pin한다.
+    first_index, first_config, first_name = jobs[0]
+    with use_preloaded_price_history(preloaded) if preloaded is not None else nullcontext():
+        first, pinned = _run_first_sweep_config(strategy, first_index, first_config, first_name, effective_freq)
+    yield first
+    if not preload_prices:
+        pinned = PinnedSnapshotInputs()
+    if len(jobs) == 1:
+        return
+
+    if workers <= 1:
+        with (
+            use_preloaded_price_history(preloaded) if preloaded is not None else nullcontext(),
+            sample.use_pinned_snapshot_inputs(pinned),
+        ):
+            for index, config, name in jobs[1:]:
+                yield _run_sweep_config(strategy, index, config, name, effective_freq)
+        return
+
+    shm = None
+    layout = None
+    try:
+        if preloaded is not None:
+            shm, layout = _share_history(preloaded.history)
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs) - 1),
+            mp_context=process_pool_context(),
+            initializer=_init_sweep_worker,
+            initargs=(layout, preload_kwargs, pinned.to_payload()),
+        ) as executor:
+            futures = [
+                executor.submit(_run_sweep_config, strategy, index, config, name, effective_freq)
+                for index, config, name in jobs[1:]
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def run_parameter_sweep(
+    strategy: str,
+    param_grid: Mapping[str, Sequence[Any]] | Iterable[Mapping[str, Any]],
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """`iter_parameter_sweep` 결과를 설정 순서대로 모은 summary 테이블."""
+    rows = [result.to_row() for result in iter_parameter_sweep(strategy, param_grid, **kwargs)]
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).sort_values("Config", kind="stable").reset_index(drop=True)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from collections.abc import Callable, Generator, Sequence
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from math import sqrt
 from typing import Any
 
@@ -111,17 +113,99 @@ class SwingBacktestResult:
     warnings: list[str]
 
 
+# dense (date x symbol) panel로 옮겨 두는 feature 컬럼. 일별 루프는 이 배열만 인덱싱한다.
+SWING_PANEL_FIELDS = (
+    "open",
+    "close",
+    "volume",
+    "avg_volume_20d",
+    "avg_dollar_volume_20d",
+    "history_days",
+    "ma20",
+    "ma50",
+    "return_20d",
+    "return_5d",
+    "close_5d_high",
+    "daily_return",
+    "volatility_20d",
+    "volume_ratio",
+    "ma20_distance",
+    "ma50_distance",
+)
+
+
 @dataclass(frozen=True)
 class PreparedSwingSimulationData:
-    """Reusable, date-indexed inputs for repeated swing simulations."""
+    """
+    Reusable inputs for repeated swing simulations.
+
+    Feature rows are laid out once as dense (date x symbol) float arrays in
+    `panel`; `symbols` maps integer symbol ids to tickers (sorted, so id order
+    is the ranking tie-break order) and `row_index` maps each cell back to its
+    `features` row (-1 when the symbol has no row that date). Config-independent
+    entry masks are precomputed; liquidity / financial eligibility masks are
+    built once per threshold set and cached.
+    """
 
     features: pd.DataFrame
     dates: tuple[pd.Timestamp, ...]
-    by_date: dict[pd.Timestamp, pd.DataFrame]
     date_positions: dict[pd.Timestamp, int]
     atr_column: str
     start_date: pd.Timestamp
     end_date: pd.Timestamp
+    symbols: tuple[str, ...]
+    symbol_index: dict[str, int]
+    row_index: np.ndarray
+    panel: dict[str, np.ndarray]
+    trend_mask: np.ndarray
+    breakout_mask: np.ndarray
+    _eligibility: dict[tuple[float, float, float, int], np.ndarray] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
+
+    @cached_property
+    def by_date(self) -> dict[pd.Timestamp, pd.DataFrame]:
+        """Symbol-indexed feature frame per date (label-lookup view; the simulator uses `panel`)."""
+
+        by_date: dict[pd.Timestamp, pd.DataFrame] = {}
+        for date_value, frame in self.features.groupby("date", sort=True):
+            by_date[pd.Timestamp(date_value).normalize()] = frame.drop_duplicates("symbol", keep="last").set_index(
+                "symbol",
+                drop=False,
+            )
+        return by_date
+
+    def eligibility_mask(self, config: RiskOnMomentumConfig) -> np.ndarray:
+        """(date x symbol) liquidity / history / financial gate for the config's thresholds."""
+
+        key = (
+            float(config.min_price),
+            float(config.min_avg_dollar_volume_20d),
+            float(config.min_avg_volume_20d),
+            int(config.min_history_days),
+        )
+        mask = self._eligibility.get(key)
+        if mask is None:
+            panel = self.panel
+            mask = (
+                (panel["close"] >= key[0])
+                & (panel["avg_dollar_volume_20d"] >= key[1])
+                & (panel["avg_volume_20d"] >= key[2])
+                & (panel["history_days"] >= key[3])
+                & panel["financial_filter_pass"]
+            )
+            self._eligibility[key] = mask
+        return mask
+
+    def feature_value(self, column: str, day_index: int, symbol_id: int) -> Any:
+        """Raw `features` cell for non-numeric columns (scanner output only)."""
+
+        row = int(self.row_index[day_index, symbol_id])
+        if row < 0 or column not in self.features.columns:
+            return None
+        return self.features[column].iat[row]
 
 
 def _normalize_percent(value: float) -> float:
@@ -152,12 +236,18 @@ def _ensure_atr_feature(features: pd.DataFrame, config: RiskOnMomentumConfig) ->
     return add_atr(features, period=int(config.atr_period), symbol_col="symbol", date_col="date")
 
 
+def _numeric_panel_values(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame.columns:
+        return np.full(len(frame), np.nan)
+    return pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
 def prepare_swing_simulation_data(
     features: pd.DataFrame,
     *,
     config: RiskOnMomentumConfig,
 ) -> PreparedSwingSimulationData:
-    """Normalize and index feature rows once for primary and variant simulations."""
+    """Normalize feature rows once and lay them out as (date x symbol) arrays for primary and variant simulations."""
 
     if features is None or features.empty:
         raise ValueError("No usable feature rows were available for Risk-On Momentum 5D.")
@@ -176,22 +266,44 @@ def prepare_swing_simulation_data(
     )
     if len(dates) < 2:
         raise ValueError("At least two trading dates are required for D+1 execution.")
-    by_date: dict[pd.Timestamp, pd.DataFrame] = {}
-    for date_value, frame in prepared.groupby("date", sort=True):
-        normalized_date = pd.Timestamp(date_value).normalize()
-        indexed = frame.drop_duplicates("symbol", keep="last").set_index(
-            "symbol",
-            drop=False,
-        )
-        by_date[normalized_date] = indexed
+
+    # 같은 (date, symbol)이 여러 행이면 마지막 행을 쓴다 (기존 by_date drop_duplicates와 동일).
+    window = prepared[prepared["date"] >= dates[0]].drop_duplicates(["date", "symbol"], keep="last")
+    symbols = tuple(sorted(window["symbol"].unique()))
+    day_idx = pd.DatetimeIndex(dates).get_indexer(window["date"])
+    symbol_idx = pd.Index(symbols).get_indexer(window["symbol"])
+    shape = (len(dates), len(symbols))
+
+    row_index = np.full(shape, -1, dtype=np.int64)
+    row_index[day_idx, symbol_idx] = window.index.to_numpy()
+    atr_col = _atr_column(config)
+    panel: dict[str, np.ndarray] = {}
+    for column in dict.fromkeys((*SWING_PANEL_FIELDS, atr_col, "atr14")):
+        if column == "atr14" and column not in window.columns:
+            continue
+        values = np.full(shape, np.nan)
+        values[day_idx, symbol_idx] = _numeric_panel_values(window, column)
+        panel[column] = values
+    financial_pass = np.zeros(shape, dtype=bool)
+    if "financial_filter_pass" in window.columns:
+        financial_pass[day_idx, symbol_idx] = window["financial_filter_pass"].fillna(False).astype(bool).to_numpy()
+    panel["financial_filter_pass"] = financial_pass
+
+    close = panel["close"]
+    volume_surge = panel["volume"] > panel["avg_volume_20d"]
     return PreparedSwingSimulationData(
         features=prepared,
         dates=dates,
-        by_date=by_date,
         date_positions={date_value: index for index, date_value in enumerate(dates)},
-        atr_column=_atr_column(config),
+        atr_column=atr_col,
         start_date=start_ts,
         end_date=end_ts,
+        symbols=symbols,
+        symbol_index={symbol: index for index, symbol in enumerate(symbols)},
+        row_index=row_index,
+        panel=panel,
+        trend_mask=(close > panel["ma20"]) & (close > panel["ma50"]) & volume_surge,
+        breakout_mask=(close >= panel["close_5d_high"]) | ((panel["daily_return"] > 0) & volume_surge),
     )
 
 
@@ -446,89 +558,196 @@ def prepare_swing_feature_frame(
     return features.sort_values(["date", "symbol"]).reset_index(drop=True)
 
 
-def _rank_candidates(day_rows: pd.DataFrame, config: RiskOnMomentumConfig, rng: np.random.Generator) -> pd.DataFrame:
-    eligible = day_rows[
-        (day_rows["close"] >= float(config.min_price))
-        & (day_rows["avg_dollar_volume_20d"] >= float(config.min_avg_dollar_volume_20d))
-        & (day_rows["avg_volume_20d"] >= float(config.min_avg_volume_20d))
-        & (day_rows["history_days"] >= int(config.min_history_days))
-        & (day_rows["financial_filter_pass"].fillna(False).astype(bool))
-    ].copy()
-    if eligible.empty:
-        return eligible
-
-    eligible["return_20d_percentile"] = eligible["return_20d"].rank(pct=True)
-    eligible["candidate_condition"] = (
-        (eligible["close"] > eligible["ma20"])
-        & (eligible["close"] > eligible["ma50"])
-        & (eligible["return_20d_percentile"] >= float(config.return_20d_percentile_min))
-        & (eligible["volume"] > eligible["avg_volume_20d"])
-    )
-    if config.require_positive_5d_return:
-        eligible["candidate_condition"] = eligible["candidate_condition"] & (eligible["return_5d"] > 0)
+@dataclass(frozen=True)
+class _RankedCandidates:
+    """One signal date's candidates, ordered by (ranking_score desc, symbol asc)."""
+
+    symbol_ids: np.ndarray
+    ranking_score: np.ndarray
+    ranking_score_raw: np.ndarray
+    return_20d_percentile: np.ndarray
+    entry_condition: np.ndarray
+
+    def __len__(self) -> int:
+        return int(len(self.symbol_ids))
+
+    def take(self, order: np.ndarray) -> "_RankedCandidates":
+        return _RankedCandidates(
+            symbol_ids=self.symbol_ids[order],
+            ranking_score=self.ranking_score[order],
+            ranking_score_raw=self.ranking_score_raw[order],
+            return_20d_percentile=self.return_20d_percentile[order],
+            entry_condition=self.entry_condition[order],
+        )
+
+
+def _nan_to_zero(values: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(values), 0.0, values)
+
+
+def _average_rank_pct(values: np.ndarray) -> np.ndarray:
+    """`Series.rank(pct=True)` (average ties, NaN excluded) on a 1-D float array."""
+
+    out = np.full(values.shape, np.nan)
+    valid = ~np.isnan(values)
+    count = int(valid.sum())
+    if count == 0:
+        return out
+    observed = values[valid]
+    ordered = np.sort(observed)
+    lower = np.searchsorted(ordered, observed, side="left")
+    upper = np.searchsorted(ordered, observed, side="right")
+    out[valid] = (lower + upper + 1) / 2.0 / count
+    return out
+
+
+def _ranking_order(scores: np.ndarray, symbol_ids: np.ndarray) -> np.ndarray:
+    # sort_values(["ranking_score", "symbol"], ascending=[False, True]): NaN 점수는 맨 뒤.
+    missing = np.isnan(scores)
+    return np.lexsort((symbol_ids, -np.where(missing, 0.0, scores), missing))
 
-    eligible["entry_condition"] = eligible["candidate_condition"] & (
-        (eligible["close"] >= eligible["close_5d_high"])
-        | ((eligible["daily_return"] > 0) & (eligible["volume"] > eligible["avg_volume_20d"]))
+
+def _candidate_pool_key(config: RiskOnMomentumConfig) -> tuple[Any, ...]:
+    """Config fields that decide one date's candidate set and score-mode scores."""
+
+    return (
+        float(config.min_price),
+        float(config.min_avg_dollar_volume_20d),
+        float(config.min_avg_volume_20d),
+        int(config.min_history_days),
+        float(config.return_20d_percentile_min),
+        bool(config.require_positive_5d_return),
+        float(config.max_ma20_extension),
+        float(config.max_5d_return_before_penalty),
+        float(config.max_volatility_20d_before_penalty),
     )
-    candidates = eligible[eligible["candidate_condition"]].copy()
-    if candidates.empty:
-        return candidates
 
-    candidates["overheat_penalty"] = np.maximum(
-        (candidates["close"] / candidates["ma20"].replace(0.0, np.nan)) - float(config.max_ma20_extension),
+
+def _candidate_pool(
+    prepared: PreparedSwingSimulationData,
+    day_index: int,
+    config: RiskOnMomentumConfig,
+) -> _RankedCandidates | None:
+    """Unordered (symbol id order) candidates with score-mode ranking scores."""
+
+    eligible_ids = np.flatnonzero(prepared.eligibility_mask(config)[day_index])
+    if not len(eligible_ids):
+        return None
+
+    panel = prepared.panel
+
+    def values(column: str, ids: np.ndarray) -> np.ndarray:
+        return panel[column][day_index, ids]
+
+    percentile = _average_rank_pct(values("return_20d", eligible_ids))
+    candidate = prepared.trend_mask[day_index, eligible_ids] & (percentile >= float(config.return_20d_percentile_min))
+    if config.require_positive_5d_return:
+        candidate &= values("return_5d", eligible_ids) > 0
+    ids = eligible_ids[candidate]
+    if not len(ids):
+        return None
+
+    close = values("close", ids)
+    ma20 = values("ma20", ids)
+    return_5d = values("return_5d", ids)
+    volume_ratio = values("volume_ratio", ids)
+    percentile = percentile[candidate]
+    overheat_penalty = np.maximum(
+        close / np.where(ma20 == 0.0, np.nan, ma20) - float(config.max_ma20_extension),
         0.0,
     ) * 100.0
-    candidates["return_5d_penalty"] = np.maximum(
-        candidates["return_5d"].fillna(0.0) - float(config.max_5d_return_before_penalty),
+    return_5d_penalty = np.maximum(
+        _nan_to_zero(return_5d) - float(config.max_5d_return_before_penalty),
         0.0,
     ) * 100.0
-    candidates["volatility_penalty"] = np.maximum(
-        candidates["volatility_20d"].fillna(0.0) - float(config.max_volatility_20d_before_penalty),
+    volatility_penalty = np.maximum(
+        _nan_to_zero(values("volatility_20d", ids)) - float(config.max_volatility_20d_before_penalty),
         0.0,
     ) * 100.0
-    candidates["ranking_score"] = (
-        candidates["return_20d_percentile"].fillna(0.0) * 40.0
-        + candidates["return_5d"].fillna(0.0) * 100.0
-        + np.log1p(candidates["volume_ratio"].clip(lower=0).fillna(0.0)) * 10.0
-        + candidates["ma20_distance"].fillna(0.0) * 50.0
-        + candidates["ma50_distance"].fillna(0.0) * 30.0
-        - candidates["overheat_penalty"]
-        - candidates["return_5d_penalty"]
-        - candidates["volatility_penalty"]
+    scores = (
+        _nan_to_zero(percentile) * 40.0
+        + _nan_to_zero(return_5d) * 100.0
+        + np.log1p(_nan_to_zero(np.where(volume_ratio < 0, 0.0, volume_ratio))) * 10.0
+        + _nan_to_zero(values("ma20_distance", ids)) * 50.0
+        + _nan_to_zero(values("ma50_distance", ids)) * 30.0
+        - overheat_penalty
+        - return_5d_penalty
+        - volatility_penalty
+    )
+    return _RankedCandidates(
+        symbol_ids=ids,
+        ranking_score=scores,
+        ranking_score_raw=scores,
+        return_20d_percentile=percentile,
+        entry_condition=prepared.breakout_mask[day_index, ids],
     )
+
+
+def _rank_candidates(
+    prepared: PreparedSwingSimulationData,
+    day_index: int,
+    config: RiskOnMomentumConfig,
+    rng: np.random.Generator,
+    pool_cache: dict[tuple[Any, ...], _RankedCandidates | None] | None = None,
+) -> _RankedCandidates | None:
+    """
+    Day's candidates in ranking order.
+
+    `pool_cache` (one dict per signal date) lets configs that share the
+    candidate thresholds reuse the pool; random ranking still draws from each
+    config's own rng, so results match an unbatched run.
+    """
+
+    if pool_cache is None:
+        pool = _candidate_pool(prepared, day_index, config)
+    else:
+        key = _candidate_pool_key(config)
+        if key not in pool_cache:
+            pool_cache[key] = _candidate_pool(prepared, day_index, config)
+        pool = pool_cache[key]
+    if pool is None:
+        return None
     if config.ranking_mode == "random":
-        candidates["ranking_score"] = rng.random(len(candidates))
-    candidates["ranking_score_raw"] = candidates["ranking_score"]
-    return candidates.sort_values(["ranking_score", "symbol"], ascending=[False, True]).reset_index(drop=True)
+        scores = rng.random(len(pool))
+        pool = replace(pool, ranking_score=scores, ranking_score_raw=scores)
+    return pool.take(_ranking_order(pool.ranking_score, pool.symbol_ids))
+
+
+def _panel_price(values: np.ndarray, day_index: int, symbol_id: int | None) -> float | None:
+    if symbol_id is None:
+        return None
+    value = values[day_index, symbol_id]
+    return None if np.isnan(value) else float(value)
+
+
+def _panel_feature(
+    prepared: PreparedSwingSimulationData,
+    column: str,
+    day_index: int,
+    symbol_id: int,
+) -> float | None:
+    values = prepared.panel.get(column)
+    return None if values is None else _panel_price(values, day_index, symbol_id)
 
 
 def _portfolio_value(
     *,
     cash: float,
     positions: dict[str, Position],
-    day_rows: pd.DataFrame,
+    prepared: PreparedSwingSimulationData,
+    day_index: int,
     price_col: str,
 ) -> float:
     total = float(cash)
+    prices = prepared.panel[price_col]
     for symbol, position in positions.items():
-        row = _day_symbol_row(day_rows, symbol)
-        price = _safe_float(row.get(price_col)) if row is not None else None
+        price = _panel_price(prices, day_index, prepared.symbol_index.get(symbol))
         if price is None:
             price = position.entry_price
         total += position.quantity * float(price)
     return float(total)
 
 
-def _day_symbol_row(day_rows: pd.DataFrame, symbol: str) -> pd.Series | None:
-    if day_rows is None or day_rows.empty or symbol not in day_rows.index:
-        return None
-    row = day_rows.loc[symbol]
-    if isinstance(row, pd.DataFrame):
-        return row.iloc[-1]
-    return row
-
-
 def _consecutive_loss_count(trades: pd.DataFrame) -> int:
     if trades.empty or "net_return_pct" not in trades.columns:
         return 0
@@ -616,30 +835,29 @@ def _ticker_contribution(trades: pd.DataFrame) -> pd.DataFrame:
     return grouped.sort_values("net_pnl", ascending=False).reset_index(drop=True)
 
 
-def run_risk_on_momentum_backtest(
-    price_history: pd.DataFrame,
-    *,
+_SwingRows = tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]
+
+
+def _simulate_swing(
+    prepared_simulation: PreparedSwingSimulationData,
     config: RiskOnMomentumConfig,
-    macro_scores: pd.DataFrame | None = None,
-    statement_history: pd.DataFrame | None = None,
-    prepared_features: pd.DataFrame | None = None,
-    prepared_simulation: PreparedSwingSimulationData | None = None,
-) -> SwingBacktestResult:
-    _validate_config(config)
-    warnings: list[str] = []
+    *,
+    macro_lookup: Callable[[pd.Timestamp, RiskOnMomentumConfig], MacroEvaluation],
+    pool_caches: dict[int, dict[tuple[Any, ...], Any]] | None = None,
+) -> Generator[None, None, _SwingRows]:
+    """
+    One config's daily loop as a generator: yields after each signal date and
+    returns (result rows, trade rows, scanner rows).
+
+    Stepping several of these in lockstep shares `pool_caches[day]` between
+    configs with the same candidate thresholds.
+    """
 
-    if prepared_simulation is None:
-        features = prepared_features if prepared_features is not None else prepare_swing_feature_frame(
-            price_history,
-            statement_history=statement_history,
-        )
-        prepared_simulation = prepare_swing_simulation_data(features, config=config)
-    elif prepared_simulation.atr_column != _atr_column(config):
-        raise ValueError("Prepared swing simulation ATR period does not match the config.")
     dates = prepared_simulation.dates
-    by_date = prepared_simulation.by_date
     date_positions = prepared_simulation.date_positions
-    macro_lookup = build_macro_lookup(macro_scores)
+    symbol_index = prepared_simulation.symbol_index
+    open_prices = prepared_simulation.panel["open"]
+    close_prices = prepared_simulation.panel["close"]
     rng = np.random.default_rng(int(config.random_seed))
 
     cash = float(config.start_balance)
@@ -655,15 +873,12 @@ def run_risk_on_momentum_backtest(
     atr_col = _atr_column(config)
 
     for idx, signal_date in enumerate(dates):
-        day_rows = by_date.get(signal_date, pd.DataFrame())
-
         if pending_sells:
             remaining_sells: list[dict[str, Any]] = []
             for order in pending_sells:
                 symbol = str(order["symbol"])
                 position = positions.get(symbol)
-                row = _day_symbol_row(day_rows, symbol)
-                open_price = _safe_float(row.get("open")) if row is not None else None
+                open_price = _panel_price(open_prices, idx, symbol_index.get(symbol))
                 if position is None:
                     continue
                 if open_price is None:
@@ -735,7 +950,8 @@ def run_risk_on_momentum_backtest(
             portfolio_open_value = _portfolio_value(
                 cash=cash,
                 positions=positions,
-                day_rows=day_rows,
+                prepared=prepared_simulation,
+                day_index=idx,
                 price_col="open",
             )
             slot_value = portfolio_open_value / float(config.max_total_positions)
@@ -746,8 +962,7 @@ def run_risk_on_momentum_backtest(
                 symbol = str(order["symbol"])
                 if symbol in positions and not config.allow_duplicate_positions:
                     continue
-                row = _day_symbol_row(day_rows, symbol)
-                open_price = _safe_float(row.get("open")) if row is not None else None
+                open_price = _panel_price(open_prices, idx, symbol_index.get(symbol))
                 if open_price is None:
                     remaining_buys.append(order)
                     continue
@@ -788,7 +1003,8 @@ def run_risk_on_momentum_backtest(
         total_balance = _portfolio_value(
             cash=cash,
             positions=positions,
-            day_rows=day_rows,
+            prepared=prepared_simulation,
+            day_index=idx,
             price_col="close",
         )
         total_return = np.nan if previous_total is None else total_balance / previous_total - 1.0
@@ -818,8 +1034,7 @@ def run_risk_on_momentum_backtest(
         next_date_exists = idx < len(dates) - 1
         exit_orders: list[dict[str, Any]] = []
         for symbol, position in list(positions.items()):
-            row = _day_symbol_row(day_rows, symbol)
-            close_price = _safe_float(row.get("close")) if row is not None else None
+            close_price = _panel_price(close_prices, idx, symbol_index.get(symbol))
             if close_price is None:
                 continue
             trading_holding_days = (
@@ -850,78 +1065,86 @@ def run_risk_on_momentum_backtest(
         available_new = min(int(config.max_new_positions_per_day), available_slots)
 
         buy_orders: list[dict[str, Any]] = []
-        ranked = pd.DataFrame()
+        ranked: _RankedCandidates | None = None
         if macro_pass and next_date_exists and available_new > 0:
-            ranked = _rank_candidates(day_rows.reset_index(drop=True), config, rng)
-            if not ranked.empty:
-                ranked["macro_penalty_total"] = float(macro_eval.penalty_total)
-                if float(macro_eval.penalty_total) > 0:
-                    ranked["ranking_score"] = ranked["ranking_score_raw"] - float(macro_eval.penalty_total)
-                    ranked = ranked.sort_values(["ranking_score", "symbol"], ascending=[False, True]).reset_index(drop=True)
-                entry_ranked = ranked[ranked["entry_condition"].fillna(False)].copy()
+            ranked = _rank_candidates(
+                prepared_simulation,
+                idx,
+                config,
+                rng,
+                None if pool_caches is None else pool_caches.setdefault(idx, {}),
+            )
+            if ranked is not None:
+                penalty_total = float(macro_eval.penalty_total)
+                if penalty_total > 0:
+                    penalized = replace(ranked, ranking_score=ranked.ranking_score_raw - penalty_total)
+                    ranked = penalized.take(_ranking_order(penalized.ranking_score, penalized.symbol_ids))
+                entry_mask = ranked.entry_condition.copy()
                 if config.exit_mode == "atr_based":
-                    entry_atr_values = (
-                        pd.to_numeric(entry_ranked[atr_col], errors="coerce")
-                        if atr_col in entry_ranked.columns
-                        else pd.Series(np.nan, index=entry_ranked.index)
-                    )
-                    entry_ranked = entry_ranked[entry_atr_values.fillna(0.0) > 0]
-                if not config.allow_duplicate_positions:
-                    entry_ranked = entry_ranked[~entry_ranked["symbol"].isin(held_symbols)]
-                selected = entry_ranked.head(available_new)
-                for _, row in selected.iterrows():
+                    entry_mask &= _nan_to_zero(prepared_simulation.panel[atr_col][idx, ranked.symbol_ids]) > 0
+                if not config.allow_duplicate_positions and positions:
+                    held_ids = [symbol_index[symbol] for symbol in positions if symbol in symbol_index]
+                    entry_mask &= ~np.isin(ranked.symbol_ids, held_ids)
+                for rank_pos in np.flatnonzero(entry_mask)[:available_new]:
+                    symbol_id = int(ranked.symbol_ids[rank_pos])
                     entry_features = {
-                        "ranking_score_raw": _safe_float(row.get("ranking_score_raw")),
-                        "return_20d": _safe_float(row.get("return_20d")),
-                        "return_5d": _safe_float(row.get("return_5d")),
-                        "volume_ratio": _safe_float(row.get("volume_ratio")),
-                        "ma20_distance": _safe_float(row.get("ma20_distance")),
-                        "ma50_distance": _safe_float(row.get("ma50_distance")),
+                        "ranking_score_raw": _safe_float(ranked.ranking_score_raw[rank_pos]),
+                        "return_20d": _panel_feature(prepared_simulation, "return_20d", idx, symbol_id),
+                        "return_5d": _panel_feature(prepared_simulation, "return_5d", idx, symbol_id),
+                        "volume_ratio": _panel_feature(prepared_simulation, "volume_ratio", idx, symbol_id),
+                        "ma20_distance": _panel_feature(prepared_simulation, "ma20_distance", idx, symbol_id),
+                        "ma50_distance": _panel_feature(prepared_simulation, "ma50_distance", idx, symbol_id),
                     }
                     buy_orders.append(
                         {
-                            "symbol": str(row["symbol"]),
+                            "symbol": prepared_simulation.symbols[symbol_id],
                             "signal_date": signal_date,
-                            "ranking_score": float(row.get("ranking_score") or 0.0),
-                            "entry_atr": _safe_float(row.get(atr_col)),
+                            "ranking_score": float(ranked.ranking_score[rank_pos] or 0.0),
+                            "entry_atr": _panel_feature(prepared_simulation, atr_col, idx, symbol_id),
                             "entry_features": entry_features,
                             "macro_snapshot": macro_snapshot,
                         }
                     )
 
-        if config.collect_scanner_rows and not ranked.empty:
+        if config.collect_scanner_rows and ranked is not None:
             selected_symbols = {str(order["symbol"]) for order in buy_orders}
-            scanner_source = ranked.head(max(int(config.scanner_top_n_per_day), len(selected_symbols))).copy()
-            for rank_idx, (_, row) in enumerate(scanner_source.iterrows(), start=1):
-                symbol = str(row["symbol"])
+            macro_penalty_total = float(float(macro_eval.penalty_total) or 0.0)
+            scanner_count = max(int(config.scanner_top_n_per_day), len(selected_symbols))
+            for rank_pos in range(min(scanner_count, len(ranked))):
+                symbol_id = int(ranked.symbol_ids[rank_pos])
+                symbol = prepared_simulation.symbols[symbol_id]
                 if symbol in selected_symbols:
                     status = "QUEUED_BUY"
                 elif symbol in held_symbols:
                     status = "HELD_EXCLUDED"
-                elif bool(row.get("entry_condition")):
+                elif bool(ranked.entry_condition[rank_pos]):
                     status = "RANK_BELOW_SLOT"
                 else:
                     status = "WATCHLIST"
                 scanner_rows.append(
                     {
                         "date": signal_date.strftime("%Y-%m-%d"),
-                        "rank": rank_idx,
+                        "rank": rank_pos + 1,
                         "symbol": symbol,
                         "status": status,
-                        "ranking_score": float(row.get("ranking_score") or 0.0),
-                        "ranking_score_raw": _safe_float(row.get("ranking_score_raw")),
-                        "macro_penalty_total": float(row.get("macro_penalty_total") or 0.0),
-                        "return_20d": _safe_float(row.get("return_20d")),
-                        "return_20d_percentile": _safe_float(row.get("return_20d_percentile")),
-                        "return_5d": _safe_float(row.get("return_5d")),
-                        "volume_ratio": _safe_float(row.get("volume_ratio")),
-                        "ma20_distance": _safe_float(row.get("ma20_distance")),
-                        "ma50_distance": _safe_float(row.get("ma50_distance")),
-                        "financial_filter_pass": bool(row.get("financial_filter_pass")),
-                        "financial_filter_reason": row.get("financial_filter_reason"),
-                        "atr14": _safe_float(row.get("atr14")),
-                        atr_col: _safe_float(row.get(atr_col)),
-                        "volatility_20d": _safe_float(row.get("volatility_20d")),
+                        "ranking_score": float(ranked.ranking_score[rank_pos] or 0.0),
+                        "ranking_score_raw": _safe_float(ranked.ranking_score_raw[rank_pos]),
+                        "macro_penalty_total": macro_penalty_total,
+                        "return_20d": _panel_feature(prepared_simulation, "return_20d", idx, symbol_id),
+                        "return_20d_percentile": _safe_float(ranked.return_20d_percentile[rank_pos]),
+                        "return_5d": _panel_feature(prepared_simulation, "return_5d", idx, symbol_id),
+                        "volume_ratio": _panel_feature(prepared_simulation, "volume_ratio", idx, symbol_id),
+                        "ma20_distance": _panel_feature(prepared_simulation, "ma20_distance", idx, symbol_id),
+                        "ma50_distance": _panel_feature(prepared_simulation, "ma50_distance", idx, symbol_id),
+                        "financial_filter_pass": bool(prepared_simulation.panel["financial_filter_pass"][idx, symbol_id]),
+                        "financial_filter_reason": prepared_simulation.feature_value(
+                            "financial_filter_reason",
+                            idx,
+                            symbol_id,
+                        ),
+                        "atr14": _panel_feature(prepared_simulation, "atr14", idx, symbol_id),
+                        atr_col: _panel_feature(prepared_simulation, atr_col, idx, symbol_id),
+                        "volatility_20d": _panel_feature(prepared_simulation, "volatility_20d", idx, symbol_id),
                         "macro_filter_pass": macro_pass,
                         "macro_filter_reason": macro_reason,
                         "macro_filter_mode": config.macro_filter_mode,
@@ -932,12 +1155,13 @@ def run_risk_on_momentum_backtest(
         pending_buys = buy_orders
         result_rows[-1]["Pending Buy Count"] = len(pending_buys)
         result_rows[-1]["Pending Sell Count"] = len(pending_sells)
+        yield
 
     final_date = dates[-1]
-    final_rows = by_date.get(final_date, pd.DataFrame())
     for symbol, position in positions.items():
-        row = _day_symbol_row(final_rows, symbol)
-        close_price = _safe_float(row.get("close")) if row is not None else position.entry_price
+        close_price = _panel_price(close_prices, len(dates) - 1, symbol_index.get(symbol))
+        if close_price is None:
+            close_price = position.entry_price
         gross_proceeds = position.quantity * float(close_price)
         gross_pnl = gross_proceeds - position.entry_notional
         net_pnl = gross_proceeds - position.entry_notional - position.entry_fee
@@ -992,6 +1216,25 @@ def run_risk_on_momentum_backtest(
             }
         )
 
+    return result_rows, trade_rows, scanner_rows
+
+
+def _finish_simulation(steps: Generator[None, None, _SwingRows]) -> _SwingRows:
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def _swing_backtest_result(
+    rows: _SwingRows,
+    *,
+    config: RiskOnMomentumConfig,
+    macro_scores: pd.DataFrame | None,
+) -> SwingBacktestResult:
+    result_rows, trade_rows, scanner_rows = rows
+    warnings: list[str] = []
     result_df = pd.DataFrame(result_rows)
     trade_log_df = pd.DataFrame(trade_rows)
     scanner_df = pd.DataFrame(scanner_rows)
@@ -1018,6 +1261,83 @@ def run_risk_on_momentum_backtest(
     )
 
 
+def _resolve_prepared_simulation(
+    price_history: pd.DataFrame,
+    config: RiskOnMomentumConfig,
+    *,
+    statement_history: pd.DataFrame | None,
+    prepared_features: pd.DataFrame | None,
+    prepared_simulation: PreparedSwingSimulationData | None,
+) -> PreparedSwingSimulationData:
+    if prepared_simulation is None:
+        features = prepared_features if prepared_features is not None else prepare_swing_feature_frame(
+            price_history,
+            statement_history=statement_history,
+        )
+        return prepare_swing_simulation_data(features, config=config)
+    if prepared_simulation.atr_column != _atr_column(config):
+        raise ValueError("Prepared swing simulation ATR period does not match the config.")
+    return prepared_simulation
+
+
+def run_risk_on_momentum_backtest(
+    price_history: pd.DataFrame,
+    *,
+    config: RiskOnMomentumConfig,
+    macro_scores: pd.DataFrame | None = None,
+    statement_history: pd.DataFrame | None = None,
+    prepared_features: pd.DataFrame | None = None,
+    prepared_simulation: PreparedSwingSimulationData | None = None,
+) -> SwingBacktestResult:
+    _validate_config(config)
+    prepared_simulation = _resolve_prepared_simulation(
+        price_history,
+        config,
+        statement_history=statement_history,
+        prepared_features=prepared_features,
+        prepared_simulation=prepared_simulation,
+    )
+    rows = _finish_simulation(
+        _simulate_swing(prepared_simulation, config, macro_lookup=build_macro_lookup(macro_scores))
+    )
+    return _swing_backtest_result(rows, config=config, macro_scores=macro_scores)
+
+
+def simulate_swing_configs(
+    prepared_simulation: PreparedSwingSimulationData,
+    configs: Sequence[RiskOnMomentumConfig],
+    *,
+    macro_scores: pd.DataFrame | None = None,
+) -> list[SwingBacktestResult]:
+    """
+    Simulate every config in one pass over the prepared dates.
+
+    All configs must match `prepared_simulation` (ATR period, start/end). Each
+    keeps its own cash, positions and rng, so results equal separate
+    `run_risk_on_momentum_backtest` calls; the day's candidate pool is built
+    once per distinct threshold set.
+    """
+
+    for config in configs:
+        _validate_config(config)
+        if prepared_simulation.atr_column != _atr_column(config):
+            raise ValueError("Prepared swing simulation ATR period does not match the config.")
+    macro_lookup = build_macro_lookup(macro_scores)
+    pool_caches: dict[int, dict[tuple[Any, ...], Any]] = {}
+    simulations = [
+        _simulate_swing(prepared_simulation, config, macro_lookup=macro_lookup, pool_caches=pool_caches)
+        for config in configs
+    ]
+    for day_index in range(len(prepared_simulation.dates)):
+        for simulation in simulations:
+            next(simulation)
+        pool_caches.pop(day_index, None)
+    return [
+        _swing_backtest_result(_finish_simulation(simulation), config=config, macro_scores=macro_scores)
+        for simulation, config in zip(simulations, configs)
+    ]
+
+
 def build_buy_and_hold_result(
     price_history: pd.DataFrame,
     *,
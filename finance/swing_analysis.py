@@ -15,6 +15,7 @@ from .swing import (
     prepare_swing_simulation_data,
     run_risk_on_momentum_backtest,
 )
+from .swing_batch import run_risk_on_momentum_batch
 
 
 @dataclass(frozen=True)
@@ -105,6 +106,44 @@ class SwingSimulationExecutor:
         self._results[key] = (result, wants_scanner)
         return result
 
+    def run_many(
+        self,
+        configs: Iterable[RiskOnMomentumConfig],
+        *,
+        max_workers: int | None = 1,
+    ) -> list[SwingBacktestResult]:
+        """`run` for many configs; cache misses are simulated together in one batch pass."""
+
+        configs = list(configs)
+        pending: dict[RiskOnMomentumConfig, RiskOnMomentumConfig] = {}
+        for config in configs:
+            cached = self._results.get(self._result_key(config))
+            if cached is not None and (cached[1] or not config.collect_scanner_rows):
+                continue
+            key = self._result_key(config)
+            if key not in pending or config.collect_scanner_rows:
+                pending[key] = config
+
+        groups: dict[tuple[int, str | None, str | None], list[RiskOnMomentumConfig]] = {}
+        for config in pending.values():
+            groups.setdefault((int(config.atr_period), config.start, config.end), []).append(config)
+        for group in groups.values():
+            results = run_risk_on_momentum_batch(
+                self.price_history,
+                group,
+                macro_scores=self.macro_scores,
+                statement_history=self.statement_history,
+                prepared_simulation=self._prepared_for(group[0]),
+                max_workers=max_workers,
+            )
+            for config, result in zip(group, results):
+                self.executed_count += 1
+                self._results[self._result_key(config)] = (result, bool(config.collect_scanner_rows))
+
+        self.request_count += len(configs)
+        self.cache_hit_count += len(configs) - len(pending)
+        return [self._results[self._result_key(config)][0] for config in configs]
+
 
 def _metric_row(
     label: str,
@@ -357,6 +396,13 @@ def build_swing_sensitivity_suite(
         )
 
     rows: list[dict[str, Any]] = []
+    if simulation_executor is not None:
+        results = simulation_executor.run_many(
+            clone_config(variant_config, collect_scanner_rows=False) for _, _, _, variant_config in variants
+        )
+        for (suite_label, variable, value, variant_config), result in zip(variants, results):
+            rows.append(_metric_row(suite_label, result, variant_config, suite="sensitivity", variable=variable, value=value))
+        return pd.DataFrame(rows)
     for suite_label, variable, value, variant_config in variants:
         result = _run_variant(
             price_history,
@@ -364,7 +410,6 @@ def build_swing_sensitivity_suite(
             macro_scores=macro_scores,
             statement_history=statement_history,
             prepared_features=prepared_features,
-            simulation_executor=simulation_executor,
         )
         rows.append(_metric_row(suite_label, result, variant_config, suite="sensitivity", variable=variable, value=value))
     return pd.DataFrame(rows)
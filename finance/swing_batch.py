@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .process_pool import process_pool_context
+from .swing import (
+    PreparedSwingSimulationData,
+    RiskOnMomentumConfig,
+    SwingBacktestResult,
+    _atr_column,
+    _validate_config,
+    prepare_swing_feature_frame,
+    prepare_swing_simulation_data,
+    simulate_swing_configs,
+)
+
+# worker로 넘길 필요가 없는 features 컬럼은 빼고, scanner가 읽는 비숫자 컬럼만 남긴다.
+_WORKER_FEATURE_COLUMNS = ("financial_filter_reason",)
+
+
+def _prepared_key(config: RiskOnMomentumConfig) -> tuple[int, str | None, str | None]:
+    return (int(config.atr_period), config.start, config.end)
+
+
+# ---------------------------------------------------------------------------
+# shared memory layout
+# ---------------------------------------------------------------------------
+
+def _prepared_arrays(prepared: PreparedSwingSimulationData) -> dict[str, np.ndarray]:
+    arrays = {f"panel:{name}": values for name, values in prepared.panel.items()}
+    arrays["row_index"] = prepared.row_index
+    arrays["trend_mask"] = prepared.trend_mask
+    arrays["breakout_mask"] = prepared.breakout_mask
+    return arrays
+
+
+def _share_prepared(prepared: PreparedSwingSimulationData) -> tuple[shared_memory.SharedMemory, dict[str, Any]]:
+    """(date x symbol) 배열을 8바이트 정렬로 하나의 shared memory 블록에 복사한다."""
+    arrays = _prepared_arrays(prepared)
+    entries: list[tuple[str, str, int]] = []
+    offset = 0
+    for name, values in arrays.items():
+        entries.append((name, values.dtype.str, offset))
+        offset += -(-values.nbytes // 8) * 8
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    shape = prepared.row_index.shape
+    for name, dtype, start in entries:
+        np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=start)[...] = arrays[name]
+    feature_columns = [column for column in _WORKER_FEATURE_COLUMNS if column in prepared.features.columns]
+    layout = {
+        "name": shm.name,
+        "shape": shape,
+        "entries": entries,
+        "dates": prepared.dates,
+        "symbols": prepared.symbols,
+        "atr_column": prepared.atr_column,
+        "start_date": prepared.start_date,
+        "end_date": prepared.end_date,
+        "features": prepared.features[feature_columns],
+    }
+    return shm, layout
+
+
+def _prepared_from_shared(shm: shared_memory.SharedMemory, layout: Mapping[str, Any]) -> PreparedSwingSimulationData:
+    shape = tuple(layout["shape"])
+    views = {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=start)
+        for name, dtype, start in layout["entries"]
+    }
+    dates = tuple(layout["dates"])
+    symbols = tuple(layout["symbols"])
+    # shared memory 버퍼를 그대로 가리키는 view; 블록은 worker 수명 동안 열어 둔다.
+    return PreparedSwingSimulationData(
+        features=layout["features"],
+        dates=dates,
+        date_positions={date_value: index for index, date_value in enumerate(dates)},
+        atr_column=layout["atr_column"],
+        start_date=layout["start_date"],
+        end_date=layout["end_date"],
+        symbols=symbols,
+        symbol_index={symbol: index for index, symbol in enumerate(symbols)},
+        row_index=views["row_index"],
+        panel={name.split(":", 1)[1]: values for name, values in views.items() if name.startswith("panel:")},
+        trend_mask=views["trend_mask"],
+        breakout_mask=views["breakout_mask"],
+    )
+
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_swing_worker(layout: Mapping[str, Any], macro_scores: pd.DataFrame | None) -> None:
+    shm = shared_memory.SharedMemory(name=layout["name"])
+    _WORKER_STATE["shm"] = shm
+    _WORKER_STATE["prepared"] = _prepared_from_shared(shm, layout)
+    _WORKER_STATE["macro_scores"] = macro_scores
+
+
+def _run_swing_shard(configs: list[RiskOnMomentumConfig]) -> list[SwingBacktestResult]:
+    return simulate_swing_configs(
+        _WORKER_STATE["prepared"],
+        configs,
+        macro_scores=_WORKER_STATE["macro_scores"],
+    )
+
+
+def _shards(count: int, workers: int) -> list[range]:
+    size = -(-count // workers)
+    return [range(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def _simulate_sharded(
+    prepared: PreparedSwingSimulationData,
+    configs: list[RiskOnMomentumConfig],
+    *,
+    macro_scores: pd.DataFrame | None,
+    workers: int,
+) -> list[SwingBacktestResult]:
+    shards = _shards(len(configs), workers)
+    shm, layout = _share_prepared(prepared)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=process_pool_context(),
+            initializer=_init_swing_worker,
+            initargs=(layout, macro_scores),
+        ) as executor:
+            futures = [executor.submit(_run_swing_shard, [configs[i] for i in shard]) for shard in shards]
+            results: list[SwingBacktestResult] = []
+            for future in futures:
+                results.extend(future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
+
+
+def run_risk_on_momentum_batch(
+    price_history: pd.DataFrame,
+    configs: Sequence[RiskOnMomentumConfig],
+    *,
+    macro_scores: pd.DataFrame | None = None,
+    statement_history: pd.DataFrame | None = None,
+    prepared_features: pd.DataFrame | None = None,
+    prepared_simulation: PreparedSwingSimulationData | None = None,
+    max_workers: int | None = 1,
+) -> list[SwingBacktestResult]:
+    """
+    Run many Risk-On Momentum 5D configs over one feature set; results follow `configs` order.
+
+    Configs are grouped by (atr_period, start, end) and each group is prepared
+    once, then simulated in lockstep over its dates. With `max_workers` > 1 a
+    group is split into contiguous shards run in worker processes that map the
+    prepared (date x symbol) arrays from one shared memory block.
+    Each result equals a separate `run_risk_on_momentum_backtest` call.
+    """
+    configs = list(configs)
+    if not configs:
+        return []
+    for config in configs:
+        _validate_config(config)
+
+    groups: dict[tuple[int, str | None, str | None], list[int]] = {}
+    for index, config in enumerate(configs):
+        groups.setdefault(_prepared_key(config), []).append(index)
+
+    prepared_by_key: dict[tuple[int, str | None, str | None], PreparedSwingSimulationData] = {}
+    if prepared_simulation is not None:
+        if any(_atr_column(config) != prepared_simulation.atr_column for config in configs):
+            raise ValueError("Prepared swing simulation ATR period does not match the config.")
+        # 호출자가 넘긴 prepared는 모든 config에 그대로 쓴다 (단건 실행과 같은 규칙).
+        groups = {_prepared_key(configs[0]): list(range(len(configs)))}
+        prepared_by_key[_prepared_key(configs[0])] = prepared_simulation
+    else:
+        features = prepared_features if prepared_features is not None else prepare_swing_feature_frame(
+            price_history,
+            statement_history=statement_history,
+        )
+        for key, indexes in groups.items():
+            prepared_by_key[key] = prepare_swing_simulation_data(features, config=configs[indexes[0]])
+
+    workers = max_workers if max_workers is not None else min(len(configs), os.cpu_count() or 1)
+    results: list[SwingBacktestResult | None] = [None] * len(configs)
+    for key, indexes in groups.items():
+        group_configs = [configs[index] for index in indexes]
+        if workers <= 1 or len(group_configs) < 2:
+            group_results = simulate_swing_configs(prepared_by_key[key], group_configs, macro_scores=macro_scores)
+        else:
+            group_results = _simulate_sharded(
+                prepared_by_key[key],
+                group_configs,
+                macro_scores=macro_scores,
+                workers=min(int(workers), len(group_configs)),
+            )
+        for index, result in zip(indexes, group_results):
+            results[index] = result
+    return [result for result in results if result is not None]
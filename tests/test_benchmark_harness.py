@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.cases import iter_cases
+from benchmarks.fixtures import fixture_rows, synthetic_price_history, synthetic_strategy_dfs
+from benchmarks.harness import BenchmarkResult, compare_results, load_baseline, run_cases, save_results
+
+
+def _result(case_id: str, time_sec: float, memory_mb: float) -> BenchmarkResult:
+    return BenchmarkResult(case_id, "g", "n", 10, 5, 3, time_sec, time_sec, memory_mb)
+
+
+class BenchmarkFixtureTests(unittest.TestCase):
+    def test_fixtures_are_deterministic_and_consistent(self) -> None:
+        history = synthetic_price_history(10, 5)
+        self.assertEqual(len(history), fixture_rows(10, 5))
+        self.assertTrue(history.equals(synthetic_price_history(10, 5)))
+
+        dfs = synthetic_strategy_dfs(10, 5)
+        first = history[history["symbol"] == "S00000"]["close"].to_numpy()
+        self.assertEqual(first.tolist(), dfs["S00000"]["Close"].tolist())
+
+    def test_case_grid_respects_row_and_symbol_caps(self) -> None:
+        ids = {case.case_id for case in iter_cases(symbol_counts=(10, 5_000), year_spans=(5, 30))}
+        self.assertIn("strategy.gtaa3[10x30y]", ids)
+        self.assertNotIn("loader.load_ohlcv_many_mysql[5000x30y]", ids)
+        self.assertNotIn("swing.run_risk_on_momentum_backtest[5000x5y]", ids)
+        self.assertIn("performance.portfolio_performance_summary[1x5y]", ids)
+
+
+class BenchmarkHarnessTests(unittest.TestCase):
+    def test_smoke_run_measures_strategy_transform_and_loader_cases(self) -> None:
+        cases = [
+            case
+            for case in iter_cases(symbol_counts=(10,), year_spans=(5,))
+            if case.name in {"gtaa3", "add_ma", "load_ohlcv_many_mysql", "price_store_load_matrix"}
+        ]
+        self.assertEqual(len(cases), 4)
+
+        results = run_cases(cases, repeat=1, warmup=0)
+
+        for result in results:
+            self.assertGreater(result.time_min_sec, 0.0)
+            self.assertGreaterEqual(result.peak_memory_mb, 0.0)
+
+    def test_compare_flags_regressions_beyond_tolerance_and_noise_floor(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "baseline.json"
+            save_results(path, [_result("slow", 0.100, 50.0), _result("tiny", 0.001, 0.1), _result("same", 0.2, 10.0)])
+            baseline = load_baseline(path)
+
+        comparisons = {
+            item.case_id: item
+            for item in compare_results(
+                [
+                    _result("slow", 0.200, 80.0),
+                    _result("tiny", 0.003, 0.5),
+                    _result("same", 0.21, 10.0),
+                    _result("new", 1.0, 1.0),
+                ],
+                baseline,
+                tolerance=0.25,
+            )
+        }
+
+        self.assertTrue(comparisons["slow"].regressed)
+        self.assertEqual(len(comparisons["slow"].reasons), 2)
+        self.assertFalse(comparisons["tiny"].regressed)
+        self.assertFalse(comparisons["same"].regressed)
+        self.assertFalse(comparisons["new"].regressed)
+        self.assertEqual(comparisons["new"].reasons, ["no baseline"])
+
+    def test_default_baseline_is_committed_and_covers_the_default_grid(self) -> None:
+        from benchmarks.__main__ import DEFAULT_BASELINE_PATH
+
+        self.assertEqual(DEFAULT_BASELINE_PATH.parent, Path(__file__).resolve().parents[1] / "benchmarks")
+        baseline = load_baseline(DEFAULT_BASELINE_PATH)
+
+        self.assertIn("environment", baseline)
+        self.assertLessEqual({case.case_id for case in iter_cases()}, set(baseline["results"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from app.jobs import ingestion_jobs
+from app.jobs.ingestion.common import build_result
+from finance.data.provider_gate import ProviderGate, get_provider_gate
+
+
+def _ok(job_name: str, symbols: list[str], rows: int) -> dict:
+    return build_result(
+        job_name=job_name,
+        status="success",
+        started_at="",
+        finished_at="",
+        duration_sec=0.0,
+        rows_written=rows,
+        symbols_requested=len(symbols),
+        symbols_processed=len(symbols),
+        details={"missing_symbols": [], "rerun_missing_payload": ""},
+    )
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.log: list[tuple[str, str, tuple[str, ...]]] = []
+
+    def mark(self, stage: str, edge: str, symbols: list[str]) -> None:
+        with self.lock:
+            self.log.append((stage, edge, tuple(symbols)))
+
+    def index(self, stage: str, edge: str, symbols: list[str]) -> int:
+        return self.log.index((stage, edge, tuple(symbols)))
+
+
+class CoreMarketDataPipelineTests(unittest.TestCase):
+    def _run(
+        self,
+        recorder: _Recorder,
+        *,
+        failing_ohlcv: set[str] = frozenset(),
+        rate_limited_ohlcv: set[str] = frozenset(),
+        **kwargs,
+    ):
+        def fake_ohlcv(symbols, *, progress_callback=None, **_):
+            recorder.mark("ohlcv", "start", symbols)
+            if progress_callback is not None:
+                progress_callback({"event": "batch_progress", "processed_symbols": 1, "rows_written": 3})
+            time.sleep(0.05)
+            if rate_limited_ohlcv & set(symbols):
+                # Mirrors the in-job circuit breaker: announce the cooldown, then sleep it off.
+                if progress_callback is not None:
+                    progress_callback({"event": "rate_limit_cooldown", "cooldown_sec": 0.1})
+                recorder.mark("ohlcv", "cooldown_start", symbols)
+                time.sleep(0.1)
+                recorder.mark("ohlcv", "cooldown_end", symbols)
+            recorder.mark("ohlcv", "end", symbols)
+            if failing_ohlcv & set(symbols):
+                return build_result(
+                    job_name="collect_ohlcv",
+                    status="failed",
+                    started_at="",
+                    finished_at="",
+                    duration_sec=0.0,
+                    rows_written=0,
+                    failed_symbols=list(symbols),
+                    message="provider down",
+                )
+            return _ok("collect_ohlcv", symbols, 10 * len(symbols))
+
+        def fake_fundamentals(symbols, *, freq):
+            recorder.mark("fundamentals", "start", symbols)
+            time.sleep(0.02)
+            recorder.mark("fundamentals", "end", symbols)
+            return _ok("collect_fundamentals", symbols, len(symbols))
+
+        def fake_factors(symbols, *, freq, start, end):
+            recorder.mark("factors", "start", symbols)
+            return _ok("calculate_factors", symbols, len(symbols))
+
+        events: list[dict] = []
+        with (
+            patch.object(ingestion_jobs, "run_collect_ohlcv", side_effect=fake_ohlcv),
+            patch.object(ingestion_jobs, "run_collect_fundamentals", side_effect=fake_fundamentals),
+            patch.object(ingestion_jobs, "run_calculate_factors", side_effect=fake_factors),
+        ):
+            result = ingestion_jobs.run_pipeline_core_market_data(
+                ["AAA", "BBB", "CCC", "DDD", "EEE"],
+                batch_size=2,
+                progress_callback=events.append,
+                **kwargs,
+            )
+        return result, events
+
+    def test_fundamentals_overlap_next_ohlcv_batch_and_factors_wait_for_both(self) -> None:
+        recorder = _Recorder()
+        result, events = self._run(recorder)
+
+        first, second = ["AAA", "BBB"], ["CCC", "DDD"]
+        self.assertLess(recorder.index("fundamentals", "start", first), recorder.index("ohlcv", "end", second))
+        for batch in (first, second, ["EEE"]):
+            self.assertLess(recorder.index("fundamentals", "end", batch), recorder.index("factors", "start", batch))
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual([step["job_name"] for step in result["details"]["steps"]], [
+            "collect_ohlcv",
+            "collect_fundamentals",
+            "calculate_factors",
+        ])
+        self.assertEqual(result["details"]["steps"][0]["rows_written"], 50)
+        self.assertEqual(result["rows_written"], 60)
+        self.assertEqual(result["details"]["pipeline"]["batch_count"], 3)
+
+        stage_events = [(event["event"], event["stage"]) for event in events if event["event"] != "batch_progress"]
+        for stage in ("ohlcv", "fundamentals", "factors"):
+            self.assertEqual(stage_events.count(("stage_start", stage)), 1)
+            self.assertEqual(stage_events.count(("stage_complete", stage)), 1)
+            self.assertLess(stage_events.index(("stage_start", stage)), stage_events.index(("stage_complete", stage)))
+        ohlcv_progress = [event for event in events if event["event"] == "batch_progress" and event["stage"] == "ohlcv"]
+        self.assertEqual(ohlcv_progress[-1]["processed_symbols"], 5)
+        self.assertEqual(ohlcv_progress[-1]["total_symbols"], 5)
+        self.assertEqual(ohlcv_progress[-1]["total_batches"], 3)
+
+    def test_failed_ohlcv_batch_is_not_passed_downstream(self) -> None:
+        recorder = _Recorder()
+        result, _ = self._run(recorder, failing_ohlcv={"CCC"})
+
+        started = {(stage, symbols) for stage, edge, symbols in recorder.log if edge == "start"}
+        self.assertNotIn(("fundamentals", ("CCC", "DDD")), started)
+        self.assertNotIn(("factors", ("CCC", "DDD")), started)
+        self.assertEqual(result["status"], "partial_success")
+        ohlcv_step, fundamentals_step, _ = result["details"]["steps"]
+        self.assertEqual(ohlcv_step["status"], "partial_success")
+        self.assertEqual(ohlcv_step["failed_symbols"], ["CCC", "DDD"])
+        self.assertEqual(fundamentals_step["details"]["skipped_symbols"], ["CCC", "DDD"])
+
+    def test_all_ohlcv_batches_failing_stops_pipeline(self) -> None:
+        recorder = _Recorder()
+        result, _ = self._run(recorder, failing_ohlcv={"AAA", "CCC", "EEE"})
+
+        self.assertEqual(result["status"], "failed")
+        self.assertEqual(result["message"], "Pipeline stopped because OHLCV collection failed.")
+        self.assertEqual([step["job_name"] for step in result["details"]["steps"]], ["collect_ohlcv"])
+        self.assertFalse(any(stage != "ohlcv" for stage, _, _ in recorder.log))
+
+
+class ProviderGateTests(unittest.TestCase):
+    def test_slots_bound_concurrent_requests(self) -> None:
+        gate = ProviderGate("test", 2)
+        lock = threading.Lock()
+        active: list[int] = [0]
+        peak: list[int] = [0]
+
+        def request() -> None:
+            with gate.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak[0], 2)
+
+    def test_cooldown_from_one_path_holds_back_new_requests_from_another(self) -> None:
+        gate = ProviderGate("test", 3)
+        gate.pause(0.1)
+
+        started = time.monotonic()
+        with gate.slot():
+            waited = time.monotonic() - started
+
+        self.assertGreaterEqual(waited, 0.09)
+        self.assertEqual(gate.remaining_pause(), 0.0)
+
+    def test_ohlcv_and_fundamentals_share_the_yahoo_gate(self) -> None:
+        from finance.data import data as data_module, fundamentals as fundamentals_module
+
+        self.assertIs(data_module.provider_slot, fundamentals_module.provider_slot)
+        self.assertEqual(data_module.YAHOO_PROVIDER, fundamentals_module.YAHOO_PROVIDER)
+        self.assertGreater(get_provider_gate(data_module.YAHOO_PROVIDER).max_concurrency, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
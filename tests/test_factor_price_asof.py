@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import unittest
+
+import pandas as pd
+
+from finance.data.factors import _attach_price_asof
+
+
+class FactorPriceAsofTests(unittest.TestCase):
+    def test_single_pass_asof_matches_prior_close_per_symbol_in_symbol_order(self) -> None:
+        fund = pd.DataFrame(
+            [
+                {"symbol": "MSFT ", "period_end": "2025-12-31"},
+                {"symbol": "AAPL", "period_end": "2025-12-31"},
+                {"symbol": "MSFT", "period_end": "2025-09-30"},
+                {"symbol": "NOPX", "period_end": "2025-09-30"},
+                {"symbol": "AAPL", "period_end": None},
+                {"symbol": "AAPL", "period_end": "2025-06-30"},
+            ]
+        )
+        price = pd.DataFrame(
+            [
+                {"symbol": "AAPL", "date": "2025-12-31", "close": 250.0},
+                {"symbol": "MSFT", "date": "2025-12-29", "close": 480.0},
+                {"symbol": "MSFT", "date": "2025-09-30", "close": 510.0},
+                {"symbol": "AAPL", "date": "2025-06-27", "close": 200.0},
+                {"symbol": "MSFT", "date": "2026-01-02", "close": 999.0},
+            ]
+        )
+
+        result = _attach_price_asof(fund, price)
+
+        self.assertEqual(result["symbol"].tolist(), ["MSFT", "MSFT", "AAPL", "AAPL", "NOPX"])
+        self.assertEqual(
+            result["period_end"].dt.strftime("%Y-%m-%d").tolist(),
+            ["2025-09-30", "2025-12-31", "2025-06-30", "2025-12-31", "2025-09-30"],
+        )
+        self.assertEqual(result["price"].tolist()[:4], [510.0, 480.0, 200.0, 250.0])
+        self.assertEqual(result["price_match_gap_days"].tolist()[:4], [0, 2, 3, 0])
+        self.assertTrue(pd.isna(result.loc[4, "price"]))
+        self.assertTrue(pd.isna(result.loc[4, "price_date"]))
+        self.assertTrue(pd.isna(result.loc[4, "price_match_gap_days"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,33 @@ def _context_fixture(index: pd.Index) -> pd.DataFrame:
     return frame
 
 
+def _reference_analog_ranking(
+    predictors: pd.DataFrame,
+    *,
+    current_date: pd.Timestamp,
+    horizon: int,
+    max_episodes: int,
+) -> pd.DataFrame:
+    from app.services.futures_macro_outlook_model import MOMENTUM_PREDICTOR_COLUMNS
+
+    position = predictors.index.get_loc(current_date)
+    train = predictors.iloc[: position - max(1, horizon)]
+    scale = train.quantile(0.75) - train.quantile(0.25)
+    scale = scale.where(scale.abs() > 1e-9, 1.0)
+    squared = train.sub(predictors.loc[current_date]).divide(scale).pow(2)
+    distance = squared.mean(axis=1, skipna=True).pow(0.5).where(
+        squared.notna().sum(axis=1) >= max(4, math.ceil(len(MOMENTUM_PREDICTOR_COLUMNS) * 0.75))
+    )
+    accepted: list[int] = []
+    for value in distance.dropna().sort_values().index:
+        candidate = predictors.index.get_loc(value)
+        if all(abs(candidate - prior) >= max(1, horizon) for prior in accepted):
+            accepted.append(candidate)
+        if len(accepted) >= max_episodes:
+            break
+    return distance.iloc[accepted].rename("combined_distance").rename_axis("as_of_date").reset_index()
+
+
 class MomentumPredictorTests(unittest.TestCase):
     def test_inner_selection_chooses_momentum_when_it_has_lower_brier(self) -> None:
         from app.services.futures_macro_outlook_model import (
@@ -214,6 +241,56 @@ class MomentumPredictorTests(unittest.TestCase):
             math.exp(-ranked.iloc[0]["combined_distance"] / 2.0),
         )
 
+
+    def test_shared_episode_index_matches_reference_ranking(self) -> None:
+        from app.services.futures_macro_outlook_model import (
+            CANDIDATES,
+            AnalogEpisodeIndex,
+            rank_weighted_analog_episodes,
+        )
+
+        predictors = _predictor_fixture(160)
+        predictors.iloc[::7, 2] = float("nan")
+        context = _context_fixture(predictors.index)
+        index = AnalogEpisodeIndex(predictors, context)
+        for position in (40, 97, 159):
+            current_date = predictors.index[position]
+            for horizon in (5, 20):
+                expected = _reference_analog_ranking(
+                    predictors,
+                    current_date=current_date,
+                    horizon=horizon,
+                    max_episodes=30,
+                )
+                for candidate in CANDIDATES:
+                    shared = rank_weighted_analog_episodes(
+                        predictors,
+                        context,
+                        current_date=current_date,
+                        horizon=horizon,
+                        candidate=candidate,
+                        temperature=0.5,
+                        max_episodes=30,
+                        episode_index=index,
+                    )
+                    fresh = rank_weighted_analog_episodes(
+                        predictors,
+                        context,
+                        current_date=current_date,
+                        horizon=horizon,
+                        candidate=candidate,
+                        temperature=0.5,
+                        max_episodes=30,
+                    )
+
+                    pd.testing.assert_frame_equal(shared, fresh)
+                    if candidate is CANDIDATES[0]:
+                        pd.testing.assert_frame_equal(
+                            shared[["as_of_date", "combined_distance"]],
+                            expected,
+                            check_exact=True,
+                        )
+
     def test_missing_macro_context_disables_hybrid_but_not_momentum(self) -> None:
         from app.services.futures_macro_outlook_model import (
             CANDIDATES,
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.services.futures_macro_pattern_outlook_cache import (
+    PATTERN_OUTLOOK_CACHE_ENABLED_ENV,
+    PatternOutlookCache,
+    default_pattern_outlook_cache,
+)
+
+
+def _prepared(fingerprint: str = "a" * 64) -> dict[str, object]:
+    return {
+        "selected_symbols": ("ES=F", "ZN=F"),
+        "candles": None,
+        "features": None,
+        "current_pattern": {"as_of_date": "2026-07-17"},
+        "context_frame": None,
+        "session": {"status": "OBSERVED", "latest_final_session": "2026-07-17"},
+        "as_of_date": "2026-07-17",
+        "input_fingerprint": fingerprint,
+        "input_evidence": {"final_daily_row_count": 10},
+    }
+
+
+class PatternOutlookCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+
+    def test_round_trip_is_shared_between_instances_and_leaves_no_temp_files(self) -> None:
+        snapshot = {"status": "READY", "horizons": [{"brier_score": float("nan"), "episode_count": 31}]}
+        PatternOutlookCache(self.root).store("key-1", snapshot)
+
+        loaded = PatternOutlookCache(self.root).load("key-1")
+
+        self.assertEqual(json.dumps(loaded, sort_keys=True), json.dumps(snapshot, sort_keys=True))
+        self.assertIsNone(PatternOutlookCache(self.root).load("key-2"))
+        self.assertEqual([path.suffix for path in self.root.iterdir()], [".json"])
+
+    def test_rejects_foreign_format_and_corrupt_files(self) -> None:
+        cache = PatternOutlookCache(self.root)
+        cache.store("key-1", {"status": "READY"})
+        payload = json.loads(cache.path("key-1").read_text(encoding="utf-8"))
+        payload["format_version"] = -1
+        cache.path("key-1").write_text(json.dumps(payload), encoding="utf-8")
+        self.assertIsNone(cache.load("key-1"))
+
+        cache.path("key-2").write_text("{", encoding="utf-8")
+        self.assertIsNone(cache.load("key-2"))
+
+    def test_evicts_least_recently_read_snapshots_over_the_size_budget(self) -> None:
+        body = {"payload": "x" * 1_000}
+        probe = PatternOutlookCache(self.root / "probe")
+        probe.store("a", body)
+        entry_bytes = probe.path("a").stat().st_size
+        cache = PatternOutlookCache(self.root / "bounded", max_bytes=entry_bytes * 2 + entry_bytes // 2)
+
+        cache.store("a", body)
+        cache.store("b", body)
+        os.utime(cache.path("a"), (1, 1))
+        os.utime(cache.path("b"), (2, 2))
+        self.assertIsNotNone(cache.load("a"))
+        cache.store("c", body)
+
+        self.assertIsNotNone(cache.load("a"))
+        self.assertIsNone(cache.load("b"))
+        self.assertIsNotNone(cache.load("c"))
+        self.assertFalse(cache.store("huge", {"payload": "x" * (entry_bytes * 3)}))
+
+    def test_enable_env_turns_the_default_cache_off(self) -> None:
+        with patch.dict(os.environ, {PATTERN_OUTLOOK_CACHE_ENABLED_ENV: "off"}):
+            self.assertIsNone(default_pattern_outlook_cache())
+        with patch.dict(os.environ, {PATTERN_OUTLOOK_CACHE_ENABLED_ENV: "1"}):
+            self.assertIsInstance(default_pattern_outlook_cache(), PatternOutlookCache)
+
+
+class PatternOutlookCacheWiringTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = PatternOutlookCache(self.tmp.name)
+
+    def test_finished_outlook_is_read_back_by_input_fingerprint(self) -> None:
+        import app.services.futures_macro_pattern_validation as service
+
+        builds: list[int] = []
+
+        def build(*_args, **_kwargs):
+            builds.append(1)
+            return {"status": "READY", "call": len(builds)}
+
+        with patch.object(service, "build_pattern_outlook_snapshot", side_effect=build):
+            first = service.build_overview_futures_macro_pattern_outlook_from_inputs(
+                _prepared(), cache=self.cache
+            )
+            pending = _prepared()
+            pending["session"] = {"status": "PENDING_SESSION_FINALIZATION", "pending_session": "2026-07-20"}
+            second = service.build_overview_futures_macro_pattern_outlook_from_inputs(
+                pending, cache=self.cache
+            )
+            third = service.build_overview_futures_macro_pattern_outlook_from_inputs(
+                _prepared("b" * 64), cache=self.cache
+            )
+
+        self.assertEqual(len(builds), 2)
+        self.assertEqual((first["call"], second["call"], third["call"]), (1, 1, 2))
+        self.assertEqual(second["session"]["status"], "PENDING_SESSION_FINALIZATION")
+        self.assertEqual(second["input_fingerprint"], "a" * 64)
+
+    def test_cache_key_tracks_feature_schema_version(self) -> None:
+        import app.services.futures_macro_pattern_validation as service
+
+        key = service.pattern_outlook_cache_key(_prepared())
+        with patch.object(service, "PATTERN_STATE_SCHEMA_VERSION", "next_schema"):
+            self.assertNotEqual(service.pattern_outlook_cache_key(_prepared()), key)
+        self.assertIsNone(service.pattern_outlook_cache_key(_prepared("short")))
+
+    def test_warm_builds_once_then_reports_hits(self) -> None:
+        import app.services.futures_macro_pattern_validation as service
+
+        with (
+            patch.object(service, "prepare_overview_futures_macro_pattern_inputs", return_value=_prepared()),
+            patch.object(service, "build_pattern_outlook_snapshot", return_value={"status": "READY"}) as build,
+        ):
+            first = service.warm_overview_futures_macro_pattern_outlook_cache(cache=self.cache)
+            second = service.warm_overview_futures_macro_pattern_outlook_cache(cache=self.cache)
+
+        self.assertEqual((first["status"], second["status"]), ("stored", "hit"))
+        build.assert_called_once()
+
+    def test_overview_automation_schedules_the_warm_job(self) -> None:
+        from app.jobs import ingestion_jobs, overview_automation
+
+        spec = next(
+            item
+            for item in overview_automation.OVERVIEW_AUTOMATION_JOB_SPECS
+            if item.job_id == "futures_macro_pattern_outlook"
+        )
+        self.assertEqual(spec.cadence_minutes, 24 * 60)
+        self.assertIn("safe", spec.profiles)
+
+        result = ingestion_jobs.run_warm_futures_macro_pattern_outlook_cache(
+            warm_fn=lambda: {"status": "stored", "input_fingerprint": "a" * 64}
+        )
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["details"]["input_fingerprint"], "a" * 64)
+        failed = ingestion_jobs.run_warm_futures_macro_pattern_outlook_cache(
+            warm_fn=lambda: (_ for _ in ()).throw(RuntimeError("db down"))
+        )
+        self.assertEqual(failed["status"], "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
@@ -34,6 +35,42 @@ def _outlook_fixture(*, days: int) -> dict[str, object]:
     }
 
 
+def _reference_similar_episodes(
+    features: pd.DataFrame,
+    *,
+    current_date: pd.Timestamp,
+    horizon: int,
+    max_episodes: int = 120,
+) -> pd.DataFrame:
+    from app.services.futures_macro_pattern import PATTERN_FEATURE_COLUMNS
+    from app.services.futures_macro_pattern_validation import SIMILARITY_SUFFIXES
+
+    columns = [
+        column
+        for column in PATTERN_FEATURE_COLUMNS
+        if column in features.columns and column.endswith(SIMILARITY_SUFFIXES)
+    ]
+    position = features.index.get_loc(current_date)
+    train = features.iloc[: position - horizon][columns].replace([float("inf"), float("-inf")], pd.NA)
+    scale = train.quantile(0.75) - train.quantile(0.25)
+    scale = scale.where(scale.abs() > 1e-9, 1.0)
+    current = features.loc[current_date, columns]
+    distance = train.sub(current).divide(scale).pow(2).mean(axis=1, skipna=True).pow(0.5)
+    accepted: list[int] = []
+    for value in distance.dropna().sort_values().index:
+        candidate = features.index.get_loc(value)
+        if all(abs(candidate - prior) >= max(1, horizon) for prior in accepted):
+            accepted.append(candidate)
+        if len(accepted) >= max_episodes:
+            break
+    return pd.DataFrame(
+        {
+            "as_of_date": features.index[accepted],
+            "similarity_distance": distance.iloc[accepted].astype(float).to_numpy(),
+        }
+    )
+
+
 class FuturesMacroPatternOutcomeTests(unittest.TestCase):
     def test_same_state_target_uses_the_canonical_future_session_state(self) -> None:
         from app.services.futures_macro_pattern import (
@@ -341,6 +378,31 @@ class FuturesMacroPatternOutcomeTests(unittest.TestCase):
         )
 
 
+    def test_episode_index_reproduces_reference_rankings_across_origins(self) -> None:
+        from app.services.futures_macro_pattern_validation import (
+            PatternEpisodeIndex,
+            select_similar_episodes,
+        )
+
+        _, features = _validation_fixture(days=320)
+        index = PatternEpisodeIndex(features)
+        for position in (30, 150, len(features) - 1):
+            current_date = features.index[position]
+            for horizon in (5, 20):
+                expected = _reference_similar_episodes(
+                    features,
+                    current_date=current_date,
+                    horizon=horizon,
+                )
+                for _ in range(2):
+                    matches = select_similar_episodes(
+                        features,
+                        current_date=current_date,
+                        horizon=horizon,
+                        episode_index=index,
+                    )
+                    pd.testing.assert_frame_equal(matches, expected, check_exact=True)
+
 class FuturesMacroPatternPublicationTests(unittest.TestCase):
     def test_v2_probability_gate_distinguishes_verified_provisional_and_no_edge(self) -> None:
         from app.services.futures_macro_pattern_validation import (
@@ -528,6 +590,33 @@ class FuturesMacroPatternPublicationTests(unittest.TestCase):
             self.assertIn("vector_status", horizon)
             self.assertIn("terminal_regions", horizon)
 
+    def test_process_pool_snapshot_matches_sequential_snapshot(self) -> None:
+        import app.services.futures_macro_pattern_validation as service
+
+        fixture = _outlook_fixture(days=360)
+        submitted: list[int] = []
+        prefill = service._prefill_forecast_cache
+
+        def recording_prefill(executor, forecast_cache, **kwargs):
+            before = len(forecast_cache)
+            prefill(executor, forecast_cache, **kwargs)
+            submitted.append(len(forecast_cache) - before)
+
+        with (
+            patch.object(service, "NESTED_OUTER_MINIMUM_TRAIN", 180),
+            patch.object(service, "NESTED_INNER_MINIMUM_TRAIN", 120),
+        ):
+            sequential = service.build_pattern_outlook_snapshot(**fixture)
+            with patch.object(service, "_prefill_forecast_cache", side_effect=recording_prefill):
+                parallel = service.build_pattern_outlook_snapshot(**fixture, max_workers=2)
+
+        self.assertGreater(sum(submitted), 0)
+        self.assertGreater(sequential["horizons"][0]["evaluation_count"], 0)
+        self.assertEqual(
+            json.dumps(parallel, default=str, sort_keys=True),
+            json.dumps(sequential, default=str, sort_keys=True),
+        )
+
     def test_publication_gate_constants_remain_unchanged_for_ten_year_history(self) -> None:
         from app.services.futures_macro_pattern_validation import (
             MIN_INDEPENDENT_EPISODES,
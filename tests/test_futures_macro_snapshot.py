@@ -665,6 +665,7 @@ class FuturesMacroSnapshotServiceTests(unittest.TestCase):
             force_refresh=True,
             cache_ttl_seconds=0,
             evaluation_time=unittest.mock.ANY,
+            max_workers=1,
         )
 
 
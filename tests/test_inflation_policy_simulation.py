@@ -185,3 +185,58 @@ def test_next_pce_scenario_reweights_policy_hike_probability_from_joint_paths()
     )
 
     assert 0.0 < cool < hot < 1.0
+
+
+def test_path_bundle_matches_tuple_paths_and_pads_shorter_rate_paths() -> None:
+    from dataclasses import replace
+
+    from finance.inflation_policy_simulation import (
+        RateTargetCondition,
+        SimulationPathBundle,
+        calculate_target_probability,
+        condition_paths_on_target,
+    )
+
+    paths = _paths() + (
+        replace(
+            _paths()[2],
+            path_id="short-hot",
+            weight=0.10,
+            remaining_monthly_mom_pct=(0.4,),
+            rate_paths_pct={"DGS10": (4.74, 4.80)},
+        ),
+    )
+    bundle = SimulationPathBundle.from_paths(paths)
+
+    assert bundle.rate_paths_pct["DGS10"].shape == (5, 5)
+    assert tuple(bundle) == paths
+    assert bundle[-1] == paths[-1]
+    for condition in ("REACH", "BREAK", "HOLD"):
+        target = RateTargetCondition(
+            instrument="DGS10",
+            zone_lower_pct=4.70,
+            zone_upper_pct=4.72,
+            condition=condition,
+            buffer_pct=0.0,
+            hold_days=2,
+        )
+        assert calculate_target_probability(bundle, target) == (
+            calculate_target_probability(paths, target)
+        )
+        assert condition_paths_on_target(
+            bundle, target, minimum_supporting_paths=1, minimum_effective_paths=1.0
+        ) == condition_paths_on_target(
+            paths, target, minimum_supporting_paths=1, minimum_effective_paths=1.0
+        )
+    with pytest.raises(ValueError, match="missing DGS2"):
+        calculate_target_probability(
+            bundle,
+            RateTargetCondition(
+                instrument="DGS2",
+                zone_lower_pct=4.0,
+                zone_upper_pct=4.1,
+                condition="REACH",
+                buffer_pct=0.0,
+                hold_days=1,
+            ),
+        )
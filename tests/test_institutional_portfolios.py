@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 import sys
+import tempfile
 import unittest
+import zipfile
 from pathlib import Path
 
 import pandas as pd
@@ -32,6 +34,71 @@ def _css_rule(style_source: str, *selectors: str) -> str:
     return match.group("body")
 
 
+def _streaming_fixture_frames() -> dict[str, pd.DataFrame]:
+    holding = {"TITLEOFCLASS": "COM", "SSHPRNAMTTYPE": "SH", "FIGI": "", "PUTCALL": "", "VOTING_AUTH_SOLE": "1,000"}
+    return {
+        "submission": pd.DataFrame(
+            [
+                {"ACCESSION_NUMBER": "base", "FILING_DATE": "15-MAY-2026", "SUBMISSIONTYPE": "13F-HR", "CIK": "0001067983", "PERIODOFREPORT": "31-MAR-2026"},
+                {"ACCESSION_NUMBER": "second", "FILING_DATE": "14-AUG-2026", "SUBMISSIONTYPE": "13F-HR", "CIK": "0001350694", "PERIODOFREPORT": "30-JUN-2026"},
+                {"ACCESSION_NUMBER": "partial", "FILING_DATE": "14-AUG-2026", "SUBMISSIONTYPE": "13F-HR", "CIK": "0001649339", "PERIODOFREPORT": "30-JUN-2026"},
+            ]
+        ),
+        "coverpage": pd.DataFrame(
+            [
+                {"ACCESSION_NUMBER": "base", "FILINGMANAGER_NAME": "Berkshire", "ISAMENDMENT": "N"},
+                {"ACCESSION_NUMBER": "second", "FILINGMANAGER_NAME": "Icahn", "ISAMENDMENT": "N"},
+                {"ACCESSION_NUMBER": "partial", "FILINGMANAGER_NAME": "Scion", "ISAMENDMENT": "N"},
+            ]
+        ),
+        "summarypage": pd.DataFrame(
+            [
+                {"ACCESSION_NUMBER": "base", "TABLEENTRYTOTAL": "2"},
+                {"ACCESSION_NUMBER": "second", "TABLEENTRYTOTAL": "1"},
+                {"ACCESSION_NUMBER": "partial", "TABLEENTRYTOTAL": "2"},
+            ]
+        ),
+        "infotable": pd.DataFrame(
+            [
+                {**holding, "ACCESSION_NUMBER": "base", "INFOTABLE_SK": "1", "NAMEOFISSUER": "APPLE INC", "CUSIP": "037833100", "VALUE": "1,000", "SSHPRNAMT": "10"},
+                {**holding, "ACCESSION_NUMBER": "partial", "INFOTABLE_SK": "7", "NAMEOFISSUER": "APPLE INC", "CUSIP": "037833100", "VALUE": "n/a", "SSHPRNAMT": "3"},
+                {**holding, "ACCESSION_NUMBER": "second", "INFOTABLE_SK": "3.0", "NAMEOFISSUER": "CVR ENERGY", "CUSIP": "12662p108", "VALUE": "500", "SSHPRNAMT": "5"},
+                {**holding, "ACCESSION_NUMBER": "partial", "INFOTABLE_SK": "8", "NAMEOFISSUER": " ", "CUSIP": "060505104", "VALUE": "2", "SSHPRNAMT": "2"},
+                {**holding, "ACCESSION_NUMBER": "base", "INFOTABLE_SK": "2", "NAMEOFISSUER": "BANK OF AMERICA CORP", "CUSIP": "060505104", "VALUE": "2000", "SSHPRNAMT": "null"},
+            ]
+        ),
+    }
+
+
+def _write_sec_13f_zip(path: Path, frames: dict[str, pd.DataFrame]) -> Path:
+    names = {"submission": "SUBMISSION.tsv", "coverpage": "COVERPAGE.tsv", "summarypage": "SUMMARYPAGE.tsv", "infotable": "INFOTABLE.tsv"}
+    with zipfile.ZipFile(path, "w") as archive:
+        for key, frame in frames.items():
+            archive.writestr(names[key], frame.to_csv(sep="\t", index=False))
+    return path
+
+
+class _RecordingSec13FDB:
+    def __init__(self, completed: set[str] | None = None) -> None:
+        self.completed = set(completed or ())
+        self.calls: list[tuple[str, list[dict]]] = []
+
+    def query(self, sql: str, params=None) -> list[dict]:
+        if "institutional_13f_ingest_progress" in sql:
+            return [{"accession_number": accession} for accession in sorted(self.completed)]
+        return []
+
+    def executemany(self, sql: str, rows: list[dict]) -> None:
+        table = re.search(r"INSERT INTO (\w+)", sql).group(1)
+        self.calls.append((table, list(rows)))
+
+    def batches(self, table: str) -> list[list[dict]]:
+        return [rows for name, rows in self.calls if name == table]
+
+    def rows(self, table: str) -> list[dict]:
+        return [row for batch in self.batches(table) for row in batch]
+
+
 class Sec13FDataSetParserTests(unittest.TestCase):
     def test_normalize_sec_13f_frames_preserves_filing_timing_and_holdings(self) -> None:
         from finance.data.institutional_13f import SEC_13F_SOURCE_CAVEATS, normalize_sec_13f_frames
@@ -189,6 +256,59 @@ class Sec13FDataSetParserTests(unittest.TestCase):
         self.assertEqual(normalized["managers"], [])
         self.assertEqual(normalized["holdings"], [])
 
+    def test_streaming_ingest_matches_bulk_normalization_chunk_by_chunk(self) -> None:
+        from finance.data.institutional_13f import normalize_sec_13f_frames, store_sec_13f_dataset_zip_streaming
+
+        frames = _streaming_fixture_frames()
+        normalized = normalize_sec_13f_frames(
+            frames, source_dataset="2026-q2", source_ref="dataset.zip", collected_at="2026-08-20 00:00:00"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = _write_sec_13f_zip(Path(tmp) / "dataset.zip", frames)
+            db = _RecordingSec13FDB()
+            progress: list[dict] = []
+            summary = store_sec_13f_dataset_zip_streaming(
+                db,
+                zip_path,
+                source_dataset="2026-q2",
+                source_ref="dataset.zip",
+                collected_at="2026-08-20 00:00:00",
+                chunk_rows=2,
+                progress_callback=progress.append,
+            )
+
+        self.assertEqual(db.rows("institutional_13f_holding"), normalized["holdings"])
+        self.assertEqual(db.rows("institutional_13f_manager"), normalized["managers"])
+        self.assertEqual(db.rows("institutional_13f_filing"), normalized["filings"])
+        self.assertGreater(len(db.batches("institutional_13f_holding")), 1)
+        self.assertTrue(all(len(batch) <= 2 for batch in db.batches("institutional_13f_holding")))
+        self.assertEqual(summary["holdings_written"], 3)
+        self.assertEqual(summary["accessions_completed"], 2)
+        self.assertEqual(progress[-1]["rows_read"], 5)
+        completed = {
+            row["accession_number"]
+            for row in db.rows("institutional_13f_ingest_progress")
+            if row["completed_at"] is not None
+        }
+        self.assertEqual(completed, {"base", "second"})
+
+    def test_streaming_ingest_resumes_past_completed_accessions(self) -> None:
+        from finance.data.institutional_13f import store_sec_13f_dataset_zip_streaming
+
+        with tempfile.TemporaryDirectory() as tmp:
+            zip_path = _write_sec_13f_zip(Path(tmp) / "dataset.zip", _streaming_fixture_frames())
+            db = _RecordingSec13FDB(completed={"base"})
+            summary = store_sec_13f_dataset_zip_streaming(
+                db, zip_path, source_dataset="2026-q2", source_ref="dataset.zip", chunk_rows=2
+            )
+
+        self.assertEqual(summary["accessions_resumed"], 1)
+        self.assertEqual(
+            [row["accession_number"] for row in db.rows("institutional_13f_holding")],
+            ["second"],
+        )
+        self.assertEqual(len(db.rows("institutional_13f_filing")), 3)
+
     def test_manager_upsert_pointer_is_monotonic(self) -> None:
         from finance.data.institutional_13f import _upsert_manager_rows
 
@@ -494,6 +614,230 @@ class InstitutionalPortfolioReadModelTests(unittest.TestCase):
         self.assertTrue(any(row["sector"] == "Unmapped" for row in model["sector_exposure"]))
         self.assertTrue(any("not a buy/sell signal" in caveat for caveat in model["caveats"]))
 
+    def test_materialized_manager_summary_rebuilds_the_live_portfolio_model(self) -> None:
+        from app.services.institutional_portfolios import (
+            build_institutional_portfolio_model,
+            build_institutional_portfolio_model_from_summary,
+        )
+        from finance.data.institutional_13f_summary import replace_institutional_13f_manager_summary
+
+        latest = pd.DataFrame(
+            [
+                {"cusip": "037833100", "holding_symbol": "AAPL", "issuer_name": "APPLE INC", "reported_value": 1500, "shares_or_principal_amount": 15, "sector": "Technology"},
+                {"cusip": "594918104", "holding_symbol": None, "issuer_name": "MICROSOFT CORP", "reported_value": 500, "shares_or_principal_amount": 5},
+                {"cusip": "191216100", "holding_symbol": None, "issuer_name": "COCA COLA CO", "reported_value": 700, "shares_or_principal_amount": 7, "put_call": "Call"},
+            ]
+        )
+        previous = pd.DataFrame(
+            [
+                {"cusip": "037833100", "holding_symbol": "AAPL", "issuer_name": "APPLE INC", "reported_value": 1000, "shares_or_principal_amount": 10, "sector": "Technology"},
+                {"cusip": "594918104", "holding_symbol": None, "issuer_name": "MICROSOFT CORP", "reported_value": 900, "shares_or_principal_amount": 9},
+                {"cusip": "060505104", "holding_symbol": "BAC", "issuer_name": "BANK OF AMERICA CORP", "reported_value": 300, "shares_or_principal_amount": 3},
+            ]
+        )
+        model = build_institutional_portfolio_model(
+            manager={"cik": "0001067983", "manager_name": "BERKSHIRE HATHAWAY INC"},
+            latest_filing={
+                "accession_number": "0001067983-26-000001",
+                "period_of_report": "2026-03-31",
+                "filing_date": "2026-05-15",
+                "collected_at": "2026-05-16 00:00:00",
+                "source_ref": "https://www.sec.gov/Archives/edgar/data/1067983/000106798326000001/",
+            },
+            latest_holdings=latest,
+            previous_filing={"period_of_report": "2025-12-31", "filing_date": "2026-02-14"},
+            previous_holdings=previous,
+        )
+
+        class RecordingDB:
+            def __init__(self) -> None:
+                self.tables: dict[str, list[dict]] = {}
+
+            def begin(self) -> None:
+                pass
+
+            def commit(self) -> None:
+                pass
+
+            def execute(self, sql: str, params: dict) -> None:
+                if "INSERT INTO" in sql:
+                    self.executemany(sql, [params])
+
+            def executemany(self, sql: str, rows: list[dict]) -> None:
+                table = re.search(r"INSERT INTO (\w+)", sql).group(1)
+                self.tables.setdefault(table, []).extend(rows)
+
+        summary = model["summary"]
+        db = RecordingDB()
+        replace_institutional_13f_manager_summary(
+            db,
+            snapshot={
+                "cik": summary["cik"],
+                "report_period": summary["latest_report_period"],
+                "manager_name": summary["manager_name"],
+                "accession_number": summary["accession_number"],
+                "filing_date": summary["latest_filing_date"],
+                "previous_report_period": summary["previous_report_period"],
+                "previous_filing_date": summary["previous_filing_date"],
+                "source_ref": summary["source_ref"],
+                "collected_at": summary["collected_at"],
+                "total_reported_value": summary["total_reported_value"],
+                "holding_count": summary["holding_count"],
+            },
+            positions=model["holdings"],
+            changes=model["changes"],
+            sectors=model["sector_exposure"],
+        )
+        rebuilt = build_institutional_portfolio_model_from_summary(
+            {
+                "snapshot": db.tables["institutional_13f_manager_snapshot"][0],
+                "positions": db.tables["institutional_13f_manager_position"],
+                "changes": db.tables["institutional_13f_manager_change"],
+                "sectors": db.tables["institutional_13f_manager_sector"],
+            }
+        )
+
+        self.assertEqual(rebuilt, model)
+        self.assertEqual(
+            [row["change_rank"] for row in db.tables["institutional_13f_manager_change"]],
+            list(range(1, len(model["changes"]) + 1)),
+        )
+
+    def test_portfolio_loader_prefers_materialized_summary_over_holdings_bundle(self) -> None:
+        import app.services.institutional_portfolios as service
+
+        def no_bundle(_cik: str) -> dict:
+            raise AssertionError("materialized managers must not load the holdings bundle")
+
+        summary = {
+            "snapshot": {"cik": "0001067983", "report_period": "2026-03-31", "manager_name": "BERKSHIRE", "total_reported_value": 100.0, "holding_count": 1},
+            "positions": [{"issuer_name": "APPLE INC", "cusip": "037833100", "reported_value": 100.0, "weight_pct": 100.0}],
+            "changes": [{"change_type": "reported_new", "issuer_name": "APPLE INC", "value_delta": 100.0, "latest_reported_value": 100.0}],
+            "sectors": [{"sector": "Unmapped", "reported_value": 100.0, "weight_pct": 100.0, "holding_count": 1}],
+        }
+        original_summary = service.load_institutional_13f_manager_summary
+        original_bundle = service.load_institutional_13f_portfolio_bundle
+        try:
+            service.load_institutional_13f_manager_summary = lambda _cik: summary
+            service.load_institutional_13f_portfolio_bundle = no_bundle
+            result = service.load_institutional_portfolio_model("0001067983")
+        finally:
+            service.load_institutional_13f_manager_summary = original_summary
+            service.load_institutional_13f_portfolio_bundle = original_bundle
+
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["model"]["summary"]["latest_report_period"], "2026-03-31")
+        self.assertEqual(result["model"]["change_summary"]["reported_new"], 1)
+        self.assertEqual(result["model"]["sector_exposure"][0]["sector"], "Unmapped")
+
+    def test_popularity_ranking_reads_materialized_rows_before_aggregating_holdings(self) -> None:
+        import finance.loaders.institutional_13f as loader
+
+        class FakeDB:
+            def __init__(self, summary_rows: list[dict]) -> None:
+                self.summary_rows = summary_rows
+                self.live_queries = 0
+
+            def query(self, sql: str, params=None) -> list[dict]:
+                if "FROM institutional_13f_security_popularity" in sql:
+                    if "MAX(report_period)" in sql:
+                        return [{"report_period": "2026-03-31"}]
+                    return self.summary_rows
+                if "GROUP BY h.report_period, h.cusip" in sql:
+                    self.live_queries += 1
+                    return [{"report_period": "2026-03-31", "cusip": "060505104", "holder_count": 2}]
+                return [{"report_period": "2026-03-31"}]
+
+            def close(self) -> None:
+                pass
+
+        materialized = FakeDB([{"report_period": "2026-03-31", "cusip": "037833100", "holder_count": 9}])
+        empty = FakeDB([])
+        original_connect = loader._connect
+        try:
+            loader._connect = lambda *_args: materialized
+            ranked = loader.load_institutional_13f_popularity_ranking()
+            loader._connect = lambda *_args: empty
+            fallback = loader.load_institutional_13f_popularity_ranking("2026-03-31")
+        finally:
+            loader._connect = original_connect
+
+        self.assertEqual(materialized.live_queries, 0)
+        self.assertEqual(ranked["cusip"].tolist(), ["037833100"])
+        self.assertEqual(empty.live_queries, 1)
+        self.assertEqual(fallback["cusip"].tolist(), ["060505104"])
+
+    def test_materializer_also_refreshes_summaries_whose_mappings_or_sectors_drifted(self) -> None:
+        from unittest.mock import patch
+
+        import app.services.institutional_portfolios as service
+
+        class FakeDB:
+            def use_db(self, _name: str) -> None:
+                pass
+
+            def close(self) -> None:
+                pass
+
+        def bundles(ciks, **_kwargs):
+            for cik in ciks:
+                yield cik, {"latest_filing": None}
+
+        replaced: list[str] = []
+        with (
+            patch.object(service, "MySQLClient", return_value=FakeDB()),
+            patch.object(service, "sync_institutional_13f_summary_schema"),
+            patch.object(service, "load_db_timestamp", return_value="2026-05-16 00:00:00"),
+            patch.object(
+                service,
+                "load_institutional_13f_summary_targets",
+                return_value={"ciks": ["0000000001"], "report_periods": ["2026-03-31"]},
+            ) as scoped,
+            patch.object(
+                service,
+                "load_stale_institutional_13f_summary_targets",
+                return_value={"ciks": ["0000000002", "0000000001"], "report_periods": ["2025-12-31"]},
+            ),
+            patch.object(service, "iter_institutional_13f_portfolio_bundles", side_effect=bundles) as iter_bundles,
+            patch.object(service, "refresh_institutional_13f_popularity", return_value=3) as popularity,
+        ):
+            scoped_result = service.materialize_institutional_13f_summaries(ciks=["1"])
+            drift_only = service.materialize_institutional_13f_summaries()
+
+        self.assertEqual(iter_bundles.call_args_list[0].args[0], ["0000000001", "0000000002"])
+        self.assertEqual(iter_bundles.call_args_list[1].args[0], ["0000000002", "0000000001"])
+        scoped.assert_called_once()
+        self.assertEqual(scoped_result["report_periods"], ["2026-03-31", "2025-12-31"])
+        self.assertEqual(drift_only["stale_managers"], 2)
+        self.assertIn("GROUP BY h.report_period, h.cusip", popularity.call_args.kwargs["aggregate_sql"])
+
+    def test_manager_summary_reader_rejects_snapshots_with_drifted_reference_data(self) -> None:
+        import finance.loaders.institutional_13f as loader
+
+        class FakeDB:
+            def __init__(self) -> None:
+                self.sql: list[str] = []
+
+            def query(self, sql: str, params=None) -> list[dict]:
+                self.sql.append(sql)
+                return []
+
+            def close(self) -> None:
+                pass
+
+        db = FakeDB()
+        original_connect = loader._connect
+        try:
+            loader._connect = lambda *_args: db
+            self.assertIsNone(loader.load_institutional_13f_manager_summary("1067983"))
+        finally:
+            loader._connect = original_connect
+
+        snapshot_sql = db.sql[0]
+        self.assertIn("NOT (", snapshot_sql)
+        for table in ("institutional_13f_cusip_symbol_map", "institutional_13f_identifier_resolution", "nyse_asset_profile"):
+            self.assertIn(table, snapshot_sql)
+
     def test_portfolio_performance_model_uses_report_period_price_window_and_coverage(self) -> None:
         from app.services.institutional_portfolios import build_institutional_portfolio_performance_model
 
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.jobs import run_history
+from app.jobs.job_telemetry import (
+    JobTelemetryStore,
+    build_telemetry_rows,
+    fit_eta_model,
+    load_throughput_distribution,
+    throughput_position,
+)
+
+
+def _ohlcv_result(
+    *,
+    symbols: int,
+    chunk_size: int,
+    max_workers: int,
+    cooldown_sec: float = 0.0,
+    started_at: str = "2026-07-01 09:00:00",
+    status: str = "success",
+) -> dict:
+    batches = math.ceil(symbols / chunk_size)
+    # Synthetic history: 2s fixed + 0.5s per symbol per worker + 1.5s per batch + cooldown.
+    duration = 2.0 + 0.5 * symbols / max_workers + 1.5 * batches + cooldown_sec
+    return {
+        "job_name": "collect_ohlcv",
+        "status": status,
+        "started_at": started_at,
+        "finished_at": "2026-07-01 09:10:00",
+        "duration_sec": duration,
+        "rows_written": symbols * 250,
+        "symbols_requested": symbols,
+        "symbols_processed": symbols,
+        "details": {
+            "execution_profile": "managed_fast",
+            "write_settings": {"chunk_size": chunk_size, "max_workers": max_workers, "sleep": 0.05},
+            "cooldown_events": [{"cooldown_sec": cooldown_sec}] if cooldown_sec else [],
+            "timing_breakdown": {
+                "fetch_sec": duration * 0.6,
+                "upsert_sec": duration * 0.2,
+                "cooldown_sleep_sec": cooldown_sec,
+                "inter_batch_sleep_sec": 0.5,
+                "batch_count": batches,
+                "avg_fetch_sec_per_batch": 9.9,
+            },
+        },
+        "run_metadata": {"execution_mode": "manual"},
+    }
+
+
+class JobTelemetryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = JobTelemetryStore(Path(self.tmp.name) / "telemetry.sqlite")
+
+    def test_flattens_throughput_profile_and_stage_timings(self) -> None:
+        run, stages = build_telemetry_rows(_ohlcv_result(symbols=100, chunk_size=50, max_workers=2, cooldown_sec=12.0))
+
+        self.assertEqual((run["chunk_size"], run["max_workers"], run["batch_count"]), (50, 2, 2))
+        self.assertEqual(run["execution_profile"], "managed_fast")
+        self.assertEqual(run["cooldown_count"], 1)
+        self.assertAlmostEqual(run["sleep_sec"], 12.5)
+        self.assertAlmostEqual(run["symbols_per_sec"], 100 / run["duration_sec"], places=5)
+        self.assertEqual(sorted(stages), ["cooldown_sleep_sec", "fetch_sec", "inter_batch_sleep_sec", "upsert_sec"])
+
+        pipeline = {
+            "job_name": "daily_market_update",
+            "status": "success",
+            "duration_sec": 30.0,
+            "symbols_requested": 100,
+            "details": {"steps": [_ohlcv_result(symbols=100, chunk_size=50, max_workers=2)]},
+        }
+        run, stages = build_telemetry_rows(pipeline)
+        self.assertEqual(run["chunk_size"], 50)
+        self.assertIn("collect_ohlcv", stages)
+        self.assertIn("collect_ohlcv.fetch_sec", stages)
+
+    def test_store_round_trip_is_idempotent_and_skips_failed_runs(self) -> None:
+        result = _ohlcv_result(symbols=100, chunk_size=50, max_workers=1)
+        self.store.record(result)
+        self.store.record(result)
+        self.store.record(_ohlcv_result(symbols=10, chunk_size=50, max_workers=1, started_at="x", status="failed"))
+
+        runs = self.store.load_runs("collect_ohlcv")
+
+        self.assertEqual(len(runs), 1)
+        self.assertAlmostEqual(runs[0]["stages"]["fetch_sec"], result["details"]["timing_breakdown"]["fetch_sec"])
+        distribution = load_throughput_distribution("collect_ohlcv", store=self.store)
+        self.assertEqual(distribution["sample_count"], 1)
+        self.assertEqual(throughput_position(0.0001, distribution["symbols_per_sec"]), "slow")
+
+    def test_eta_model_recovers_chunk_and_worker_effects(self) -> None:
+        runs = [
+            build_telemetry_rows(
+                _ohlcv_result(symbols=symbols, chunk_size=chunk, max_workers=workers, cooldown_sec=cooldown)
+            )[0]
+            for symbols, chunk, workers, cooldown in (
+                (100, 50, 1, 0.0),
+                (200, 40, 2, 0.0),
+                (300, 60, 1, 0.0),
+                (400, 100, 2, 0.0),
+                (500, 70, 1, 0.0),
+            )
+        ]
+
+        model = fit_eta_model(runs)
+
+        self.assertIsNotNone(model)
+        self.assertAlmostEqual(model.predict(1000, chunk_size=100, max_workers=2), 2.0 + 250.0 + 15.0, places=3)
+        self.assertLess(
+            model.predict(1000, chunk_size=100, max_workers=2),
+            model.predict(1000, chunk_size=20, max_workers=1),
+        )
+        self.assertIsNone(fit_eta_model(runs[:2]))
+
+    def test_history_estimate_prefers_telemetry_model_and_falls_back_to_history(self) -> None:
+        for symbols in (100, 200, 300):
+            self.store.record(_ohlcv_result(symbols=symbols, chunk_size=50, max_workers=1, started_at=str(symbols)))
+
+        estimate = run_history.estimate_duration_from_history("collect_ohlcv", 400, telemetry_store=self.store)
+
+        self.assertEqual(estimate["method"], "telemetry_model")
+        self.assertLessEqual(estimate["seconds_low"], 2 + 200 + 12 + 1)
+        self.assertGreaterEqual(estimate["seconds_high"], 2 + 200 + 12 - 1)
+
+        empty = JobTelemetryStore(Path(self.tmp.name) / "empty.sqlite")
+        with patch.object(
+            run_history,
+            "load_run_history",
+            return_value=[{"job_name": "collect_ohlcv", "symbols_requested": 10, "duration_sec": 20.0}],
+        ):
+            fallback = run_history.estimate_duration_from_history("collect_ohlcv", 100, telemetry_store=empty)
+        self.assertEqual(fallback["method"], "history_average")
+        self.assertEqual((fallback["seconds_low"], fallback["seconds_high"]), (140, 260))
+
+    def test_history_append_writes_telemetry_beside_history_and_tolerates_bad_payloads(self) -> None:
+        history_file = Path(self.tmp.name) / "history" / "WEB_APP_RUN_HISTORY.jsonl"
+        with patch.object(run_history, "HISTORY_FILE", history_file):
+            run_history.append_run_history(_ohlcv_result(symbols=100, chunk_size=50, max_workers=1))
+            malformed = _ohlcv_result(symbols=10, chunk_size=50, max_workers=1, started_at="bad")
+            malformed["details"]["write_settings"] = "chunk_size=50"
+            run_history.append_run_history(malformed)
+
+        store = JobTelemetryStore(history_file.parent / "JOB_TELEMETRY.sqlite")
+        self.assertEqual(len(store.load_runs("collect_ohlcv")), 1)
+        self.assertEqual(len(history_file.read_text(encoding="utf-8").splitlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -100,6 +100,9 @@ def test_rank_copula_paths_preserve_requested_marginals_and_current_rate_start()
         for path in paths
     )
     assert all(len(path.remaining_monthly_mom_pct) == 6 for path in paths)
+    assert paths.rate_paths_pct["DGS10"].shape == (100, 25)
+    assert paths.remaining_monthly_mom_pct.shape == (100, 6)
+    assert paths[3].path_id == "joint-00003"
 
 
 def test_joint_artifact_fails_closed_without_a_chronological_rate_library() -> None:
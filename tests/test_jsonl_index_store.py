@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.runtime.backtest.stores import candidate_registry
+from app.runtime.backtest.stores.jsonl_index import IndexedJsonlStore
+from app.runtime.backtest.stores.run_history import count_backtest_run_history, load_backtest_run_history
+
+
+def _history_row(i: int, *, strategy_key: str = "gtaa", run_kind: str = "single") -> dict:
+    return {
+        "recorded_at": f"2026-01-{i + 1:02d}T00:00:00",
+        "strategy_key": strategy_key,
+        "run_kind": run_kind,
+        "seq": i,
+    }
+
+
+class IndexedJsonlStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "HISTORY.jsonl"
+        self.store = IndexedJsonlStore(self.path)
+
+    def test_tail_pages_newest_first_and_filters_by_indexed_columns(self) -> None:
+        for i in range(6):
+            self.store.append(_history_row(i, strategy_key="gtaa" if i % 2 else "equal_weight"))
+
+        self.assertEqual([row["seq"] for row in self.store.load_tail(3)], [5, 4, 3])
+        self.assertEqual([row["seq"] for row in self.store.load_tail(2, offset=2)], [3, 2])
+        self.assertEqual([row["seq"] for row in self.store.load_tail(None, strategy_key="gtaa")], [5, 3, 1])
+        self.assertEqual(
+            [row["seq"] for row in self.store.load_tail(None, recorded_from="2026-01-02", recorded_to="2026-01-04T23")],
+            [3, 2, 1],
+        )
+        self.assertEqual(self.store.count(strategy_key="equal_weight"), 3)
+
+    def test_index_catches_up_incrementally_and_skips_bad_lines(self) -> None:
+        self.store.append(_history_row(0))
+        self.assertEqual(len(self.store.load_tail(None)), 1)
+
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("not json\n\n")
+        self.store.append(_history_row(1))
+
+        with patch.object(IndexedJsonlStore, "_index_entries", wraps=self.store._index_entries) as entries:
+            rows = self.store.load_tail(None)
+        self.assertEqual([row["seq"] for row in rows], [1, 0])
+        # 새로 붙은 구간만 다시 읽는다.
+        self.assertEqual(entries.call_args.args[1], len(json.dumps(_history_row(0))) + 1)
+
+    def test_rewritten_file_rebuilds_the_index(self) -> None:
+        for i in range(3):
+            self.store.append(_history_row(i))
+        self.store.load_tail(None)
+
+        self.path.write_text(
+            "".join(json.dumps(_history_row(i, run_kind="compare")) + "\n" for i in (7, 8, 9, 10)),
+            encoding="utf-8",
+        )
+
+        self.assertEqual([row["seq"] for row in self.store.load_tail(None)], [10, 9, 8, 7])
+        self.assertEqual(self.store.count(run_kind="single"), 0)
+
+    def test_run_history_loader_reads_through_the_index(self) -> None:
+        with patch("app.runtime.backtest.stores.run_history.BACKTEST_HISTORY_FILE", self.path):
+            self.assertEqual(load_backtest_run_history(), [])
+            for i in range(40):
+                self.store.append(_history_row(i, run_kind="compare" if i >= 35 else "single"))
+
+            latest = load_backtest_run_history()
+            compare = load_backtest_run_history(run_kind="compare", limit=10)
+            total = count_backtest_run_history()
+
+        self.assertEqual([row["seq"] for row in latest], list(range(39, 9, -1)))
+        self.assertEqual([row["seq"] for row in compare], [39, 38, 37, 36, 35])
+        self.assertEqual(total, 40)
+        self.assertTrue(self.path.with_name(self.path.name + ".idx.sqlite").exists())
+
+
+class CandidateRegistryIndexTests(unittest.TestCase):
+    def test_latest_row_per_registry_id_matches_full_scan_semantics(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "CURRENT_CANDIDATE_REGISTRY.jsonl"
+            rows = [
+                {"registry_id": "a", "recorded_at": "2026-01-01", "title": "A1", "strategy_family": "value"},
+                {"registry_id": "b", "recorded_at": "2026-01-02", "title": "B1", "strategy_family": "quality"},
+                {"registry_id": "a", "recorded_at": "2026-01-03", "title": "A2", "strategy_family": "value"},
+                {"registry_id": "b", "recorded_at": "2026-01-02", "title": "B2", "strategy_family": "quality"},
+                {"registry_id": "a", "recorded_at": "2026-01-02", "title": "A-old", "strategy_family": "value"},
+                {"registry_id": "c", "recorded_at": "2026-01-04", "title": "C", "status": "retired"},
+                {"registry_id": "", "recorded_at": "2026-01-05", "title": "no id"},
+            ]
+            with patch.object(candidate_registry, "CURRENT_CANDIDATE_REGISTRY_FILE", path):
+                for row in rows:
+                    candidate_registry.append_current_candidate_registry_row(row)
+                latest = candidate_registry.load_current_candidate_registry_latest()
+
+        self.assertEqual([row["title"] for row in latest], ["A2", "B2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
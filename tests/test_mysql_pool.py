@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from finance.data.db import mysql as mysql_module
+from finance.data.db.mysql import (
+    MySQLClient,
+    MySQLPoolTimeout,
+    close_mysql_pools,
+    configure_mysql_pool,
+    get_mysql_pool,
+    get_mysql_pool_stats,
+    mysql_client,
+)
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConnection"):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+
+    def fetchall(self):
+        return []
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.open = True
+        self.statements: list[str] = []
+        self.ping_ok = True
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        if not self.ping_ok:
+            raise ConnectionError("gone away")
+
+    def begin(self):
+        pass
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.open = False
+
+
+class MySQLConnectionPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        close_mysql_pools()
+        self._saved_config = configure_mysql_pool()
+        self.connections: list[_FakeConnection] = []
+
+        def fake_connect(**kwargs):
+            conn = _FakeConnection()
+            self.connections.append(conn)
+            return conn
+
+        patcher = patch.object(mysql_module.pymysql, "connect", side_effect=fake_connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        close_mysql_pools()
+        configure_mysql_pool(**self._saved_config)
+
+    def test_reuses_released_connection_and_reports_hits_and_misses(self) -> None:
+        with mysql_client("finance_price") as db:
+            first = db.conn
+        with mysql_client("finance_price") as db:
+            second = db.conn
+
+        self.assertIs(first, second)
+        pool = get_mysql_pool()
+        stats = get_mysql_pool_stats()[f"{pool.user}@{pool.host}:{pool.port}"]
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 1))
+        self.assertEqual((stats["in_use"], stats["idle"]), (0, 1))
+
+    def test_use_db_skips_repeated_create_and_use(self) -> None:
+        for _ in range(3):
+            with mysql_client("finance_price"):
+                pass
+        with mysql_client("finance_meta"):
+            pass
+
+        statements = self.connections[0].statements
+        self.assertEqual(
+            statements,
+            [
+                "CREATE DATABASE IF NOT EXISTS finance_price",
+                "USE finance_price",
+                "CREATE DATABASE IF NOT EXISTS finance_meta",
+                "USE finance_meta",
+            ],
+        )
+
+    def test_stale_idle_connection_failing_ping_is_replaced(self) -> None:
+        configure_mysql_pool(health_check_interval=0.0)
+        with mysql_client() as db:
+            db.conn.ping_ok = False
+
+        with mysql_client() as db:
+            self.assertIsNot(db.conn, self.connections[0])
+
+        stats = get_mysql_pool().stats()
+        self.assertEqual(stats["health_check_failures"], 1)
+        self.assertEqual(stats["misses"], 2)
+
+    def test_exhausted_pool_waits_for_release_then_times_out(self) -> None:
+        configure_mysql_pool(max_size=1, checkout_timeout=2.0)
+        holder = MySQLClient()
+        releaser = threading.Timer(0.05, holder.close)
+        releaser.start()
+        with mysql_client() as db:
+            self.assertIs(db.conn, self.connections[0])
+        releaser.join()
+
+        configure_mysql_pool(checkout_timeout=0.01)
+        holder = MySQLClient()
+        with self.assertRaises(MySQLPoolTimeout):
+            MySQLClient()
+        holder.close()
+
+        stats = get_mysql_pool().stats()
+        self.assertEqual(stats["waits"], 2)
+        self.assertGreater(stats["wait_seconds"], 0.0)
+
+    def test_open_transaction_is_rolled_back_on_release(self) -> None:
+        db = MySQLClient()
+        db.begin()
+        db.close()
+
+        self.assertEqual(self.connections[0].rollbacks, 1)
+        self.assertEqual(get_mysql_pool().stats()["idle"], 1)
+
+    def test_default_pool_covers_concurrent_automation_pipelines(self) -> None:
+        import inspect
+
+        from app.jobs import ingestion_jobs
+        from app.jobs.overview_automation import DEFAULT_AUTOMATION_MAX_WORKERS
+
+        defaults = inspect.signature(ingestion_jobs.run_pipeline_core_market_data).parameters
+        stage_threads = sum(
+            defaults[name].default for name in ("ohlcv_workers", "fundamentals_workers", "factors_workers")
+        )
+        # Every thread may hold a nested client while calling into a loader.
+        self.assertGreaterEqual(mysql_module.DEFAULT_POOL_MAX_SIZE, DEFAULT_AUTOMATION_MAX_WORKERS * stage_threads * 2)
+
+    def test_service_read_helpers_borrow_pooled_connections(self) -> None:
+        from app.services import futures_macro_thermometer, futures_market_monitoring
+        from app.services.overview import data_health, events, market_movers
+
+        for module in (data_health, events, market_movers, futures_macro_thermometer, futures_market_monitoring):
+            module._default_query("finance_meta", "SELECT 1")
+
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(self.connections[0].statements.count("USE finance_meta"), 1)
+        self.assertEqual(get_mysql_pool().stats()["hits"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
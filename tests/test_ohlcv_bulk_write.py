@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from finance.data import data as data_module
+from finance.data.data import _price_rows_from_frame, _to_none, store_ohlcv_to_mysql
+
+
+class _RecordingDB:
+    def __init__(self, *args, **kwargs):
+        self.statements: list[str] = []
+        self.batches: list[tuple[str, list[tuple]]] = []
+
+    def use_db(self, name):
+        self.statements.append(f"USE {name}")
+
+    def execute(self, sql, params=None):
+        self.statements.append(" ".join(str(sql).split()))
+
+    def executemany(self, sql, params):
+        self.batches.append((" ".join(str(sql).split()), list(params)))
+
+    def close(self):
+        self.statements.append("CLOSE")
+
+
+def _download_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]),
+            "Open": [1.0, np.nan, 3.0],
+            "High": [1.5, 2.5, 3.5],
+            "Low": [0.5, 1.5, 2.5],
+            "Close": [1.2, 2.2, 3.2],
+            "Adj Close": [1.1, 2.1, 3.1],
+            "Volume": [100, 200, 300],
+            "Dividends": [0.0, 0.0, 0.25],
+        }
+    )
+
+
+class PriceRowSerializationTests(unittest.TestCase):
+    def test_vectorized_rows_match_iterrows_conversion(self) -> None:
+        d = _download_frame()
+        d["Date"] = d["Date"].dt.date
+        cols = {c.lower(): c for c in d.columns}
+
+        expected = [
+            (
+                "AAA",
+                "1d",
+                r["Date"],
+                *[_to_none(r.get(cols.get(name.lower()))) for name in data_module.PRICE_VALUE_COLUMNS],
+            )
+            for _, r in d.iterrows()
+        ]
+        actual = _price_rows_from_frame("AAA", "1d", d, cols)
+
+        self.assertEqual(actual, expected)
+        self.assertIsNone(actual[1][3])
+        self.assertIsNone(actual[0][-1])
+        self.assertEqual([type(value) for value in actual[2][3:9]], [float] * 5 + [int])
+
+
+class BulkWriteModeTests(unittest.TestCase):
+    def _store(self, write_mode: str) -> tuple[_RecordingDB, dict]:
+        db = _RecordingDB()
+        with (
+            patch.object(data_module, "MySQLClient", return_value=db),
+            patch.object(data_module, "get_ohlcv", return_value=({"AAA": _download_frame()}, "")),
+            patch.object(data_module, "invalidate_price_store") as invalidate,
+        ):
+            stats = store_ohlcv_to_mysql(
+                ["AAA"],
+                start="2024-01-01",
+                end="2024-01-05",
+                sleep=0,
+                return_stats=True,
+                write_mode=write_mode,
+            )
+        invalidate.assert_called_once()
+        return db, stats
+
+    def test_bulk_mode_stages_rows_then_merges_in_one_statement(self) -> None:
+        db, stats = self._store("bulk")
+
+        self.assertEqual(stats["rows_written"], 3)
+        self.assertEqual(stats["write_mode"], "bulk")
+        (stage_sql, staged_rows), = db.batches
+        self.assertTrue(stage_sql.startswith("INSERT INTO nyse_price_history_stage"))
+        self.assertEqual(len(staged_rows), 3)
+
+        merges = [sql for sql in db.statements if sql.startswith("INSERT INTO nyse_price_history ")]
+        self.assertEqual(len(merges), 1)
+        self.assertIn("FROM nyse_price_history_stage AS s ORDER BY s.seq ON DUPLICATE KEY UPDATE", merges[0])
+        self.assertIn("DROP TEMPORARY TABLE IF EXISTS nyse_price_history_stage", db.statements)
+        logged = [sql for sql in db.statements if sql.startswith("INSERT INTO nyse_price_write_log")]
+        self.assertEqual(len(logged), 1)
+        self.assertLess(db.statements.index(merges[0]), db.statements.index(logged[0]))
+        for key in ("serialize_sec", "stage_load_sec", "merge_sec"):
+            self.assertIn(key, stats["timing_breakdown"])
+
+    def test_upsert_mode_keeps_direct_executemany(self) -> None:
+        db, stats = self._store("upsert")
+
+        (upsert_sql, rows), = db.batches
+        self.assertTrue(upsert_sql.startswith("INSERT INTO nyse_price_history ("))
+        self.assertEqual(len(rows), 3)
+        self.assertFalse(any("nyse_price_history_stage" in sql for sql in db.statements))
+
+    def test_rate_limit_cooldown_pauses_the_shared_yahoo_gate(self) -> None:
+        with (
+            patch.object(data_module, "MySQLClient", return_value=_RecordingDB()),
+            patch.object(data_module, "get_ohlcv", return_value=({}, "YFRateLimitError('Too Many Requests')")),
+            patch.object(data_module, "_sleep_with_jitter", return_value=0.0),
+            patch.object(data_module, "pause_provider") as pause,
+        ):
+            stats = store_ohlcv_to_mysql(
+                ["AAA"],
+                start="2024-01-01",
+                end="2024-01-05",
+                sleep=0,
+                max_retry=0,
+                rate_limit_cooldown_sec=12.0,
+                return_stats=True,
+            )
+
+        pause.assert_called_once_with("yahoo", 12.0)
+        self.assertEqual(len(stats["cooldown_events"]), 1)
+
+    def test_unknown_write_mode_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            store_ohlcv_to_mysql(["AAA"], write_mode="copy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import datetime as dt
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from finance.data import data as data_module
+from finance.data.db import mysql as mysql_module
+from finance.sample import _build_snapshot_strategy_avg_dollar_volume_20d
+
+
+def _table_rows() -> list[tuple]:
+    rows = []
+    for symbol, count, volume in (("AAA", 5, 100), ("BBB", 1, None), ("CCC", 4, 300)):
+        for i in range(count):
+            day = dt.date(2024, 1, 2) + dt.timedelta(days=i)
+            close = 10.0 + i
+            rows.append((symbol, day, close, close, close, close, None if i == 1 else close, volume, 0.0, 0.0))
+    return rows
+
+
+class _StreamingClient:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def use_db(self, name):
+        pass
+
+    def stream(self, sql, params=None, *, batch_size=10_000):
+        symbols = {param for param in params if param in {"AAA", "BBB", "CCC"}}
+        rows = [row for row in _table_rows() if row[0] in symbols]
+        for i in range(0, len(rows), batch_size):
+            yield rows[i : i + batch_size]
+
+    def close(self):
+        pass
+
+
+class StreamingOhlcvLoaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(mysql_module, "MySQLClient", _StreamingClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_typed_load_matches_dict_cursor_frame(self) -> None:
+        actual = data_module.load_ohlcv_many_mysql(["AAA", "BBB", "CCC"], start="2024-01-01", chunk_size=2, fetch_size=3)
+
+        columns = ["symbol", "date", *data_module.OHLCV_VALUE_FIELDS]
+        expected = pd.DataFrame([dict(zip(columns, row)) for row in _table_rows()])
+        expected["date"] = pd.to_datetime(expected["date"])
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        self.assertEqual(actual["date"].dtype, np.dtype("datetime64[s]"))
+        self.assertEqual(actual["open"].dtype, np.float64)
+        self.assertTrue(np.isnan(actual.loc[1, "adj_close"]))
+
+    def test_iter_yields_whole_symbols_across_fetch_batches(self) -> None:
+        frames = list(data_module.iter_ohlcv_mysql(["AAA", "BBB", "CCC"], start="2024-01-01", fetch_size=2))
+
+        self.assertEqual([symbol for symbol, _ in frames], ["AAA", "BBB", "CCC"])
+        self.assertEqual([len(frame) for _, frame in frames], [5, 1, 4])
+        self.assertEqual(frames[0][1]["close"].tolist(), [10.0, 11.0, 12.0, 13.0, 14.0])
+        self.assertEqual(frames[2][1]["volume"].dtype, np.int64)
+        self.assertTrue(frames[1][1]["volume"].isna().all())
+
+    def test_iter_keeps_ascending_symbol_order_across_query_chunks(self) -> None:
+        frames = list(data_module.iter_ohlcv_mysql(["CCC", "AAA", "BBB", "AAA"], start="2024-01-01", chunk_size=1))
+
+        self.assertEqual([symbol for symbol, _ in frames], ["AAA", "BBB", "CCC"])
+        self.assertEqual([len(frame) for _, frame in frames], [5, 1, 4])
+
+
+class StreamingAvgDollarVolumeTests(unittest.TestCase):
+    def test_avg_dollar_volume_is_computed_per_streamed_symbol(self) -> None:
+        dates = pd.date_range("2024-01-01", periods=4, freq="D")
+        frames = [
+            ("AAA", pd.DataFrame({"date": dates, "close": [1.0, 2.0, np.nan, 4.0], "volume": [10, 10, 10, 10]})),
+            ("BBB", pd.DataFrame({"date": dates[:1], "close": [5.0], "volume": [1]})),
+        ]
+        with patch("finance.sample.iter_price_history", return_value=iter(frames)):
+            result = _build_snapshot_strategy_avg_dollar_volume_20d(("AAA", "BBB"), "2024-01-01", None, "1d", 2)
+
+        self.assertEqual(result.symbols, ("AAA", "BBB"))
+        self.assertEqual(list(result.dates), [dates[1].to_datetime64(), dates[3].to_datetime64()])
+        self.assertEqual(result.values.dtype, np.float32)
+        np.testing.assert_array_equal(
+            result.take([dates[1], dates[2], dates[3]], ["AAA", "BBB"]),
+            [[15.0, np.nan], [np.nan, np.nan], [30.0, np.nan]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
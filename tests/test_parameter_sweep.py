@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import contextvars
+import pickle
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from finance import sample, sweep
+from finance.loaders import price as price_loader
+from finance.loaders.price import PreloadedPriceHistory, load_price_history, use_preloaded_price_history
+from finance.snapshot_cache import PinnedSnapshotInputs
+
+
+def _history() -> pd.DataFrame:
+    dates = pd.date_range("2024-01-01", periods=4, freq="D")
+    frames = []
+    for symbol, base in (("BBB", 20.0), ("AAA", 10.0)):
+        closes = base + np.arange(4, dtype=float)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "date": dates,
+                    "open": closes,
+                    "high": closes,
+                    "low": closes,
+                    "close": closes,
+                    "adj_close": closes,
+                    "volume": 100.0,
+                    "dividends": 0.0,
+                    "stock_splits": 0.0,
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def _fake_result(scale: float) -> pd.DataFrame:
+    dates = pd.date_range("2024-01-31", periods=4, freq="ME")
+    balance = 10000.0 * np.cumprod([1.0, 1.0 + 0.01 * scale, 1.0 - 0.005 * scale, 1.0 + 0.02 * scale])
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Total Balance": balance,
+            "Total Return": pd.Series(balance).pct_change().fillna(0.0).to_numpy(),
+        }
+    )
+
+
+class PreloadedPriceHistoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.preloaded = PreloadedPriceHistory(
+            _history(),
+            start=pd.Timestamp("2024-01-01"),
+            end=None,
+            requested_symbols=frozenset({"AAA", "BBB", "ZZZ"}),
+        )
+
+    def test_covers_requested_symbols_inside_window_only(self) -> None:
+        self.assertTrue(self.preloaded.covers(["AAA", "ZZZ"], pd.Timestamp("2024-01-02"), None, "1d"))
+        self.assertFalse(self.preloaded.covers(["AAA"], None, None, "1d"))
+        self.assertFalse(self.preloaded.covers(["CCC"], pd.Timestamp("2024-01-02"), None, "1d"))
+        self.assertFalse(self.preloaded.covers(["AAA"], pd.Timestamp("2024-01-02"), None, "1wk"))
+
+    def test_loader_serves_covered_requests_without_touching_the_database(self) -> None:
+        with (
+            use_preloaded_price_history(self.preloaded),
+            patch.object(price_loader, "mysql_client", side_effect=AssertionError("db read")),
+        ):
+            history = load_price_history(["BBB", "AAA", "ZZZ"], start="2024-01-02", end="2024-01-03", use_store=False)
+
+        self.assertEqual(history["symbol"].tolist(), ["AAA", "AAA", "BBB", "BBB"])
+        self.assertEqual(history["close"].tolist(), [11.0, 12.0, 21.0, 22.0])
+
+
+class ParameterSweepTests(unittest.TestCase):
+    def test_grid_expands_in_product_order(self) -> None:
+        configs = sweep.expand_param_grid({"top": [2, 3], "interval": [1, 6]})
+
+        self.assertEqual(
+            configs,
+            [
+                {"top": 2, "interval": 1},
+                {"top": 2, "interval": 6},
+                {"top": 3, "interval": 1},
+                {"top": 3, "interval": 6},
+            ],
+        )
+
+    def test_unknown_parameter_is_rejected_before_loading(self) -> None:
+        with patch.object(sweep, "load_price_history") as load:
+            with self.assertRaises(ValueError):
+                sweep.run_parameter_sweep("equal_weight", {"lookback": [3]}, max_workers=1)
+        load.assert_not_called()
+
+    def test_inline_sweep_loads_once_and_returns_one_summary_row_per_config(self) -> None:
+        seen: list[pd.DataFrame] = []
+
+        def runner(option="month_end", interval=12, start=None, end=None, timeframe="1d", tickers=None):
+            seen.append(price_loader.load_price_history(tickers, start="2024-01-02", use_store=False))
+            return _fake_result(interval)
+
+        spec = sweep.SweepStrategySpec(runner, ("AAA", "BBB"))
+        with (
+            patch.dict(sweep.SWEEP_STRATEGIES, {"equal_weight": spec}),
+            patch.object(sweep, "load_price_history", return_value=_history()) as load,
+            patch.object(price_loader, "mysql_client", side_effect=AssertionError("db read")),
+        ):
+            table = sweep.run_parameter_sweep(
+                "equal_weight",
+                {"interval": [1, 2, 3]},
+                base_params={"start": "2024-01-02", "tickers": ["AAA"]},
+                max_workers=1,
+            )
+
+        load.assert_called_once()
+        self.assertEqual(sorted(load.call_args.kwargs["symbols"]), ["AAA", "BBB"])
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(table["Config"].tolist(), [0, 1, 2])
+        self.assertEqual(table["interval"].tolist(), [1, 2, 3])
+        self.assertEqual(table["tickers"].tolist(), ["AAA"] * 3)
+        self.assertEqual(table["Name"].tolist(), [f"equal_weight[interval={i}]" for i in (1, 2, 3)])
+        self.assertIn("CAGR", table.columns)
+        self.assertTrue(table["Error"].isna().all())
+
+    def test_failing_config_is_reported_instead_of_raised(self) -> None:
+        def runner(interval=12, start=None, end=None, timeframe="1d", tickers=None, option="month_end"):
+            if interval == 2:
+                raise RuntimeError("boom")
+            return _fake_result(interval)
+
+        spec = sweep.SweepStrategySpec(runner)
+        with patch.dict(sweep.SWEEP_STRATEGIES, {"equal_weight": spec}):
+            results = list(sweep.iter_parameter_sweep("equal_weight", {"interval": [1, 2]}, max_workers=1))
+
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[1].error, "RuntimeError: boom")
+        self.assertIsNone(results[1].summary)
+
+    def test_shared_history_round_trips_through_shared_memory(self) -> None:
+        history = _history()
+        shm, layout = sweep._share_history(history)
+        try:
+            restored = sweep._history_from_shared(shm, layout)
+            pd.testing.assert_frame_equal(
+                restored,
+                history.assign(date=history["date"].astype("datetime64[ns]")),
+                check_dtype=False,
+            )
+            del restored
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_worker_preload_keeps_viewing_the_shared_buffer(self) -> None:
+        parent = PreloadedPriceHistory(_history(), start=pd.Timestamp("2024-01-01"))
+        shm, layout = sweep._share_history(parent.history)
+        try:
+            worker = contextvars.copy_context()
+            worker.run(sweep._init_sweep_worker, layout, {"start": pd.Timestamp("2024-01-01")})
+            preloaded = worker[price_loader._PRELOADED_PRICE_HISTORY]
+            _, dates, values = sweep._history_views(sweep._WORKER_STATE["shm"], layout["rows"])
+
+            self.assertTrue(np.shares_memory(preloaded.history["close"].to_numpy(), values))
+            self.assertTrue(np.shares_memory(preloaded._dates, dates))
+            self.assertEqual(preloaded.history["close"].tolist(), parent.history["close"].tolist())
+            del preloaded, worker, dates, values
+        finally:
+            sweep._WORKER_STATE.pop("shm").close()
+            shm.close()
+            shm.unlink()
+
+
+def _statement_runner(interval=12, start=None, end=None, timeframe="1d", tickers=None, option="month_end"):
+    # Reads a non-price input the way the statement shadow runners do.
+    factors = sample._get_cached_statement_factors_shadow(symbols=["AAA"], freq="annual", end=None)
+    return _fake_result(interval + float(factors["value"].iloc[0]))
+
+
+class _InlineExecutor:
+    """Runs submissions in-process after calling the worker initializer, like a one-worker pool."""
+
+    last_kwargs: dict = {}
+
+    def __init__(self, **kwargs) -> None:
+        type(self).last_kwargs = kwargs
+        token = sample._PINNED_SNAPSHOT_INPUTS.set(None)
+        self._reset = lambda: sample._PINNED_SNAPSHOT_INPUTS.reset(token)
+        kwargs["initializer"](*kwargs["initargs"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._reset()
+        return False
+
+    def submit(self, fn, *args):
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class SweepPinnedInputTests(unittest.TestCase):
+    def setUp(self) -> None:
+        sample.clear_snapshot_input_cache()
+        self.addCleanup(sample.clear_snapshot_input_cache)
+        patches = (
+            patch.dict(sweep.SWEEP_STRATEGIES, {"equal_weight": sweep.SweepStrategySpec(_statement_runner)}),
+            patch.object(sample, "load_statement_factors_data_version", return_value=(1,)),
+            patch.object(sample, "load_statement_factors_shadow", return_value=pd.DataFrame({"value": [0.5]})),
+        )
+        started = [patcher.start() for patcher in patches]
+        self.version, self.load = started[1], started[2]
+        for patcher in patches:
+            self.addCleanup(patcher.stop)
+
+    def test_variants_reuse_recorded_inputs_without_version_queries(self) -> None:
+        table = sweep.run_parameter_sweep("equal_weight", {"interval": [1, 2, 3]}, max_workers=1)
+
+        self.assertTrue(table["Error"].isna().all())
+        self.version.assert_called_once()
+        self.load.assert_called_once()
+
+    def test_pool_workers_are_started_safely_with_the_pinned_inputs(self) -> None:
+        with patch.object(sweep, "ProcessPoolExecutor", _InlineExecutor):
+            results = list(sweep.iter_parameter_sweep("equal_weight", {"interval": [1, 2, 3]}, max_workers=2))
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result.error is None for result in results))
+        kwargs = _InlineExecutor.last_kwargs
+        self.assertEqual(kwargs["mp_context"].get_start_method(), sweep.process_pool_context().get_start_method())
+        payload = kwargs["initargs"][2]
+        self.assertEqual(list(payload), [("statement_factors_shadow", ("AAA",), "annual", None)])
+        self.version.assert_called_once()
+        self.load.assert_called_once()
+
+    def test_pinned_payload_survives_pickling_with_frozen_mappings(self) -> None:
+        pinned = PinnedSnapshotInputs({"frames": {"AAA": pd.DataFrame({"close": [1.0]})}, "version": (1, 2)})
+
+        restored = PinnedSnapshotInputs(pickle.loads(pickle.dumps(pinned.to_payload())))
+
+        self.assertEqual(restored.get("version"), (1, 2))
+        with self.assertRaises(TypeError):
+            restored.get("frames")["BBB"] = pd.DataFrame()
+        pd.testing.assert_frame_equal(restored.get("frames")["AAA"], pd.DataFrame({"close": [1.0]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -615,6 +615,38 @@ class PortfolioMonitoringReadModelTests(unittest.TestCase):
         self.assertEqual(curve.loc[pd.Timestamp("2026-07-01"), "item:later"], 100.0)
         self.assertEqual(curve.loc[pd.Timestamp("2026-07-03"), "item:first"], 100.0)
 
+    def test_decimal_audit_confirms_float_group_alignment(self) -> None:
+        read_model = _load_read_model()
+        position_item = _item(
+            "item-amd",
+            requested=date(2026, 7, 1),
+            effective=date(2026, 7, 1),
+            capital="1000",
+            funding_mode="fixed_shares",
+            input_shares=10,
+        )
+        ended = _item(
+            "b",
+            requested=date(2026, 7, 1),
+            effective=date(2026, 7, 2),
+            status="ended",
+            end=date(2026, 7, 2),
+            exit_value="120",
+        )
+        lanes = {
+            "item-amd": _position_lane(position_item),
+            "b": _lane(ended, [("2026-07-02", 120)]),
+        }
+
+        fast = read_model.align_group_value_lanes([position_item, ended], lanes)
+        audited = read_model.align_group_value_lanes(
+            [position_item, ended], lanes, decimal_audit=True
+        )
+
+        pd.testing.assert_frame_equal(fast.curve, audited.curve)
+        self.assertEqual(audited.curve.iloc[-1]["total_value"], 1320.0)
+        self.assertEqual(fast.metrics, audited.metrics)
+
     def test_failed_lane_is_partial_and_preserves_planned_cash(self) -> None:
         read_model = _load_read_model()
         ready = _item("ready", requested=date(2026, 7, 1), effective=date(2026, 7, 1))
@@ -5,6 +5,7 @@ import unittest
 from datetime import date
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
 from app.services.portfolio_monitoring.persistence import MonitoringItemRecord
@@ -563,6 +564,67 @@ class PortfolioMonitoringDirectValuationTests(unittest.TestCase):
         ):
             valuation.resolve_tracking_end(lane, date(2026, 7, 5))
 
+    def test_decimal_audit_agrees_with_vector_lane_across_events(self) -> None:
+        valuation = _load_valuation()
+        item = self._item(
+            input_shares=30,
+            entry_close=Decimal("50"),
+            initial_capital=Decimal("1500"),
+            effective_start_date=date(2026, 7, 14),
+        )
+        frame = _history(
+            [
+                {"date": "2026-07-14", "close": 50, "adj_close": 25, "stock_splits": 0, "dividends": 0},
+                {"date": "2026-07-15", "close": 25, "adj_close": 25, "stock_splits": 2, "dividends": 1},
+                {"date": "2026-07-16", "close": 26.5, "adj_close": 26.5, "stock_splits": 0, "dividends": 0},
+                {"date": "2026-07-17", "close": 24.25, "adj_close": 24.25, "stock_splits": 0, "dividends": 0.5},
+            ]
+        )
+        events = [
+            self._event(
+                event_id="sell-v1", root_id="sell-root", order=1,
+                effect="sell", day="2026-07-15", quantity=20, price="25", fee="1",
+            ),
+            self._event(
+                event_id="buy-v1", root_id="buy-root", order=2,
+                effect="buy", day="2026-07-17", quantity=5, price="24.25",
+            ),
+        ]
+
+        fast = valuation.build_direct_security_value_lane(item, frame, position_events=events)
+        audited = valuation.build_direct_security_value_lane(
+            item, frame, position_events=events, decimal_audit=True
+        )
+
+        valuation.assert_value_curves_agree(fast.curve, audited.curve, subject="lane")
+        self.assertEqual(fast.position, audited.position)
+        self.assertEqual(audited.position.current_shares, Decimal("45"))
+
+    def test_value_curve_audit_rejects_disagreement_beyond_tolerance(self) -> None:
+        valuation = _load_valuation()
+        curve = pd.DataFrame(
+            {"date": pd.to_datetime(["2026-07-01", "2026-07-02"]), "total_value": [100.0, 101.0]}
+        )
+        drifted = curve.assign(total_value=[100.0, 101.001])
+
+        valuation.assert_value_curves_agree(
+            curve, curve.assign(total_value=[100.0, 101.0 + 1e-12]), subject="lane"
+        )
+        with self.assertRaises(valuation.ValuationAuditError):
+            valuation.assert_value_curves_agree(drifted, curve, subject="lane")
+
+    def test_vector_modified_dietz_marks_non_positive_denominator_as_missing(self) -> None:
+        valuation = _load_valuation()
+
+        result = valuation.modified_dietz_returns(
+            np.array([3000.0, 0.0]), np.array([4100.0, 10.0]), np.array([1000.0, 0.0])
+        )
+
+        self.assertAlmostEqual(result[0], float(valuation.modified_dietz_return(
+            begin_value=Decimal("3000"), end_value=Decimal("4100"), net_external_flow=Decimal("1000"),
+        )))
+        self.assertTrue(pd.isna(result[1]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from finance.engine import BacktestEngine
+from finance.panel import PanelFrameView, PricePanel
+from finance.transform import (
+    add_avg_score,
+    add_interval_returns,
+    add_ma,
+    align_dfs_by_date_intersection,
+    filter_ohlcv,
+    select_rows_by_interval_with_ends,
+    slice_ohlcv,
+)
+
+
+def _price_dfs() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2019-01-01", "2021-12-31")
+    dfs = {}
+    for offset, symbol in enumerate(["SPY", "TLT", "GLD"]):
+        # 심볼마다 상장 시점과 결측 날짜가 달라야 심볼 row 기준 rolling/shift가 검증된다.
+        symbol_dates = dates[offset * 40 :]
+        symbol_dates = symbol_dates.delete(np.arange(5 + offset, len(symbol_dates), 97))
+        closes = 100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.01, len(symbol_dates)))
+        dividends = np.where(np.arange(len(symbol_dates)) % 63 == 0, 0.25, 0.0)
+        dfs[symbol] = pd.DataFrame(
+            {
+                "Date": symbol_dates,
+                "Ticker": symbol,
+                "Open": closes,
+                "Close": closes,
+                "Volume": np.full(len(symbol_dates), 1_000.0),
+                "Dividends": dividends,
+            }
+        )
+    return dfs
+
+
+def _assert_same_dfs(test: unittest.TestCase, expected: dict, actual) -> None:
+    test.assertEqual(list(expected.keys()), list(actual.keys()))
+    for symbol, expected_df in expected.items():
+        actual_df = actual[symbol]
+        test.assertEqual(list(expected_df.columns), list(actual_df.columns))
+        pd.testing.assert_frame_equal(
+            expected_df.reset_index(drop=True),
+            actual_df.reset_index(drop=True),
+            check_dtype=False,
+            check_exact=True,
+        )
+
+
+class PricePanelTransformTests(unittest.TestCase):
+    def test_round_trip_view_matches_source_frames(self) -> None:
+        dfs = _price_dfs()
+        view = PricePanel.from_dfs(dfs).to_dfs()
+
+        self.assertIsInstance(view, PanelFrameView)
+        _assert_same_dfs(self, dfs, view)
+
+    def test_daily_transforms_match_dict_path_with_uneven_histories(self) -> None:
+        dfs = _price_dfs()
+        panel = PricePanel.from_dfs(dfs)
+
+        _assert_same_dfs(self, add_ma(dfs, (5, 20)), panel.add_ma((5, 20)).to_dfs())
+        _assert_same_dfs(self, add_interval_returns(dfs, [1, 3]), panel.add_interval_returns([1, 3]).to_dfs())
+        _assert_same_dfs(self, select_rows_by_interval_with_ends(dfs, 7), panel.select_rows_by_interval_with_ends(7).to_dfs())
+        _assert_same_dfs(self, slice_ohlcv(dfs, "2020-01-01", "2020-06-30"), panel.slice("2020-01-01", "2020-06-30").to_dfs())
+
+    def test_period_filter_and_alignment_match_dict_path(self) -> None:
+        dfs = _price_dfs()
+        panel = PricePanel.from_dfs(dfs)
+
+        for option in ("month_start", "month_end", "year_end"):
+            _assert_same_dfs(self, filter_ohlcv(dfs, option), panel.filter_period(option).to_dfs())
+
+        expected = align_dfs_by_date_intersection(filter_ohlcv(dfs, "month_end"))
+        _assert_same_dfs(self, expected, panel.filter_period("month_end").align_dates().to_dfs())
+
+    def test_avg_score_matches_dict_path_with_weights_and_missing_values(self) -> None:
+        dfs = add_interval_returns(filter_ohlcv(_price_dfs(), "month_end"), [1, 3])
+        dfs["SPY"].loc[dfs["SPY"].index[2], "3MReturn"] = np.nan
+        panel = PricePanel.from_dfs(dfs)
+        cols = ("1MReturn", "3MReturn")
+
+        _assert_same_dfs(self, add_avg_score(dfs, return_cols=cols), panel.add_avg_score(return_cols=cols).to_dfs())
+        weights = {"1MReturn": 2.0, "3MReturn": 1.0}
+        _assert_same_dfs(
+            self,
+            add_avg_score(dfs, return_cols=cols, weights=weights),
+            panel.add_avg_score(return_cols=cols, weights=weights).to_dfs(),
+        )
+
+    def test_align_dates_without_common_dates_raises(self) -> None:
+        dfs = {
+            "A": pd.DataFrame({"Date": pd.to_datetime(["2020-01-01"]), "Close": [1.0]}),
+            "B": pd.DataFrame({"Date": pd.to_datetime(["2020-01-02"]), "Close": [1.0]}),
+        }
+        with self.assertRaises(ValueError):
+            PricePanel.from_dfs(dfs).align_dates()
+
+
+class BacktestEnginePanelModeTests(unittest.TestCase):
+    def _run_chain(self, engine: BacktestEngine) -> dict:
+        engine.dfs = _price_dfs()
+        return (
+            engine.add_ma(20)
+            .filter_by_period()
+            .add_interval_returns([1, 3])
+            .align_dates()
+            .slice(start="2019-06-01", end="2021-12-31")
+            .add_avg_score(return_cols=("1MReturn", "3MReturn"))
+            .drop_columns(["Open", "Volume"])
+            .dfs
+        )
+
+    def test_panel_mode_chain_matches_dict_mode(self) -> None:
+        expected = self._run_chain(BacktestEngine(["SPY", "TLT", "GLD"], "db", "month_end"))
+        actual = self._run_chain(BacktestEngine(["SPY", "TLT", "GLD"], "db", "month_end", panel=True))
+
+        _assert_same_dfs(self, expected, actual)
+
+    def test_panel_mode_accepts_dict_assignment(self) -> None:
+        engine = BacktestEngine(["SPY"], "db", "month_end", panel=True)
+        engine.dfs = {"SPY": _price_dfs()["SPY"]}
+
+        self.assertIsNotNone(engine.panel)
+        self.assertEqual(list(engine.dfs.keys()), ["SPY"])
+
+    def test_panel_view_and_its_frames_are_reused_until_the_panel_changes(self) -> None:
+        engine = BacktestEngine(["SPY", "TLT", "GLD"], "db", "month_end", panel=True)
+        engine.dfs = _price_dfs()
+
+        view = engine.dfs
+        self.assertIs(engine.dfs, view)
+        self.assertIs(engine.dfs["SPY"], view["SPY"])
+
+        engine.add_ma(20)
+        self.assertIsNot(engine.dfs, view)
+        self.assertIn("MA20", engine.dfs["SPY"].columns)
+        self.assertIs(engine.dfs["SPY"], engine.dfs["SPY"])
+
+
+if __name__ == "__main__":
+    unittest.main()
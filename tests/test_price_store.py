@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from finance.data.data import _invalidate_price_store_for_write
+from finance.data import price_store
+from finance.data.price_store import PriceStore
+
+
+class _FakePriceTable:
+    """Stand-in for nyse_price_history that records every incremental query."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.calls: list[tuple[list[str], str, str | None]] = []
+        self.version_calls: list[dict[str, int]] = []
+        self.log: list[tuple[int, str, str | None]] = []
+
+    def __call__(self, symbols: list[str], timeframe: str, after: str | None) -> pd.DataFrame:
+        self.calls.append((list(symbols), timeframe, after))
+        out = self.frame[self.frame["symbol"].isin(symbols)]
+        if after is not None:
+            out = out[pd.to_datetime(out["date"]) > pd.Timestamp(after)]
+        return out.reset_index(drop=True)
+
+    def versions(self, symbols: list[str], timeframe: str, marks: dict[str, int]) -> dict[str, dict]:
+        """Mirror `_fetch_versions_from_mysql` over `self.log` rows of (write_id, symbol, changed_from)."""
+        self.version_calls.append(dict(marks))
+        out = {}
+        for symbol in symbols:
+            entries = [(write_id, changed_from) for write_id, logged, changed_from in self.log if logged == symbol]
+            if not entries:
+                continue
+            newer = [changed_from for write_id, changed_from in entries if symbol in marks and write_id > marks[symbol]]
+            changed_from = None
+            if None in newer:
+                changed_from = "all"
+            elif newer:
+                changed_from = min(newer)
+            out[symbol] = {"write_id": max(write_id for write_id, _ in entries), "changed_from": changed_from}
+        return out
+
+    def write(self, frame: pd.DataFrame, changed_from: str | None) -> None:
+        """Replace the table as another writer would, logging the rewritten range."""
+        self.frame = frame.reset_index(drop=True)
+        for symbol in sorted(set(frame["symbol"])):
+            self.log.append((len(self.log) + 1, symbol, changed_from))
+
+
+def _rows(symbol: str, dates: list[str], closes: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "date": pd.to_datetime(dates).date,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "adj_close": closes,
+            "volume": [1000] * len(dates),
+            "dividends": [0.0] * len(dates),
+            "stock_splits": [0.0] * len(dates),
+        }
+    )
+
+
+class PriceStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.table = _FakePriceTable(
+            pd.concat(
+                [
+                    _rows("AAA", ["2024-01-02", "2024-01-03", "2024-01-04"], [10.0, 11.0, 12.0]),
+                    _rows("BBB", ["2024-01-03", "2024-01-04"], [20.0, 21.0]),
+                ],
+                ignore_index=True,
+            )
+        )
+        self.store = PriceStore(tmp.name, fetch_rows=self.table)
+
+    def test_history_and_matrix_match_long_form_pivot(self) -> None:
+        self.store.sync(["AAA", "BBB"])
+
+        history = self.store.load_history(["BBB", "AAA"], start="2024-01-03")
+        self.assertEqual(history["symbol"].tolist(), ["AAA", "AAA", "BBB", "BBB"])
+        self.assertEqual(history["close"].tolist(), [11.0, 12.0, 20.0, 21.0])
+
+        matrix = self.store.load_matrix(["AAA", "BBB"], field="close")
+        expected = self.store.load_history(["AAA", "BBB"]).pivot(index="date", columns="symbol", values="close")
+        expected.columns.name = None
+        pd.testing.assert_frame_equal(matrix, expected)
+
+    def test_sync_only_fetches_rows_past_high_water_mark(self) -> None:
+        self.store.sync(["AAA"])
+        self.table.frame = pd.concat([self.table.frame, _rows("AAA", ["2024-01-05"], [13.0])], ignore_index=True)
+
+        stats = self.store.sync(["AAA"])
+
+        self.assertEqual(self.table.calls[-1], (["AAA"], "1d", "2024-01-04"))
+        self.assertEqual(stats["rows_fetched"], 1)
+        self.assertEqual(self.store.read_meta("AAA")["high_water"], "2024-01-05")
+
+    def test_read_path_skips_clean_partitions_until_invalidated(self) -> None:
+        self.store.sync(["AAA", "BBB"])
+        calls_after_load = len(self.table.calls)
+        self.store.sync(["AAA", "BBB"], only_stale=True)
+        self.assertEqual(len(self.table.calls), calls_after_load)
+
+        # writer가 01-03부터 다시 썼다고 가정: 그 이후 구간만 다시 채워야 한다.
+        self.table.frame.loc[self.table.frame["symbol"].eq("AAA"), "close"] = [10.0, 31.0, 32.0]
+        with patch("finance.data.data.invalidate_price_store", side_effect=self.store.invalidate):
+            _invalidate_price_store_for_write(
+                [("AAA", "1d", pd.Timestamp("2024-01-03").date())],
+                timeframe="1d",
+            )
+        self.assertTrue(self.store.needs_sync("AAA"))
+        self.assertFalse(self.store.needs_sync("BBB"))
+
+        self.store.sync(["AAA", "BBB"], only_stale=True)
+
+        self.assertEqual(self.table.calls[-1], (["AAA"], "1d", "2024-01-02"))
+        np.testing.assert_array_equal(self.store.load_matrix(["AAA"])["AAA"].to_numpy(), [10.0, 31.0, 32.0])
+
+    def test_symbol_without_rows_is_cached_as_empty(self) -> None:
+        self.store.sync(["ZZZ"])
+
+        self.assertFalse(self.store.needs_sync("ZZZ"))
+        self.assertTrue(self.store.load_history(["ZZZ"]).empty)
+
+
+class PriceStoreSourceVersionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.table = _FakePriceTable(pd.DataFrame())
+        self.table.write(_rows("AAA", ["2024-01-02", "2024-01-03", "2024-01-04"], [10.0, 11.0, 12.0]), None)
+        self.store = PriceStore(tmp.name, fetch_rows=self.table, fetch_versions=self.table.versions)
+        self.store.sync(["AAA"], only_stale=True)
+
+    def test_matching_source_version_serves_the_partition_without_fetching_rows(self) -> None:
+        calls = len(self.table.calls)
+
+        stats = self.store.sync(["AAA"], only_stale=True)
+
+        self.assertEqual(len(self.table.calls), calls)
+        self.assertEqual(stats["source_changed"], 0)
+        self.assertEqual(self.table.version_calls[-1], {"AAA": 1})
+        self.assertEqual(self.store.load_history(["AAA"])["volume"].dtype, np.int64)
+
+    def test_rows_rewritten_by_another_writer_are_refilled_from_the_earliest_change(self) -> None:
+        # Another process restates adj_close from 01-03 and appends 01-05 without touching this store.
+        frame = self.table.frame.copy()
+        frame.loc[frame["date"].astype(str).ge("2024-01-03"), "close"] = [31.0, 32.0]
+        self.table.write(pd.concat([frame, _rows("AAA", ["2024-01-05"], [33.0])]), "2024-01-03")
+
+        stats = self.store.sync(["AAA"], only_stale=True)
+
+        self.assertEqual(stats["source_changed"], 1)
+        self.assertEqual(self.table.calls[-1], (["AAA"], "1d", "2024-01-02"))
+        np.testing.assert_array_equal(self.store.load_matrix(["AAA"])["AAA"].to_numpy(), [10.0, 31.0, 32.0, 33.0])
+        self.assertEqual(self.store.read_meta("AAA")["source_version"], {"write_id": 2})
+
+    def test_whole_history_rewrite_forces_a_full_reload(self) -> None:
+        self.table.write(self.table.frame.iloc[1:], None)
+
+        stats = self.store.sync(["AAA"], only_stale=True)
+
+        self.assertEqual(stats["full_loads"], 1)
+        self.assertEqual(self.table.calls[-1], (["AAA"], "1d", None))
+        self.assertEqual(len(self.store.load_history(["AAA"])), 2)
+
+
+class _WriteLogDB:
+    """Answers the write-log queries of `_fetch_versions_from_mysql` and records every statement."""
+
+    def __init__(self, latest: dict[str, int], changed: dict[str, str]):
+        self.latest = latest
+        self.changed = changed
+        self.statements: list[str] = []
+
+    def query(self, sql, params=None):
+        self.statements.append(" ".join(sql.split()))
+        if "MIN(changed_from)" in sql:
+            return [{"symbol": symbol, "changed_from": day, "rewrote_all": 0} for symbol, day in self.changed.items()]
+        return [{"symbol": symbol, "write_id": write_id} for symbol, write_id in self.latest.items()]
+
+
+class PriceStoreWriteLogQueryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.table = _FakePriceTable(_rows("AAA", ["2024-01-02", "2024-01-03"], [10.0, 11.0]))
+        self.store = PriceStore(tmp.name, fetch_rows=self.table, fetch_versions=price_store._fetch_versions_from_mysql)
+        self.db = _WriteLogDB({"AAA": 7}, {})
+
+        @contextmanager
+        def client(_name):
+            yield self.db
+
+        patcher = patch.object(price_store, "mysql_client", side_effect=client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_warm_read_issues_no_aggregate_over_the_price_table(self) -> None:
+        self.store.sync(["AAA"], only_stale=True)
+        self.db.statements.clear()
+
+        stats = self.store.sync(["AAA"], only_stale=True)
+
+        self.assertEqual(stats["synced_symbols"], 0)
+        self.assertEqual(len(self.db.statements), 1)
+        self.assertIn("FROM nyse_price_write_log", self.db.statements[0])
+        self.assertFalse(any("nyse_price_history" in sql for sql in self.db.statements))
+
+    def test_logged_write_refills_from_the_logged_date(self) -> None:
+        self.store.sync(["AAA"], only_stale=True)
+        self.table.frame.loc[1, "close"] = 21.0
+        self.db.latest, self.db.changed = {"AAA": 8}, {"AAA": "2024-01-03"}
+
+        self.store.sync(["AAA"], only_stale=True)
+
+        self.assertEqual(self.table.calls[-1], (["AAA"], "1d", "2024-01-02"))
+        self.assertIn("(symbol = %s AND write_id > %s)", self.db.statements[-1])
+        np.testing.assert_array_equal(self.store.load_matrix(["AAA"])["AAA"].to_numpy(), [10.0, 21.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
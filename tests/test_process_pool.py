@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import unittest
+
+from finance.process_pool import process_pool_context
+
+
+class ProcessPoolContextTests(unittest.TestCase):
+    def test_never_forks_while_other_threads_are_alive(self) -> None:
+        chosen: list[str] = []
+        release = threading.Event()
+        worker = threading.Thread(target=release.wait)
+        worker.start()
+        try:
+            chosen.append(process_pool_context().get_start_method())
+        finally:
+            release.set()
+            worker.join()
+
+        self.assertNotEqual(chosen[0], "fork")
+        if threading.active_count() == 1 and "fork" in multiprocessing.get_all_start_methods():
+            self.assertEqual(process_pool_context().get_start_method(), "fork")
+
+
+if __name__ == "__main__":
+    unittest.main()
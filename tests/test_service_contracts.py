@@ -1475,6 +1475,36 @@ class RiskOnMomentumSwingContractTests(unittest.TestCase):
         self.assertEqual(prepared.by_date[first_date].index.name, "symbol")
         self.assertTrue(prepared.by_date[first_date].index.is_unique)
 
+    def test_prepared_swing_simulation_lays_out_dense_symbol_panel(self) -> None:
+        from finance.swing import (
+            RiskOnMomentumConfig,
+            clone_config,
+            prepare_swing_feature_frame,
+            prepare_swing_simulation_data,
+        )
+
+        prices, statements, _ = _risk_on_momentum_fixture()
+        config = RiskOnMomentumConfig(start="2024-03-15", end="2024-05-03")
+        features = prepare_swing_feature_frame(prices, statement_history=statements)
+
+        prepared = prepare_swing_simulation_data(features, config=config)
+
+        self.assertEqual(list(prepared.symbols), sorted(prepared.symbols))
+        self.assertEqual(prepared.panel["close"].shape, (len(prepared.dates), len(prepared.symbols)))
+        day_index = len(prepared.dates) - 1
+        day_rows = prepared.by_date[prepared.dates[day_index]]
+        for symbol, row in day_rows.iterrows():
+            symbol_id = prepared.symbol_index[symbol]
+            self.assertEqual(prepared.panel["close"][day_index, symbol_id], float(row["close"]))
+            self.assertEqual(
+                prepared.feature_value("financial_filter_reason", day_index, symbol_id),
+                row["financial_filter_reason"],
+            )
+
+        mask = prepared.eligibility_mask(config)
+        self.assertIs(prepared.eligibility_mask(clone_config(config, exit_mode="atr_based")), mask)
+        self.assertIsNot(prepared.eligibility_mask(clone_config(config, min_price=1_000.0)), mask)
+
     def test_prepared_swing_simulation_preserves_backtest_results(self) -> None:
         from finance.swing import (
             RiskOnMomentumConfig,
@@ -1515,6 +1545,77 @@ class RiskOnMomentumSwingContractTests(unittest.TestCase):
         pd.testing.assert_frame_equal(optimized.scanner_df, baseline.scanner_df)
         self.assertEqual(optimized.metrics, baseline.metrics)
 
+    def test_swing_batch_matches_individual_runs_in_lockstep_and_sharded(self) -> None:
+        from finance.swing import (
+            RiskOnMomentumConfig,
+            clone_config,
+            prepare_swing_feature_frame,
+            run_risk_on_momentum_backtest,
+        )
+        from finance.swing_batch import run_risk_on_momentum_batch
+
+        prices, statements, macro_scores = _risk_on_momentum_fixture()
+        config = RiskOnMomentumConfig(start="2024-03-15", end="2024-05-03", scanner_top_n_per_day=10)
+        configs = [
+            config,
+            clone_config(config, ranking_mode="random", random_seed=7, collect_scanner_rows=False),
+            clone_config(config, ranking_mode="random", random_seed=8, collect_scanner_rows=False),
+            clone_config(config, exit_mode="atr_based", atr_period=10, stop_atr_multiple=1.5),
+            clone_config(config, max_total_positions=1, macro_filter_mode="ranking_penalty"),
+        ]
+        features = prepare_swing_feature_frame(prices, statement_history=statements)
+        expected = [
+            run_risk_on_momentum_backtest(
+                prices,
+                config=item,
+                macro_scores=macro_scores,
+                statement_history=statements,
+                prepared_features=features,
+            )
+            for item in configs
+        ]
+
+        for max_workers in (1, 2):
+            batch = run_risk_on_momentum_batch(
+                prices,
+                configs,
+                macro_scores=macro_scores,
+                statement_history=statements,
+                prepared_features=features,
+                max_workers=max_workers,
+            )
+            self.assertEqual(len(batch), len(configs))
+            for actual, reference in zip(batch, expected):
+                pd.testing.assert_frame_equal(actual.result_df, reference.result_df)
+                pd.testing.assert_frame_equal(actual.trade_log_df, reference.trade_log_df)
+                pd.testing.assert_frame_equal(actual.scanner_df, reference.scanner_df)
+                pd.testing.assert_series_equal(pd.Series(actual.metrics), pd.Series(reference.metrics))
+
+    def test_swing_simulation_executor_run_many_batches_cache_misses(self) -> None:
+        from finance.swing import RiskOnMomentumConfig, clone_config, prepare_swing_feature_frame
+        from finance.swing_analysis import SwingSimulationExecutor
+
+        prices, statements, macro_scores = _risk_on_momentum_fixture()
+        config = RiskOnMomentumConfig(start="2024-03-15", end="2024-05-03", collect_scanner_rows=False)
+        executor = SwingSimulationExecutor(
+            price_history=prices,
+            macro_scores=macro_scores,
+            statement_history=statements,
+            prepared_features=prepare_swing_feature_frame(prices, statement_history=statements),
+        )
+        primary = executor.run(config)
+
+        results = executor.run_many(
+            [config, *(clone_config(config, ranking_mode="random", random_seed=seed) for seed in (1, 2, 1))]
+        )
+
+        self.assertIs(results[0], primary)
+        self.assertIs(results[3], results[1])
+        self.assertIsNot(results[1], results[2])
+        self.assertEqual(executor.executed_count, 3)
+        self.assertEqual(executor.cache_hit_count, 2)
+        self.assertEqual(executor.request_count, 5)
+
     def test_swing_analysis_intensity_resolves_standard_and_legacy_controls(self) -> None:
         from finance.swing_analysis import resolve_swing_analysis_controls
 
@@ -6652,6 +6753,21 @@ class BoundaryContractHardeningTests(unittest.TestCase):
         self.assertNotIn("execution_profile", manual_params)
         self.assertNotIn("excluded_symbols", manual_params)
 
+    def test_ingestion_large_run_guard_estimates_with_the_selected_execution_profile(self) -> None:
+        from app.web.ingestion import page
+
+        with patch.object(page, "estimate_duration_from_history", return_value={"available": False}) as estimate:
+            page._render_large_run_guard(
+                prefix="daily_market",
+                job_name="daily_market_update",
+                symbols=[],
+                execution_profile="managed_refresh_short",
+            )
+            page._render_large_run_guard(prefix="fs", job_name="collect_financial_statements", symbols=[])
+
+        self.assertEqual(estimate.call_args_list[0].kwargs, {"chunk_size": 70, "max_workers": 2})
+        self.assertEqual(estimate.call_args_list[1].kwargs, {"chunk_size": None, "max_workers": None})
+
     def test_ingestion_asset_profile_job_builder_records_metadata(self) -> None:
         from app.web.ingestion_console import _build_asset_profile_job
 
@@ -12819,6 +12935,176 @@ class OverviewAutomationContractTests(unittest.TestCase):
         self.assertEqual(summary["jobs_run"], 0)
         self.assertEqual(appended, [])
 
+    def test_run_overlaps_independent_jobs_and_records_history_in_plan_order(self) -> None:
+        import threading
+
+        from app.jobs.overview_automation import ScheduledJobSpec, run_overview_automation
+
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peaks: dict[str, int] = {}
+        started: list[str] = []
+        both_hosts_running = threading.Barrier(2, timeout=5)
+
+        def runner_for(job_id: str, resource_class: str) -> Any:
+            def runner(_: datetime) -> dict:
+                with lock:
+                    started.append(job_id)
+                    active[resource_class] = active.get(resource_class, 0) + 1
+                    peaks[resource_class] = max(peaks.get(resource_class, 0), active[resource_class])
+                if job_id in {"host_a_first", "host_b"}:
+                    # Only passes when both provider hosts run at the same time.
+                    both_hosts_running.wait()
+                with lock:
+                    active[resource_class] -= 1
+                if job_id == "host_b":
+                    raise RuntimeError("host b down")
+                return {"job_name": f"{job_id}_job", "status": "success", "message": job_id, "details": {}}
+
+            return runner
+
+        def spec(job_id: str, resource_class: str, depends_on: tuple[str, ...] = ()) -> ScheduledJobSpec:
+            return ScheduledJobSpec(
+                job_id=job_id,
+                job_name=f"{job_id}_job",
+                label=job_id,
+                cadence_minutes=60,
+                profiles=("test",),
+                market_hours_only=False,
+                runner=runner_for(job_id, resource_class),
+                description=job_id,
+                depends_on=depends_on,
+                resource_class=resource_class,
+            )
+
+        specs = (
+            spec("dependent", "cpu", depends_on=("host_b",)),
+            spec("host_a_first", "provider:a"),
+            spec("host_a_second", "provider:a"),
+            spec("host_b", "provider:b"),
+        )
+        appended: list[dict] = []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            summary = run_overview_automation(
+                profile="test",
+                history_rows=[],
+                history_appender=appended.append,
+                lock_path=Path(tmp_dir) / "overview.lock",
+                now=datetime(2026, 5, 29, 10, 0),
+                specs=specs,
+                max_workers=4,
+            )
+
+        self.assertEqual(peaks["provider:a"], 1)
+        self.assertLess(started.index("host_b"), started.index("dependent"))
+        self.assertEqual(
+            [row["details"]["automation"]["job_id"] for row in appended],
+            ["host_a_first", "host_a_second", "host_b", "dependent"],
+        )
+        self.assertEqual([row["status"] for row in summary["results"]], ["success", "success", "failed", "success"])
+        self.assertEqual(summary["status"], "partial_success")
+
+    def test_cpu_class_jobs_wait_for_in_flight_jobs_and_run_alone(self) -> None:
+        import threading
+
+        from app.jobs.overview_automation import RESOURCE_CPU, ScheduledJobSpec, run_overview_automation
+
+        lock = threading.Lock()
+        active: set[str] = set()
+        started: list[str] = []
+        overlap: dict[str, set[str]] = {}
+
+        def runner_for(job_id: str) -> Any:
+            def runner(_: datetime) -> dict:
+                with lock:
+                    started.append(job_id)
+                    overlap[job_id] = set(active)
+                    active.add(job_id)
+                with lock:
+                    active.discard(job_id)
+                return {"job_name": f"{job_id}_job", "status": "success", "message": job_id, "details": {}}
+
+            return runner
+
+        specs = tuple(
+            ScheduledJobSpec(
+                job_id=job_id,
+                job_name=f"{job_id}_job",
+                label=job_id,
+                cadence_minutes=60,
+                profiles=("test",),
+                market_hours_only=False,
+                runner=runner_for(job_id),
+                description=job_id,
+                resource_class=resource_class,
+            )
+            for job_id, resource_class in (
+                ("provider_first", "provider:a"),
+                ("forks_workers", RESOURCE_CPU),
+                ("provider_later", "provider:b"),
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_overview_automation(
+                profile="test",
+                history_rows=[],
+                history_appender=lambda _: None,
+                lock_path=Path(tmp_dir) / "overview.lock",
+                now=datetime(2026, 5, 29, 10, 0),
+                specs=specs,
+                max_workers=4,
+            )
+
+        self.assertEqual(started, ["provider_first", "forks_workers", "provider_later"])
+        self.assertEqual(overlap["forks_workers"], set())
+        self.assertEqual(overlap["provider_later"], set())
+
+    def test_run_rejects_dependency_cycles_before_taking_the_lock(self) -> None:
+        from app.jobs.overview_automation import ScheduledJobSpec, run_overview_automation
+
+        def spec(job_id: str, depends_on: str) -> ScheduledJobSpec:
+            return ScheduledJobSpec(
+                job_id=job_id,
+                job_name=f"{job_id}_job",
+                label=job_id,
+                cadence_minutes=60,
+                profiles=("test",),
+                market_hours_only=False,
+                runner=lambda _: self.fail("cyclic jobs must not run"),
+                description=job_id,
+                depends_on=(depends_on,),
+            )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lock_path = Path(tmp_dir) / "overview.lock"
+            with self.assertRaises(ValueError):
+                run_overview_automation(
+                    profile="test",
+                    history_rows=[],
+                    history_appender=lambda _: None,
+                    lock_path=lock_path,
+                    now=datetime(2026, 5, 29, 10, 0),
+                    specs=(spec("a", "b"), spec("b", "a")),
+                )
+            self.assertFalse(lock_path.exists())
+
+    def test_registered_job_dependencies_reference_known_jobs(self) -> None:
+        from app.jobs.overview_automation import OVERVIEW_AUTOMATION_JOB_SPECS, _dependency_order
+
+        job_ids = {spec.job_id for spec in OVERVIEW_AUTOMATION_JOB_SPECS}
+        for spec in OVERVIEW_AUTOMATION_JOB_SPECS:
+            self.assertTrue(set(spec.depends_on) <= job_ids, spec.job_id)
+        self.assertEqual(len(_dependency_order(OVERVIEW_AUTOMATION_JOB_SPECS)), len(job_ids))
+
+    def test_yahoo_price_writers_share_one_resource_class(self) -> None:
+        from app.jobs.overview_automation import OVERVIEW_AUTOMATION_JOB_SPECS, RESOURCE_YAHOO
+
+        classes = {spec.job_id: spec.resource_class for spec in OVERVIEW_AUTOMATION_JOB_SPECS}
+        for job_id in ("economic_cycle_asset_pathways", "sp500_valuation", "nasdaq100_valuation", "sp500_intraday"):
+            self.assertEqual(classes[job_id], RESOURCE_YAHOO, job_id)
+
 
 class BacktestRuntimeContractTests(unittest.TestCase):
     def test_gtaa_strategy_records_liquidity_exclusions_when_adv_filter_is_enabled(self) -> None:
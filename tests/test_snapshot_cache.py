@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+import finance.sample as sample
+from finance.snapshot_cache import VersionedSnapshotCache, estimate_nbytes
+
+
+def _frame(rows: int = 4) -> pd.DataFrame:
+    return pd.DataFrame({"Date": pd.date_range("2026-01-01", periods=rows), "Close": [float(i) for i in range(rows)]})
+
+
+class VersionedSnapshotCacheTests(unittest.TestCase):
+    def test_hit_requires_matching_data_version(self) -> None:
+        cache = VersionedSnapshotCache(max_bytes=1 << 20)
+        builds: list[int] = []
+
+        def build() -> pd.DataFrame:
+            builds.append(1)
+            return _frame()
+
+        cache.get_or_build(("prices", "AAA"), (10, "2026-01-04"), build)
+        cache.get_or_build(("prices", "AAA"), (10, "2026-01-04"), build)
+        cache.get_or_build(("prices", "AAA"), (11, "2026-01-05"), build)
+
+        self.assertEqual(len(builds), 2)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stale"]), (1, 2, 1))
+        self.assertEqual(stats["entries"], 1)
+
+    def test_shared_values_are_not_deep_copies_and_cannot_corrupt_the_cache(self) -> None:
+        cache = VersionedSnapshotCache(max_bytes=1 << 20)
+        first = cache.get_or_build("price_dfs", 1, lambda: {"AAA": _frame()})
+
+        with self.assertRaises(TypeError):
+            first["BBB"] = _frame()
+        first["AAA"]["Close"] = -1.0
+        first["AAA"].loc[0, "Date"] = pd.Timestamp("1999-01-01")
+
+        second = cache.get_or_build("price_dfs", 1, lambda: self.fail("cached value should be reused"))
+        self.assertEqual(second["AAA"]["Close"].tolist(), [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(second["AAA"].loc[0, "Date"], pd.Timestamp("2026-01-01"))
+        self.assertIsNot(first["AAA"], second["AAA"])
+
+        nested = cache.get_or_build("adv", 1, lambda: {"AAA": {pd.Timestamp("2026-01-02"): 5.0}})
+        with self.assertRaises(TypeError):
+            nested["AAA"][pd.Timestamp("2026-01-03")] = 6.0
+
+    def test_evicts_least_recently_used_entries_by_size(self) -> None:
+        entry_bytes = estimate_nbytes(_frame(100))
+        cache = VersionedSnapshotCache(max_bytes=entry_bytes * 2 + entry_bytes // 2)
+        cache.get_or_build("a", 1, lambda: _frame(100))
+        cache.get_or_build("b", 1, lambda: _frame(100))
+        cache.get_or_build("a", 1, lambda: self.fail("a should still be cached"))
+        cache.get_or_build("c", 1, lambda: _frame(100))
+
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["entries"], 2)
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+        rebuilt: list[str] = []
+        cache.get_or_build("b", 1, lambda: rebuilt.append("b") or _frame(100))
+        self.assertEqual(rebuilt, ["b"])
+
+        cache.get_or_build("huge", 1, lambda: _frame(10_000))
+        self.assertEqual(cache.stats()["oversized"], 1)
+
+
+class SnapshotInputCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        sample.clear_snapshot_input_cache()
+        self.addCleanup(sample.clear_snapshot_input_cache)
+
+    def test_price_inputs_rebuild_when_price_data_version_changes(self) -> None:
+        versions = iter(
+            [
+                ("nyse_price_history", 4, "2026-01-04"),
+                ("nyse_price_history", 4, "2026-01-04"),
+                ("nyse_price_history", 5, "2026-01-05"),
+            ]
+        )
+        builds: list[tuple[str, ...]] = []
+
+        def build(symbols_key, *_args):
+            builds.append(symbols_key)
+            return {symbol: _frame() for symbol in symbols_key}
+
+        with patch.object(sample, "load_price_data_version", side_effect=lambda *_a, **_k: next(versions)), patch.object(
+            sample, "_build_snapshot_strategy_price_dfs_from_db", side_effect=build
+        ):
+            for _ in range(3):
+                price_dfs = sample._get_cached_snapshot_strategy_price_dfs(
+                    symbols=["aaa", "BBB"],
+                    option="month_end",
+                    start="2026-01-01",
+                    end=None,
+                    timeframe="1d",
+                    trend_filter_window=None,
+                )
+
+        self.assertEqual(builds, [("AAA", "BBB"), ("AAA", "BBB")])
+        self.assertEqual(sorted(price_dfs), ["AAA", "BBB"])
+        self.assertGreaterEqual(sample.snapshot_input_cache_stats()["hits"], 1)
+
+    def test_in_place_price_rewrite_refreshes_cached_inputs(self) -> None:
+        from finance.data import price_store
+
+        table = {("AAA", "2026-01-02"): 10.0, ("AAA", "2026-01-03"): 11.0}
+        write_log = [("AAA", None)]
+        statements: list[str] = []
+
+        class _FakeDb:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+            def query(self, sql, _params):
+                statements.append(sql)
+                return [{"symbol": "AAA", "write_id": len(write_log)}]
+
+        builds: list[float] = []
+
+        def build(symbols_key, *_args):
+            builds.append(table[("AAA", "2026-01-02")])
+            return {symbol: _frame() for symbol in symbols_key}
+
+        def load():
+            return sample._get_cached_snapshot_strategy_price_dfs(
+                symbols=["AAA"],
+                option="month_end",
+                start="2026-01-01",
+                end=None,
+                timeframe="1d",
+                trend_filter_window=None,
+            )
+
+        with patch.object(price_store, "mysql_client", return_value=_FakeDb()), patch.object(
+            sample, "_build_snapshot_strategy_price_dfs_from_db", side_effect=build
+        ):
+            load()
+            load()
+            # Dividend restatement: same row count and latest date, new adj_close and a new write-log entry.
+            table[("AAA", "2026-01-02")] = 9.5
+            write_log.append(("AAA", "2026-01-02"))
+            load()
+
+        self.assertEqual(builds, [10.0, 9.5])
+        self.assertTrue(all("nyse_price_write_log" in sql and "nyse_price_history" not in sql for sql in statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
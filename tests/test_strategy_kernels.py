@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from finance.strategy import (
+    AvgDollarVolumeMatrix,
+    _liquidity_pass_matrix,
+    _strategy_matrix,
+    dual_momentum,
+    equal_weight,
+    global_relative_strength_allocation,
+    gtaa3,
+)
+
+
+def _price_df(dates: pd.DatetimeIndex, closes: list[float], scores: list[float], ma: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Close": closes,
+            "Avg Score": scores,
+            "12MReturn": scores,
+            "MA200": [ma] * len(dates),
+        }
+    )
+
+
+class StrategyKernelHelperTests(unittest.TestCase):
+    def test_strategy_matrix_sorts_by_date_and_fills_optional_columns(self) -> None:
+        dates = pd.to_datetime(["2020-02-29", "2020-01-31"])
+        dfs = {
+            "AAA": pd.DataFrame({"Date": dates, "Close": [2.0, 1.0], "MA200": [1.5, 0.5]}),
+            "BBB": pd.DataFrame({"Date": dates, "Close": [4.0, 3.0]}),
+        }
+
+        closes = _strategy_matrix(dfs, ["AAA", "BBB"], "Close", sort_dates=True)
+        mas = _strategy_matrix(dfs, ["AAA", "BBB"], "MA200", sort_dates=True, required=False)
+
+        np.testing.assert_array_equal(closes, [[1.0, 3.0], [2.0, 4.0]])
+        np.testing.assert_array_equal(mas[:, 0], [0.5, 1.5])
+        self.assertTrue(np.isnan(mas[:, 1]).all())
+        with self.assertRaises(KeyError):
+            _strategy_matrix(dfs, ["AAA", "BBB"], "MA200")
+
+    def test_liquidity_mask_rejects_missing_and_thin_names(self) -> None:
+        day = pd.Timestamp("2020-01-31")
+        by_date = {"AAA": {day: 30_000_000.0}, "BBB": {day: None}, "CCC": {day: 5_000_000.0}}
+
+        mask = _liquidity_pass_matrix(by_date, ["AAA", "BBB", "CCC", "DDD"], [day], 20.0)
+        disabled = _liquidity_pass_matrix(by_date, ["AAA", "BBB"], [day], 0.0)
+
+        self.assertEqual(mask.tolist(), [[True, False, False, False]])
+        self.assertEqual(disabled.tolist(), [[True, True]])
+
+    def test_liquidity_matrix_matches_mapping_lookup_on_exact_dates(self) -> None:
+        days = pd.to_datetime(["2020-01-30", "2020-01-31", "2020-02-03"])
+        by_date = {
+            "AAA": {days[0]: 10_000_000.0, days[2]: 30_000_000.0},
+            "BBB": {days[1]: 25_000_000.0},
+        }
+        matrix = AvgDollarVolumeMatrix.from_mapping(by_date)
+        wanted = [days[0], days[1], days[2], pd.Timestamp("2020-02-04")]
+        tickers = ["BBB", "AAA", "ZZZ"]
+
+        self.assertEqual(matrix.values.dtype, np.float32)
+        self.assertFalse(matrix.values.flags.writeable)
+        np.testing.assert_array_equal(
+            matrix.take(wanted, tickers),
+            [[np.nan, 10_000_000.0, np.nan], [25_000_000.0, np.nan, np.nan], [np.nan, 30_000_000.0, np.nan], [np.nan] * 3],
+        )
+        self.assertEqual(
+            _liquidity_pass_matrix(matrix, tickers, wanted, 20.0).tolist(),
+            _liquidity_pass_matrix(by_date, tickers, wanted, 20.0).tolist(),
+        )
+
+
+class PriceOnlyStrategyKernelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dates = pd.date_range("2020-01-31", periods=4, freq="ME")
+
+    def test_equal_weight_rolls_balances_forward_between_rebalances(self) -> None:
+        dfs = {
+            "AAA": _price_df(self.dates, [100.0, 110.0, 121.0, 121.0], [0.0] * 4),
+            "BBB": _price_df(self.dates, [100.0, 100.0, 50.0, 100.0], [0.0] * 4),
+        }
+
+        result = equal_weight(dfs, start_balance=1000.0, rebalance_interval=2)
+
+        self.assertEqual(result["Rebalancing"].tolist(), [True, False, True, False])
+        self.assertEqual(result.loc[1, "End Balance"], [550.0, 500.0])
+        self.assertAlmostEqual(float(result.loc[2, "Total Balance"]), 855.0)
+        self.assertEqual(result.loc[3, "End Balance"], [427.5, 855.0])
+
+    def test_gtaa_ranking_keeps_universe_order_for_tied_scores(self) -> None:
+        dfs = {
+            "AAA": _price_df(self.dates, [10.0] * 4, [0.5] * 4),
+            "BBB": _price_df(self.dates, [10.0] * 4, [0.9] * 4),
+            "CCC": _price_df(self.dates, [10.0] * 4, [0.5] * 4),
+            "DDD": _price_df(self.dates, [10.0] * 4, [np.nan] * 4),
+        }
+
+        result = gtaa3(dfs, start_balance=1000, top=3, filter_ma="MA200")
+
+        self.assertEqual(result.loc[0, "Raw Selected Ticker"], ["BBB", "AAA", "CCC"])
+
+    def test_dual_momentum_and_grs_share_top_n_selection_with_trend_filter(self) -> None:
+        dfs = {
+            "AAA": _price_df(self.dates, [10.0, 11.0, 12.0, 13.0], [0.3] * 4),
+            "BBB": _price_df(self.dates, [10.0, 9.0, 8.0, 7.0], [0.8] * 4, ma=100.0),
+            "CCC": _price_df(self.dates, [10.0, 10.0, 10.0, 10.0], [0.1] * 4),
+        }
+
+        dual = dual_momentum(dfs, start_balance=1000.0, top=2)
+        grs = global_relative_strength_allocation(dfs, start_balance=1000.0, top=2)
+        # 매월 리밸런싱: 절반은 AAA, 나머지 슬롯은 현금
+        expected_balance = 1000.0
+        for growth in (11.0 / 10.0, 12.0 / 11.0, 13.0 / 12.0):
+            expected_balance = expected_balance / 2 * growth + expected_balance / 2
+
+        for result in (dual, grs):
+            self.assertEqual(result.loc[0, "Raw Selected Ticker"], ["BBB", "AAA"])
+            self.assertEqual(result.loc[0, "Next Ticker"], ["AAA"])
+            self.assertEqual(result.loc[0, "Trend Rejected Ticker"], ["BBB"])
+            self.assertAlmostEqual(float(result.loc[3, "Total Balance"]), expected_balance)
+
+
+if __name__ == "__main__":
+    unittest.main()